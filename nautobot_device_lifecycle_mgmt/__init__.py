@@ -29,16 +29,21 @@ class DeviceLifeCycleConfig(PluginConfig):
         "barchart_bar_width": 0.1,
         "barchart_width": 12,
         "barchart_height": 5,
+        "closed_vulnerability_statuses": ["closed", "exempt", "fixed", "resolved"],
     }
     caching_config = {}
 
     def ready(self):
-        """Register custom signals."""
+        """Register custom signals and extend the core GraphQL types."""
         from .signals import post_migrate_create_relationships  # pylint: disable=import-outside-toplevel
 
         nautobot_database_ready.connect(post_migrate_create_relationships, sender=self)
 
         super().ready()
 
+        from .graphql.extensions import extend_core_schema_types  # pylint: disable=import-outside-toplevel
+
+        extend_core_schema_types()
+
 
 config = DeviceLifeCycleConfig  # pylint:disable=invalid-name
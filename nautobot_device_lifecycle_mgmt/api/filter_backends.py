@@ -0,0 +1,22 @@
+"""API filter backends for the Lifecycle Management plugin."""
+from nautobot.core.api.filter_backends import NautobotFilterBackend
+
+
+class LifecycleFilterBackend(NautobotFilterBackend):
+    """Filter backend that also ignores the query parameters handled by the plugin API views."""
+
+    non_filter_params = (
+        "count",  # keyset pagination
+        "cursor",  # keyset pagination
+        "exclude",  # sparse fieldsets
+        "expand",  # sparse fieldsets
+        "fields",  # sparse fieldsets
+        "pagination",  # keyset pagination
+    )
+
+    def get_filterset_kwargs(self, request, queryset, view):
+        """Drop the plugin's non-filterset query parameters before constructing the FilterSet."""
+        kwargs = super().get_filterset_kwargs(request, queryset, view)
+        for non_filter_param in self.non_filter_params:
+            kwargs["data"].pop(non_filter_param, None)
+        return kwargs
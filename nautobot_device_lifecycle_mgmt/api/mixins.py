@@ -0,0 +1,75 @@
+"""API serializer mixins for the Lifecycle Management plugin."""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.relations import ManyRelatedField
+
+from nautobot.core.api import SerializedPKRelatedField
+
+
+class SparseFieldsetSerializerMixin:  # pylint: disable=too-few-public-methods
+    """Let API clients shape read responses with query parameters.
+
+    - `?fields=a,b` only renders the listed fields.
+    - `?exclude=a,b` renders all fields except the listed ones.
+    - `?expand=false` renders related objects as primary keys instead of nested objects;
+      `?expand=a,b` only renders the listed relations as nested objects.
+
+    Only applies to the top-level serializer of a safe (read) request.
+    """
+
+    @staticmethod
+    def _get_query_param_list(request, name):
+        """Return the comma separated values of query parameter `name` as a set, or None if it was not passed."""
+        if name not in request.query_params:
+            return None
+        return {value.strip() for value in request.query_params[name].split(",") if value.strip()}
+
+    def _is_root_serializer(self):
+        """Return True if this is the serializer the view was called with (possibly wrapped in a ListSerializer)."""
+        if self.parent is None:
+            return True
+        return isinstance(self.parent, serializers.ListSerializer) and self.parent.parent is None
+
+    def get_fields(self):
+        """Apply `fields`, `exclude` and `expand` from the request query parameters."""
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is None or request.method not in SAFE_METHODS or not self._is_root_serializer():
+            return fields
+
+        only = self._get_query_param_list(request, "fields")
+        exclude = self._get_query_param_list(request, "exclude") or set()
+        fields = {
+            name: field for name, field in fields.items() if (only is None or name in only) and name not in exclude
+        }
+
+        expand = self._get_query_param_list(request, "expand")
+        if expand is None or expand & {"true", "1"}:
+            return fields
+        for name, field in fields.items():
+            if name not in expand:
+                fields[name] = self._collapse_field(name, field)
+        return fields
+
+    def _collapse_field(self, name, field):
+        """Return a primary key field in place of a nested object field, or the field itself if it is not nested."""
+        try:
+            model_field = self.Meta.model._meta.get_field(field.source or name)  # pylint: disable=protected-access
+        except FieldDoesNotExist:
+            return field
+        if not model_field.is_relation:
+            return field
+        if isinstance(field, ManyRelatedField):
+            if not isinstance(field.child_relation, SerializedPKRelatedField):
+                return field
+        elif not isinstance(field, serializers.BaseSerializer):
+            return field
+        kwargs = {
+            "many": isinstance(field, (serializers.ListSerializer, ManyRelatedField)),
+            "pk_field": serializers.UUIDField(read_only=True),
+            "read_only": True,
+        }
+        if field.source and field.source != name:
+            kwargs["source"] = field.source
+        return serializers.PrimaryKeyRelatedField(**kwargs)
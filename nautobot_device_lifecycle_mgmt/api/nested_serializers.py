@@ -114,3 +114,18 @@ class NestedCVELCMSerializer(WritableNestedSerializer):
             "fix",
             "comments",
         ]
+
+
+class NestedValidatedSoftwareLCMSerializer(WritableNestedSerializer):
+    """Nested/brief serializer for ValidatedSoftwareLCM."""
+
+    url = serializers.HyperlinkedIdentityField(
+        view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:validatedsoftwarelcm-detail"
+    )
+    software = NestedSoftwareLCMSerializer(read_only=True)
+
+    class Meta:
+        """Meta attributes."""
+
+        model = models.ValidatedSoftwareLCM
+        fields = ["id", "url", "software", "start", "end", "preferred", "valid"]
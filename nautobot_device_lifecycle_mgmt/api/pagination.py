@@ -0,0 +1,74 @@
+"""API pagination classes for the Lifecycle Management plugin."""
+from collections import OrderedDict
+
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+from nautobot.utilities.config import get_settings_or_config
+
+
+class KeysetPagination(CursorPagination):
+    """Opt-in keyset pagination on the primary key.
+
+    Selected per request with `?pagination=cursor` (following `next`/`previous` links keeps it selected through the
+    `cursor` parameter). Each page is fetched with `WHERE id > <cursor> ORDER BY id LIMIT n`, so deep pages cost the
+    same as the first one. The total count is not computed unless `?count=true` is passed.
+    """
+
+    ordering = "pk"
+    cursor_query_param = "cursor"
+    page_size_query_param = "limit"
+    pagination_query_param = "pagination"
+    pagination_query_value = "cursor"
+    count_query_param = "count"
+    count = None
+
+    @classmethod
+    def is_requested(cls, request):
+        """Return True if the request opted in to keyset pagination."""
+        if request is None:
+            return False
+        query_params = request.query_params
+        return (
+            query_params.get(cls.pagination_query_param) == cls.pagination_query_value
+            or cls.cursor_query_param in query_params
+        )
+
+    def get_ordering(self, request, queryset, view):
+        """Always paginate on the primary key, it is unique and indexed."""
+        return (self.ordering,)
+
+    def get_page_size(self, request):
+        """Honour `limit` and the Nautobot PAGINATE_COUNT/MAX_PAGE_SIZE settings like the default paginator."""
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+            if page_size <= 0:
+                raise ValueError()
+        except (KeyError, ValueError):
+            page_size = get_settings_or_config("PAGINATE_COUNT")
+
+        max_page_size = get_settings_or_config("MAX_PAGE_SIZE")
+        if max_page_size:
+            return min(page_size, max_page_size)
+        return page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate the queryset, counting it only if explicitly requested."""
+        self.count = None
+        if request.query_params.get(self.count_query_param, "").lower() in ("true", "1"):
+            self.count = queryset.count()
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data):
+        """Return the page in the same envelope as the default paginator, with `count` only when requested."""
+        response_data = []
+        if self.count is not None:
+            response_data.append(("count", self.count))
+        response_data.extend(
+            [
+                ("next", self.get_next_link()),
+                ("previous", self.get_previous_link()),
+                ("results", data),
+            ]
+        )
+        return Response(OrderedDict(response_data))
@@ -30,6 +30,8 @@ except ImportError:
 from nautobot.extras.models import Status
 
 from nautobot_device_lifecycle_mgmt import choices
+from nautobot_device_lifecycle_mgmt.api.mixins import SparseFieldsetSerializerMixin
+from nautobot_device_lifecycle_mgmt.const import BULK_SOFTWARE_VALIDATION_MAX_OBJECTS, CONTRACT_FORECAST_MAX_YEARS
 from nautobot_device_lifecycle_mgmt.models import (
     CVELCM,
     ContactLCM,
@@ -42,6 +44,10 @@ from nautobot_device_lifecycle_mgmt.models import (
     VulnerabilityLCM,
     DeviceSoftwareValidationResult,
     InventoryItemSoftwareValidationResult,
+    DeviceHardwareEoXResult,
+    InventoryItemHardwareEoXResult,
+    DeviceContractCoverage,
+    InventoryItemContractCoverage,
 )
 
 from .nested_serializers import (
@@ -52,6 +58,9 @@ from .nested_serializers import (
     NestedSoftwareLCMSerializer,
 )
 
+# The sparse fieldset mixin comes first, to drop the omitted fields before the other base classes handle them.
+serializer_base_classes = [SparseFieldsetSerializerMixin, *serializer_base_classes]  # pylint: disable=invalid-name
+
 
 class HardwareLCMSerializer(*serializer_base_classes):  # pylint: disable=R0901,too-few-public-methods
     """API serializer."""
@@ -72,6 +81,7 @@ class HardwareLCMSerializer(*serializer_base_classes):  # pylint: disable=R0901,
             "url",
             "id",
             "expired",
+            "days_to_expiry",
             "devices",
             "device_type",
             "inventory_item",
@@ -136,6 +146,7 @@ class ContractLCMSerializer(*serializer_base_classes):  # pylint: disable=R0901,
             "support_level",
             "contract_type",
             "expired",
+            "days_to_expiry",
             "custom_fields",
             "tags",
         ]
@@ -286,6 +297,7 @@ class CVELCMSerializer(*serializer_base_classes, StatusModelSerializerMixin):  #
             "cvss_v3",
             "fix",
             "comments",
+            "affected_versions",
             "custom_fields",
             "tags",
         ]
@@ -379,3 +391,171 @@ class InventoryItemSoftwareValidationResultSerializer(
             "valid_software",
             "url",
         ]
+
+
+class DeviceHardwareEoXResultSerializer(*serializer_base_classes):  # pylint: disable=too-few-public-methods
+    """REST API serializer for DeviceHardwareEoXResult records."""
+
+    url = serializers.HyperlinkedIdentityField(
+        view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:devicehardwareeoxresult-detail"
+    )
+    device = NestedDeviceSerializer(read_only=True)
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Meta attributes."""
+
+        model = DeviceHardwareEoXResult
+        fields = [
+            "device",
+            "end_of_sale",
+            "end_of_support",
+            "end_of_sw_releases",
+            "end_of_security_patches",
+            "last_run",
+            "run_type",
+            "url",
+        ]
+
+
+class InventoryItemHardwareEoXResultSerializer(*serializer_base_classes):  # pylint: disable=too-few-public-methods
+    """REST API serializer for InventoryItemHardwareEoXResult records."""
+
+    url = serializers.HyperlinkedIdentityField(
+        view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:inventoryitemhardwareeoxresult-detail"
+    )
+    inventory_item = NestedInventoryItemSerializer(read_only=True)
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Meta attributes."""
+
+        model = InventoryItemHardwareEoXResult
+        fields = [
+            "inventory_item",
+            "end_of_sale",
+            "end_of_support",
+            "end_of_sw_releases",
+            "end_of_security_patches",
+            "last_run",
+            "run_type",
+            "url",
+        ]
+
+
+class DeviceContractCoverageSerializer(*serializer_base_classes):  # pylint: disable=too-few-public-methods
+    """REST API serializer for DeviceContractCoverage records."""
+
+    url = serializers.HyperlinkedIdentityField(
+        view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:devicecontractcoverage-detail"
+    )
+    device = NestedDeviceSerializer(read_only=True)
+    contract = NestedContractLCMSerializer(read_only=True)
+    provider = NestedProviderLCMSerializer(read_only=True)
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Meta attributes."""
+
+        model = DeviceContractCoverage
+        fields = [
+            "device",
+            "is_covered",
+            "contract",
+            "provider",
+            "support_level",
+            "end",
+            "gap_start",
+            "gap_end",
+            "contract_count",
+            "last_run",
+            "run_type",
+            "url",
+        ]
+
+
+class InventoryItemContractCoverageSerializer(*serializer_base_classes):  # pylint: disable=too-few-public-methods
+    """REST API serializer for InventoryItemContractCoverage records."""
+
+    url = serializers.HyperlinkedIdentityField(
+        view_name="plugins-api:nautobot_device_lifecycle_mgmt-api:inventoryitemcontractcoverage-detail"
+    )
+    inventory_item = NestedInventoryItemSerializer(read_only=True)
+    contract = NestedContractLCMSerializer(read_only=True)
+    provider = NestedProviderLCMSerializer(read_only=True)
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Meta attributes."""
+
+        model = InventoryItemContractCoverage
+        fields = [
+            "inventory_item",
+            "is_covered",
+            "contract",
+            "provider",
+            "support_level",
+            "end",
+            "gap_start",
+            "gap_end",
+            "contract_count",
+            "last_run",
+            "run_type",
+            "url",
+        ]
+
+
+class BulkSoftwareRequestSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Input of the bulk software APIs: the Devices and InventoryItems to evaluate."""
+
+    devices = serializers.ListField(
+        child=serializers.UUIDField(), required=False, max_length=BULK_SOFTWARE_VALIDATION_MAX_OBJECTS
+    )
+    inventory_items = serializers.ListField(
+        child=serializers.UUIDField(), required=False, max_length=BULK_SOFTWARE_VALIDATION_MAX_OBJECTS
+    )
+    device_filter = serializers.DictField(
+        required=False, help_text="Device filter parameters, as accepted by the Device list API endpoint."
+    )
+    inventory_item_filter = serializers.DictField(
+        required=False, help_text="InventoryItem filter parameters, as accepted by the InventoryItem list API endpoint."
+    )
+
+    def validate(self, attrs):
+        """At least one set of objects to evaluate must be given."""
+        if not set(attrs) & {"devices", "device_filter", "inventory_items", "inventory_item_filter"}:
+            raise serializers.ValidationError(
+                "One of devices, device_filter, inventory_items or inventory_item_filter is required."
+            )
+        return attrs
+
+
+class SoftwareImageResolutionRequestSerializer(BulkSoftwareRequestSerializer):  # pylint: disable=abstract-method
+    """Input of the bulk software image resolution API."""
+
+    software = serializers.PrimaryKeyRelatedField(
+        queryset=SoftwareLCM.objects.all(),
+        required=False,
+        help_text="Target software of all the objects. Defaults to the software assigned to each object.",
+    )
+
+    def __init__(self, *args, **kwargs):
+        """Only accept the target software the requesting user can view."""
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request is not None:
+            self.fields["software"].queryset = SoftwareLCM.objects.restrict(request.user, "view")
+
+
+class ContractRenewalForecastRequestSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Query parameters of the contract renewal forecast API."""
+
+    period = serializers.ChoiceField(
+        choices=choices.ContractForecastPeriodChoices.CHOICES,
+        default=choices.ContractForecastPeriodChoices.QUARTER,
+        help_text="Period grouping the contract end dates.",
+    )
+    years = serializers.IntegerField(
+        min_value=1, max_value=CONTRACT_FORECAST_MAX_YEARS, default=1, help_text="Number of years forecast."
+    )
+    group_by = serializers.ChoiceField(
+        choices=choices.ContractForecastGroupChoices.CHOICES,
+        default=choices.ContractForecastGroupChoices.PROVIDER,
+        help_text="Breakdown of the contracts of each period, along with their currency.",
+    )
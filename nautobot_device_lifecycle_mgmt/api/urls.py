@@ -1,5 +1,6 @@
 """API URLs for the Lifecycle Management plugin."""
 
+from django.urls import path
 from rest_framework import routers
 from nautobot_device_lifecycle_mgmt.api.views import (
     HardwareLCMView,
@@ -13,6 +14,13 @@ from nautobot_device_lifecycle_mgmt.api.views import (
     VulnerabilityLCMViewSet,
     DeviceSoftwareValidationResultListViewSet,
     InventoryItemSoftwareValidationResultListViewSet,
+    DeviceHardwareEoXResultListViewSet,
+    InventoryItemHardwareEoXResultListViewSet,
+    DeviceContractCoverageListViewSet,
+    InventoryItemContractCoverageListViewSet,
+    SoftwareImageResolutionView,
+    SoftwareValidationView,
+    ContractRenewalForecastView,
 )
 
 router = routers.DefaultRouter()
@@ -28,7 +36,15 @@ router.register(r"cve", CVELCMViewSet)
 router.register(r"vulnerability", VulnerabilityLCMViewSet)
 router.register(r"device-validated-software-result", DeviceSoftwareValidationResultListViewSet)
 router.register(r"inventory-item-validated-software-result", InventoryItemSoftwareValidationResultListViewSet)
+router.register(r"device-hardware-eox-result", DeviceHardwareEoXResultListViewSet)
+router.register(r"inventory-item-hardware-eox-result", InventoryItemHardwareEoXResultListViewSet)
+router.register(r"device-contract-coverage", DeviceContractCoverageListViewSet)
+router.register(r"inventory-item-contract-coverage", InventoryItemContractCoverageListViewSet)
 
 app_name = "nautobot_device_lifecycle_mgmt"
 
-urlpatterns = router.urls
+urlpatterns = [
+    path("software-validation/", SoftwareValidationView.as_view(), name="software-validation"),
+    path("software-image-resolution/", SoftwareImageResolutionView.as_view(), name="software-image-resolution"),
+    path("contract-renewal-forecast/", ContractRenewalForecastView.as_view(), name="contract-renewal-forecast"),
+] + router.urls
@@ -0,0 +1,121 @@
+"""Utilities for the Lifecycle Management plugin API."""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField, RelatedField
+
+from nautobot.core.api import SerializedPKRelatedField
+
+# Related fields traversed when rendering the `display` value (`display` property or `__str__`) of serialized models.
+DISPLAY_RELATED_FIELDS = {
+    "dcim.devicetype": ("manufacturer",),
+    "nautobot_device_lifecycle_mgmt.hardwarelcm": ("device_type",),
+    "nautobot_device_lifecycle_mgmt.softwarelcm": ("device_platform",),
+    "nautobot_device_lifecycle_mgmt.validatedsoftwarelcm": ("software__device_platform",),
+    "nautobot_device_lifecycle_mgmt.devicesoftwarevalidationresult": ("device",),
+    "nautobot_device_lifecycle_mgmt.inventoryitemsoftwarevalidationresult": ("inventory_item",),
+    "nautobot_device_lifecycle_mgmt.vulnerabilitylcm": ("cve", "software__device_platform", "device", "inventory_item"),
+}
+
+
+def _get_nested_serializer(field):
+    """Return the serializer used to render the related object(s) of `field`, if any."""
+    if isinstance(field, serializers.ListSerializer):
+        return field.child
+    if isinstance(field, serializers.BaseSerializer):
+        return field
+    if isinstance(field, ManyRelatedField):
+        field = field.child_relation
+    if isinstance(field, SerializedPKRelatedField):
+        return field.serializer()
+    return None
+
+
+def _needs_related_object(field):
+    """Return True if rendering `field` requires the related object and not only its primary key."""
+    if isinstance(field, ManyRelatedField):
+        return True
+    if isinstance(field, PrimaryKeyRelatedField) and not isinstance(field, SerializedPKRelatedField):
+        # PrimaryKeyRelatedField reads the foreign key column directly, see `use_pk_only_optimization()`.
+        return False
+    return isinstance(field, (RelatedField, serializers.BaseSerializer))
+
+
+def _is_many_path(model, path):
+    """Return True if any relation along the `__` separated `path` is many-to-many or reverse."""
+    for name in path.split("__"):
+        model_field = model._meta.get_field(name)  # pylint: disable=protected-access
+        if model_field.many_to_many or model_field.one_to_many:
+            return True
+        model = model_field.related_model
+    return False
+
+
+def get_serializer_related_lookups(serializer, model=None, prefix="", in_prefetch=False):
+    """Return the `(select_related, prefetch_related)` lookups needed to render `serializer` without extra queries.
+
+    The lookups are derived from the serializer's declared fields: forward foreign keys and one-to-one relations are
+    joined with `select_related()`, while many-to-many and reverse relations (and anything nested beneath them) are
+    fetched with `prefetch_related()`.
+    """
+    model = model or serializer.Meta.model
+    select_related, prefetch_related = [], []
+
+    def add(lookup, many):
+        if many or in_prefetch:
+            prefetch_related.append(lookup)
+        else:
+            select_related.append(lookup)
+
+    for field in serializer.fields.values():
+        if field.write_only or not field.source or field.source == "*" or "." in field.source:
+            continue
+        try:
+            model_field = model._meta.get_field(field.source)  # pylint: disable=protected-access
+        except FieldDoesNotExist:
+            continue
+        if not model_field.is_relation or not _needs_related_object(field):
+            continue
+
+        lookup = f"{prefix}{field.source}"
+        many = model_field.many_to_many or model_field.one_to_many
+        add(lookup, many)
+
+        nested_serializer = _get_nested_serializer(field)
+        if nested_serializer is not None:
+            nested_select, nested_prefetch = get_serializer_related_lookups(
+                nested_serializer,
+                model=model_field.related_model,
+                prefix=f"{lookup}__",
+                in_prefetch=in_prefetch or many,
+            )
+            select_related.extend(nested_select)
+            prefetch_related.extend(nested_prefetch)
+
+    if "display" in serializer.fields:
+        for path in DISPLAY_RELATED_FIELDS.get(model._meta.label_lower, ()):  # pylint: disable=protected-access
+            add(f"{prefix}{path}", _is_many_path(model, path))
+
+    return select_related, prefetch_related
+
+
+def optimize_queryset_for_serializer(queryset, serializer):
+    """Apply the `select_related()` and `prefetch_related()` lookups needed to render `serializer` to `queryset`."""
+    select_related, prefetch_related = get_serializer_related_lookups(serializer, model=queryset.model)
+    if select_related:
+        queryset = queryset.select_related(*dict.fromkeys(select_related))
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*dict.fromkeys(prefetch_related))
+    return queryset
+
+
+def get_serializer_related_models(serializer, model=None):
+    """Return the set of models, other than `model` itself, whose data is rendered by `serializer`."""
+    model = model or serializer.Meta.model
+    select_related, prefetch_related = get_serializer_related_lookups(serializer, model=model)
+    related_models = set()
+    for path in select_related + prefetch_related:
+        related_model = model
+        for name in path.split("__"):
+            related_model = related_model._meta.get_field(name).related_model  # pylint: disable=protected-access
+            related_models.add(related_model)
+    return related_models
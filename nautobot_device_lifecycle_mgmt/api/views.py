@@ -1,7 +1,29 @@
 """API Views implementation for the Lifecycle Management plugin."""
+import json
+from abc import ABC, abstractmethod
+
+from django.contrib.auth import get_user_model
+from django.db.models import prefetch_related_objects
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.views import APIView
 
 from nautobot.core.api.views import ModelViewSet
+from nautobot.dcim.filters import DeviceFilterSet, InventoryItemFilterSet
+from nautobot.dcim.models import Device, InventoryItem
 from nautobot.extras.api.views import CustomFieldModelViewSet
+from nautobot.users.models import ObjectPermission
+
+from nautobot_device_lifecycle_mgmt.const import BULK_SOFTWARE_VALIDATION_MAX_OBJECTS
+from nautobot_device_lifecycle_mgmt.contract_forecast import ContractRenewalForecast
+from nautobot_device_lifecycle_mgmt.data_version import get_conditional_headers, set_conditional_headers
 
 from nautobot_device_lifecycle_mgmt.models import (
     HardwareLCM,
@@ -15,6 +37,10 @@ from nautobot_device_lifecycle_mgmt.models import (
     VulnerabilityLCM,
     DeviceSoftwareValidationResult,
     InventoryItemSoftwareValidationResult,
+    DeviceHardwareEoXResult,
+    InventoryItemHardwareEoXResult,
+    DeviceContractCoverage,
+    InventoryItemContractCoverage,
 )
 from nautobot_device_lifecycle_mgmt.filters import (
     HardwareLCMFilterSet,
@@ -28,8 +54,21 @@ from nautobot_device_lifecycle_mgmt.filters import (
     VulnerabilityLCMFilterSet,
     DeviceSoftwareValidationResultFilterSet,
     InventoryItemSoftwareValidationResultFilterSet,
+    DeviceHardwareEoXResultFilterSet,
+    InventoryItemHardwareEoXResultFilterSet,
+    DeviceContractCoverageFilterSet,
+    InventoryItemContractCoverageFilterSet,
 )
+from nautobot_device_lifecycle_mgmt.software_bulk import BulkDeviceSoftware, BulkInventoryItemSoftware
 
+from .filter_backends import LifecycleFilterBackend
+from .nested_serializers import (
+    NestedSoftwareImageLCMSerializer,
+    NestedSoftwareLCMSerializer,
+    NestedValidatedSoftwareLCMSerializer,
+)
+from .pagination import KeysetPagination
+from .utils import get_serializer_related_models, optimize_queryset_for_serializer
 from .serializers import (
     HardwareLCMSerializer,
     ContractLCMSerializer,
@@ -42,26 +81,128 @@ from .serializers import (
     VulnerabilityLCMSerializer,
     DeviceSoftwareValidationResultSerializer,
     InventoryItemSoftwareValidationResultSerializer,
+    DeviceHardwareEoXResultSerializer,
+    InventoryItemHardwareEoXResultSerializer,
+    DeviceContractCoverageSerializer,
+    InventoryItemContractCoverageSerializer,
+    BulkSoftwareRequestSerializer,
+    SoftwareImageResolutionRequestSerializer,
+    ContractRenewalForecastRequestSerializer,
 )
 
 
-class HardwareLCMView(ModelViewSet):
+class LifecycleViewSetMixin:
+    """Common behaviour for the plugin API viewsets."""
+
+    filter_backends = (LifecycleFilterBackend,)
+
+    def get_queryset(self):
+        """Join or prefetch every related object rendered by the serializer."""
+        queryset = super().get_queryset()
+        if getattr(self, "request", None) is None:
+            return queryset
+        return optimize_queryset_for_serializer(queryset, self.get_serializer())
+
+    def list(self, request, *args, **kwargs):
+        """List objects, answering conditional requests when the rendered data did not change."""
+        return self.get_conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve an object, answering conditional requests when the rendered data did not change."""
+        return self.get_conditional_response(super().retrieve, request, *args, **kwargs)
+
+    def get_data_version_models(self):
+        """Return the models whose data is rendered in the responses of this viewset."""
+        model = self.queryset.model
+        return {model, ObjectPermission, get_user_model()} | get_serializer_related_models(self.get_serializer(), model)
+
+    def get_conditional_response(self, handler, request, *args, **kwargs):
+        """Return a 304 response if the client has the current representation, else the response of `handler`."""
+        etag, last_modified = get_conditional_headers(self.get_data_version_models(), request)
+        if etag is None:
+            return handler(request, *args, **kwargs)
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code == 200:
+                set_conditional_headers(response, etag, last_modified)
+        return response
+
+    @property
+    def paginator(self):
+        """Use `KeysetPagination` instead of the default offset pagination when the request opts in to it."""
+        if not hasattr(self, "_paginator") and KeysetPagination.is_requested(getattr(self, "request", None)):
+            self._paginator = KeysetPagination()  # pylint: disable=attribute-defined-outside-init
+        return super().paginator
+
+
+class NDJSONStreamMixin:  # pylint: disable=too-few-public-methods
+    """Add a `stream/` list action returning the filtered queryset as newline-delimited JSON.
+
+    Objects are read through a server-side cursor and serialized in chunks, so the whole result set is
+    never held in memory and no count or offset queries are issued.
+    """
+
+    stream_chunk_size = 1000
+
+    @action(detail=False, methods=["get"], url_path="stream")
+    def stream(self, request):  # pylint: disable=unused-argument
+        """Stream all objects matching the request filters as NDJSON."""
+        queryset = self.filter_queryset(self.get_queryset())
+        response = StreamingHttpResponse(self._stream_ndjson(queryset), content_type="application/x-ndjson")
+        response["Cache-Control"] = "no-cache"
+        return response
+
+    def _stream_ndjson(self, queryset):
+        """Yield one JSON document per line for each object in `queryset`."""
+        # QuerySet.iterator() ignores prefetch_related(), so re-apply the lookups on each chunk instead.
+        prefetch_lookups = queryset._prefetch_related_lookups  # pylint: disable=protected-access
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+        chunk = []
+        for obj in queryset.iterator(chunk_size=self.stream_chunk_size):
+            chunk.append(obj)
+            if len(chunk) >= self.stream_chunk_size:
+                yield self._serialize_ndjson_chunk(chunk, prefetch_lookups, serializer_class, context)
+                chunk = []
+        if chunk:
+            yield self._serialize_ndjson_chunk(chunk, prefetch_lookups, serializer_class, context)
+
+    @staticmethod
+    def _serialize_ndjson_chunk(chunk, prefetch_lookups, serializer_class, context):
+        """Serialize a chunk of objects to NDJSON lines."""
+        if prefetch_lookups:
+            prefetch_related_objects(chunk, *prefetch_lookups)
+        data = serializer_class(chunk, many=True, context=context).data
+        return "".join(json.dumps(item, cls=JSONEncoder) + "\n" for item in data)
+
+
+class HardwareLCMView(LifecycleViewSetMixin, ModelViewSet):
     """CRUD operations set for the Hardware Lifecycle Management view."""
 
     queryset = HardwareLCM.objects.all()
     filterset_class = HardwareLCMFilterSet
     serializer_class = HardwareLCMSerializer
 
+    def get_queryset(self):
+        """Annotate the expiry of the notices as of the day of the request."""
+        return super().get_queryset().with_expiry()
 
-class ContractLCMView(ModelViewSet):
+
+class ContractLCMView(LifecycleViewSetMixin, ModelViewSet):
     """CRUD operations set for the Contract Lifecycle Management view."""
 
     queryset = ContractLCM.objects.all()
     filterset_class = ContractLCMFilterSet
     serializer_class = ContractLCMSerializer
 
+    def get_queryset(self):
+        """Annotate the expiry of the contracts as of the day of the request."""
+        return super().get_queryset().with_expiry()
+
 
-class ProviderLCMView(ModelViewSet):
+class ProviderLCMView(LifecycleViewSetMixin, ModelViewSet):
     """CRUD operations set for the Contract Provider Lifecycle Management view."""
 
     queryset = ProviderLCM.objects.all()
@@ -69,7 +210,7 @@ class ProviderLCMView(ModelViewSet):
     serializer_class = ProviderLCMSerializer
 
 
-class ContactLCMView(ModelViewSet):
+class ContactLCMView(LifecycleViewSetMixin, ModelViewSet):
     """CRUD operations set for the Contact Lifecycle Management view."""
 
     queryset = ContactLCM.objects.all()
@@ -77,7 +218,7 @@ class ContactLCMView(ModelViewSet):
     serializer_class = ContactLCMSerializer
 
 
-class SoftwareLCMViewSet(CustomFieldModelViewSet):
+class SoftwareLCMViewSet(LifecycleViewSetMixin, CustomFieldModelViewSet):
     """REST API viewset for SoftwareLCM records."""
 
     queryset = SoftwareLCM.objects.prefetch_related("software_images")
@@ -85,7 +226,7 @@ class SoftwareLCMViewSet(CustomFieldModelViewSet):
     filterset_class = SoftwareLCMFilterSet
 
 
-class SoftwareImageLCMViewSet(CustomFieldModelViewSet):
+class SoftwareImageLCMViewSet(LifecycleViewSetMixin, CustomFieldModelViewSet):
     """REST API viewset for SoftwareImageLCM records."""
 
     queryset = SoftwareImageLCM.objects.prefetch_related("software")
@@ -93,7 +234,7 @@ class SoftwareImageLCMViewSet(CustomFieldModelViewSet):
     filterset_class = SoftwareImageLCMFilterSet
 
 
-class ValidatedSoftwareLCMViewSet(CustomFieldModelViewSet):
+class ValidatedSoftwareLCMViewSet(LifecycleViewSetMixin, CustomFieldModelViewSet):
     """REST API viewset for ValidatedSoftwareLCM records."""
 
     queryset = ValidatedSoftwareLCM.objects.all()
@@ -101,7 +242,7 @@ class ValidatedSoftwareLCMViewSet(CustomFieldModelViewSet):
     filterset_class = ValidatedSoftwareLCMFilterSet
 
 
-class CVELCMViewSet(CustomFieldModelViewSet):
+class CVELCMViewSet(LifecycleViewSetMixin, CustomFieldModelViewSet):
     """REST API viewset for CVELCM records."""
 
     queryset = CVELCM.objects.all()
@@ -109,7 +250,7 @@ class CVELCMViewSet(CustomFieldModelViewSet):
     filterset_class = CVELCMFilterSet
 
 
-class VulnerabilityLCMViewSet(CustomFieldModelViewSet):
+class VulnerabilityLCMViewSet(LifecycleViewSetMixin, NDJSONStreamMixin, CustomFieldModelViewSet):
     """REST API viewset for VulnerabilityLCM records."""
 
     queryset = VulnerabilityLCM.objects.all()
@@ -120,7 +261,7 @@ class VulnerabilityLCMViewSet(CustomFieldModelViewSet):
     http_method_names = ["get", "put", "patch", "delete", "head", "options"]
 
 
-class DeviceSoftwareValidationResultListViewSet(CustomFieldModelViewSet):
+class DeviceSoftwareValidationResultListViewSet(LifecycleViewSetMixin, NDJSONStreamMixin, CustomFieldModelViewSet):
     """REST API viewset for DeviceSoftwareValidationResult records."""
 
     queryset = DeviceSoftwareValidationResult.objects.all()
@@ -131,7 +272,9 @@ class DeviceSoftwareValidationResultListViewSet(CustomFieldModelViewSet):
     http_method_names = ["get", "head", "options"]
 
 
-class InventoryItemSoftwareValidationResultListViewSet(CustomFieldModelViewSet):
+class InventoryItemSoftwareValidationResultListViewSet(
+    LifecycleViewSetMixin, NDJSONStreamMixin, CustomFieldModelViewSet
+):
     """REST API viewset for DeviceSoftwareValidationResult records."""
 
     queryset = InventoryItemSoftwareValidationResult.objects.all()
@@ -140,3 +283,219 @@ class InventoryItemSoftwareValidationResultListViewSet(CustomFieldModelViewSet):
 
     # Disabling POST as these should only be created via Job.
     http_method_names = ["get", "head", "options"]
+
+
+class DeviceHardwareEoXResultListViewSet(LifecycleViewSetMixin, NDJSONStreamMixin, CustomFieldModelViewSet):
+    """REST API viewset for DeviceHardwareEoXResult records."""
+
+    queryset = DeviceHardwareEoXResult.objects.all()
+    serializer_class = DeviceHardwareEoXResultSerializer
+    filterset_class = DeviceHardwareEoXResultFilterSet
+
+    # Disabling POST as these should only be created via Job.
+    http_method_names = ["get", "head", "options"]
+
+
+class InventoryItemHardwareEoXResultListViewSet(LifecycleViewSetMixin, NDJSONStreamMixin, CustomFieldModelViewSet):
+    """REST API viewset for InventoryItemHardwareEoXResult records."""
+
+    queryset = InventoryItemHardwareEoXResult.objects.all()
+    serializer_class = InventoryItemHardwareEoXResultSerializer
+    filterset_class = InventoryItemHardwareEoXResultFilterSet
+
+    # Disabling POST as these should only be created via Job.
+    http_method_names = ["get", "head", "options"]
+
+
+class DeviceContractCoverageListViewSet(LifecycleViewSetMixin, NDJSONStreamMixin, CustomFieldModelViewSet):
+    """REST API viewset for DeviceContractCoverage records."""
+
+    queryset = DeviceContractCoverage.objects.all()
+    serializer_class = DeviceContractCoverageSerializer
+    filterset_class = DeviceContractCoverageFilterSet
+
+    # Disabling POST as these should only be created via Job.
+    http_method_names = ["get", "head", "options"]
+
+
+class InventoryItemContractCoverageListViewSet(LifecycleViewSetMixin, NDJSONStreamMixin, CustomFieldModelViewSet):
+    """REST API viewset for InventoryItemContractCoverage records."""
+
+    queryset = InventoryItemContractCoverage.objects.all()
+    serializer_class = InventoryItemContractCoverageSerializer
+    filterset_class = InventoryItemContractCoverageFilterSet
+
+    # Disabling POST as these should only be created via Job.
+    http_method_names = ["get", "head", "options"]
+
+
+class BulkSoftwareAPIView(APIView, ABC):
+    """Base view evaluating a batch of Devices and InventoryItems, given by ID and/or by filter parameters.
+
+    Each set of objects is evaluated with a fixed number of queries and nothing is written to the database.
+    """
+
+    permission_classes = [IsAuthenticated]
+    request_serializer_class = BulkSoftwareRequestSerializer
+    required_permission = None
+
+    # (IDs request key, filter request key, model, filterset class, bulk software class)
+    item_types = (
+        ("devices", "device_filter", Device, DeviceFilterSet, BulkDeviceSoftware),
+        ("inventory_items", "inventory_item_filter", InventoryItem, InventoryItemFilterSet, BulkInventoryItemSoftware),
+    )
+
+    def post(self, request):
+        """Evaluate each requested set of objects."""
+        if not request.user.has_perm(self.required_permission):
+            raise PermissionDenied()
+
+        request_serializer = self.request_serializer_class(data=request.data, context={"request": request})
+        request_serializer.is_valid(raise_exception=True)
+        validated_data = request_serializer.validated_data
+
+        self._serialized = {}  # pylint: disable=attribute-defined-outside-init
+        data = {}
+        for key, filter_key, model, filterset_class, bulk_class in self.item_types:
+            items_qs = self.get_items_queryset(validated_data, key, filter_key, model, filterset_class)
+            if items_qs is None:
+                continue
+            bulk_software = bulk_class(
+                items_qs[: BULK_SOFTWARE_VALIDATION_MAX_OBJECTS + 1],
+                validated_software_qs=ValidatedSoftwareLCM.objects.restrict(request.user, "view"),
+                software_qs=SoftwareLCM.objects.restrict(request.user, "view"),
+                software_image_qs=SoftwareImageLCM.objects.restrict(request.user, "view"),
+            )
+            if len(bulk_software.items) > BULK_SOFTWARE_VALIDATION_MAX_OBJECTS:
+                raise ValidationError(
+                    {key: f"At most {BULK_SOFTWARE_VALIDATION_MAX_OBJECTS} objects can be evaluated per request."}
+                )
+            data[key] = self.get_results(bulk_software, validated_data)
+
+        return Response(data)
+
+    def get_items_queryset(self, validated_data, key, filter_key, model, filterset_class):
+        """Return the queryset of objects to evaluate for `key`, or None if none were requested."""
+        if key not in validated_data and filter_key not in validated_data:
+            return None
+
+        items_qs = model.objects.restrict(self.request.user, "view")
+        if key in validated_data:
+            items_qs = items_qs.filter(pk__in=validated_data[key])
+        if filter_key in validated_data:
+            filterset = filterset_class(validated_data[filter_key], items_qs)
+            if not filterset.is_valid():
+                raise ValidationError({filter_key: filterset.errors})
+            items_qs = filterset.qs
+        return items_qs
+
+    @abstractmethod
+    def get_results(self, bulk_software, validated_data):
+        """Return the list of results rendered for the objects of `bulk_software`."""
+
+    def serialize(self, serializer_class, obj):
+        """Serialize `obj` with `serializer_class`, once per request whatever the number of objects referencing it."""
+        if obj is None:
+            return None
+        key = (serializer_class, obj.pk)
+        if key not in self._serialized:
+            self._serialized[key] = serializer_class(obj, context={"request": self.request}).data
+        return self._serialized[key]
+
+
+class SoftwareValidationView(BulkSoftwareAPIView):
+    """Validate the software of a batch of Devices and InventoryItems without storing any validation result."""
+
+    required_permission = "nautobot_device_lifecycle_mgmt.view_validatedsoftwarelcm"
+
+    def get_view_name(self):
+        """Return the name shown in the browsable API."""
+        return "Software Validation"
+
+    @extend_schema(request=BulkSoftwareRequestSerializer, responses={200: OpenApiTypes.OBJECT})
+    def post(self, request):
+        """Return the assigned software, applicable validated software and validation status of each object."""
+        return super().post(request)
+
+    def get_results(self, bulk_software, validated_data):
+        """Return the software validation result of each object."""
+        return [
+            {
+                "id": item_pk,
+                "name": bulk_software.items[item_pk]["name"],
+                "software": self.serialize(NestedSoftwareLCMSerializer, result["software"]),
+                "validated_software": [
+                    {**self.serialize(NestedValidatedSoftwareLCMSerializer, validated_software), "weight": weight}
+                    for validated_software, weight in result["validated_software"]
+                ],
+                "is_validated": result["is_validated"],
+                "is_preferred_validated": result["is_preferred_validated"],
+            }
+            for item_pk, result in bulk_software.get_results().items()
+        ]
+
+
+class SoftwareImageResolutionView(BulkSoftwareAPIView):
+    """Resolve the software image to use on each of a batch of Devices and InventoryItems."""
+
+    request_serializer_class = SoftwareImageResolutionRequestSerializer
+    required_permission = "nautobot_device_lifecycle_mgmt.view_softwareimagelcm"
+
+    def get_view_name(self):
+        """Return the name shown in the browsable API."""
+        return "Software Image Resolution"
+
+    @extend_schema(request=SoftwareImageResolutionRequestSerializer, responses={200: OpenApiTypes.OBJECT})
+    def post(self, request):
+        """Return the target software and the software image to use on each object."""
+        return super().post(request)
+
+    def get_results(self, bulk_software, validated_data):
+        """Return the resolved software image of each object."""
+        if "software" in validated_data:
+            software_map = dict.fromkeys(bulk_software.items, validated_data["software"])
+        else:
+            software_map = bulk_software.get_software_map()
+        image_map = bulk_software.get_software_image_map(software_map)
+        return [
+            {
+                "id": item_pk,
+                "name": item["name"],
+                "software": self.serialize(NestedSoftwareLCMSerializer, software_map.get(item_pk)),
+                "software_image": self.serialize(NestedSoftwareImageLCMSerializer, image_map.get(item_pk)),
+            }
+            for item_pk, item in bulk_software.items.items()
+        ]
+
+
+class ContractRenewalForecastView(APIView):
+    """Number and summed cost of the contracts ending in each upcoming month or quarter."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get_view_name(self):
+        """Return the name shown in the browsable API."""
+        return "Contract Renewal Forecast"
+
+    @extend_schema(parameters=[ContractRenewalForecastRequestSerializer], responses={200: OpenApiTypes.OBJECT})
+    def get(self, request):
+        """Return the contracts ending in each period of the forecast, broken down by group and currency."""
+        if not request.user.has_perm("nautobot_device_lifecycle_mgmt.view_contractlcm"):
+            raise PermissionDenied()
+
+        request_serializer = ContractRenewalForecastRequestSerializer(data=request.query_params)
+        request_serializer.is_valid(raise_exception=True)
+        forecast = ContractRenewalForecast(
+            ContractLCM.objects.restrict(request.user, "view"),
+            devices_qs=Device.objects.restrict(request.user, "view"),
+            **request_serializer.validated_data,
+        )
+        return Response(
+            {
+                **request_serializer.validated_data,
+                "start": forecast.start,
+                "end": forecast.end,
+                "periods": forecast.get_periods(),
+                "results": forecast.get_rows(),
+            }
+        )
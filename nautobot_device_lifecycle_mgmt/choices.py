@@ -98,3 +98,45 @@ class CVESeverityChoices(ChoiceSet):
         (LOW, LOW),
         (NONE, NONE),
     )
+
+
+class UpgradePlanStatusChoices(ChoiceSet):
+    """Choices for the upgrade status of a device in the fleet upgrade plan."""
+
+    CURRENT = "current"
+    UPGRADE = "upgrade"
+    NO_TARGET = "no-target"
+
+    CHOICES = (
+        (CURRENT, "On Target Software"),
+        (UPGRADE, "Upgrade Required"),
+        (NO_TARGET, "No Validated Software"),
+    )
+
+
+class ContractForecastPeriodChoices(ChoiceSet):
+    """Choices for the periods grouping the contract end dates of the renewal forecast."""
+
+    MONTH = "month"
+    QUARTER = "quarter"
+
+    CHOICES = (
+        (MONTH, "Month"),
+        (QUARTER, "Quarter"),
+    )
+
+
+class ContractForecastGroupChoices(ChoiceSet):
+    """Choices for the breakdown of the contract renewal forecast within each period."""
+
+    PROVIDER = "provider"
+    CURRENCY = "currency"
+    CONTRACT_TYPE = "contract_type"
+    SITE = "site"
+
+    CHOICES = (
+        (PROVIDER, "Vendor"),
+        (CURRENCY, "Currency"),
+        (CONTRACT_TYPE, "Contract Type"),
+        (SITE, "Site of Covered Devices"),
+    )
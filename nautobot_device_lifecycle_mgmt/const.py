@@ -25,3 +25,10 @@ class URL:  # pylint: disable=too-few-public-methods
 
         List = "plugins:nautobot_device_lifecycle_mgmt:validatedsoftwarelcm_list"
         View = "plugins:nautobot_device_lifecycle_mgmt:validatedsoftwarelcm"
+
+
+# Maximum number of Devices, and of InventoryItems, evaluated by a single bulk software validation API request.
+BULK_SOFTWARE_VALIDATION_MAX_OBJECTS = 50000
+
+# Maximum number of years covered by the contract renewal forecast.
+CONTRACT_FORECAST_MAX_YEARS = 10
@@ -0,0 +1,124 @@
+"""Computation of the support contract coverage of Devices and Inventory Items."""
+
+import datetime
+from collections import defaultdict
+
+from nautobot.dcim.models import Device, InventoryItem
+from nautobot.extras.models import RelationshipAssociation
+
+from nautobot_device_lifecycle_mgmt import choices
+from nautobot_device_lifecycle_mgmt.models import ContractLCM, DeviceContractCoverage, InventoryItemContractCoverage
+from nautobot_device_lifecycle_mgmt.report_results import get_run_fields, update_report_results
+
+
+# Fields of the contract coverage results computed by `get_contract_coverage()`.
+CONTRACT_COVERAGE_FIELDS = (
+    "is_covered",
+    "contract",
+    "provider",
+    "support_level",
+    "end",
+    "gap_start",
+    "gap_end",
+    "contract_count",
+)
+
+
+def get_contract_coverage(contracts, today):
+    """Return the `{field: value}` coverage, on `today`, of an object related to the `contracts`.
+
+    `contracts` are dicts with the `pk`, `start`, `end`, `provider_id` and `support_level` of ContractLCM records.
+    A contract covers the days from its start, or forever if it has none, to the day before its end, or forever if it
+    has none. The active contract is the covering contract ending last. The coverage gap is the first period without
+    any covering contract from `today` on: `gap_start` is None when the coverage never ends, and `gap_end` is None
+    when no later contract starts after the gap.
+    """
+    active = [
+        contract
+        for contract in contracts
+        if (contract["start"] is None or contract["start"] <= today)
+        and (contract["end"] is None or contract["end"] > today)
+    ]
+    contract = max(
+        active, key=lambda contract: (contract["end"] is None, contract["end"] or datetime.date.min), default=None
+    )
+
+    # Walk the contracts by start date, extending the coverage with each contract starting before it lapses.
+    gap_start = today
+    for next_contract in sorted(contracts, key=lambda contract: contract["start"] or datetime.date.min):
+        if next_contract["start"] is not None and next_contract["start"] > gap_start:
+            break
+        if next_contract["end"] is None:
+            gap_start = None
+            break
+        gap_start = max(gap_start, next_contract["end"])
+
+    next_starts = [
+        contract["start"]
+        for contract in contracts
+        if gap_start is not None and contract["start"] is not None and contract["start"] > gap_start
+    ]
+    return {
+        "is_covered": contract is not None,
+        "contract": contract["pk"] if contract else None,
+        "provider": contract["provider_id"] if contract else None,
+        "support_level": contract["support_level"] if contract else None,
+        "end": contract["end"] if contract else None,
+        "gap_start": gap_start,
+        "gap_end": min(next_starts) - datetime.timedelta(days=1) if next_starts else None,
+        "contract_count": len(contracts),
+    }
+
+
+def get_contract_coverages(relationship_slug, object_pks, today):
+    """Return `{object pk: coverage}` of the `object_pks`, from the contracts related to them by `relationship_slug`.
+
+    The contracts are loaded with one query on the relationship associations and one on the contracts, and are
+    given to `get_contract_coverage()` in the ContractLCM ordering, which breaks the ties between active contracts.
+    """
+    associations = RelationshipAssociation.objects.filter(relationship__slug=relationship_slug)
+    contract_pks = defaultdict(list)
+    for object_pk, contract_pk in associations.values_list("destination_id", "source_id").order_by():
+        contract_pks[object_pk].append(contract_pk)
+
+    contracts = {
+        contract["pk"]: contract
+        for contract in ContractLCM.objects.filter(pk__in=associations.values("source_id")).values(
+            "pk", "start", "end", "provider_id", "support_level"
+        )
+    }
+    contract_order = {pk: index for index, pk in enumerate(contracts)}
+    return {
+        object_pk: get_contract_coverage(
+            sorted(
+                (contracts[pk] for pk in contract_pks.get(object_pk, ()) if pk in contracts),
+                key=lambda contract: contract_order[contract["pk"]],
+            ),
+            today,
+        )
+        for object_pk in object_pks
+    }
+
+
+def update_device_contract_coverage(last_run, run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN):
+    """Refresh the DeviceContractCoverage of every Device, including the Devices without any contract."""
+    coverages = get_contract_coverages(
+        "contractlcm-to-device", Device.objects.values_list("pk", flat=True).order_by(), last_run.date()
+    )
+    return update_report_results(
+        DeviceContractCoverage, "device", CONTRACT_COVERAGE_FIELDS, coverages, get_run_fields(last_run, run_type)
+    )
+
+
+def update_inventory_item_contract_coverage(last_run, run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN):
+    """Refresh the InventoryItemContractCoverage of every Inventory Item, including the items without any contract."""
+    coverages = get_contract_coverages(
+        "contractlcm-to-inventoryitem", InventoryItem.objects.values_list("pk", flat=True).order_by(), last_run.date()
+    )
+    return update_report_results(
+        InventoryItemContractCoverage,
+        "inventory_item",
+        CONTRACT_COVERAGE_FIELDS,
+        coverages,
+        get_run_fields(last_run, run_type),
+    )
@@ -0,0 +1,182 @@
+"""Renewal forecast of the support contracts: number and cost of the contracts ending in each upcoming period."""
+
+import datetime
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth, TruncQuarter
+from nautobot.dcim.models import Device, Site
+from nautobot.extras.models import RelationshipAssociation
+
+from nautobot_device_lifecycle_mgmt.choices import ContractForecastGroupChoices, ContractForecastPeriodChoices
+from nautobot_device_lifecycle_mgmt.data_version import get_data_version_token
+from nautobot_device_lifecycle_mgmt.models import ContractLCM, ProviderLCM
+
+
+CONTRACT_FORECAST_CACHE_KEY = "nautobot_device_lifecycle_mgmt:contract_forecast:{}"
+
+# Cached forecasts are keyed by the data version of the models they read, so they are never served once outdated;
+# the timeout only bounds the memory used by the forecasts of past data versions.
+CONTRACT_FORECAST_CACHE_TIMEOUT = 24 * 60 * 60
+CONTRACT_FORECAST_DATA_VERSION_MODELS = (ContractLCM, ProviderLCM)
+CONTRACT_FORECAST_SITE_DATA_VERSION_MODELS = (RelationshipAssociation, Device, Site)
+
+# Length, in months, and database truncation function of each forecast period.
+CONTRACT_FORECAST_PERIODS = {
+    ContractForecastPeriodChoices.MONTH: (1, TruncMonth),
+    ContractForecastPeriodChoices.QUARTER: (3, TruncQuarter),
+}
+
+# ContractLCM field grouped on for each breakdown. Sites are reached through the devices related to the contracts.
+CONTRACT_FORECAST_GROUP_FIELDS = {
+    ContractForecastGroupChoices.PROVIDER: "provider__name",
+    ContractForecastGroupChoices.CURRENCY: None,
+    ContractForecastGroupChoices.CONTRACT_TYPE: "contract_type",
+    ContractForecastGroupChoices.SITE: "source_for_associations__destination_dcim_device__site__name",
+}
+
+
+def add_months(date, months):
+    """Return the first day of the month `months` months after the month of `date`."""
+    month_index = date.year * 12 + date.month - 1 + months
+    return datetime.date(month_index // 12, month_index % 12 + 1, 1)
+
+
+class ContractRenewalForecast:
+    """Number and summed cost of the contracts ending in each month or quarter of the next `years` years.
+
+    The contracts of each period are broken down by vendor, contract type or site of the devices they cover, and
+    always by currency, as costs in different currencies cannot be summed. A contract covering devices of several
+    sites is counted in each of those sites. The forecast starts with the current period, including its contracts
+    already ended.
+
+    The contracts are grouped in the database, the site breakdown summing the distinct contract and site pairs
+    returned by the database. The rows are cached until the contracts or vendors change, or for the site breakdown,
+    until the devices, sites or relationship associations change.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        contracts_qs,
+        *,
+        period=ContractForecastPeriodChoices.QUARTER,
+        years=1,
+        group_by=ContractForecastGroupChoices.PROVIDER,
+        devices_qs=None,
+        today=None,
+    ):
+        """Initialize ContractRenewalForecast object."""
+        self.contracts_qs = contracts_qs
+        self.period = period
+        self.years = years
+        self.group_by = group_by
+        self.devices_qs = devices_qs if devices_qs is not None else Device.objects.all()
+
+        today = today or datetime.date.today()
+        self.start = add_months(today, -((today.month - 1) % self.months))
+        self.end = add_months(self.start, 12 * years)
+
+    @property
+    def months(self):
+        """Return the length of the forecast periods, in months."""
+        return CONTRACT_FORECAST_PERIODS[self.period][0]
+
+    @property
+    def trunc_function(self):
+        """Return the database function truncating a date to the start of its forecast period."""
+        return CONTRACT_FORECAST_PERIODS[self.period][1]
+
+    @property
+    def columns(self):
+        """Return the keys of the forecast rows."""
+        if self.group_by == ContractForecastGroupChoices.CURRENCY:
+            return ("period", "currency", "contract_count", "total_cost")
+        return ("period", self.group_by, "currency", "contract_count", "total_cost")
+
+    def get_periods(self):
+        """Return the first day of each period of the forecast."""
+        return [add_months(self.start, months) for months in range(0, 12 * self.years, self.months)]
+
+    def get_period_label(self, period_start):
+        """Return the name of the period starting on `period_start`, as `YYYY-MM` or `YYYY-Qn`."""
+        if self.period == ContractForecastPeriodChoices.QUARTER:
+            return f"{period_start.year}-Q{(period_start.month - 1) // 3 + 1}"
+        return period_start.strftime("%Y-%m")
+
+    def get_queryset(self):
+        """Return the query grouping the contracts ending within the forecast.
+
+        The site breakdown is not summed by the query, which returns each distinct contract and site pair instead.
+        """
+        group_field = CONTRACT_FORECAST_GROUP_FIELDS[self.group_by]
+        group_fields = ("period", group_field, "currency") if group_field else ("period", "currency")
+        contracts_qs = self.contracts_qs.filter(end__gte=self.start, end__lt=self.end).annotate(
+            period=self.trunc_function("end")
+        )
+        if self.group_by == ContractForecastGroupChoices.SITE:
+            # Both conditions apply to the same association, which the site is then read from.
+            contracts_qs = contracts_qs.filter(
+                source_for_associations__relationship__slug="contractlcm-to-device",
+                source_for_associations__destination_id__in=self.devices_qs.values("pk"),
+            )
+            return contracts_qs.order_by().values("pk", "cost", *group_fields).distinct()
+        return (
+            contracts_qs.order_by()
+            .values(*group_fields)
+            .annotate(contract_count=Count("pk"), total_cost=Sum("cost"))
+            .order_by(*group_fields)
+        )
+
+    def get_rows(self):
+        """Return the forecast rows, from the cache if the data did not change since they were computed."""
+        models = CONTRACT_FORECAST_DATA_VERSION_MODELS
+        if self.group_by == ContractForecastGroupChoices.SITE:
+            models += CONTRACT_FORECAST_SITE_DATA_VERSION_MODELS
+        token = get_data_version_token(models)
+        if token is None:
+            return self.compute_rows()
+
+        # The query covers the forecast dates, breakdown and permission constraints of the contracts and devices.
+        sql, params = self.get_queryset().query.sql_with_params()
+        key_source = "|".join((token, sql, repr(params)))
+        key = CONTRACT_FORECAST_CACHE_KEY.format(hashlib.md5(key_source.encode()).hexdigest())  # nosec
+        rows = cache.get(key)
+        if rows is None:
+            rows = self.compute_rows()
+            cache.set(key, rows, timeout=CONTRACT_FORECAST_CACHE_TIMEOUT)
+        return rows
+
+    def compute_rows(self):
+        """Return the forecast rows, as dicts with the `columns` keys, ordered by period and group."""
+        group_field = CONTRACT_FORECAST_GROUP_FIELDS[self.group_by]
+        if self.group_by != ContractForecastGroupChoices.SITE:
+            return [
+                {
+                    "period": row["period"],
+                    **({self.group_by: row[group_field]} if group_field else {}),
+                    "currency": row["currency"],
+                    "contract_count": row["contract_count"],
+                    "total_cost": row["total_cost"],
+                }
+                for row in self.get_queryset()
+            ]
+
+        rows = {}
+        for pair in self.get_queryset():
+            row_key = (pair["period"], pair[group_field], pair["currency"])
+            row = rows.setdefault(
+                row_key,
+                {
+                    "period": pair["period"],
+                    "site": pair[group_field],
+                    "currency": pair["currency"],
+                    "contract_count": 0,
+                    "total_cost": None,
+                },
+            )
+            row["contract_count"] += 1
+            if pair["cost"] is not None:
+                row["total_cost"] = (row["total_cost"] or 0) + pair["cost"]
+        ordered_keys = sorted(rows, key=lambda row_key: (row_key[0], row_key[1] or "", row_key[2] or ""))
+        return [rows[row_key] for row_key in ordered_keys]
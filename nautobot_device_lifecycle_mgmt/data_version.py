@@ -0,0 +1,111 @@
+"""Per-model data version tokens, used to answer conditional (ETag/Last-Modified) requests and to key cached data."""
+import hashlib
+import time
+import uuid
+from datetime import date
+
+from django.core.cache import cache
+from django.utils.http import http_date, quote_etag
+
+# Models whose writes are tracked. A view can only be answered with a 304 when all the models it renders are tracked.
+DATA_VERSION_MODELS = (
+    "nautobot_device_lifecycle_mgmt.hardwarelcm",
+    "nautobot_device_lifecycle_mgmt.contractlcm",
+    "nautobot_device_lifecycle_mgmt.providerlcm",
+    "nautobot_device_lifecycle_mgmt.contactlcm",
+    "nautobot_device_lifecycle_mgmt.softwarelcm",
+    "nautobot_device_lifecycle_mgmt.softwareimagelcm",
+    "nautobot_device_lifecycle_mgmt.validatedsoftwarelcm",
+    "nautobot_device_lifecycle_mgmt.cvelcm",
+    "nautobot_device_lifecycle_mgmt.vulnerabilitylcm",
+    "nautobot_device_lifecycle_mgmt.devicesoftwarevalidationresult",
+    "nautobot_device_lifecycle_mgmt.inventoryitemsoftwarevalidationresult",
+    "nautobot_device_lifecycle_mgmt.devicehardwareeoxresult",
+    "nautobot_device_lifecycle_mgmt.inventoryitemhardwareeoxresult",
+    "nautobot_device_lifecycle_mgmt.devicecontractcoverage",
+    "nautobot_device_lifecycle_mgmt.inventoryitemcontractcoverage",
+    # Core models rendered as nested or related objects by the plugin views.
+    "dcim.device",
+    "dcim.devicerole",
+    "dcim.devicetype",
+    "dcim.inventoryitem",
+    "dcim.manufacturer",
+    "dcim.platform",
+    "dcim.site",
+    "extras.relationshipassociation",
+    "extras.status",
+    "extras.tag",
+    # Permission and user preference changes alter what a given user is shown.
+    "users.objectpermission",
+    "users.user",
+)
+
+DATA_VERSION_CACHE_KEY = "nautobot_device_lifecycle_mgmt:data_version:{}"
+
+
+def _model_label(model):
+    return model._meta.label_lower  # pylint: disable=protected-access
+
+
+def is_tracked(model):
+    """Return True if writes to `model` bump its data version."""
+    return _model_label(model) in DATA_VERSION_MODELS
+
+
+def get_data_version(model):
+    """Return the `(token, timestamp)` data version of `model`, initializing it if needed."""
+    key = DATA_VERSION_CACHE_KEY.format(_model_label(model))
+    version = cache.get(key)
+    if version is None:
+        # add() keeps the first version stored if several processes initialize it concurrently.
+        cache.add(key, (uuid.uuid4().hex, time.time()), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_data_version(model):
+    """Record that the data of `model` changed."""
+    cache.set(DATA_VERSION_CACHE_KEY.format(_model_label(model)), (uuid.uuid4().hex, time.time()), timeout=None)
+
+
+def get_data_version_token(models):
+    """Return a token changing whenever any of `models` is written to, or None if any of them is not tracked."""
+    models = sorted(set(models), key=_model_label)
+    if not models or not all(is_tracked(model) for model in models):
+        return None
+    return "|".join(get_data_version(model)[0] for model in models)
+
+
+def get_conditional_headers(models, request):
+    """Return the `(etag, last_modified)` of the response to `request`, rendering the data of `models`.
+
+    The ETag changes whenever any of the models is written to, and is specific to the requesting user, the full
+    request path and the accepted content type. `last_modified` is the timestamp of the latest write. Both also
+    change at local midnight, as the rendered data can depend on the current date (validity, expiry, days to expiry).
+    Both are None if any of the models is not tracked.
+    """
+    models = sorted(set(models), key=_model_label)
+    if not models or not all(is_tracked(model) for model in models):
+        return None, None
+
+    today = date.today()
+    versions = [get_data_version(model) for model in models]
+    etag_source = "|".join(
+        [token for token, _ in versions]
+        + [
+            today.isoformat(),
+            str(getattr(request.user, "pk", None)),
+            request.get_full_path(),
+            request.META.get("HTTP_ACCEPT", ""),
+        ]
+    )
+    etag = quote_etag(hashlib.md5(etag_source.encode()).hexdigest())  # nosec
+    midnight = time.mktime(today.timetuple())
+    return etag, int(max([midnight] + [timestamp for _, timestamp in versions]))
+
+
+def set_conditional_headers(response, etag, last_modified):
+    """Add the ETag and Last-Modified headers to `response`."""
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    return response
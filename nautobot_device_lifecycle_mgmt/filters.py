@@ -2,10 +2,11 @@
 import datetime
 
 import django_filters
-from django.db.models import Q
+from django.db.models import Case, IntegerField, Q, Value, When
 from nautobot.dcim.models import Device, DeviceRole, DeviceType, InventoryItem, Platform, Region, Site, Manufacturer
 from nautobot.extras.filters import StatusFilter, StatusModelFilterSetMixin, TagFilter
 from nautobot.extras.models import Tag
+from nautobot.utilities.filters import MultiValueCharFilter, MultiValueUUIDFilter
 
 try:
     from nautobot.extras.filters import NautobotFilterSet
@@ -22,8 +23,12 @@ from nautobot_device_lifecycle_mgmt.models import (
     CVELCM,
     ContactLCM,
     ContractLCM,
+    DeviceContractCoverage,
+    DeviceHardwareEoXResult,
     DeviceSoftwareValidationResult,
     HardwareLCM,
+    InventoryItemContractCoverage,
+    InventoryItemHardwareEoXResult,
     InventoryItemSoftwareValidationResult,
     ProviderLCM,
     SoftwareImageLCM,
@@ -31,6 +36,52 @@ from nautobot_device_lifecycle_mgmt.models import (
     ValidatedSoftwareLCM,
     VulnerabilityLCM,
 )
+from nautobot_device_lifecycle_mgmt.search import (
+    combine_search_q,
+    get_date_search_q,
+    get_decimal_search_q,
+    get_related_search_q,
+    get_text_search_q,
+)
+from nautobot_device_lifecycle_mgmt.software_bulk import BulkDeviceSoftware, BulkInventoryItemSoftware
+from nautobot_device_lifecycle_mgmt.versions import get_version_key
+
+
+def get_filter_devices(name, value):
+    """Return the Devices selected by the `device_name` or `device_id` filter values, or None if there are none."""
+    if name == "device_name":
+        value = [device_name.strip() for device_name in value if device_name.strip()]
+        return Device.objects.filter(name__in=value) if value else None
+    return Device.objects.filter(pk__in=value)
+
+
+def filter_software_images(queryset, bulk_software):
+    """Keep the SoftwareImageLCM of `queryset` to use on any of the objects of `bulk_software`."""
+    image_pks = {
+        image.pk for candidates in bulk_software.get_software_image_candidates().values() for image in candidates
+    }
+    return queryset.filter(pk__in=image_pks)
+
+
+def filter_validated_software(queryset, bulk_software):
+    """Keep the ValidatedSoftwareLCM of `queryset` applying to any of the objects of `bulk_software`.
+
+    The validated software is ordered by its lowest weight over the objects, as `get_for_object()` orders it for a
+    single object, then by start date.
+    """
+    weight_map = bulk_software.get_validated_software_weight_map()
+    if not weight_map:
+        return queryset.none()
+    return (
+        queryset.filter(pk__in=weight_map)
+        .annotate(
+            weight=Case(
+                *(When(pk=vs_pk, then=Value(weight)) for vs_pk, weight in weight_map.items()),
+                output_field=IntegerField(),
+            )
+        )
+        .order_by("weight", "start")
+    )
 
 
 class HardwareLCMFilterSet(NautobotFilterSet):
@@ -97,16 +148,12 @@ class HardwareLCMFilterSet(NautobotFilterSet):
         if not value.strip():
             return queryset
 
-        qs_filter = Q(end_of_sale__icontains=value) | Q(end_of_support__icontains=value)
+        qs_filter = combine_search_q(get_date_search_q(value, ("end_of_sale", "end_of_support")))
         return queryset.filter(qs_filter)
 
     def expired_search(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
         """Perform the filtered search."""
-        today = datetime.datetime.today().date()
-        lookup = "gte" if not value else "lt"
-
-        qs_filter = Q(**{f"end_of_sale__{lookup}": today}) | Q(**{f"end_of_support__{lookup}": today})
-        return queryset.filter(qs_filter)
+        return queryset.filter_expired(value)
 
 
 class SoftwareLCMFilterSet(NautobotFilterSet):
@@ -126,6 +173,10 @@ class SoftwareLCMFilterSet(NautobotFilterSet):
     )
     release_date = django_filters.DateTimeFromToRangeFilter()
     end_of_support = django_filters.DateTimeFromToRangeFilter()
+    version__gte = django_filters.CharFilter(method="version_range", label="Version (newer or equal)")
+    version__gt = django_filters.CharFilter(method="version_range", label="Version (newer)")
+    version__lte = django_filters.CharFilter(method="version_range", label="Version (older or equal)")
+    version__lt = django_filters.CharFilter(method="version_range", label="Version (older)")
 
     class Meta:
         """Meta attributes for filter."""
@@ -145,14 +196,19 @@ class SoftwareLCMFilterSet(NautobotFilterSet):
         if not value.strip():
             return queryset
 
-        qs_filter = (
-            Q(version__icontains=value)
-            | Q(alias__icontains=value)
-            | Q(release_date__icontains=value)
-            | Q(end_of_support__icontains=value)
+        qs_filter = combine_search_q(
+            get_text_search_q(value, ("version", "alias")),
+            get_date_search_q(value, ("release_date", "end_of_support")),
         )
         return queryset.filter(qs_filter)
 
+    def version_range(self, queryset, name, value):  # pylint: disable=no-self-use
+        """Filter on the natural order of versions, comparing version sort keys."""
+        if not value.strip():
+            return queryset
+        _, lookup = name.split("__")
+        return queryset.filter(**{f"version_sort_key__{lookup}": get_version_key(value)})
+
 
 class SoftwareImageLCMFilterSet(NautobotFilterSet):
     """Filter for SoftwareImageLCM."""
@@ -202,9 +258,9 @@ class SoftwareImageLCMFilterSet(NautobotFilterSet):
         to_field_name="slug",
         label="Object Tags (slug)",
     )
-    device_name = django_filters.CharFilter(method="device", label="Device Name")
-    device_id = django_filters.CharFilter(method="device", label="Device ID")
-    inventory_item_id = django_filters.CharFilter(method="inventory_item", label="InventoryItem ID")
+    device_name = MultiValueCharFilter(method="device", label="Device Name")
+    device_id = MultiValueUUIDFilter(method="device", label="Device ID")
+    inventory_item_id = MultiValueUUIDFilter(method="inventory_item", label="InventoryItem ID")
 
     class Meta:
         """Meta attributes for filter."""
@@ -229,43 +285,21 @@ class SoftwareImageLCMFilterSet(NautobotFilterSet):
         if not value.strip():
             return queryset
 
-        qs_filter = Q(image_file_name__icontains=value) | Q(software__version__icontains=value)
+        qs_filter = get_text_search_q(value, ("image_file_name",)) | get_related_search_q(
+            value, "software", SoftwareLCM.objects.all(), ("version",)
+        )
         return queryset.filter(qs_filter)
 
     def device(self, queryset, name, value):  # pylint: disable=no-self-use
-        """Search for software image for a given device."""
-        value = value.strip()
-        if not value:
+        """Search for the software images of the given devices."""
+        devices = get_filter_devices(name, value)
+        if devices is None:
             return queryset
-
-        if name == "device_name":
-            devices = Device.objects.filter(name=value)
-        elif name == "device_id":
-            devices = Device.objects.filter(id=value)
-        else:
-            devices = Device.objects.none()
-
-        if devices.count() != 1:
-            return queryset.none()
-
-        device = devices.first()
-
-        return queryset.filter(id__in=SoftwareImageLCM.objects.get_for_object(device).values("id"))
+        return filter_software_images(queryset, BulkDeviceSoftware(devices))
 
     def inventory_item(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
-        """Search for software image for a given inventory item."""
-        value = value.strip()
-        if not value:
-            return queryset
-
-        inventory_items = InventoryItem.objects.filter(id=value)
-
-        if inventory_items.count() != 1:
-            return queryset.none()
-
-        inventory_item = inventory_items.first()
-
-        return queryset.filter(id__in=SoftwareImageLCM.objects.get_for_object(inventory_item).values("id"))
+        """Search for the software images of the given inventory items."""
+        return filter_software_images(queryset, BulkInventoryItemSoftware(InventoryItem.objects.filter(pk__in=value)))
 
 
 class ValidatedSoftwareLCMFilterSet(NautobotFilterSet):
@@ -332,9 +366,9 @@ class ValidatedSoftwareLCMFilterSet(NautobotFilterSet):
         to_field_name="slug",
         label="Object Tags (slug)",
     )
-    device_name = django_filters.CharFilter(method="device", label="Device Name")
-    device_id = django_filters.CharFilter(method="device", label="Device ID")
-    inventory_item_id = django_filters.CharFilter(method="inventory_item", label="InventoryItem ID")
+    device_name = MultiValueCharFilter(method="device", label="Device Name")
+    device_id = MultiValueUUIDFilter(method="device", label="Device ID")
+    inventory_item_id = MultiValueUUIDFilter(method="inventory_item", label="InventoryItem ID")
     start = django_filters.DateTimeFromToRangeFilter()
     end = django_filters.DateTimeFromToRangeFilter()
     valid = django_filters.BooleanFilter(method="valid_search", label="Currently valid")
@@ -365,7 +399,7 @@ class ValidatedSoftwareLCMFilterSet(NautobotFilterSet):
         if not value.strip():
             return queryset
 
-        qs_filter = Q(start__icontains=value) | Q(end__icontains=value)
+        qs_filter = combine_search_q(get_date_search_q(value, ("start", "end")))
         return queryset.filter(qs_filter)
 
     def valid_search(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
@@ -378,39 +412,17 @@ class ValidatedSoftwareLCMFilterSet(NautobotFilterSet):
         return queryset.filter(qs_filter)
 
     def device(self, queryset, name, value):  # pylint: disable=no-self-use
-        """Search for validated software for a given device."""
-        value = value.strip()
-        if not value:
+        """Search for the validated software applying to any of the given devices."""
+        devices = get_filter_devices(name, value)
+        if devices is None:
             return queryset
-
-        if name == "device_name":
-            devices = Device.objects.filter(name=value)
-        elif name == "device_id":
-            devices = Device.objects.filter(id=value)
-        else:
-            devices = Device.objects.none()
-
-        if devices.count() != 1:
-            return queryset.none()
-
-        device = devices.first()
-
-        return ValidatedSoftwareLCM.objects.get_for_object(device)
+        return filter_validated_software(queryset, BulkDeviceSoftware(devices, queryset))
 
     def inventory_item(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
-        """Search for validated software for a given inventory item."""
-        value = value.strip()
-        if not value:
-            return queryset
-
-        inventory_items = InventoryItem.objects.filter(id=value)
-
-        if inventory_items.count() != 1:
-            return queryset.none()
-
-        inventory_item = inventory_items.first()
-
-        return ValidatedSoftwareLCM.objects.get_for_object(inventory_item)
+        """Search for the validated software applying to any of the given inventory items."""
+        return filter_validated_software(
+            queryset, BulkInventoryItemSoftware(InventoryItem.objects.filter(pk__in=value), queryset)
+        )
 
 
 class DeviceSoftwareValidationResultFilterSet(NautobotFilterSet):
@@ -518,7 +530,9 @@ class DeviceSoftwareValidationResultFilterSet(NautobotFilterSet):
         """Perform the filtered search."""
         if not value.strip():
             return queryset
-        qs_filter = Q(device__name__icontains=value) | Q(software__version__icontains=value)
+        qs_filter = get_related_search_q(value, "device", Device.objects.all(), ("name",)) | get_related_search_q(
+            value, "software", SoftwareLCM.objects.all(), ("version",)
+        )
         return queryset.filter(qs_filter)
 
     def _exclude_sw_missing(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
@@ -655,11 +669,9 @@ class InventoryItemSoftwareValidationResultFilterSet(NautobotFilterSet):
         """Perform the filtered search."""
         if not value.strip():
             return queryset
-        qs_filter = (
-            Q(inventory_item__name__icontains=value)
-            | Q(inventory_item__device__name__icontains=value)
-            | Q(software__version__icontains=value)
-        )
+        qs_filter = get_related_search_q(
+            value, "inventory_item", InventoryItem.objects.all(), ("name", "device__name")
+        ) | get_related_search_q(value, "software", SoftwareLCM.objects.all(), ("version",))
         return queryset.filter(qs_filter)
 
     def search_part_id(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
@@ -684,6 +696,417 @@ class InventoryItemSoftwareValidationResultFilterSet(NautobotFilterSet):
         return queryset
 
 
+class HardwareEoXResultFilterSet(NautobotFilterSet):
+    """Base filter of the hardware EoX milestones of the DeviceHardwareEoXResult and InventoryItemHardwareEoXResult."""
+
+    end_of_sale = django_filters.DateFilter()
+    end_of_sale__gte = django_filters.DateFilter(field_name="end_of_sale", lookup_expr="gte")
+    end_of_sale__lte = django_filters.DateFilter(field_name="end_of_sale", lookup_expr="lte")
+
+    end_of_support = django_filters.DateFilter()
+    end_of_support__gte = django_filters.DateFilter(field_name="end_of_support", lookup_expr="gte")
+    end_of_support__lte = django_filters.DateFilter(field_name="end_of_support", lookup_expr="lte")
+
+    end_of_sw_releases = django_filters.DateFilter()
+    end_of_sw_releases__gte = django_filters.DateFilter(field_name="end_of_sw_releases", lookup_expr="gte")
+    end_of_sw_releases__lte = django_filters.DateFilter(field_name="end_of_sw_releases", lookup_expr="lte")
+
+    end_of_security_patches = django_filters.DateFilter()
+    end_of_security_patches__gte = django_filters.DateFilter(field_name="end_of_security_patches", lookup_expr="gte")
+    end_of_security_patches__lte = django_filters.DateFilter(field_name="end_of_security_patches", lookup_expr="lte")
+
+    end_of_support_within = django_filters.NumberFilter(
+        method="end_of_support_within_search", label="End of Support within (days)"
+    )
+
+    def end_of_support_within_search(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
+        """Keep the results reaching end of support between today and the given number of days from now."""
+        if value is None:
+            return queryset
+        today = datetime.date.today()
+        return queryset.filter(
+            end_of_support__gte=today, end_of_support__lte=today + datetime.timedelta(days=int(value))
+        )
+
+
+class DeviceHardwareEoXResultFilterSet(HardwareEoXResultFilterSet):
+    """Filter for DeviceHardwareEoXResult."""
+
+    q = django_filters.CharFilter(method="search", label="Search")
+
+    site_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__site",
+        queryset=Site.objects.all(),
+        label="Site",
+    )
+    site = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__site__slug",
+        queryset=Site.objects.all(),
+        to_field_name="slug",
+        label="Site (slug)",
+    )
+    region_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__site__region",
+        queryset=Region.objects.all(),
+        label="Region",
+    )
+    region = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__site__region__slug",
+        queryset=Region.objects.all(),
+        to_field_name="slug",
+        label="Region (slug)",
+    )
+    device_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="device",
+        queryset=Device.objects.all(),
+        label="Device",
+    )
+    device = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__name",
+        queryset=Device.objects.all(),
+        to_field_name="name",
+        label="Device (name)",
+    )
+    device_type_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__device_type",
+        queryset=DeviceType.objects.all(),
+        label="Device Type",
+    )
+    device_type = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__device_type__model",
+        queryset=DeviceType.objects.all(),
+        to_field_name="model",
+        label="Device Type (model)",
+    )
+    device_role_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__device_role_id",
+        queryset=DeviceRole.objects.all(),
+        label="Device Role",
+    )
+    device_role = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__device_role__slug",
+        queryset=DeviceRole.objects.all(),
+        to_field_name="slug",
+        label="Device Role (slug)",
+    )
+
+    class Meta:
+        """Meta attributes for filter."""
+
+        model = DeviceHardwareEoXResult
+
+        fields = [
+            "end_of_sale",
+            "end_of_support",
+            "end_of_sw_releases",
+            "end_of_security_patches",
+            "site",
+            "region",
+            "device",
+            "device_type",
+            "device_role",
+        ]
+
+    def search(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
+        """Perform the filtered search."""
+        if not value.strip():
+            return queryset
+        return queryset.filter(
+            get_related_search_q(value, "device", Device.objects.all(), ("name", "device_type__model"))
+        )
+
+
+class InventoryItemHardwareEoXResultFilterSet(HardwareEoXResultFilterSet):
+    """Filter for InventoryItemHardwareEoXResult."""
+
+    q = django_filters.CharFilter(method="search", label="Search")
+
+    site_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item__device__site",
+        queryset=Site.objects.all(),
+        label="Site",
+    )
+    site = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item__device__site__slug",
+        queryset=Site.objects.all(),
+        to_field_name="slug",
+        label="Site (slug)",
+    )
+    region_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item__device__site__region",
+        queryset=Region.objects.all(),
+        label="Region",
+    )
+    region = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item__device__site__region__slug",
+        queryset=Region.objects.all(),
+        to_field_name="slug",
+        label="Region (slug)",
+    )
+    inventory_item_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item",
+        queryset=InventoryItem.objects.all(),
+        label="Inventory Item",
+    )
+    part_id = django_filters.CharFilter(
+        field_name="inventory_item__part_id",
+        label="Part ID",
+    )
+    device_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item__device",
+        queryset=Device.objects.all(),
+        label="Device",
+    )
+    device = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item__device__name",
+        queryset=Device.objects.all(),
+        to_field_name="name",
+        label="Device (name)",
+    )
+
+    class Meta:
+        """Meta attributes for filter."""
+
+        model = InventoryItemHardwareEoXResult
+
+        fields = [
+            "end_of_sale",
+            "end_of_support",
+            "end_of_sw_releases",
+            "end_of_security_patches",
+            "site",
+            "region",
+            "part_id",
+            "device",
+        ]
+
+    def search(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
+        """Perform the filtered search."""
+        if not value.strip():
+            return queryset
+        qs_filter = get_related_search_q(
+            value, "inventory_item", InventoryItem.objects.all(), ("name", "part_id", "device__name")
+        )
+        return queryset.filter(qs_filter)
+
+
+class ContractCoverageFilterSet(NautobotFilterSet):
+    """Base filter of the coverage dates of the DeviceContractCoverage and InventoryItemContractCoverage."""
+
+    is_covered = django_filters.BooleanFilter(label="Covered")
+
+    end = django_filters.DateFilter()
+    end__gte = django_filters.DateFilter(field_name="end", lookup_expr="gte")
+    end__lte = django_filters.DateFilter(field_name="end", lookup_expr="lte")
+
+    gap_start = django_filters.DateFilter()
+    gap_start__gte = django_filters.DateFilter(field_name="gap_start", lookup_expr="gte")
+    gap_start__lte = django_filters.DateFilter(field_name="gap_start", lookup_expr="lte")
+
+    coverage_ends_within = django_filters.NumberFilter(
+        method="coverage_ends_within_search", label="Coverage ends within (days)"
+    )
+
+    def coverage_ends_within_search(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
+        """Keep the covered results whose coverage lapses between today and the given number of days from now."""
+        if value is None:
+            return queryset
+        today = datetime.date.today()
+        return queryset.filter(gap_start__gt=today, gap_start__lte=today + datetime.timedelta(days=int(value)))
+
+
+class DeviceContractCoverageFilterSet(ContractCoverageFilterSet):
+    """Filter for DeviceContractCoverage."""
+
+    q = django_filters.CharFilter(method="search", label="Search")
+
+    contract = django_filters.ModelMultipleChoiceFilter(
+        queryset=ContractLCM.objects.all(),
+        label="Active Contract",
+    )
+    provider = django_filters.ModelMultipleChoiceFilter(
+        queryset=ProviderLCM.objects.all(),
+        label="Provider",
+    )
+    support_level = MultiValueCharFilter(label="Support Level")
+
+    site_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__site",
+        queryset=Site.objects.all(),
+        label="Site",
+    )
+    site = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__site__slug",
+        queryset=Site.objects.all(),
+        to_field_name="slug",
+        label="Site (slug)",
+    )
+    region_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__site__region",
+        queryset=Region.objects.all(),
+        label="Region",
+    )
+    region = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__site__region__slug",
+        queryset=Region.objects.all(),
+        to_field_name="slug",
+        label="Region (slug)",
+    )
+    device_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="device",
+        queryset=Device.objects.all(),
+        label="Device",
+    )
+    device = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__name",
+        queryset=Device.objects.all(),
+        to_field_name="name",
+        label="Device (name)",
+    )
+    device_type_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__device_type",
+        queryset=DeviceType.objects.all(),
+        label="Device Type",
+    )
+    device_type = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__device_type__model",
+        queryset=DeviceType.objects.all(),
+        to_field_name="model",
+        label="Device Type (model)",
+    )
+    device_role_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__device_role_id",
+        queryset=DeviceRole.objects.all(),
+        label="Device Role",
+    )
+    device_role = django_filters.ModelMultipleChoiceFilter(
+        field_name="device__device_role__slug",
+        queryset=DeviceRole.objects.all(),
+        to_field_name="slug",
+        label="Device Role (slug)",
+    )
+
+    class Meta:
+        """Meta attributes for filter."""
+
+        model = DeviceContractCoverage
+
+        fields = [
+            "is_covered",
+            "contract",
+            "provider",
+            "support_level",
+            "end",
+            "gap_start",
+            "site",
+            "region",
+            "device",
+            "device_type",
+            "device_role",
+        ]
+
+    def search(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
+        """Perform the filtered search."""
+        if not value.strip():
+            return queryset
+        return queryset.filter(
+            combine_search_q(
+                get_related_search_q(value, "device", Device.objects.all(), ("name", "device_type__model")),
+                get_related_search_q(value, "contract", ContractLCM.objects.all(), ("name", "number")),
+            )
+        )
+
+
+class InventoryItemContractCoverageFilterSet(ContractCoverageFilterSet):
+    """Filter for InventoryItemContractCoverage."""
+
+    q = django_filters.CharFilter(method="search", label="Search")
+
+    contract = django_filters.ModelMultipleChoiceFilter(
+        queryset=ContractLCM.objects.all(),
+        label="Active Contract",
+    )
+    provider = django_filters.ModelMultipleChoiceFilter(
+        queryset=ProviderLCM.objects.all(),
+        label="Provider",
+    )
+    support_level = MultiValueCharFilter(label="Support Level")
+
+    site_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item__device__site",
+        queryset=Site.objects.all(),
+        label="Site",
+    )
+    site = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item__device__site__slug",
+        queryset=Site.objects.all(),
+        to_field_name="slug",
+        label="Site (slug)",
+    )
+    region_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item__device__site__region",
+        queryset=Region.objects.all(),
+        label="Region",
+    )
+    region = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item__device__site__region__slug",
+        queryset=Region.objects.all(),
+        to_field_name="slug",
+        label="Region (slug)",
+    )
+    inventory_item_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item",
+        queryset=InventoryItem.objects.all(),
+        label="Inventory Item",
+    )
+    part_id = django_filters.CharFilter(
+        field_name="inventory_item__part_id",
+        label="Part ID",
+    )
+    device_id = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item__device",
+        queryset=Device.objects.all(),
+        label="Device",
+    )
+    device = django_filters.ModelMultipleChoiceFilter(
+        field_name="inventory_item__device__name",
+        queryset=Device.objects.all(),
+        to_field_name="name",
+        label="Device (name)",
+    )
+
+    class Meta:
+        """Meta attributes for filter."""
+
+        model = InventoryItemContractCoverage
+
+        fields = [
+            "is_covered",
+            "contract",
+            "provider",
+            "support_level",
+            "end",
+            "gap_start",
+            "site",
+            "region",
+            "part_id",
+            "device",
+        ]
+
+    def search(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
+        """Perform the filtered search."""
+        if not value.strip():
+            return queryset
+        return queryset.filter(
+            combine_search_q(
+                get_related_search_q(
+                    value, "inventory_item", InventoryItem.objects.all(), ("name", "part_id", "device__name")
+                ),
+                get_related_search_q(value, "contract", ContractLCM.objects.all(), ("name", "number")),
+            )
+        )
+
+
 class ContractLCMFilterSet(NautobotFilterSet):
     """Filter for ContractLCMFilter."""
 
@@ -725,21 +1148,15 @@ class ContractLCMFilterSet(NautobotFilterSet):
         if not value.strip():
             return queryset
 
-        qs_filter = (
-            Q(name__icontains=value)
-            | Q(cost__icontains=value)
-            | Q(contract_type__icontains=value)
-            | Q(support_level__icontains=value)
+        qs_filter = combine_search_q(
+            get_text_search_q(value, ("name", "contract_type", "support_level")),
+            get_decimal_search_q(value, ("cost",)),
         )
         return queryset.filter(qs_filter)
 
     def expired_search(self, queryset, name, value):  # pylint: disable=unused-argument, no-self-use
         """Perform the filtered search."""
-        today = datetime.datetime.today().date()
-        lookup = "gte" if not value else "lt"
-
-        qs_filter = Q(**{f"end__{lookup}": today})
-        return queryset.filter(qs_filter)
+        return queryset.filter_expired(value)
 
 
 class ProviderLCMFilterSet(NautobotFilterSet):
@@ -759,13 +1176,7 @@ class ProviderLCMFilterSet(NautobotFilterSet):
         if not value.strip():
             return queryset
 
-        qs_filter = (
-            Q(name__icontains=value)
-            | Q(description__icontains=value)
-            | Q(physical_address__icontains=value)
-            | Q(phone__icontains=value)
-            | Q(email__icontains=value)
-        )
+        qs_filter = get_text_search_q(value, ("name", "description", "physical_address", "phone", "email"))
         return queryset.filter(qs_filter)
 
 
@@ -786,12 +1197,7 @@ class ContactLCMFilterSet(NautobotFilterSet):
         if not value.strip():
             return queryset
 
-        qs_filter = (
-            Q(name__icontains=value)
-            | Q(email__icontains=value)
-            | Q(phone__icontains=value)
-            | Q(address__icontains=value)
-        )
+        qs_filter = get_text_search_q(value, ("name", "email", "phone", "address"))
         return queryset.filter(qs_filter)
 
 
@@ -829,7 +1235,7 @@ class CVELCMFilterSet(NautobotFilterSet, StatusModelFilterSetMixin):  # , Custom
         if not value.strip():
             return queryset
 
-        qs_filter = Q(name__icontains=value) | Q(link__icontains=value)
+        qs_filter = get_text_search_q(value, ("name", "link"))
         return queryset.filter(qs_filter)
 
 
@@ -858,12 +1264,11 @@ class VulnerabilityLCMFilterSet(NautobotFilterSet, StatusModelFilterSetMixin):
         if not value.strip():
             return queryset
 
-        # Searching all of the items that make up the __str__ method.
+        # Searching all of the items that make up the __str__ method, each in a subquery on its own table.
         qs_filter = (
-            Q(cve__name__icontains=value)
-            | Q(software__device_platform__name__icontains=value)
-            | Q(software__version__icontains=value)
-            | Q(device__name__icontains=value)
-            | Q(inventory_item__name__icontains=value)
+            get_related_search_q(value, "cve", CVELCM.objects.all(), ("name",))
+            | get_related_search_q(value, "software", SoftwareLCM.objects.all(), ("device_platform__name", "version"))
+            | get_related_search_q(value, "device", Device.objects.all(), ("name",))
+            | get_related_search_q(value, "inventory_item", InventoryItem.objects.all(), ("name",))
         )
         return queryset.filter(qs_filter)
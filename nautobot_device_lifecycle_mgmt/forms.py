@@ -21,6 +21,7 @@ from nautobot.utilities.forms import (
     DatePicker,
     DynamicModelChoiceField,
     DynamicModelMultipleChoiceField,
+    JSONField,
     StaticSelect2,
     BOOLEAN_WITH_BLANK_CHOICES,
     add_blank_choice,
@@ -28,18 +29,25 @@ from nautobot.utilities.forms import (
     TagFilterField,
 )
 from nautobot_device_lifecycle_mgmt.choices import (
+    ContractForecastGroupChoices,
+    ContractForecastPeriodChoices,
     ContractTypeChoices,
     CurrencyChoices,
     PoCTypeChoices,
     CountryCodes,
     CVESeverityChoices,
 )
+from nautobot_device_lifecycle_mgmt.const import CONTRACT_FORECAST_MAX_YEARS
 from nautobot_device_lifecycle_mgmt.models import (
     HardwareLCM,
     InventoryItemSoftwareValidationResult,
     SoftwareLCM,
     ValidatedSoftwareLCM,
     DeviceSoftwareValidationResult,
+    DeviceHardwareEoXResult,
+    InventoryItemHardwareEoXResult,
+    DeviceContractCoverage,
+    InventoryItemContractCoverage,
     ContractLCM,
     ProviderLCM,
     ContactLCM,
@@ -696,6 +704,210 @@ class InventoryItemSoftwareValidationResultFilterForm(BootstrapMixin, CustomFiel
         ]
 
 
+class DeviceHardwareEoXResultFilterForm(BootstrapMixin, forms.ModelForm):
+    """Filter form to filter searches for DeviceHardwareEoXResult."""
+
+    q = forms.CharField(
+        required=False,
+        label="Search",
+    )
+    site = DynamicModelMultipleChoiceField(
+        queryset=Site.objects.all(),
+        to_field_name="slug",
+        required=False,
+    )
+    region = DynamicModelMultipleChoiceField(
+        queryset=Region.objects.all(),
+        to_field_name="slug",
+        required=False,
+    )
+    device_type = DynamicModelMultipleChoiceField(
+        queryset=DeviceType.objects.all(),
+        to_field_name="model",
+        required=False,
+    )
+    device_role = DynamicModelMultipleChoiceField(
+        queryset=DeviceRole.objects.all(),
+        to_field_name="slug",
+        required=False,
+    )
+    end_of_support__gte = forms.DateField(widget=DatePicker(), required=False, label="End of Support after")
+    end_of_support__lte = forms.DateField(widget=DatePicker(), required=False, label="End of Support before")
+    end_of_support_within = forms.IntegerField(required=False, min_value=0, label="End of Support within (days)")
+
+    class Meta:
+        """Meta attributes."""
+
+        model = DeviceHardwareEoXResult
+        fields = [
+            "q",
+            "site",
+            "region",
+            "device_type",
+            "device_role",
+            "end_of_support__gte",
+            "end_of_support__lte",
+            "end_of_support_within",
+        ]
+
+
+class InventoryItemHardwareEoXResultFilterForm(BootstrapMixin, forms.ModelForm):
+    """Filter form to filter searches for InventoryItemHardwareEoXResult."""
+
+    q = forms.CharField(
+        required=False,
+        label="Search",
+    )
+    site = DynamicModelMultipleChoiceField(
+        queryset=Site.objects.all(),
+        to_field_name="slug",
+        required=False,
+    )
+    region = DynamicModelMultipleChoiceField(
+        queryset=Region.objects.all(),
+        to_field_name="slug",
+        required=False,
+    )
+    part_id = forms.CharField(
+        required=False,
+        label="Part ID",
+    )
+    end_of_support__gte = forms.DateField(widget=DatePicker(), required=False, label="End of Support after")
+    end_of_support__lte = forms.DateField(widget=DatePicker(), required=False, label="End of Support before")
+    end_of_support_within = forms.IntegerField(required=False, min_value=0, label="End of Support within (days)")
+
+    class Meta:
+        """Meta attributes."""
+
+        model = InventoryItemHardwareEoXResult
+        fields = [
+            "q",
+            "site",
+            "region",
+            "part_id",
+            "end_of_support__gte",
+            "end_of_support__lte",
+            "end_of_support_within",
+        ]
+
+
+class DeviceContractCoverageFilterForm(BootstrapMixin, forms.ModelForm):
+    """Filter form to filter searches for DeviceContractCoverage."""
+
+    q = forms.CharField(
+        required=False,
+        label="Search",
+    )
+    site = DynamicModelMultipleChoiceField(
+        queryset=Site.objects.all(),
+        to_field_name="slug",
+        required=False,
+    )
+    region = DynamicModelMultipleChoiceField(
+        queryset=Region.objects.all(),
+        to_field_name="slug",
+        required=False,
+    )
+    device_type = DynamicModelMultipleChoiceField(
+        queryset=DeviceType.objects.all(),
+        to_field_name="model",
+        required=False,
+    )
+    device_role = DynamicModelMultipleChoiceField(
+        queryset=DeviceRole.objects.all(),
+        to_field_name="slug",
+        required=False,
+    )
+    is_covered = forms.BooleanField(
+        label="Covered", required=False, widget=StaticSelect2(choices=BOOLEAN_WITH_BLANK_CHOICES)
+    )
+    provider = DynamicModelMultipleChoiceField(
+        queryset=ProviderLCM.objects.all(),
+        required=False,
+    )
+    contract = DynamicModelMultipleChoiceField(
+        queryset=ContractLCM.objects.all(),
+        required=False,
+        label="Active Contract",
+    )
+    end__gte = forms.DateField(widget=DatePicker(), required=False, label="Contract End after")
+    end__lte = forms.DateField(widget=DatePicker(), required=False, label="Contract End before")
+    coverage_ends_within = forms.IntegerField(required=False, min_value=0, label="Coverage ends within (days)")
+
+    class Meta:
+        """Meta attributes."""
+
+        model = DeviceContractCoverage
+        fields = [
+            "q",
+            "site",
+            "region",
+            "device_type",
+            "device_role",
+            "is_covered",
+            "provider",
+            "contract",
+            "end__gte",
+            "end__lte",
+            "coverage_ends_within",
+        ]
+
+
+class InventoryItemContractCoverageFilterForm(BootstrapMixin, forms.ModelForm):
+    """Filter form to filter searches for InventoryItemContractCoverage."""
+
+    q = forms.CharField(
+        required=False,
+        label="Search",
+    )
+    site = DynamicModelMultipleChoiceField(
+        queryset=Site.objects.all(),
+        to_field_name="slug",
+        required=False,
+    )
+    region = DynamicModelMultipleChoiceField(
+        queryset=Region.objects.all(),
+        to_field_name="slug",
+        required=False,
+    )
+    part_id = forms.CharField(
+        required=False,
+        label="Part ID",
+    )
+    is_covered = forms.BooleanField(
+        label="Covered", required=False, widget=StaticSelect2(choices=BOOLEAN_WITH_BLANK_CHOICES)
+    )
+    provider = DynamicModelMultipleChoiceField(
+        queryset=ProviderLCM.objects.all(),
+        required=False,
+    )
+    contract = DynamicModelMultipleChoiceField(
+        queryset=ContractLCM.objects.all(),
+        required=False,
+        label="Active Contract",
+    )
+    end__gte = forms.DateField(widget=DatePicker(), required=False, label="Contract End after")
+    end__lte = forms.DateField(widget=DatePicker(), required=False, label="Contract End before")
+    coverage_ends_within = forms.IntegerField(required=False, min_value=0, label="Coverage ends within (days)")
+
+    class Meta:
+        """Meta attributes."""
+
+        model = InventoryItemContractCoverage
+        fields = [
+            "q",
+            "site",
+            "region",
+            "part_id",
+            "is_covered",
+            "provider",
+            "contract",
+            "end__gte",
+            "end__lte",
+            "coverage_ends_within",
+        ]
+
+
 class ValidatedSoftwareLCMCSVForm(CustomFieldModelCSVForm):
     """Form for bulk creating ValidatedSoftwareLCM objects."""
 
@@ -1034,6 +1246,12 @@ class CVELCMForm(StatusBulkEditFormMixin, BootstrapMixin, CustomFieldModelForm,
 
     published_date = forms.DateField(widget=DatePicker())
     severity = forms.ChoiceField(choices=CVESeverityChoices.CHOICES, label="Severity", required=False)
+    affected_versions = JSONField(
+        label="Affected Versions",
+        required=False,
+        help_text='List of {"platform": "&lt;platform slug&gt;", "versions": "&lt;range&gt;"} objects, where a range is '
+        'a comma-separated list of constraints such as "&gt;=15.2(4)M, &lt;15.2(7)E3".',
+    )
     tags = DynamicModelMultipleChoiceField(queryset=Tag.objects.all(), required=False)
 
     model = CVELCM
@@ -1045,6 +1263,7 @@ class CVELCMForm(StatusBulkEditFormMixin, BootstrapMixin, CustomFieldModelForm,
 
         fields = [
             *CVELCM.csv_headers,
+            "affected_versions",
             "tags",
         ]
 
@@ -1052,6 +1271,10 @@ class CVELCMForm(StatusBulkEditFormMixin, BootstrapMixin, CustomFieldModelForm,
             "published_date": DatePicker(),
         }
 
+    def clean_affected_versions(self):
+        """Store an empty list when no affected versions are given."""
+        return self.cleaned_data["affected_versions"] or []
+
 
 class CVELCMBulkEditForm(StatusBulkEditFormMixin, BootstrapMixin, CustomFieldBulkEditForm):
     """CVE Lifecycle Management bulk edit form."""
@@ -1208,3 +1431,27 @@ class VulnerabilityLCMFilterForm(BootstrapMixin, StatusFilterFormMixin, CustomFi
             *VulnerabilityLCM.csv_headers,
             "tags",
         ]
+
+
+class FleetUpgradePlanFilterForm(BootstrapMixin, forms.Form):
+    """Filter form selecting the devices of the fleet upgrade plan."""
+
+    region = DynamicModelMultipleChoiceField(queryset=Region.objects.all(), to_field_name="slug", required=False)
+    site = DynamicModelMultipleChoiceField(queryset=Site.objects.all(), to_field_name="slug", required=False)
+    role = DynamicModelMultipleChoiceField(queryset=DeviceRole.objects.all(), to_field_name="slug", required=False)
+    platform = DynamicModelMultipleChoiceField(queryset=Platform.objects.all(), to_field_name="slug", required=False)
+
+
+class ContractRenewalForecastFilterForm(BootstrapMixin, forms.Form):
+    """Filter form setting the periods and breakdown of the contract renewal forecast."""
+
+    period = forms.ChoiceField(
+        choices=add_blank_choice(ContractForecastPeriodChoices.CHOICES), required=False, widget=StaticSelect2()
+    )
+    years = forms.IntegerField(required=False, min_value=1, max_value=CONTRACT_FORECAST_MAX_YEARS)
+    group_by = forms.ChoiceField(
+        choices=add_blank_choice(ContractForecastGroupChoices.CHOICES),
+        required=False,
+        widget=StaticSelect2(),
+        label="Breakdown",
+    )
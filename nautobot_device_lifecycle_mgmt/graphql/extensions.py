@@ -0,0 +1,239 @@
+"""Lifecycle Management fields added to the core Nautobot GraphQL types."""
+import importlib
+from abc import ABC, abstractmethod
+from datetime import date
+
+import graphene
+
+from nautobot.core.graphql.generators import generate_schema_type
+from nautobot.dcim.models import Device, InventoryItem
+from nautobot.extras.choices import RelationshipSideChoices
+from nautobot.extras.registry import registry
+
+from nautobot_device_lifecycle_mgmt.graphql.loaders import (
+    OpenVulnerabilityCountsLoader,
+    RelatedObjectLoader,
+    RelationshipPeersLoader,
+    ValidatedSoftwareLoader,
+    get_loader,
+)
+from nautobot_device_lifecycle_mgmt.graphql.types import HardwareLCMType, SoftwareLCMType, ValidatedSoftwareLCMType
+from nautobot_device_lifecycle_mgmt.models import (
+    ContractLCM,
+    DeviceSoftwareValidationResult,
+    HardwareLCM,
+    InventoryItemSoftwareValidationResult,
+    SoftwareLCM,
+)
+
+
+class LifecycleSummary(ABC):
+    """Lifecycle data of a Device or InventoryItem, loaded in batch with the other objects of the GraphQL result."""
+
+    model = None
+    software_relationship = None
+    contract_relationship = None
+    validation_result_model = None
+    validation_result_field = None
+    hardware_notice_field = None
+
+    def __init__(self, obj):
+        """Initialize LifecycleSummary object."""
+        self.obj = obj
+
+    @abstractmethod
+    def get_hardware_notice_key(self):
+        """Return the value of the HardwareLCM `hardware_notice_field` matching the object, or None."""
+
+    def load_software(self, info):
+        """Return a Promise of the SoftwareLCM assigned to the object, or None."""
+        loader = get_loader(
+            info,
+            RelationshipPeersLoader,
+            self.software_relationship,
+            RelationshipSideChoices.SIDE_DESTINATION,
+            SoftwareLCM,
+        )
+        return loader.load(self.obj.pk).then(lambda softwares: softwares[0] if softwares else None)
+
+    def load_validated_softwares(self, info):
+        """Return a Promise of the ValidatedSoftwareLCM applying to the object, ordered by weight."""
+        return get_loader(info, ValidatedSoftwareLoader, self.model).load(self.obj.pk)
+
+    def load_validation_result(self, info):
+        """Return a Promise of the stored software validation result of the object, or None."""
+        loader = get_loader(info, RelatedObjectLoader, self.validation_result_model, self.validation_result_field)
+        return loader.load(self.obj.pk)
+
+    def load_hardware_notice(self, info):
+        """Return a Promise of the HardwareLCM notice of the object, or None."""
+        key = self.get_hardware_notice_key()
+        if not key:
+            return None
+        return get_loader(info, RelatedObjectLoader, HardwareLCM, self.hardware_notice_field).load(key)
+
+    def load_open_vulnerabilities(self, info):
+        """Return a Promise of the open vulnerability counts of the object."""
+        return get_loader(info, OpenVulnerabilityCountsLoader, self.validation_result_field).load(self.obj.pk)
+
+    def load_contracts(self, info):
+        """Return a Promise of the ContractLCM covering the object."""
+        loader = get_loader(
+            info,
+            RelationshipPeersLoader,
+            self.contract_relationship,
+            RelationshipSideChoices.SIDE_DESTINATION,
+            ContractLCM,
+        )
+        return loader.load(self.obj.pk)
+
+
+class DeviceLifecycleSummary(LifecycleSummary):
+    """Lifecycle data of a Device."""
+
+    model = Device
+    software_relationship = "device_soft"
+    contract_relationship = "contractlcm-to-device"
+    validation_result_model = DeviceSoftwareValidationResult
+    validation_result_field = "device"
+    hardware_notice_field = "device_type"
+
+    def get_hardware_notice_key(self):
+        """Return the device type of the Device."""
+        return self.obj.device_type_id
+
+
+class InventoryItemLifecycleSummary(LifecycleSummary):
+    """Lifecycle data of an InventoryItem."""
+
+    model = InventoryItem
+    software_relationship = "inventory_item_soft"
+    contract_relationship = "contractlcm-to-inventoryitem"
+    validation_result_model = InventoryItemSoftwareValidationResult
+    validation_result_field = "inventory_item"
+    hardware_notice_field = "inventory_item"
+
+    def get_hardware_notice_key(self):
+        """Return the part ID of the InventoryItem."""
+        return self.obj.part_id
+
+
+def get_active_contract_end(contracts):
+    """Return the latest end date of the started and not expired `contracts`, or None."""
+    today = date.today()
+    ends = [
+        contract.end
+        for contract in contracts
+        if contract.end and not contract.expired and (not contract.start or contract.start <= today)
+    ]
+    return max(ends, default=None)
+
+
+class VulnerabilityCountsType(graphene.ObjectType):
+    """Number of open vulnerabilities by CVE severity."""
+
+    critical = graphene.Int()
+    high = graphene.Int()
+    medium = graphene.Int()
+    low = graphene.Int()
+    none = graphene.Int()
+    total = graphene.Int()
+
+
+class LifecycleSummaryType(graphene.ObjectType):
+    """Lifecycle summary of a Device or InventoryItem."""
+
+    software = graphene.Field(SoftwareLCMType)
+    software_is_validated = graphene.Boolean()
+    software_validation_last_run = graphene.DateTime()
+    hardware_notice = graphene.Field(HardwareLCMType)
+    end_of_sale = graphene.Date()
+    end_of_support = graphene.Date()
+    open_vulnerabilities = graphene.Field(VulnerabilityCountsType)
+    active_contract_end = graphene.Date()
+
+    def resolve_software(self, info):
+        """Return the assigned software."""
+        return self.load_software(info)
+
+    def resolve_software_is_validated(self, info):
+        """Return the result of the last software validation job run, or None if not validated yet."""
+        return self.load_validation_result(info).then(lambda result: result.is_validated if result else None)
+
+    def resolve_software_validation_last_run(self, info):
+        """Return the time of the last software validation job run."""
+        return self.load_validation_result(info).then(lambda result: result.last_run if result else None)
+
+    def resolve_hardware_notice(self, info):
+        """Return the hardware notice."""
+        return self.load_hardware_notice(info)
+
+    def resolve_end_of_sale(self, info):
+        """Return the end of sale date of the hardware notice."""
+        notice = self.load_hardware_notice(info)
+        return notice and notice.then(lambda notice: notice.end_of_sale if notice else None)
+
+    def resolve_end_of_support(self, info):
+        """Return the end of support date of the hardware notice."""
+        notice = self.load_hardware_notice(info)
+        return notice and notice.then(lambda notice: notice.end_of_support if notice else None)
+
+    def resolve_open_vulnerabilities(self, info):
+        """Return the open vulnerability counts."""
+        return self.load_open_vulnerabilities(info)
+
+    def resolve_active_contract_end(self, info):
+        """Return the end date of the active contract covering the object the longest."""
+        return self.load_contracts(info).then(get_active_contract_end)
+
+
+# Core types extended by the plugin, with the class giving the lifecycle data of their objects.
+LIFECYCLE_SUMMARIES = {
+    "dcim.device": DeviceLifecycleSummary,
+    "dcim.inventoryitem": InventoryItemLifecycleSummary,
+}
+
+
+def get_core_schema_type(type_identifier, model):
+    """Return the GraphQL type of a core model, registering the type Nautobot would generate if not defined yet."""
+    # Importing the schema module initializes the registry with the statically defined core types.
+    importlib.import_module("nautobot.core.graphql.schema")
+
+    if type_identifier not in registry["graphql_types"]:
+        registry["graphql_types"][type_identifier] = generate_schema_type(
+            app_name=model._meta.app_label, model=model  # pylint: disable=protected-access
+        )
+    return registry["graphql_types"][type_identifier]
+
+
+def generate_lifecycle_resolvers(summary_class):
+    """Return the resolvers of the fields added to the GraphQL type of `summary_class.model`."""
+
+    def resolve_software(self, info):
+        return summary_class(self).load_software(info)
+
+    def resolve_validated_softwares(self, info):
+        return summary_class(self).load_validated_softwares(info)
+
+    def resolve_lifecycle(self, info):  # pylint: disable=unused-argument
+        return summary_class(self)
+
+    return {
+        "software": resolve_software,
+        "validated_softwares": resolve_validated_softwares,
+        "lifecycle": resolve_lifecycle,
+    }
+
+
+def extend_core_schema_types():
+    """Add the `software`, `validated_softwares` and `lifecycle` fields to the Device and InventoryItem types."""
+    for type_identifier, summary_class in LIFECYCLE_SUMMARIES.items():
+        schema_type = get_core_schema_type(type_identifier, summary_class.model)
+        # pylint: disable=protected-access
+        schema_type._meta.fields["software"] = graphene.Field(SoftwareLCMType)
+        schema_type._meta.fields["validated_softwares"] = graphene.Field.mounted(
+            graphene.List(ValidatedSoftwareLCMType)
+        )
+        schema_type._meta.fields["lifecycle"] = graphene.Field(LifecycleSummaryType)
+        for field_name, resolver in generate_lifecycle_resolvers(summary_class).items():
+            setattr(schema_type, f"resolve_{field_name}", resolver)
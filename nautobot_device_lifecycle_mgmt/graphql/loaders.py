@@ -0,0 +1,135 @@
+"""DataLoaders batching the GraphQL resolution of Lifecycle Management relations.
+
+A loader collects the keys requested by all the objects of a GraphQL result before querying the database, so
+resolving a relation for N objects costs a fixed number of queries instead of N.
+"""
+from collections import defaultdict
+
+from django.db.models import Count
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from nautobot.dcim.models import Device, InventoryItem
+from nautobot.extras.choices import RelationshipSideChoices
+from nautobot.extras.models import RelationshipAssociation
+
+from nautobot_device_lifecycle_mgmt.choices import CVESeverityChoices
+from nautobot_device_lifecycle_mgmt.const import PLUGIN_CFG
+from nautobot_device_lifecycle_mgmt.models import ValidatedSoftwareLCM, VulnerabilityLCM
+from nautobot_device_lifecycle_mgmt.software_bulk import BulkDeviceSoftware, BulkInventoryItemSoftware
+
+LOADERS_ATTRIBUTE = "_nautobot_device_lifecycle_mgmt_loaders"
+
+# GraphQL field name of each CVE severity in the open vulnerability counts.
+SEVERITY_FIELDS = {severity: severity.lower() for severity, _ in CVESeverityChoices.CHOICES}
+
+
+def get_loader(info, loader_class, *args):
+    """Return the `loader_class(user, *args)` instance of the current GraphQL request, creating it on first use.
+
+    Loaders are bound to the request so that batches and caches are never shared between users.
+    """
+    loaders = getattr(info.context, LOADERS_ATTRIBUTE, None)
+    if loaders is None:
+        loaders = {}
+        setattr(info.context, LOADERS_ATTRIBUTE, loaders)
+    key = (loader_class, *args)
+    if key not in loaders:
+        loaders[key] = loader_class(info.context.user, *args)
+    return loaders[key]
+
+
+class RelationshipPeersLoader(DataLoader):
+    """Load the peer objects of a Relationship, keyed by the pk of the objects on the given `side`."""
+
+    def __init__(self, user, relationship_slug, side, peer_model):
+        """Initialize RelationshipPeersLoader."""
+        super().__init__()
+        self.user = user
+        self.relationship_slug = relationship_slug
+        self.side = side
+        self.peer_side = RelationshipSideChoices.OPPOSITE[side]
+        self.peer_model = peer_model
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        """Return the list of peers of each key."""
+        associations = RelationshipAssociation.objects.filter(
+            relationship__slug=self.relationship_slug, **{f"{self.side}_id__in": keys}
+        ).values_list(f"{self.side}_id", f"{self.peer_side}_id")
+        peer_pks = defaultdict(list)
+        for key, peer_pk in associations:
+            peer_pks[key].append(peer_pk)
+        peers = self.peer_model.objects.restrict(self.user, "view").in_bulk(
+            {peer_pk for pks in peer_pks.values() for peer_pk in pks}
+        )
+        return Promise.resolve(
+            [[peers[peer_pk] for peer_pk in peer_pks.get(key, ()) if peer_pk in peers] for key in keys]
+        )
+
+
+class ValidatedSoftwareLoader(DataLoader):
+    """Load the ValidatedSoftwareLCM applying to Devices or InventoryItems, ordered by weight."""
+
+    bulk_classes = {Device: BulkDeviceSoftware, InventoryItem: BulkInventoryItemSoftware}
+
+    def __init__(self, user, model):
+        """Initialize ValidatedSoftwareLoader."""
+        super().__init__()
+        self.user = user
+        self.model = model
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        """Return the list of validated software of each key."""
+        bulk_software = self.bulk_classes[self.model](
+            self.model.objects.filter(pk__in=keys), ValidatedSoftwareLCM.objects.restrict(self.user, "view")
+        )
+        validated_software_map = bulk_software.get_validated_software_map()
+        return Promise.resolve(
+            [[validated_software for validated_software, _ in validated_software_map.get(key, [])] for key in keys]
+        )
+
+
+class RelatedObjectLoader(DataLoader):
+    """Load the `model` object whose `field_name` field matches each key, such as the result or notice of an object."""
+
+    def __init__(self, user, model, field_name):
+        """Initialize RelatedObjectLoader."""
+        super().__init__()
+        self.user = user
+        self.model = model
+        self.attname = model._meta.get_field(field_name).attname  # pylint: disable=protected-access
+        self.field_name = field_name
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        """Return the matching object, or None, of each key."""
+        objects = {
+            getattr(obj, self.attname): obj
+            for obj in self.model.objects.restrict(self.user, "view").filter(**{f"{self.field_name}__in": keys})
+        }
+        return Promise.resolve([objects.get(key) for key in keys])
+
+
+class OpenVulnerabilityCountsLoader(DataLoader):
+    """Load the number of open VulnerabilityLCM of each Device or InventoryItem, by CVE severity."""
+
+    def __init__(self, user, field_name):
+        """Initialize OpenVulnerabilityCountsLoader."""
+        super().__init__()
+        self.user = user
+        self.field_name = field_name
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        """Return a {severity: count} dict, with a `total` entry, of each key."""
+        rows = (
+            VulnerabilityLCM.objects.restrict(self.user, "view")
+            .filter(**{f"{self.field_name}__in": keys})
+            .exclude(status__slug__in=PLUGIN_CFG["closed_vulnerability_statuses"])
+            .values_list(self.field_name, "cve__severity")
+            .annotate(count=Count("pk"))
+            .order_by()
+        )
+        counts = defaultdict(lambda: dict.fromkeys([*SEVERITY_FIELDS.values(), "total"], 0))
+        for key, severity, count in rows:
+            counts[key][SEVERITY_FIELDS.get(severity, "none")] += count
+            counts[key]["total"] += count
+        return Promise.resolve([counts[key] for key in keys])
@@ -1,17 +1,109 @@
 """GraphQL implementation for the Device LifeCycle Management plugin."""
 import graphene
 
-from graphene_django import DjangoObjectType
+from nautobot.core.graphql.types import OptimizedNautobotObjectType
+from nautobot.dcim.models import Device, InventoryItem
+from nautobot.extras.choices import RelationshipSideChoices
+from nautobot.extras.registry import registry
 
 from nautobot_device_lifecycle_mgmt.models import (
+    HardwareLCM,
+    SoftwareLCM,
+    SoftwareImageLCM,
     ValidatedSoftwareLCM,
+    DeviceSoftwareValidationResult,
+    InventoryItemSoftwareValidationResult,
+    DeviceHardwareEoXResult,
+    InventoryItemHardwareEoXResult,
+    DeviceContractCoverage,
+    InventoryItemContractCoverage,
+    ContractLCM,
+    ProviderLCM,
+    ContactLCM,
+    CVELCM,
+    VulnerabilityLCM,
 )
 from nautobot_device_lifecycle_mgmt.filters import (
+    HardwareLCMFilterSet,
+    SoftwareLCMFilterSet,
+    SoftwareImageLCMFilterSet,
     ValidatedSoftwareLCMFilterSet,
+    DeviceSoftwareValidationResultFilterSet,
+    InventoryItemSoftwareValidationResultFilterSet,
+    DeviceHardwareEoXResultFilterSet,
+    InventoryItemHardwareEoXResultFilterSet,
+    DeviceContractCoverageFilterSet,
+    InventoryItemContractCoverageFilterSet,
+    ContractLCMFilterSet,
+    ProviderLCMFilterSet,
+    ContactLCMFilterSet,
+    CVELCMFilterSet,
+    VulnerabilityLCMFilterSet,
 )
+from nautobot_device_lifecycle_mgmt.graphql.loaders import RelationshipPeersLoader, get_loader
 
 
-class ValidatedSoftwareLCMType(DjangoObjectType):
+def registered_type(type_identifier):
+    """Return a callable resolving to the GraphQL type registered for `type_identifier` once the schema is built."""
+    return lambda: registry["graphql_types"][type_identifier]
+
+
+def load_relationship_peers(info, obj, relationship_slug, side, peer_model):
+    """Return a Promise of the peers of `obj` through the `relationship_slug` Relationship, loaded in batch."""
+    return get_loader(info, RelationshipPeersLoader, relationship_slug, side, peer_model).load(obj.pk)
+
+
+class HardwareLCMType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the HardwareLCM model."""
+
+    expired = graphene.Boolean()
+
+    class Meta:
+        """Metadata magic method for the HardwareLCM."""
+
+        model = HardwareLCM
+        filterset_class = HardwareLCMFilterSet
+
+
+class SoftwareLCMType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the SoftwareLCM model."""
+
+    devices = graphene.List(registered_type("dcim.device"))
+    inventory_items = graphene.List(registered_type("dcim.inventoryitem"))
+    cves = graphene.List(lambda: CVELCMType)
+
+    class Meta:
+        """Metadata magic method for the SoftwareLCM."""
+
+        model = SoftwareLCM
+        filterset_class = SoftwareLCMFilterSet
+
+    def resolve_devices(self, info):
+        """Return the Devices running this software."""
+        return load_relationship_peers(info, self, "device_soft", RelationshipSideChoices.SIDE_SOURCE, Device)
+
+    def resolve_inventory_items(self, info):
+        """Return the InventoryItems running this software."""
+        return load_relationship_peers(
+            info, self, "inventory_item_soft", RelationshipSideChoices.SIDE_SOURCE, InventoryItem
+        )
+
+    def resolve_cves(self, info):
+        """Return the CVEs affecting this software."""
+        return load_relationship_peers(info, self, "soft_cve", RelationshipSideChoices.SIDE_SOURCE, CVELCM)
+
+
+class SoftwareImageLCMType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the SoftwareImageLCM model."""
+
+    class Meta:
+        """Metadata magic method for the SoftwareImageLCM."""
+
+        model = SoftwareImageLCM
+        filterset_class = SoftwareImageLCMFilterSet
+
+
+class ValidatedSoftwareLCMType(OptimizedNautobotObjectType):
     """Graphql Type Object for the ValidatedSoftwareLCM model."""
 
     valid = graphene.Boolean()
@@ -23,6 +115,150 @@ class ValidatedSoftwareLCMType(DjangoObjectType):
         filterset_class = ValidatedSoftwareLCMFilterSet
 
 
+class DeviceSoftwareValidationResultType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the DeviceSoftwareValidationResult model."""
+
+    class Meta:
+        """Metadata magic method for the DeviceSoftwareValidationResult."""
+
+        model = DeviceSoftwareValidationResult
+        filterset_class = DeviceSoftwareValidationResultFilterSet
+
+
+class InventoryItemSoftwareValidationResultType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the InventoryItemSoftwareValidationResult model."""
+
+    class Meta:
+        """Metadata magic method for the InventoryItemSoftwareValidationResult."""
+
+        model = InventoryItemSoftwareValidationResult
+        filterset_class = InventoryItemSoftwareValidationResultFilterSet
+
+
+class DeviceHardwareEoXResultType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the DeviceHardwareEoXResult model."""
+
+    class Meta:
+        """Metadata magic method for the DeviceHardwareEoXResult."""
+
+        model = DeviceHardwareEoXResult
+        filterset_class = DeviceHardwareEoXResultFilterSet
+
+
+class InventoryItemHardwareEoXResultType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the InventoryItemHardwareEoXResult model."""
+
+    class Meta:
+        """Metadata magic method for the InventoryItemHardwareEoXResult."""
+
+        model = InventoryItemHardwareEoXResult
+        filterset_class = InventoryItemHardwareEoXResultFilterSet
+
+
+class DeviceContractCoverageType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the DeviceContractCoverage model."""
+
+    class Meta:
+        """Metadata magic method for the DeviceContractCoverage."""
+
+        model = DeviceContractCoverage
+        filterset_class = DeviceContractCoverageFilterSet
+
+
+class InventoryItemContractCoverageType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the InventoryItemContractCoverage model."""
+
+    class Meta:
+        """Metadata magic method for the InventoryItemContractCoverage."""
+
+        model = InventoryItemContractCoverage
+        filterset_class = InventoryItemContractCoverageFilterSet
+
+
+class ContractLCMType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the ContractLCM model."""
+
+    expired = graphene.Boolean()
+    devices = graphene.List(registered_type("dcim.device"))
+    inventory_items = graphene.List(registered_type("dcim.inventoryitem"))
+
+    class Meta:
+        """Metadata magic method for the ContractLCM."""
+
+        model = ContractLCM
+        filterset_class = ContractLCMFilterSet
+
+    def resolve_devices(self, info):
+        """Return the Devices covered by this contract."""
+        return load_relationship_peers(info, self, "contractlcm-to-device", RelationshipSideChoices.SIDE_SOURCE, Device)
+
+    def resolve_inventory_items(self, info):
+        """Return the InventoryItems covered by this contract."""
+        return load_relationship_peers(
+            info, self, "contractlcm-to-inventoryitem", RelationshipSideChoices.SIDE_SOURCE, InventoryItem
+        )
+
+
+class ProviderLCMType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the ProviderLCM model."""
+
+    class Meta:
+        """Metadata magic method for the ProviderLCM."""
+
+        model = ProviderLCM
+        filterset_class = ProviderLCMFilterSet
+
+
+class ContactLCMType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the ContactLCM model."""
+
+    class Meta:
+        """Metadata magic method for the ContactLCM."""
+
+        model = ContactLCM
+        filterset_class = ContactLCMFilterSet
+
+
+class CVELCMType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the CVELCM model."""
+
+    affected_softwares = graphene.List(SoftwareLCMType)
+
+    class Meta:
+        """Metadata magic method for the CVELCM."""
+
+        model = CVELCM
+        filterset_class = CVELCMFilterSet
+
+    def resolve_affected_softwares(self, info):
+        """Return the software versions affected by this CVE."""
+        return load_relationship_peers(info, self, "soft_cve", RelationshipSideChoices.SIDE_DESTINATION, SoftwareLCM)
+
+
+class VulnerabilityLCMType(OptimizedNautobotObjectType):
+    """Graphql Type Object for the VulnerabilityLCM model."""
+
+    class Meta:
+        """Metadata magic method for the VulnerabilityLCM."""
+
+        model = VulnerabilityLCM
+        filterset_class = VulnerabilityLCMFilterSet
+
+
 graphql_types = [
+    HardwareLCMType,
+    SoftwareLCMType,
+    SoftwareImageLCMType,
     ValidatedSoftwareLCMType,
+    DeviceSoftwareValidationResultType,
+    InventoryItemSoftwareValidationResultType,
+    DeviceHardwareEoXResultType,
+    InventoryItemHardwareEoXResultType,
+    DeviceContractCoverageType,
+    InventoryItemContractCoverageType,
+    ContractLCMType,
+    ProviderLCMType,
+    ContactLCMType,
+    CVELCMType,
+    VulnerabilityLCMType,
 ]
@@ -0,0 +1,136 @@
+"""Maintenance of the precomputed mapping of HardwareLCM notices to the Devices and InventoryItems they apply to."""
+
+from django.db.models import Min
+from nautobot.dcim.models import Device, InventoryItem
+
+from nautobot_device_lifecycle_mgmt import choices
+from nautobot_device_lifecycle_mgmt.models import (
+    DeviceHardwareEoXResult,
+    DeviceHardwareNotice,
+    HardwareLCM,
+    InventoryItemHardwareEoXResult,
+)
+from nautobot_device_lifecycle_mgmt.report_results import get_run_fields, update_report_results
+
+
+# Number of DeviceHardwareNotice rows inserted per query.
+HARDWARE_NOTICE_BATCH_SIZE = 1000
+
+# HardwareLCM milestones summarized by the hardware EoX results.
+HARDWARE_EOX_FIELDS = ("end_of_sale", "end_of_support", "end_of_sw_releases", "end_of_security_patches")
+
+
+def get_device_hardware_notice_keys(hardware_notice_pks=None, device_pks=None, inventory_item_pks=None):
+    """Return the set of `(device pk, inventory item pk or None, notice pk)` mappings of the given scope.
+
+    Each argument restricts the scope to the mappings of those HardwareLCM, Device or InventoryItem pks; the mappings
+    of the whole database are returned when all are None.
+    """
+    notices = HardwareLCM.objects.all()
+    if hardware_notice_pks is not None:
+        notices = notices.filter(pk__in=hardware_notice_pks)
+
+    keys = set()
+    if inventory_item_pks is None:
+        devices = Device.objects.filter(device_type__in=notices.values("device_type"))
+        if device_pks is not None:
+            devices = devices.filter(pk__in=device_pks)
+        notice_by_device_type = dict(
+            notices.filter(device_type__isnull=False).values_list("device_type_id", "pk").order_by()
+        )
+        keys.update(
+            (device_pk, None, notice_by_device_type[device_type_pk])
+            for device_pk, device_type_pk in devices.values_list("pk", "device_type_id").order_by()
+        )
+
+    inventory_items = InventoryItem.objects.filter(part_id__in=notices.values("inventory_item"))
+    if device_pks is not None:
+        inventory_items = inventory_items.filter(device__in=device_pks)
+    if inventory_item_pks is not None:
+        inventory_items = inventory_items.filter(pk__in=inventory_item_pks)
+    item_rows = list(inventory_items.values_list("pk", "device_id", "part_id").order_by())
+    notice_by_part = dict(
+        notices.filter(inventory_item__in={part_id for _, _, part_id in item_rows})
+        .values_list("inventory_item", "pk")
+        .order_by()
+    )
+    keys.update((device_pk, item_pk, notice_by_part[part_id]) for item_pk, device_pk, part_id in item_rows)
+    return keys
+
+
+def sync_device_hardware_notices(hardware_notice_pks=None, device_pks=None, inventory_item_pks=None):
+    """Bring the DeviceHardwareNotice mappings of the given scope up to date.
+
+    The scope is given as in `get_device_hardware_notice_keys()`. Obsolete mappings are deleted and missing ones
+    created in bulk. Returns `(number of mappings created, number of mappings deleted)`.
+    """
+    existing = DeviceHardwareNotice.objects.all()
+    if hardware_notice_pks is not None:
+        existing = existing.filter(hardware_notice__in=hardware_notice_pks)
+    if device_pks is not None:
+        existing = existing.filter(device__in=device_pks)
+    if inventory_item_pks is not None:
+        existing = existing.filter(inventory_item__in=inventory_item_pks)
+    existing_keys = {
+        (device_pk, item_pk, notice_pk): pk
+        for pk, device_pk, item_pk, notice_pk in existing.values_list(
+            "pk", "device_id", "inventory_item_id", "hardware_notice_id"
+        ).order_by()
+    }
+
+    keys = get_device_hardware_notice_keys(hardware_notice_pks, device_pks, inventory_item_pks)
+    obsolete = [pk for key, pk in existing_keys.items() if key not in keys]
+    if obsolete:
+        DeviceHardwareNotice.objects.filter(pk__in=obsolete).delete()
+    missing = keys.difference(existing_keys)
+    DeviceHardwareNotice.objects.bulk_create(
+        [
+            DeviceHardwareNotice(device_id=device_pk, inventory_item_id=item_pk, hardware_notice_id=notice_pk)
+            for device_pk, item_pk, notice_pk in missing
+        ],
+        batch_size=HARDWARE_NOTICE_BATCH_SIZE,
+    )
+    return len(missing), len(obsolete)
+
+
+def get_hardware_eox_dates(key_field, mappings):
+    """Return `{key pk: {milestone: earliest date}}` over the DeviceHardwareNotice `mappings`, grouped by `key_field`.
+
+    The dates are aggregated in a single grouped query.
+    """
+    rows = (
+        mappings.order_by()
+        .values(key_field)
+        .annotate(**{f"eox_{field}": Min(f"hardware_notice__{field}") for field in HARDWARE_EOX_FIELDS})
+    )
+    return {row[key_field]: {field: row[f"eox_{field}"] for field in HARDWARE_EOX_FIELDS} for row in rows}
+
+
+def update_hardware_eox_results(
+    result_model, key_field, eox_dates, last_run, run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN
+):
+    """Replace the `result_model` records, keyed by their `key_field` relation, with the given `eox_dates`.
+
+    The results of objects missing from `eox_dates` are deleted, as in `update_report_results()`.
+    Returns `(number of results created, number of results updated, number of results deleted)`.
+    """
+    return update_report_results(
+        result_model, key_field, HARDWARE_EOX_FIELDS, eox_dates, get_run_fields(last_run, run_type)
+    )
+
+
+def update_device_hardware_eox_results(last_run, run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN):
+    """Refresh the DeviceHardwareEoXResult of every Device with hardware notices.
+
+    The milestones of a Device are the earliest of all the notices of its device type and of its Inventory Items.
+    """
+    eox_dates = get_hardware_eox_dates("device", DeviceHardwareNotice.objects.all())
+    return update_hardware_eox_results(DeviceHardwareEoXResult, "device", eox_dates, last_run, run_type)
+
+
+def update_inventory_item_hardware_eox_results(last_run, run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN):
+    """Refresh the InventoryItemHardwareEoXResult of every Inventory Item with hardware notices."""
+    eox_dates = get_hardware_eox_dates(
+        "inventory_item", DeviceHardwareNotice.objects.filter(inventory_item__isnull=False)
+    )
+    return update_hardware_eox_results(InventoryItemHardwareEoXResult, "inventory_item", eox_dates, last_run, run_type)
@@ -1,5 +1,20 @@
 """Nautobot Jobs for the Device Lifecycle plugin."""
-from .cve_tracking import GenerateVulnerabilities
-from .lifecycle_reporting import DeviceSoftwareValidationFullReport, InventoryItemSoftwareValidationFullReport
+from .cve_tracking import GenerateVulnerabilities, ImportNVDFeeds, LinkAffectedSoftware
+from .lifecycle_reporting import (
+    ContractCoverageFullReport,
+    DeviceSoftwareValidationFullReport,
+    FleetUpgradePlanReport,
+    HardwareEoXFullReport,
+    InventoryItemSoftwareValidationFullReport,
+)
 
-jobs = [DeviceSoftwareValidationFullReport, InventoryItemSoftwareValidationFullReport, GenerateVulnerabilities]
+jobs = [
+    DeviceSoftwareValidationFullReport,
+    InventoryItemSoftwareValidationFullReport,
+    HardwareEoXFullReport,
+    ContractCoverageFullReport,
+    FleetUpgradePlanReport,
+    ImportNVDFeeds,
+    LinkAffectedSoftware,
+    GenerateVulnerabilities,
+]
@@ -1,12 +1,18 @@
 """Jobs for the CVE Tracking portion of the Device Lifecycle plugin."""
+import os
 from datetime import datetime
 
-from nautobot.extras.jobs import Job, StringVar, BooleanVar
-from nautobot.extras.models import Relationship, RelationshipAssociation
+from nautobot.extras.jobs import Job, StringVar, BooleanVar, ObjectVar
+from nautobot.extras.models import Status
 
-from nautobot_device_lifecycle_mgmt.models import (
-    CVELCM,
-    VulnerabilityLCM,
+from nautobot_device_lifecycle_mgmt.models import CVELCM
+from nautobot_device_lifecycle_mgmt.nvd_import import get_feed_paths, import_nvd_feed
+from nautobot_device_lifecycle_mgmt.vulnerability_bulk import (
+    create_missing_vulnerabilities,
+    iter_obsolete_vulnerabilities,
+    iter_vulnerability_keys,
+    link_affected_softwares,
+    retire_vulnerabilities,
 )
 
 
@@ -26,47 +32,121 @@ class GenerateVulnerabilities(Job):
         default="1970-01-01",
         required=False,
     )
+    reconcile = BooleanVar(
+        label="Reconcile",
+        description="Also retire the Vulnerabilities whose software is no longer associated to their CVE or object.",
+        required=False,
+    )
+    obsolete_status = ObjectVar(
+        model=Status,
+        label="Obsolete Status",
+        description="Status set on the retired Vulnerabilities. Leave empty to delete them.",
+        query_params={"content_types": "nautobot_device_lifecycle_mgmt.vulnerabilitylcm"},
+        required=False,
+    )
 
     class Meta:  # pylint: disable=too-few-public-methods
         """Meta class for the job."""
 
         commit_default = True
-        field_order = ["published_after", "_task_queue", "debug", "_commit"]
+        field_order = ["published_after", "reconcile", "obsolete_status", "_task_queue", "debug", "_commit"]
 
     debug = BooleanVar(description="Enable for more verbose logging.")
 
-    def run(self, data, commit):  # pylint: disable=too-many-locals
-        """Check if software assigned to each device is valid. If no software is assigned return warning message."""
+    def run(self, data, commit):
+        """Create the missing vulnerabilities of the devices and inventory items running software affected by CVEs."""
         # Although the default is set on the class attribute for the UI, it doesn't default for the API
-        published_after = data.get("published_after", "1970-01-01")
+        published_after = data.get("published_after") or "1970-01-01"
+        cves = CVELCM.objects.filter(published_date__gte=datetime.fromisoformat(published_after))
+
+        created = 0
+        for software_pks, keys in iter_vulnerability_keys(cves):
+            batch_created = create_missing_vulnerabilities(cves, software_pks, keys)
+            created += batch_created
+            if data.get("debug"):
+                self.log_info(
+                    message=f"Generated {batch_created} vulnerabilities for {len(software_pks)} software versions."
+                )
+        self.log_success(message=f"Processed {cves.count()} CVEs and generated {created} Vulnerabilities.")
+
+        if data.get("reconcile"):
+            self.reconcile_vulnerabilities(cves, data.get("obsolete_status"), data.get("debug"))
+
+    def reconcile_vulnerabilities(self, cves, status, debug):
+        """Retire the vulnerabilities of `cves` that are no longer backed by associations."""
+        retired = 0
+        for pks in iter_obsolete_vulnerabilities(cves, status):
+            retire_vulnerabilities(pks, status)
+            retired += len(pks)
+            if debug:
+                self.log_info(message=f"Retired {len(pks)} obsolete vulnerabilities.")
+        action = f"set status {status} on" if status else "deleted"
+        self.log_success(message=f"Reconciliation {action} {retired} obsolete Vulnerabilities.")
+
+
+class LinkAffectedSoftware(Job):
+    """Associates CVELCM objects to the SoftwareLCM objects matching their affected versions."""
+
+    name = "Link CVEs to Affected Software"
+    description = "Creates the missing CVE to Software associations from the affected versions of the CVEs."
+    read_only = False
+    published_after = StringVar(
+        regex=r"^[0-9]{4}\-[0-9]{2}\-[0-9]{2}$",
+        label="CVEs Published After",
+        description="Enter a date in ISO Format (YYYY-MM-DD) to only process CVEs published after that date.",
+        default="1970-01-01",
+        required=False,
+    )
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Meta class for the job."""
+
+        commit_default = True
+        field_order = ["published_after", "_task_queue", "_commit"]
+
+    def run(self, data, commit):
+        """Match the affected version ranges of the CVEs against the software versions of their platforms."""
+        published_after = data.get("published_after") or "1970-01-01"
         cves = CVELCM.objects.filter(published_date__gte=datetime.fromisoformat(published_after))
-        count_before = VulnerabilityLCM.objects.count()
-
-        for cve in cves:
-            if data["debug"]:
-                self.log_info(obj=cve, message="Generating vulnerabilities for CVE {cve}")
-            software_rels = RelationshipAssociation.objects.filter(relationship__slug="soft_cve", destination_id=cve.id)
-            for soft_rel in software_rels:
-
-                # Loop through any device relationships
-                device_rels = soft_rel.source.get_relationships()["source"][
-                    Relationship.objects.get(slug="device_soft")
-                ]
-                for dev_rel in device_rels:
-                    vuln_obj, _ = VulnerabilityLCM.objects.get_or_create(
-                        cve=cve, software=dev_rel.source, device=dev_rel.destination
-                    )
-                    vuln_obj.validated_save()
-
-                # Loop through any inventory tem relationships
-                item_rels = soft_rel.source.get_relationships()["source"][
-                    Relationship.objects.get(slug="inventory_item_soft")
-                ]
-                for item_rel in item_rels:
-                    vuln_obj, _ = VulnerabilityLCM.objects.get_or_create(
-                        cve=cve, software=item_rel.source, inventory_item=item_rel.destination
-                    )
-                    vuln_obj.validated_save()
-
-        diff = VulnerabilityLCM.objects.count() - count_before
-        self.log_success(message=f"Processed {cves.count()} CVEs and generated {diff} Vulnerabilities.")
+
+        created, invalid = link_affected_softwares(cves)
+        for cve_name in invalid:
+            self.log_warning(message=f"Skipped the invalid affected versions of CVE {cve_name}.")
+        self.log_success(message=f"Processed {cves.count()} CVEs and created {created} CVE to Software associations.")
+
+
+class ImportNVDFeeds(Job):
+    """Creates or updates CVELCM objects from NVD JSON feed files."""
+
+    name = "Import NVD Feeds"
+    description = "Creates or updates CVEs from NVD JSON feed files."
+    read_only = False
+    feed_path = StringVar(
+        label="Feed Path",
+        description="Path, on the Nautobot worker, of an NVD JSON feed file (.json or .json.gz) or of a directory of "
+        "feed files.",
+    )
+    force = BooleanVar(description="Import the feed files even if they did not change since their last import.")
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Meta class for the job."""
+
+        commit_default = True
+        field_order = ["feed_path", "force", "_task_queue", "_commit"]
+
+    def run(self, data, commit):
+        """Import each feed file, skipping the files that did not change since their last import."""
+        path = data["feed_path"]
+        if not os.path.exists(path):
+            self.log_failure(message=f"Feed path {path} does not exist.")
+            return
+
+        for feed_path in get_feed_paths(path):
+            counts = import_nvd_feed(feed_path, force=data.get("force"))
+            if counts is None:
+                self.log_info(message=f"Skipped {feed_path}, unchanged since its last import.")
+            else:
+                self.log_success(
+                    message=f"Imported {feed_path}: {counts['created']} CVEs created, {counts['updated']} updated, "
+                    f"{counts['unchanged']} unchanged and {counts['skipped']} skipped."
+                )
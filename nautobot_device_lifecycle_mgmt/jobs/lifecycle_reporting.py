@@ -1,16 +1,29 @@
 """Jobs for the Lifecycle Management plugin."""
 from datetime import datetime
+from urllib.parse import urlencode
 
-from nautobot.dcim.models import Device, InventoryItem
-from nautobot.extras.jobs import Job
+from django.urls import reverse
+from nautobot.dcim.filters import DeviceFilterSet
+from nautobot.dcim.models import Device, DeviceRole, InventoryItem, Region, Site
+from nautobot.extras.jobs import Job, MultiObjectVar
 
 from nautobot_device_lifecycle_mgmt import choices
+from nautobot_device_lifecycle_mgmt.contract_coverage import (
+    update_device_contract_coverage,
+    update_inventory_item_contract_coverage,
+)
+from nautobot_device_lifecycle_mgmt.hardware_notices import (
+    sync_device_hardware_notices,
+    update_device_hardware_eox_results,
+    update_inventory_item_hardware_eox_results,
+)
 from nautobot_device_lifecycle_mgmt.models import (
     DeviceSoftwareValidationResult,
     InventoryItemSoftwareValidationResult,
     ValidatedSoftwareLCM,
 )
 from nautobot_device_lifecycle_mgmt.software import DeviceSoftware, InventoryItemSoftware
+from nautobot_device_lifecycle_mgmt.upgrade_plan import FleetUpgradePlan
 
 
 name = "Device/Software Lifecycle Reporting"  # pylint: disable=invalid-name
@@ -75,3 +88,106 @@ class InventoryItemSoftwareValidationFullReport(Job):
             validate_obj.validated_save()
 
         self.log_success(message=f"Performed validation on: {inventory_items.count()} inventory items.")
+
+
+class HardwareEoXFullReport(Job):
+    """Summarizes the end of life milestones of the hardware of devices and inventory items."""
+
+    name = "Hardware EoX Report"
+    description = (
+        "Records the earliest end of life milestones of the hardware notices of each device and inventory item."
+    )
+    read_only = False
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Meta class for the job."""
+
+        commit_default = True
+
+    def run(self, data, commit):
+        """Refresh the hardware EoX results of all devices and inventory items in bulk."""
+        job_run_time = datetime.now()
+        created, deleted = sync_device_hardware_notices()
+        if created or deleted:
+            self.log_info(message=f"Caught up {created} new and {deleted} obsolete hardware notice mappings.")
+
+        created, updated, deleted = update_device_hardware_eox_results(job_run_time)
+        self.log_success(
+            message=f"Hardware EoX results of devices: {created} created, {updated} updated, {deleted} deleted."
+        )
+        created, updated, deleted = update_inventory_item_hardware_eox_results(job_run_time)
+        self.log_success(
+            message=f"Hardware EoX results of inventory items: {created} created, {updated} updated, {deleted} deleted."
+        )
+
+
+class ContractCoverageFullReport(Job):
+    """Summarizes the support contract coverage of devices and inventory items."""
+
+    name = "Contract Coverage Report"
+    description = "Records the active contract and the next coverage gap of each device and inventory item."
+    read_only = False
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Meta class for the job."""
+
+        commit_default = True
+
+    def run(self, data, commit):
+        """Refresh the contract coverage of all devices and inventory items in bulk."""
+        job_run_time = datetime.now()
+        created, updated, deleted = update_device_contract_coverage(job_run_time)
+        self.log_success(
+            message=f"Contract coverage of devices: {created} created, {updated} updated, {deleted} deleted."
+        )
+        created, updated, deleted = update_inventory_item_contract_coverage(job_run_time)
+        self.log_success(
+            message=f"Contract coverage of inventory items: {created} created, {updated} updated, {deleted} deleted."
+        )
+
+
+class FleetUpgradePlanReport(Job):
+    """Plans the upgrade of devices to their preferred validated software."""
+
+    name = "Fleet Upgrade Plan"
+    description = "Computes the target software and image of each device and groups the upgrades into waves."
+    read_only = True
+    regions = MultiObjectVar(model=Region, required=False, description="Only plan the devices of these regions.")
+    sites = MultiObjectVar(model=Site, required=False, description="Only plan the devices of these sites.")
+    roles = MultiObjectVar(model=DeviceRole, required=False, description="Only plan the devices with these roles.")
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Meta class for the job."""
+
+        field_order = ["regions", "sites", "roles", "_task_queue"]
+
+    def run(self, data, commit):
+        """Plan the upgrade of the selected devices and report the upgrade waves."""
+        filter_params = {
+            "region": [str(region.pk) for region in data.get("regions") or []],
+            "site": [str(site.pk) for site in data.get("sites") or []],
+            "role_id": [str(role.pk) for role in data.get("roles") or []],
+        }
+        filter_params = {key: value for key, value in filter_params.items() if value}
+        devices = DeviceFilterSet(filter_params, Device.objects.all()).qs
+
+        plan = FleetUpgradePlan(devices)
+        for _ in plan:
+            pass
+        for wave in plan.waves.values():
+            targets = ", ".join(f"{version} ({count})" for version, count in wave["target_softwares"].items())
+            self.log_info(
+                message=f"Wave {wave['wave']}: upgrade {wave['device_count']} {wave['platform'] or 'no platform'} "
+                f"{wave['device_type']} devices to {targets}."
+            )
+
+        export_url = reverse("plugins:nautobot_device_lifecycle_mgmt:upgrade_plan")
+        query = urlencode({**filter_params, "export": "csv"}, doseq=True)
+        counts = plan.status_counts
+        self.log_success(
+            message=f"Planned {sum(counts.values())} devices: "
+            f"{counts[choices.UpgradePlanStatusChoices.CURRENT]} on target software, "
+            f"{counts[choices.UpgradePlanStatusChoices.UPGRADE]} to upgrade in {len(plan.waves)} waves and "
+            f"{counts[choices.UpgradePlanStatusChoices.NO_TARGET]} without validated software. "
+            f"[Export the plan]({export_url}?{query})"
+        )
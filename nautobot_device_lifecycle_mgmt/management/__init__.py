@@ -0,0 +1 @@
+"""Management commands for the Device Lifecycle plugin."""
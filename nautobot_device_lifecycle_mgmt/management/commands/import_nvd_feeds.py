@@ -0,0 +1,47 @@
+"""Import NVD JSON feed files into CVELCM."""
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot_device_lifecycle_mgmt.nvd_import import NVD_IMPORT_BATCH_SIZE, get_feed_paths, import_nvd_feed
+
+
+class Command(BaseCommand):
+    """Create or update CVEs from NVD JSON feed files."""
+
+    help = (
+        "Create or update CVEs from NVD JSON feed files (.json or .json.gz), or directories of feed files. Files "
+        "that did not change since their last import are skipped."
+    )
+
+    def add_arguments(self, parser):
+        """Add the command arguments."""
+        parser.add_argument("paths", nargs="+", help="Feed files or directories of feed files.")
+        parser.add_argument(
+            "--force", action="store_true", help="Import the files even if they did not change since their last import."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=NVD_IMPORT_BATCH_SIZE,
+            help="Number of CVEs created or updated at a time.",
+        )
+
+    def handle(self, *args, **options):
+        """Import the feed files."""
+        for path in options["paths"]:
+            if not os.path.exists(path):
+                raise CommandError(f"Feed path {path} does not exist.")
+
+        for path in options["paths"]:
+            for feed_path in get_feed_paths(path):
+                counts = import_nvd_feed(feed_path, force=options["force"], batch_size=options["batch_size"])
+                if counts is None:
+                    self.stdout.write(f"Skipped {feed_path}, unchanged since its last import.")
+                else:
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"Imported {feed_path}: {counts['created']} CVEs created, {counts['updated']} updated, "
+                            f"{counts['unchanged']} unchanged and {counts['skipped']} skipped."
+                        )
+                    )
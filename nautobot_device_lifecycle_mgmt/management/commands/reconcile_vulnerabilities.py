@@ -0,0 +1,63 @@
+"""Retire the Vulnerabilities that are no longer backed by CVE and software associations."""
+from datetime import date
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from nautobot.extras.models import Status
+
+from nautobot_device_lifecycle_mgmt.models import CVELCM, VulnerabilityLCM
+from nautobot_device_lifecycle_mgmt.vulnerability_bulk import (
+    VULNERABILITY_BATCH_SIZE,
+    iter_obsolete_vulnerabilities,
+    retire_vulnerabilities,
+)
+
+
+class Command(BaseCommand):
+    """Retire obsolete Vulnerabilities, committing each batch separately."""
+
+    help = (
+        "Set a status on, or delete, the Vulnerabilities whose software is no longer associated to their CVE or to "
+        "their device or inventory item. Each batch is committed on its own, so locks are only held briefly."
+    )
+
+    def add_arguments(self, parser):
+        """Add the command arguments."""
+        parser.add_argument(
+            "--published-after",
+            type=date.fromisoformat,
+            default=date(1970, 1, 1),
+            help="Only reconcile the Vulnerabilities of CVEs published after this date (YYYY-MM-DD).",
+        )
+        parser.add_argument(
+            "--status", help="Slug of the Status set on obsolete Vulnerabilities. They are deleted if not given."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=VULNERABILITY_BATCH_SIZE,
+            help="Number of Vulnerabilities checked and retired per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        """Run the reconciliation."""
+        status = None
+        if options["status"]:
+            try:
+                status = Status.objects.get(
+                    slug=options["status"], content_types=ContentType.objects.get_for_model(VulnerabilityLCM)
+                )
+            except Status.DoesNotExist as err:
+                raise CommandError(f"No Vulnerability status with slug {options['status']}.") from err
+
+        cves = CVELCM.objects.filter(published_date__gte=options["published_after"])
+        retired = 0
+        for pks in iter_obsolete_vulnerabilities(cves, status, options["batch_size"]):
+            with transaction.atomic():
+                retire_vulnerabilities(pks, status)
+            retired += len(pks)
+            self.stdout.write(f"Retired {retired} obsolete Vulnerabilities so far.")
+
+        self.stdout.write(self.style.SUCCESS(f"Retired {retired} obsolete Vulnerabilities."))
@@ -0,0 +1,21 @@
+"""Rebuild the mapping of Hardware Notices to the Devices and InventoryItems they apply to."""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from nautobot_device_lifecycle_mgmt.hardware_notices import sync_device_hardware_notices
+
+
+class Command(BaseCommand):
+    """Bring the whole Hardware Notice mapping up to date."""
+
+    help = (
+        "Create the missing, and delete the obsolete, mappings of Hardware Notices to Devices and InventoryItems. "
+        "The mapping is maintained on save; run this command after bulk changes made without signals, such as "
+        "QuerySet.update() of InventoryItem part IDs."
+    )
+
+    def handle(self, *args, **options):
+        """Run the synchronization."""
+        with transaction.atomic():
+            created, deleted = sync_device_hardware_notices()
+        self.stdout.write(self.style.SUCCESS(f"Created {created} and deleted {deleted} Hardware Notice mappings."))
@@ -3,10 +3,11 @@ from datetime import datetime
 
 from django.db.models import Case, Count, F, IntegerField, OuterRef, Q, Subquery, Value, When
 from django.db.models.functions import Coalesce
-from nautobot.dcim.models import Device, DeviceType, InventoryItem, Site
+from nautobot.dcim.models import DeviceType, InventoryItem, Site
 from prometheus_client.core import GaugeMetricFamily
 
 from nautobot_device_lifecycle_mgmt.models import (
+    DeviceHardwareNotice,
     DeviceSoftwareValidationResult,
     HardwareLCM,
     InventoryItemSoftwareValidationResult,
@@ -187,33 +188,21 @@ def metrics_lcm_hw_end_of_support():  # pylint: disable=too-many-locals
     init_site_counts = Site.objects.values(site_slug=F("slug")).annotate(
         site_count=Value(0, output_field=IntegerField())
     )
-    # Get count of out of hw support devices per site
-    hw_end_of_support_per_site_devices = (
-        Device.objects.order_by()
-        .filter(device_type_id__in=hw_end_of_support_device_types)
-        .values(site_slug=F("site__slug"))
-        .annotate(site_count=Count("id"))
-    )
-    # Get count of out of hw support inventory items per site
-    hw_end_of_support_per_site_invitems = (
-        InventoryItem.objects.order_by()
-        .filter(part_id__in=hw_end_of_support_invitems)
+    # Get count of out of hw support devices and inventory items per site, from the precomputed notice mapping
+    hw_end_of_support_per_site = (
+        DeviceHardwareNotice.objects.order_by()
+        .filter(hardware_notice__in=hw_end_of_support)
         .values(site_slug=F("device__site__slug"))
         .annotate(site_count=Count("id"))
     )
 
-    # Build subqueries used in the final query offloading count sum to the DB
-    hw_end_of_support_per_site_devices_sq = Subquery(
-        hw_end_of_support_per_site_devices.filter(site_slug=OuterRef("site_slug")).values_list("site_count")
-    )
-    hw_end_of_support_per_site_invitems_sq = Subquery(
-        hw_end_of_support_per_site_invitems.filter(site_slug=OuterRef("site_slug")).values_list("site_count")
+    # Build subquery used in the final query offloading count sum to the DB
+    hw_end_of_support_per_site_sq = Subquery(
+        hw_end_of_support_per_site.filter(site_slug=OuterRef("site_slug")).values_list("site_count")
     )
     # Build query summing counts per site and generate corresponding metrics
     for site_slug, total_count in init_site_counts.annotate(
-        total_count=F("site_count")
-        + Coalesce(hw_end_of_support_per_site_devices_sq, 0)
-        + Coalesce(hw_end_of_support_per_site_invitems_sq, 0)
+        total_count=F("site_count") + Coalesce(hw_end_of_support_per_site_sq, 0)
     ).values_list("site_slug", "total_count"):
         hw_end_of_support_site_gauge.add_metric(labels=[site_slug], value=total_count)
 
@@ -0,0 +1,33 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:36
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_device_lifecycle_mgmt", "0012_add_related_name_to_results_model"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NVDFeedImport",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("file_name", models.CharField(max_length=255, unique=True)),
+                ("checksum", models.CharField(max_length=64)),
+                ("last_import", models.DateTimeField()),
+                ("cve_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "NVD Feed Import",
+                "ordering": ("file_name",),
+            },
+        ),
+    ]
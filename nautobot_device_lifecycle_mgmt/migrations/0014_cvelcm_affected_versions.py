@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_device_lifecycle_mgmt", "0013_nvdfeedimport"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cvelcm",
+            name="affected_versions",
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
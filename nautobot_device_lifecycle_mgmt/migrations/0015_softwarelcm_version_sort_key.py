@@ -0,0 +1,43 @@
+# Generated by Django 3.2.25 on 2026-10-19 10:56
+
+from django.db import migrations, models
+
+from nautobot_device_lifecycle_mgmt.versions import get_version_key
+
+
+def populate_version_sort_keys(apps, schema_editor):
+    """
+    Compute the version sort key of the existing SoftwareLCM objects.
+    """
+    SoftwareLCM = apps.get_model("nautobot_device_lifecycle_mgmt", "SoftwareLCM")
+    softwares = list(SoftwareLCM.objects.only("pk", "version"))
+    for software in softwares:
+        software.version_sort_key = get_version_key(software.version)
+    SoftwareLCM.objects.bulk_update(softwares, ["version_sort_key"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_device_lifecycle_mgmt", "0014_cvelcm_affected_versions"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="softwarelcm",
+            options={
+                "ordering": ("device_platform", "version_sort_key", "end_of_support", "release_date"),
+                "verbose_name": "Software",
+            },
+        ),
+        migrations.AddField(
+            model_name="softwarelcm",
+            name="version_sort_key",
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name="softwarelcm",
+            index=models.Index(fields=["device_platform", "version_sort_key"], name="nautobot_de_device__7bb813_idx"),
+        ),
+        migrations.RunPython(populate_version_sort_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 3.2.25 on 2026-10-19 11:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def populate_device_hardware_notices(apps, schema_editor):
+    """
+    Map the existing HardwareLCM objects to the Devices and InventoryItems they apply to.
+    """
+    HardwareLCM = apps.get_model("nautobot_device_lifecycle_mgmt", "HardwareLCM")
+    DeviceHardwareNotice = apps.get_model("nautobot_device_lifecycle_mgmt", "DeviceHardwareNotice")
+    Device = apps.get_model("dcim", "Device")
+    InventoryItem = apps.get_model("dcim", "InventoryItem")
+
+    notice_by_device_type = dict(
+        HardwareLCM.objects.filter(device_type__isnull=False).values_list("device_type_id", "pk")
+    )
+    notice_by_part = dict(HardwareLCM.objects.filter(inventory_item__isnull=False).values_list("inventory_item", "pk"))
+    mappings = [
+        DeviceHardwareNotice(device_id=device_pk, hardware_notice_id=notice_by_device_type[device_type_pk])
+        for device_pk, device_type_pk in Device.objects.filter(device_type__in=notice_by_device_type).values_list(
+            "pk", "device_type_id"
+        )
+    ]
+    mappings.extend(
+        DeviceHardwareNotice(device_id=device_pk, inventory_item_id=item_pk, hardware_notice_id=notice_by_part[part_id])
+        for item_pk, device_pk, part_id in InventoryItem.objects.filter(part_id__in=notice_by_part).values_list(
+            "pk", "device_id", "part_id"
+        )
+    )
+    DeviceHardwareNotice.objects.bulk_create(mappings, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dcim", "0023_interface_redundancy_group_data_migration"),
+        ("nautobot_device_lifecycle_mgmt", "0015_softwarelcm_version_sort_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeviceHardwareNotice",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                (
+                    "device",
+                    models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="+", to="dcim.device"),
+                ),
+                (
+                    "hardware_notice",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="device_mappings",
+                        to="nautobot_device_lifecycle_mgmt.hardwarelcm",
+                    ),
+                ),
+                (
+                    "inventory_item",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="dcim.inventoryitem",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Device Hardware Notice",
+                "ordering": ("device", "hardware_notice"),
+            },
+        ),
+        migrations.AddIndex(
+            model_name="devicehardwarenotice",
+            index=models.Index(fields=["device", "hardware_notice"], name="nautobot_de_device__7febd6_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="devicehardwarenotice",
+            index=models.Index(fields=["hardware_notice", "device"], name="nautobot_de_hardwar_82c5a7_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="devicehardwarenotice",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("inventory_item__isnull", True)),
+                fields=("device", "hardware_notice"),
+                name="unique_device_hardware_notice",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="devicehardwarenotice",
+            constraint=models.UniqueConstraint(
+                fields=("inventory_item", "hardware_notice"), name="unique_inventory_item_hardware_notice"
+            ),
+        ),
+        migrations.RunPython(populate_device_hardware_notices, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 3.2.25 on 2026-10-19 11:16
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+import nautobot.extras.models.mixins
+import taggit.managers
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("extras", "0058_jobresult_add_time_status_idxs"),
+        ("dcim", "0023_interface_redundancy_group_data_migration"),
+        ("nautobot_device_lifecycle_mgmt", "0016_devicehardwarenotice"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InventoryItemHardwareEoXResult",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("created", models.DateField(auto_now_add=True, null=True)),
+                ("last_updated", models.DateTimeField(auto_now=True, null=True)),
+                (
+                    "_custom_field_data",
+                    models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder),
+                ),
+                ("end_of_sale", models.DateField(blank=True, db_index=True, null=True)),
+                ("end_of_support", models.DateField(blank=True, db_index=True, null=True)),
+                ("end_of_sw_releases", models.DateField(blank=True, db_index=True, null=True)),
+                ("end_of_security_patches", models.DateField(blank=True, db_index=True, null=True)),
+                ("last_run", models.DateTimeField(blank=True, null=True)),
+                ("run_type", models.CharField(max_length=50)),
+                (
+                    "inventory_item",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="inventoryitem_hardware_eox",
+                        to="dcim.inventoryitem",
+                    ),
+                ),
+                ("tags", taggit.managers.TaggableManager(through="extras.TaggedItem", to="extras.Tag")),
+            ],
+            options={
+                "verbose_name": "Inventory Item Hardware EoX Report",
+                "ordering": ("inventory_item",),
+            },
+            bases=(
+                models.Model,
+                nautobot.extras.models.mixins.DynamicGroupMixin,
+                nautobot.extras.models.mixins.NotesMixin,
+            ),
+        ),
+        migrations.CreateModel(
+            name="DeviceHardwareEoXResult",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("created", models.DateField(auto_now_add=True, null=True)),
+                ("last_updated", models.DateTimeField(auto_now=True, null=True)),
+                (
+                    "_custom_field_data",
+                    models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder),
+                ),
+                ("end_of_sale", models.DateField(blank=True, db_index=True, null=True)),
+                ("end_of_support", models.DateField(blank=True, db_index=True, null=True)),
+                ("end_of_sw_releases", models.DateField(blank=True, db_index=True, null=True)),
+                ("end_of_security_patches", models.DateField(blank=True, db_index=True, null=True)),
+                ("last_run", models.DateTimeField(blank=True, null=True)),
+                ("run_type", models.CharField(max_length=50)),
+                (
+                    "device",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="device_hardware_eox",
+                        to="dcim.device",
+                    ),
+                ),
+                ("tags", taggit.managers.TaggableManager(through="extras.TaggedItem", to="extras.Tag")),
+            ],
+            options={
+                "verbose_name": "Device Hardware EoX Report",
+                "ordering": ("device",),
+            },
+            bases=(
+                models.Model,
+                nautobot.extras.models.mixins.DynamicGroupMixin,
+                nautobot.extras.models.mixins.NotesMixin,
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 3.2.25 on 2026-10-19 11:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_device_lifecycle_mgmt", "0017_hardware_eox_results"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="contractlcm",
+            name="end",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="hardwarelcm",
+            name="end_of_sale",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="hardwarelcm",
+            name="end_of_security_patches",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="hardwarelcm",
+            name="end_of_support",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="hardwarelcm",
+            name="end_of_sw_releases",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+    ]
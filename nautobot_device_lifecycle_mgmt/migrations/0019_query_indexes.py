@@ -0,0 +1,65 @@
+# Generated by Django 3.2.25 on 2026-10-19 11:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_device_lifecycle_mgmt", "0018_expiry_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="cvelcm",
+            name="published_date",
+            field=models.DateField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name="softwarelcm",
+            name="end_of_support",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="cvelcm",
+            index=models.Index(fields=["severity", "name"], name="nautobot_de_severit_affc91_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="devicesoftwarevalidationresult",
+            index=models.Index(fields=["run_type", "last_run"], name="nautobot_de_run_typ_6cd744_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="devicesoftwarevalidationresult",
+            index=models.Index(fields=["is_validated"], name="nautobot_de_is_vali_63b95e_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="inventoryitemsoftwarevalidationresult",
+            index=models.Index(fields=["run_type", "last_run"], name="nautobot_de_run_typ_404260_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="inventoryitemsoftwarevalidationresult",
+            index=models.Index(fields=["is_validated"], name="nautobot_de_is_vali_24cb26_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="validatedsoftwarelcm",
+            index=models.Index(fields=["software", "preferred", "start"], name="nautobot_de_softwar_69861e_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="validatedsoftwarelcm",
+            index=models.Index(fields=["start", "end"], name="nautobot_de_start_abc4ee_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="validatedsoftwarelcm",
+            index=models.Index(
+                condition=models.Q(("preferred", True)), fields=["start", "end"], name="validatedsoft_preferred_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vulnerabilitylcm",
+            index=models.Index(fields=["cve", "software", "device"], name="nautobot_de_cve_id_02344b_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="vulnerabilitylcm",
+            index=models.Index(fields=["cve", "software", "inventory_item"], name="nautobot_de_cve_id_45e4c2_idx"),
+        ),
+    ]
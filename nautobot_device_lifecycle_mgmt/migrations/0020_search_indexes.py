@@ -0,0 +1,70 @@
+from django.db import DatabaseError, migrations, models, transaction
+
+
+# Text fields searched by the `q` filters, keyed by model.
+TRIGRAM_SEARCH_FIELDS = {
+    "softwarelcm": ("version", "alias"),
+    "softwareimagelcm": ("image_file_name",),
+    "contractlcm": ("name", "contract_type", "support_level"),
+    "providerlcm": ("name", "description", "physical_address", "phone", "email"),
+    "contactlcm": ("name", "email", "phone", "address"),
+    "cvelcm": ("name", "link"),
+}
+
+
+def get_trigram_indexes(apps):
+    """
+    Yield the name, table and column of each trigram index.
+    """
+    for model_name, field_names in TRIGRAM_SEARCH_FIELDS.items():
+        model = apps.get_model("nautobot_device_lifecycle_mgmt", model_name)
+        for field_name in field_names:
+            column = model._meta.get_field(field_name).column
+            yield f"dlm_{model_name}_{column}_trgm", model._meta.db_table, column
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    Create the trigram indexes serving the case-insensitive `icontains` searches on PostgreSQL.
+
+    The indexes are skipped when the pg_trgm extension cannot be installed; the searches then work without them.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except DatabaseError:
+        return
+    quote_name = schema_editor.quote_name
+    for index_name, table, column in get_trigram_indexes(apps):
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {quote_name(index_name)} ON {quote_name(table)} "
+            f"USING gin (UPPER({quote_name(column)}::text) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """
+    Drop the trigram indexes.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name, _, _ in get_trigram_indexes(apps):
+        schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(index_name)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nautobot_device_lifecycle_mgmt", "0019_query_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="softwarelcm",
+            name="release_date",
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
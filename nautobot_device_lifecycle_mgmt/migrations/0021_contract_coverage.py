@@ -0,0 +1,148 @@
+# Generated by Django 3.2.25 on 2026-10-19 12:08
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+import nautobot.extras.models.mixins
+import taggit.managers
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dcim", "0023_interface_redundancy_group_data_migration"),
+        ("extras", "0058_jobresult_add_time_status_idxs"),
+        ("nautobot_device_lifecycle_mgmt", "0020_search_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InventoryItemContractCoverage",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("created", models.DateField(auto_now_add=True, null=True)),
+                ("last_updated", models.DateTimeField(auto_now=True, null=True)),
+                (
+                    "_custom_field_data",
+                    models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder),
+                ),
+                ("is_covered", models.BooleanField(db_index=True, default=False)),
+                ("support_level", models.CharField(blank=True, max_length=64, null=True)),
+                ("end", models.DateField(blank=True, db_index=True, null=True)),
+                ("gap_start", models.DateField(blank=True, db_index=True, null=True)),
+                ("gap_end", models.DateField(blank=True, null=True)),
+                ("contract_count", models.PositiveIntegerField(default=0)),
+                ("last_run", models.DateTimeField(blank=True, null=True)),
+                ("run_type", models.CharField(max_length=50)),
+                (
+                    "contract",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="nautobot_device_lifecycle_mgmt.contractlcm",
+                    ),
+                ),
+                (
+                    "inventory_item",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="inventoryitem_contract_coverage",
+                        to="dcim.inventoryitem",
+                    ),
+                ),
+                (
+                    "provider",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="nautobot_device_lifecycle_mgmt.providerlcm",
+                    ),
+                ),
+                ("tags", taggit.managers.TaggableManager(through="extras.TaggedItem", to="extras.Tag")),
+            ],
+            options={
+                "verbose_name": "Inventory Item Contract Coverage",
+                "verbose_name_plural": "Inventory Item Contract Coverage",
+                "ordering": ("inventory_item",),
+            },
+            bases=(
+                models.Model,
+                nautobot.extras.models.mixins.DynamicGroupMixin,
+                nautobot.extras.models.mixins.NotesMixin,
+            ),
+        ),
+        migrations.CreateModel(
+            name="DeviceContractCoverage",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("created", models.DateField(auto_now_add=True, null=True)),
+                ("last_updated", models.DateTimeField(auto_now=True, null=True)),
+                (
+                    "_custom_field_data",
+                    models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder),
+                ),
+                ("is_covered", models.BooleanField(db_index=True, default=False)),
+                ("support_level", models.CharField(blank=True, max_length=64, null=True)),
+                ("end", models.DateField(blank=True, db_index=True, null=True)),
+                ("gap_start", models.DateField(blank=True, db_index=True, null=True)),
+                ("gap_end", models.DateField(blank=True, null=True)),
+                ("contract_count", models.PositiveIntegerField(default=0)),
+                ("last_run", models.DateTimeField(blank=True, null=True)),
+                ("run_type", models.CharField(max_length=50)),
+                (
+                    "contract",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="nautobot_device_lifecycle_mgmt.contractlcm",
+                    ),
+                ),
+                (
+                    "device",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="device_contract_coverage",
+                        to="dcim.device",
+                    ),
+                ),
+                (
+                    "provider",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="nautobot_device_lifecycle_mgmt.providerlcm",
+                    ),
+                ),
+                ("tags", taggit.managers.TaggableManager(through="extras.TaggedItem", to="extras.Tag")),
+            ],
+            options={
+                "verbose_name": "Device Contract Coverage",
+                "verbose_name_plural": "Device Contract Coverage",
+                "ordering": ("device",),
+            },
+            bases=(
+                models.Model,
+                nautobot.extras.models.mixins.DynamicGroupMixin,
+                nautobot.extras.models.mixins.NotesMixin,
+            ),
+        ),
+    ]
@@ -1,18 +1,23 @@
 """Django models for the Lifecycle Management plugin."""
 
+from abc import ABC, abstractmethod
 from datetime import datetime, date
 
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.urls import reverse
 from django.core.exceptions import ValidationError
 from django.conf import settings
 from nautobot.extras.utils import extras_features
 from nautobot.extras.models.statuses import StatusField
+from nautobot.core.models import BaseModel
 from nautobot.core.models.generics import PrimaryModel, OrganizationalModel
 from nautobot.dcim.models import Device, InventoryItem
 from nautobot.utilities.querysets import RestrictedQuerySet
 
 from nautobot_device_lifecycle_mgmt import choices
+from nautobot_device_lifecycle_mgmt.utils import DaysBetween
+from nautobot_device_lifecycle_mgmt.versions import get_version_key, validate_affected_versions
 from nautobot_device_lifecycle_mgmt.software_filters import (
     DeviceValidatedSoftwareFilter,
     InventoryItemValidatedSoftwareFilter,
@@ -23,12 +28,92 @@ from nautobot_device_lifecycle_mgmt.software_filters import (
 )
 
 
+class ExpiryAttribute:
+    """Model attribute computed by a method, unless it was annotated on the instance by `with_expiry()`."""
+
+    def __init__(self, method):
+        """Initialize ExpiryAttribute object."""
+        self.method = method
+        self.name = method.__name__
+        self.__doc__ = method.__doc__
+
+    def __get__(self, instance, owner):
+        """Return the annotated value if any, otherwise compute it."""
+        if instance is None:
+            return self
+        if self.name in instance.__dict__:
+            return instance.__dict__[self.name]
+        return self.method(instance)
+
+    def __set__(self, instance, value):
+        """Store the value annotated by the database."""
+        instance.__dict__[self.name] = value
+
+
+class ExpiryQuerySet(RestrictedQuerySet, ABC):
+    """Queryset computing the expiry of the objects in the database, as the `expired` property does in Python."""
+
+    @abstractmethod
+    def get_expiry_date_expression(self):
+        """Return the expression of the date at which an object expires."""
+
+    @abstractmethod
+    def get_expired_q(self, today):
+        """Return the Q object matching the objects expired on `today`, written so that it can use the date indexes."""
+
+    def with_expiry(self, today=None):
+        """Annotate the `expiry_date`, `expired` and `days_to_expiry` of each object."""
+        today = today or datetime.today().date()
+        expiry_date = self.get_expiry_date_expression()
+        return self.annotate(
+            expiry_date=expiry_date,
+            expired=models.Case(
+                models.When(self.get_expired_q(today), then=models.Value(True)),
+                default=models.Value(False),
+                output_field=models.BooleanField(),
+            ),
+            days_to_expiry=DaysBetween(models.Value(today, output_field=models.DateField()), expiry_date),
+        )
+
+    def filter_expired(self, expired=True, today=None):
+        """Keep the objects expired on `today`, or those not expired if `expired` is False."""
+        expired_q = self.get_expired_q(today or datetime.today().date())
+        return self.filter(expired_q) if expired else self.exclude(expired_q)
+
+
+def get_hardware_expired_field():
+    """Return the HardwareLCM date field, chosen by the `expired_field` setting, used to decide if a notice expired."""
+    return settings.PLUGINS_CONFIG["nautobot_device_lifecycle_mgmt"].get("expired_field", "end_of_support")
+
+
+class HardwareLCMQuerySet(ExpiryQuerySet):
+    """Queryset for `HardwareLCM` objects."""
+
+    def get_expiry_date_expression(self):
+        """Return the `expired_field` date, or the one of end of sale or end of support that is set."""
+        fallback = models.Case(
+            models.When(end_of_support__isnull=True, then=models.F("end_of_sale")),
+            models.When(end_of_sale__isnull=True, then=models.F("end_of_support")),
+            default=models.Value(None),
+            output_field=models.DateField(),
+        )
+        return Coalesce(models.F(get_hardware_expired_field()), fallback, output_field=models.DateField())
+
+    def get_expired_q(self, today):
+        """Return the Q object matching the notices expired on `today`."""
+        expired_field = get_hardware_expired_field()
+        return (
+            models.Q(**{f"{expired_field}__lte": today})
+            | models.Q(**{f"{expired_field}__isnull": True, "end_of_support__isnull": True, "end_of_sale__lte": today})
+            | models.Q(**{f"{expired_field}__isnull": True, "end_of_sale__isnull": True, "end_of_support__lte": today})
+        )
+
+
 @extras_features(
     "custom_fields",
     "custom_links",
     "custom_validators",
     "export_templates",
-    "graphql",
     "relationships",
     "webhooks",
 )
@@ -45,13 +130,17 @@ class HardwareLCM(PrimaryModel):
     )
     inventory_item = models.CharField(verbose_name="Inventory Item Part", max_length=255, blank=True, null=True)
     release_date = models.DateField(null=True, blank=True, verbose_name="Release Date")
-    end_of_sale = models.DateField(null=True, blank=True, verbose_name="End of Sale")
-    end_of_support = models.DateField(null=True, blank=True, verbose_name="End of Support")
-    end_of_sw_releases = models.DateField(null=True, blank=True, verbose_name="End of Software Releases")
-    end_of_security_patches = models.DateField(null=True, blank=True, verbose_name="End of Security Patches")
+    end_of_sale = models.DateField(null=True, blank=True, db_index=True, verbose_name="End of Sale")
+    end_of_support = models.DateField(null=True, blank=True, db_index=True, verbose_name="End of Support")
+    end_of_sw_releases = models.DateField(null=True, blank=True, db_index=True, verbose_name="End of Software Releases")
+    end_of_security_patches = models.DateField(
+        null=True, blank=True, db_index=True, verbose_name="End of Security Patches"
+    )
     documentation_url = models.URLField(blank=True, verbose_name="Documentation URL")
     comments = models.TextField(null=True, blank=True, verbose_name="Comments")
 
+    objects = HardwareLCMQuerySet.as_manager()
+
     csv_headers = [
         "device_type",
         "inventory_item",
@@ -98,19 +187,25 @@ class HardwareLCM(PrimaryModel):
         """Returns the Detail view for HardwareLCM models."""
         return reverse("plugins:nautobot_device_lifecycle_mgmt:hardwarelcm", kwargs={"pk": self.pk})
 
-    @property
+    @ExpiryAttribute
+    def expiry_date(self):
+        """Return the date of the chosen field, or of the required field that is present if it is not set."""
+        expiry_date = getattr(self, get_hardware_expired_field())
+        if not expiry_date and not self.end_of_support:
+            expiry_date = self.end_of_sale
+        elif not expiry_date and not self.end_of_sale:
+            expiry_date = self.end_of_support
+        return expiry_date
+
+    @ExpiryAttribute
     def expired(self):
         """Return True or False if chosen field is expired."""
-        expired_field = settings.PLUGINS_CONFIG["nautobot_device_lifecycle_mgmt"].get("expired_field", "end_of_support")
-
-        # If the chosen or default field does not exist, default to one of the required fields that are present
-        if not getattr(self, expired_field) and not getattr(self, "end_of_support"):
-            expired_field = "end_of_sale"
-        elif not getattr(self, expired_field) and not getattr(self, "end_of_sale"):
-            expired_field = "end_of_support"
+        return self.expiry_date is not None and datetime.today().date() >= self.expiry_date
 
-        today = datetime.today().date()
-        return today >= getattr(self, expired_field)
+    @ExpiryAttribute
+    def days_to_expiry(self):
+        """Return the number of days until the notice expires, negative once expired."""
+        return (self.expiry_date - datetime.today().date()).days if self.expiry_date is not None else None
 
     def save(self, *args, **kwargs):
         """Override save to assert a full clean."""
@@ -169,13 +264,18 @@ class SoftwareLCMQuerySet(RestrictedQuerySet):
 
         return qs
 
+    def bulk_create(self, objs, *args, **kwargs):
+        """Create `objs` in bulk, setting their version sort key as save() would."""
+        for obj in objs:
+            obj.version_sort_key = get_version_key(obj.version)
+        return super().bulk_create(objs, *args, **kwargs)
+
 
 @extras_features(
     "custom_fields",
     "custom_links",
     "custom_validators",
     "export_templates",
-    "graphql",
     "relationships",
     "statuses",
     "webhooks",
@@ -185,9 +285,11 @@ class SoftwareLCM(PrimaryModel):
 
     device_platform = models.ForeignKey(to="dcim.Platform", on_delete=models.CASCADE, verbose_name="Device Platform")
     version = models.CharField(max_length=50)
+    # Normalized form of `version` whose lexical order is the natural version order, see `get_version_key()`.
+    version_sort_key = models.CharField(max_length=255, blank=True, editable=False, db_index=True)
     alias = models.CharField(max_length=50, blank=True, null=True)
-    release_date = models.DateField(null=True, blank=True, verbose_name="Release Date")
-    end_of_support = models.DateField(null=True, blank=True, verbose_name="End of Software Support")
+    release_date = models.DateField(null=True, blank=True, db_index=True, verbose_name="Release Date")
+    end_of_support = models.DateField(null=True, blank=True, db_index=True, verbose_name="End of Software Support")
     documentation_url = models.URLField(blank=True, verbose_name="Documentation URL")
     long_term_support = models.BooleanField(verbose_name="Long Term Support", default=False)
     pre_release = models.BooleanField(verbose_name="Pre-Release", default=False)
@@ -207,11 +309,12 @@ class SoftwareLCM(PrimaryModel):
         """Meta attributes for SoftwareLCM."""
 
         verbose_name = "Software"
-        ordering = ("device_platform", "version", "end_of_support", "release_date")
+        ordering = ("device_platform", "version_sort_key", "end_of_support", "release_date")
         unique_together = (
             "device_platform",
             "version",
         )
+        indexes = [models.Index(fields=["device_platform", "version_sort_key"])]
 
     def __str__(self):
         """String representation of SoftwareLCM."""
@@ -221,6 +324,11 @@ class SoftwareLCM(PrimaryModel):
         """Returns the Detail view for SoftwareLCM models."""
         return reverse("plugins:nautobot_device_lifecycle_mgmt:softwarelcm", kwargs={"pk": self.pk})
 
+    def save(self, *args, **kwargs):
+        """Update the version sort key before saving."""
+        self.version_sort_key = get_version_key(self.version)
+        super().save(*args, **kwargs)
+
     def to_csv(self):
         """Return fields for bulk view."""
         return (
@@ -259,7 +367,6 @@ class SoftwareImageLCMQuerySet(RestrictedQuerySet):
     "custom_links",
     "custom_validators",
     "export_templates",
-    "graphql",
     "relationships",
     "statuses",
     "webhooks",
@@ -380,6 +487,13 @@ class ValidatedSoftwareLCM(PrimaryModel):
 
         verbose_name = "Validated Software"
         ordering = ("software", "preferred", "start")
+        indexes = [
+            models.Index(fields=["software", "preferred", "start"]),
+            models.Index(fields=["start", "end"]),
+            models.Index(
+                fields=["start", "end"], condition=models.Q(preferred=True), name="validatedsoft_preferred_idx"
+            ),
+        ]
 
     def __str__(self):
         """String representation of ValidatedSoftwareLCM."""
@@ -435,9 +549,7 @@ class ValidatedSoftwareLCM(PrimaryModel):
     objects = ValidatedSoftwareLCMQuerySet.as_manager()
 
 
-@extras_features(
-    "graphql",
-)
+@extras_features()
 class DeviceSoftwareValidationResult(PrimaryModel):
     """Device Software validation details model."""
 
@@ -472,6 +584,10 @@ class DeviceSoftwareValidationResult(PrimaryModel):
 
         verbose_name = "Device Software Validation Report"
         ordering = ("device",)
+        indexes = [
+            models.Index(fields=["run_type", "last_run"]),
+            models.Index(fields=["is_validated"]),
+        ]
 
     def __str__(self):
         """String representation of DeviceSoftwareValidationResult."""
@@ -493,9 +609,7 @@ class DeviceSoftwareValidationResult(PrimaryModel):
         )
 
 
-@extras_features(
-    "graphql",
-)
+@extras_features()
 class InventoryItemSoftwareValidationResult(PrimaryModel):
     """InventoryItem Software validation details model."""
 
@@ -529,6 +643,10 @@ class InventoryItemSoftwareValidationResult(PrimaryModel):
 
         verbose_name = "Inventory Item Software Validation Report"
         ordering = ("inventory_item",)
+        indexes = [
+            models.Index(fields=["run_type", "last_run"]),
+            models.Index(fields=["is_validated"]),
+        ]
 
     def to_csv(self):
         """Indicates model fields to return as csv."""
@@ -542,12 +660,289 @@ class InventoryItemSoftwareValidationResult(PrimaryModel):
         )
 
 
+@extras_features()
+class DeviceHardwareEoXResult(PrimaryModel):
+    """Earliest end of life milestones of the hardware notices applying to a Device or to its Inventory Items."""
+
+    device = models.OneToOneField(
+        to="dcim.Device",
+        on_delete=models.CASCADE,
+        help_text="The device",
+        related_name="device_hardware_eox",
+    )
+    end_of_sale = models.DateField(null=True, blank=True, db_index=True, verbose_name="End of Sale")
+    end_of_support = models.DateField(null=True, blank=True, db_index=True, verbose_name="End of Support")
+    end_of_sw_releases = models.DateField(null=True, blank=True, db_index=True, verbose_name="End of Software Releases")
+    end_of_security_patches = models.DateField(
+        null=True, blank=True, db_index=True, verbose_name="End of Security Patches"
+    )
+    last_run = models.DateTimeField(null=True, blank=True)
+    run_type = models.CharField(max_length=50, choices=choices.ReportRunTypeChoices)
+
+    csv_headers = [
+        "device",
+        "end_of_sale",
+        "end_of_support",
+        "end_of_sw_releases",
+        "end_of_security_patches",
+        "last_run",
+        "run_type",
+    ]
+
+    class Meta:
+        """Meta attributes for DeviceHardwareEoXResult."""
+
+        verbose_name = "Device Hardware EoX Report"
+        ordering = ("device",)
+
+    def __str__(self):
+        """String representation of DeviceHardwareEoXResult."""
+        return f"Device: {self.device} - End of Support: {self.end_of_support or '-'}"
+
+    def to_csv(self):
+        """Indicates model fields to return as csv."""
+        return (
+            self.device.name,
+            self.end_of_sale,
+            self.end_of_support,
+            self.end_of_sw_releases,
+            self.end_of_security_patches,
+            self.last_run.strftime("%Y-%m-%d %H:%M:%S") if self.last_run else "-",
+            self.run_type,
+        )
+
+
+@extras_features()
+class InventoryItemHardwareEoXResult(PrimaryModel):
+    """Earliest end of life milestones of the hardware notices applying to an Inventory Item."""
+
+    inventory_item = models.OneToOneField(
+        to="dcim.InventoryItem",
+        on_delete=models.CASCADE,
+        help_text="The Inventory Item",
+        related_name="inventoryitem_hardware_eox",
+    )
+    end_of_sale = models.DateField(null=True, blank=True, db_index=True, verbose_name="End of Sale")
+    end_of_support = models.DateField(null=True, blank=True, db_index=True, verbose_name="End of Support")
+    end_of_sw_releases = models.DateField(null=True, blank=True, db_index=True, verbose_name="End of Software Releases")
+    end_of_security_patches = models.DateField(
+        null=True, blank=True, db_index=True, verbose_name="End of Security Patches"
+    )
+    last_run = models.DateTimeField(null=True, blank=True)
+    run_type = models.CharField(max_length=50, choices=choices.ReportRunTypeChoices)
+
+    csv_headers = [
+        "inventory_item",
+        "device",
+        "part_id",
+        "end_of_sale",
+        "end_of_support",
+        "end_of_sw_releases",
+        "end_of_security_patches",
+        "last_run",
+        "run_type",
+    ]
+
+    class Meta:
+        """Meta attributes for InventoryItemHardwareEoXResult."""
+
+        verbose_name = "Inventory Item Hardware EoX Report"
+        ordering = ("inventory_item",)
+
+    def __str__(self):
+        """String representation of InventoryItemHardwareEoXResult."""
+        return f"Inventory Item: {self.inventory_item} - End of Support: {self.end_of_support or '-'}"
+
+    def to_csv(self):
+        """Indicates model fields to return as csv."""
+        return (
+            self.inventory_item.name,
+            self.inventory_item.device.name,
+            self.inventory_item.part_id,
+            self.end_of_sale,
+            self.end_of_support,
+            self.end_of_sw_releases,
+            self.end_of_security_patches,
+            self.last_run.strftime("%Y-%m-%d %H:%M:%S") if self.last_run else "-",
+            self.run_type,
+        )
+
+
+@extras_features()
+class DeviceContractCoverage(PrimaryModel):
+    """Support contract coverage of a Device, computed from the contracts related to it."""
+
+    device = models.OneToOneField(
+        to="dcim.Device",
+        on_delete=models.CASCADE,
+        help_text="The device",
+        related_name="device_contract_coverage",
+    )
+    is_covered = models.BooleanField(default=False, db_index=True, verbose_name="Covered")
+    contract = models.ForeignKey(
+        to="nautobot_device_lifecycle_mgmt.ContractLCM",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Active Contract",
+    )
+    provider = models.ForeignKey(
+        to="nautobot_device_lifecycle_mgmt.ProviderLCM",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Vendor",
+    )
+    support_level = models.CharField(verbose_name="Support Level", max_length=64, blank=True, null=True)
+    end = models.DateField(null=True, blank=True, db_index=True, verbose_name="Coverage End Date")
+    gap_start = models.DateField(null=True, blank=True, db_index=True, verbose_name="Coverage Gap Start")
+    gap_end = models.DateField(null=True, blank=True, verbose_name="Coverage Gap End")
+    contract_count = models.PositiveIntegerField(default=0, verbose_name="Contracts")
+    last_run = models.DateTimeField(null=True, blank=True)
+    run_type = models.CharField(max_length=50, choices=choices.ReportRunTypeChoices)
+
+    csv_headers = [
+        "device",
+        "is_covered",
+        "contract",
+        "provider",
+        "support_level",
+        "end",
+        "gap_start",
+        "gap_end",
+        "contract_count",
+        "last_run",
+        "run_type",
+    ]
+
+    class Meta:
+        """Meta attributes for DeviceContractCoverage."""
+
+        verbose_name = "Device Contract Coverage"
+        verbose_name_plural = "Device Contract Coverage"
+        ordering = ("device",)
+
+    def __str__(self):
+        """String representation of DeviceContractCoverage."""
+        return f"Device: {self.device} - Covered until: {self.gap_start or '-'}"
+
+    def to_csv(self):
+        """Indicates model fields to return as csv."""
+        return (
+            self.device.name,
+            str(self.is_covered),
+            self.contract.name if self.contract else None,
+            self.provider.name if self.provider else None,
+            self.support_level,
+            self.end,
+            self.gap_start,
+            self.gap_end,
+            self.contract_count,
+            self.last_run.strftime("%Y-%m-%d %H:%M:%S") if self.last_run else "-",
+            self.run_type,
+        )
+
+
+@extras_features()
+class InventoryItemContractCoverage(PrimaryModel):
+    """Support contract coverage of an Inventory Item, computed from the contracts related to it."""
+
+    inventory_item = models.OneToOneField(
+        to="dcim.InventoryItem",
+        on_delete=models.CASCADE,
+        help_text="The Inventory Item",
+        related_name="inventoryitem_contract_coverage",
+    )
+    is_covered = models.BooleanField(default=False, db_index=True, verbose_name="Covered")
+    contract = models.ForeignKey(
+        to="nautobot_device_lifecycle_mgmt.ContractLCM",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Active Contract",
+    )
+    provider = models.ForeignKey(
+        to="nautobot_device_lifecycle_mgmt.ProviderLCM",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Vendor",
+    )
+    support_level = models.CharField(verbose_name="Support Level", max_length=64, blank=True, null=True)
+    end = models.DateField(null=True, blank=True, db_index=True, verbose_name="Coverage End Date")
+    gap_start = models.DateField(null=True, blank=True, db_index=True, verbose_name="Coverage Gap Start")
+    gap_end = models.DateField(null=True, blank=True, verbose_name="Coverage Gap End")
+    contract_count = models.PositiveIntegerField(default=0, verbose_name="Contracts")
+    last_run = models.DateTimeField(null=True, blank=True)
+    run_type = models.CharField(max_length=50, choices=choices.ReportRunTypeChoices)
+
+    csv_headers = [
+        "inventory_item",
+        "device",
+        "part_id",
+        "is_covered",
+        "contract",
+        "provider",
+        "support_level",
+        "end",
+        "gap_start",
+        "gap_end",
+        "contract_count",
+        "last_run",
+        "run_type",
+    ]
+
+    class Meta:
+        """Meta attributes for InventoryItemContractCoverage."""
+
+        verbose_name = "Inventory Item Contract Coverage"
+        verbose_name_plural = "Inventory Item Contract Coverage"
+        ordering = ("inventory_item",)
+
+    def __str__(self):
+        """String representation of InventoryItemContractCoverage."""
+        return f"Inventory Item: {self.inventory_item} - Covered until: {self.gap_start or '-'}"
+
+    def to_csv(self):
+        """Indicates model fields to return as csv."""
+        return (
+            self.inventory_item.name,
+            self.inventory_item.device.name,
+            self.inventory_item.part_id,
+            str(self.is_covered),
+            self.contract.name if self.contract else None,
+            self.provider.name if self.provider else None,
+            self.support_level,
+            self.end,
+            self.gap_start,
+            self.gap_end,
+            self.contract_count,
+            self.last_run.strftime("%Y-%m-%d %H:%M:%S") if self.last_run else "-",
+            self.run_type,
+        )
+
+
+class ContractLCMQuerySet(ExpiryQuerySet):
+    """Queryset for `ContractLCM` objects."""
+
+    def get_expiry_date_expression(self):
+        """Return the end date of the contract."""
+        return models.F("end")
+
+    def get_expired_q(self, today):
+        """Return the Q object matching the contracts ended on `today`."""
+        return models.Q(end__lte=today)
+
+
 @extras_features(
     "custom_fields",
     "custom_links",
     "custom_validators",
     "export_templates",
-    "graphql",
     "relationships",
     "webhooks",
 )
@@ -565,13 +960,15 @@ class ContractLCM(PrimaryModel):
     name = models.CharField(max_length=100, unique=True)
     number = models.CharField(max_length=100, null=True, blank=True)
     start = models.DateField(null=True, blank=True, verbose_name="Contract Start Date")
-    end = models.DateField(null=True, blank=True, verbose_name="Contract End Date")
+    end = models.DateField(null=True, blank=True, db_index=True, verbose_name="Contract End Date")
     cost = models.DecimalField(null=True, blank=True, decimal_places=2, max_digits=15, verbose_name="Contract Cost")
     support_level = models.CharField(verbose_name="Support Level", max_length=64, blank=True, null=True)
     currency = models.CharField(verbose_name="Currency", max_length=4, blank=True, null=True)
     contract_type = models.CharField(null=True, blank=True, max_length=32, verbose_name="Contract Type")
     comments = models.TextField(blank=True)
 
+    objects = ContractLCMQuerySet.as_manager()
+
     csv_headers = [
         "provider",
         "name",
@@ -599,13 +996,23 @@ class ContractLCM(PrimaryModel):
         """Returns the Detail view for ContractLCM models."""
         return reverse("plugins:nautobot_device_lifecycle_mgmt:contractlcm", kwargs={"pk": self.pk})
 
-    @property
+    @ExpiryAttribute
+    def expiry_date(self):
+        """Return the end date of the contract."""
+        return self.end
+
+    @ExpiryAttribute
     def expired(self):
         """Return True or False if chosen field is expired."""
         if not self.end:
             return False
         return datetime.today().date() >= self.end
 
+    @ExpiryAttribute
+    def days_to_expiry(self):
+        """Return the number of days until the contract ends, negative once ended."""
+        return (self.end - datetime.today().date()).days if self.end else None
+
     def save(self, *args, **kwargs):
         """Override save to assert a full clean."""
         # Full clean to assert custom validation in clean() for ORM, etc.
@@ -641,7 +1048,6 @@ class ContractLCM(PrimaryModel):
     "custom_links",
     "custom_validators",
     "export_templates",
-    "graphql",
     "relationships",
     "webhooks",
 )
@@ -708,7 +1114,6 @@ class ProviderLCM(OrganizationalModel):
     "custom_links",
     "custom_validators",
     "export_templates",
-    "graphql",
     "relationships",
     "webhooks",
 )
@@ -786,7 +1191,6 @@ class ContactLCM(PrimaryModel):
     "custom_links",
     "custom_validators",
     "export_templates",
-    "graphql",
     "relationships",
     "webhooks",
     "statuses",
@@ -795,7 +1199,7 @@ class CVELCM(PrimaryModel):
     """CVELCM is a model representation of a cve vulnerability record."""
 
     name = models.CharField(max_length=16, blank=False, unique=True)
-    published_date = models.DateField(verbose_name="Published Date")
+    published_date = models.DateField(db_index=True, verbose_name="Published Date")
     link = models.URLField()
     status = StatusField(
         null=True,
@@ -812,6 +1216,7 @@ class CVELCM(PrimaryModel):
     cvss_v3 = models.FloatField(blank=True, null=True, verbose_name="CVSSv3 Score")
     fix = models.CharField(max_length=255, blank=True, null=True)
     comments = models.TextField(blank=True)
+    affected_versions = models.JSONField(default=list, blank=True, verbose_name="Affected Versions")
 
     csv_headers = [
         "name",
@@ -833,6 +1238,7 @@ class CVELCM(PrimaryModel):
         verbose_name = "CVE"
 
         ordering = ("severity", "name")
+        indexes = [models.Index(fields=["severity", "name"])]
 
     def get_absolute_url(self):
         """Returns the Detail view for CVELCM models."""
@@ -842,6 +1248,15 @@ class CVELCM(PrimaryModel):
         """String representation of the model."""
         return f"{self.name}"
 
+    def clean(self):
+        """Override clean to validate the affected version ranges."""
+        super().clean()
+
+        try:
+            validate_affected_versions(self.affected_versions)
+        except ValueError as err:
+            raise ValidationError({"affected_versions": str(err)}) from err
+
     def to_csv(self):
         """Return fields for bulk view."""
         return (
@@ -864,7 +1279,6 @@ class CVELCM(PrimaryModel):
     "custom_links",
     "custom_validators",
     "export_templates",
-    "graphql",
     "relationships",
     "webhooks",
     "statuses",
@@ -896,6 +1310,10 @@ class VulnerabilityLCM(PrimaryModel):
 
         verbose_name = "Vulnerability"
         verbose_name_plural = "Vulnerabilities"
+        indexes = [
+            models.Index(fields=["cve", "software", "device"]),
+            models.Index(fields=["cve", "software", "inventory_item"]),
+        ]
 
     def get_absolute_url(self):
         """Returns the Detail view for VulnerabilityLCM models."""
@@ -919,3 +1337,62 @@ class VulnerabilityLCM(PrimaryModel):
             self.inventory_item,
             self.status,
         )
+
+
+class NVDFeedImport(BaseModel):
+    """Record of the last import of an NVD JSON feed file into CVELCM, used to skip unchanged files."""
+
+    file_name = models.CharField(max_length=255, unique=True)
+    checksum = models.CharField(max_length=64, verbose_name="SHA256 Checksum")
+    last_import = models.DateTimeField(verbose_name="Last Import")
+    cve_count = models.PositiveIntegerField(default=0, verbose_name="CVE Count")
+
+    class Meta:
+        """Meta attributes for the class."""
+
+        verbose_name = "NVD Feed Import"
+        ordering = ("file_name",)
+
+    def __str__(self):
+        """String representation of the model."""
+        return f"{self.file_name} - {self.last_import}"
+
+
+class DeviceHardwareNotice(BaseModel):
+    """Precomputed mapping of the HardwareLCM notices applying to each Device, and to which of its InventoryItems.
+
+    A notice for a device type maps to each Device of that type with no `inventory_item`; a notice for an inventory
+    item part maps to each InventoryItem with that `part_id`, and to its Device. Maintained by `hardware_notices`.
+    """
+
+    device = models.ForeignKey(to="dcim.Device", on_delete=models.CASCADE, related_name="+")
+    inventory_item = models.ForeignKey(
+        to="dcim.InventoryItem", on_delete=models.CASCADE, related_name="+", blank=True, null=True
+    )
+    hardware_notice = models.ForeignKey(
+        to="nautobot_device_lifecycle_mgmt.HardwareLCM", on_delete=models.CASCADE, related_name="device_mappings"
+    )
+
+    class Meta:
+        """Meta attributes for the class."""
+
+        verbose_name = "Device Hardware Notice"
+        ordering = ("device", "hardware_notice")
+        indexes = [
+            models.Index(fields=["device", "hardware_notice"]),
+            models.Index(fields=["hardware_notice", "device"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["device", "hardware_notice"],
+                condition=models.Q(inventory_item__isnull=True),
+                name="unique_device_hardware_notice",
+            ),
+            models.UniqueConstraint(
+                fields=["inventory_item", "hardware_notice"], name="unique_inventory_item_hardware_notice"
+            ),
+        ]
+
+    def __str__(self):
+        """String representation of the model."""
+        return f"{self.device} - {self.hardware_notice}"
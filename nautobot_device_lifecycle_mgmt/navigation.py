@@ -274,6 +274,48 @@ menu_items = (
                             "nautobot_device_lifecycle_mgmt.view_inventoryitemsoftwarevalidationresult",
                         ],
                     ),
+                    NavMenuItem(
+                        link="plugins:nautobot_device_lifecycle_mgmt:devicehardwareeoxresult_list",
+                        name="Device Hardware EoX - List",
+                        permissions=[
+                            "nautobot_device_lifecycle_mgmt.view_devicehardwareeoxresult",
+                        ],
+                    ),
+                    NavMenuItem(
+                        link="plugins:nautobot_device_lifecycle_mgmt:inventoryitemhardwareeoxresult_list",
+                        name="Inventory Item Hardware EoX - List",
+                        permissions=[
+                            "nautobot_device_lifecycle_mgmt.view_inventoryitemhardwareeoxresult",
+                        ],
+                    ),
+                    NavMenuItem(
+                        link="plugins:nautobot_device_lifecycle_mgmt:devicecontractcoverage_list",
+                        name="Device Contract Coverage - List",
+                        permissions=[
+                            "nautobot_device_lifecycle_mgmt.view_devicecontractcoverage",
+                        ],
+                    ),
+                    NavMenuItem(
+                        link="plugins:nautobot_device_lifecycle_mgmt:inventoryitemcontractcoverage_list",
+                        name="Inventory Item Contract Coverage - List",
+                        permissions=[
+                            "nautobot_device_lifecycle_mgmt.view_inventoryitemcontractcoverage",
+                        ],
+                    ),
+                    NavMenuItem(
+                        link="plugins:nautobot_device_lifecycle_mgmt:upgrade_plan",
+                        name="Fleet Upgrade Plan",
+                        permissions=[
+                            "nautobot_device_lifecycle_mgmt.view_validatedsoftwarelcm",
+                        ],
+                    ),
+                    NavMenuItem(
+                        link="plugins:nautobot_device_lifecycle_mgmt:contract_renewal_forecast",
+                        name="Contract Renewal Forecast",
+                        permissions=[
+                            "nautobot_device_lifecycle_mgmt.view_contractlcm",
+                        ],
+                    ),
                 ),
             ),
         ),
@@ -0,0 +1,232 @@
+"""Streaming import of NVD JSON vulnerability feeds into CVELCM."""
+import gzip
+import hashlib
+import json
+import os
+
+from django.utils import timezone
+
+from nautobot_device_lifecycle_mgmt.choices import CVESeverityChoices
+from nautobot_device_lifecycle_mgmt.data_version import bump_data_version
+from nautobot_device_lifecycle_mgmt.models import CVELCM, NVDFeedImport
+
+
+NVD_CVE_URL = "https://nvd.nist.gov/vuln/detail/{}"
+# Number of CVEs read from the feed, then created or updated, at a time.
+NVD_IMPORT_BATCH_SIZE = 2000
+# Keys of the list of CVEs in the NVD 1.1 feeds and in the NVD 2.0 API responses.
+NVD_ITEMS_KEYS = ("CVE_Items", "vulnerabilities")
+NVD_CVE_FIELDS = ("published_date", "link", "description", "severity", "cvss", "cvss_v2", "cvss_v3")
+READ_CHUNK_SIZE = 1024 * 1024
+
+SEVERITIES = {severity.upper(): severity for severity, _ in CVESeverityChoices.CHOICES}
+
+
+def open_feed(path):
+    """Open the feed file at `path` as text, decompressing it on the fly if it is gzipped."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "rt", encoding="utf-8")  # pylint: disable=consider-using-with
+
+
+def get_file_checksum(path):
+    """Return the SHA256 hex digest of the file at `path`."""
+    checksum = hashlib.sha256()
+    with open(path, "rb") as feed_file:
+        for chunk in iter(lambda: feed_file.read(READ_CHUNK_SIZE), b""):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+
+def iter_json_array(stream, keys=NVD_ITEMS_KEYS):
+    """Yield the elements of the first JSON array found under one of `keys` in `stream`, one at a time.
+
+    Only the element being decoded is held in memory, so arbitrarily large documents can be read.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position, eof = "", 0, False
+
+    def read_more():
+        nonlocal buffer, position, eof
+        chunk = stream.read(READ_CHUNK_SIZE)
+        eof = not chunk
+        buffer, position = buffer[position:] + chunk, 0
+        return not eof
+
+    def skip_whitespace():
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position < len(buffer) or not read_more():
+                return
+
+    # Find the start of the array.
+    while True:
+        starts = [buffer.find(f'"{key}"', position) for key in keys]
+        starts = [start for start in starts if start >= 0]
+        if starts:
+            position = buffer.find("[", min(starts))
+            if position >= 0:
+                position += 1
+                break
+            position = min(starts)
+        else:
+            # Keep the end of the buffer, in case it holds the beginning of a key.
+            position = max(len(buffer) - max(len(key) for key in keys) - 2, 0)
+        if not read_more():
+            return
+
+    while True:
+        skip_whitespace()
+        if position >= len(buffer) or buffer[position] == "]":
+            return
+        try:
+            element, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if not read_more():
+                raise
+            continue
+        position = end
+        yield element
+
+
+def _get_nvd_11_cve(item):
+    """Return the CVELCM field values of an NVD 1.1 feed item."""
+    cve = item.get("cve", {})
+    impact = item.get("impact", {})
+    cvss_v3 = impact.get("baseMetricV3", {}).get("cvssV3", {})
+    cvss_v2 = impact.get("baseMetricV2", {})
+    descriptions = cve.get("description", {}).get("description_data", [])
+    return {
+        "name": cve.get("CVE_data_meta", {}).get("ID"),
+        "published_date": item.get("publishedDate"),
+        "descriptions": descriptions,
+        "severity": cvss_v3.get("baseSeverity") or cvss_v2.get("severity"),
+        "cvss_v2": cvss_v2.get("cvssV2", {}).get("baseScore"),
+        "cvss_v3": cvss_v3.get("baseScore"),
+    }
+
+
+def _get_nvd_20_cve(item):
+    """Return the CVELCM field values of an NVD 2.0 API item."""
+    cve = item.get("cve", {})
+    metrics = cve.get("metrics", {})
+    cvss_v3_metrics = metrics.get("cvssMetricV31") or metrics.get("cvssMetricV30") or [{}]
+    cvss_v3 = cvss_v3_metrics[0].get("cvssData", {})
+    cvss_v2 = (metrics.get("cvssMetricV2") or [{}])[0]
+    return {
+        "name": cve.get("id"),
+        "published_date": cve.get("published"),
+        "descriptions": cve.get("descriptions", []),
+        "severity": cvss_v3.get("baseSeverity") or cvss_v2.get("baseSeverity"),
+        "cvss_v2": cvss_v2.get("cvssData", {}).get("baseScore"),
+        "cvss_v3": cvss_v3.get("baseScore"),
+    }
+
+
+def parse_nvd_item(item):
+    """Return the CVELCM field values, keyed by field name, of an NVD feed item, or None if it is not usable."""
+    values = _get_nvd_20_cve(item) if "id" in item.get("cve", {}) else _get_nvd_11_cve(item)
+    name, published = values.pop("name"), values.pop("published_date")
+    name_length = CVELCM._meta.get_field("name").max_length  # pylint: disable=protected-access
+    if not name or not published or len(name) > name_length:
+        return None
+
+    descriptions = values.pop("descriptions")
+    description = next((desc.get("value") for desc in descriptions if desc.get("lang") == "en"), None)
+    description_length = CVELCM._meta.get_field("description").max_length  # pylint: disable=protected-access
+    values.update(
+        {
+            "name": name,
+            "published_date": published[:10],
+            "link": NVD_CVE_URL.format(name),
+            "description": description[:description_length] if description else None,
+            "severity": SEVERITIES.get((values["severity"] or "").upper(), CVESeverityChoices.NONE),
+            "cvss": values["cvss_v3"] if values["cvss_v3"] is not None else values["cvss_v2"],
+        }
+    )
+    return values
+
+
+def upsert_cves(records):
+    """Create or update the CVELCM objects of `records`, keyed on name, and return the `(created, updated)` counts."""
+    records = {record["name"]: record for record in records}
+    existing = CVELCM.objects.in_bulk(list(records), field_name="name")
+    to_create, to_update = [], []
+    for name, record in records.items():
+        cve = existing.get(name)
+        if cve is None:
+            to_create.append(CVELCM(**record))
+            continue
+        changed = False
+        for field in NVD_CVE_FIELDS:
+            value = record[field]
+            if field == "published_date":
+                changed |= str(cve.published_date) != value
+            else:
+                changed |= getattr(cve, field) != value
+            setattr(cve, field, value)
+        if changed:
+            to_update.append(cve)
+    CVELCM.objects.bulk_create(to_create, batch_size=NVD_IMPORT_BATCH_SIZE)
+    CVELCM.objects.bulk_update(to_update, NVD_CVE_FIELDS, batch_size=NVD_IMPORT_BATCH_SIZE)
+    return len(to_create), len(to_update)
+
+
+def _add_counts(counts, batch):
+    """Upsert the CVEs of `batch` and add the results to `counts`."""
+    created, updated = upsert_cves(batch)
+    counts["created"] += created
+    counts["updated"] += updated
+    counts["unchanged"] += len({record["name"] for record in batch}) - created - updated
+
+
+def import_nvd_feed(path, force=False, batch_size=NVD_IMPORT_BATCH_SIZE):
+    """Import the NVD JSON feed file at `path` into CVELCM.
+
+    Returns None if the file was skipped because it did not change since its last import, else a dict with the
+    number of CVEs `created`, `updated`, `unchanged` and `skipped` (items without usable ID or publication date).
+    """
+    file_name = os.path.basename(path)
+    checksum = get_file_checksum(path)
+    previous_import = NVDFeedImport.objects.filter(file_name=file_name).first()
+    if not force and previous_import and previous_import.checksum == checksum:
+        return None
+
+    counts = {"created": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+    batch = []
+    with open_feed(path) as stream:
+        for item in iter_json_array(stream):
+            record = parse_nvd_item(item)
+            if record is None:
+                counts["skipped"] += 1
+                continue
+            batch.append(record)
+            if len(batch) >= batch_size:
+                _add_counts(counts, batch)
+                batch = []
+    if batch:
+        _add_counts(counts, batch)
+
+    if counts["created"] or counts["updated"]:
+        # bulk_create() and bulk_update() do not send the signals bumping the data version.
+        bump_data_version(CVELCM)
+    NVDFeedImport.objects.update_or_create(
+        file_name=file_name,
+        defaults={
+            "checksum": checksum,
+            "last_import": timezone.now(),
+            "cve_count": counts["created"] + counts["updated"] + counts["unchanged"],
+        },
+    )
+    return counts
+
+
+def get_feed_paths(path):
+    """Return the NVD feed files at `path`, which is either a file or a directory of `.json` or `.json.gz` files."""
+    if not os.path.isdir(path):
+        return [path]
+    return sorted(
+        os.path.join(path, file_name) for file_name in os.listdir(path) if file_name.endswith((".json", ".json.gz"))
+    )
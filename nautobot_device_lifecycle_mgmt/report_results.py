@@ -0,0 +1,52 @@
+"""Bulk maintenance of the precomputed report results keyed by a Device or an Inventory Item."""
+
+from nautobot_device_lifecycle_mgmt import choices
+from nautobot_device_lifecycle_mgmt.data_version import bump_data_version
+
+
+# Number of report results written per query.
+REPORT_RESULT_BATCH_SIZE = 1000
+
+
+def get_run_fields(last_run, run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN):
+    """Return the `{field: value}` recording the run in the report results."""
+    return {"last_run": last_run, "run_type": run_type}
+
+
+def set_report_result_values(result_model, results, key_attname, values):
+    """Set the `values` of their key pk, given by `key_attname`, on each of the `results`."""
+    attnames = {field.name: field.attname for field in result_model._meta.fields}
+    for result in results:
+        for field, value in values[getattr(result, key_attname)].items():
+            setattr(result, attnames[field], value)
+
+
+def update_report_results(result_model, key_field, fields, values, run_fields):
+    """Replace the `result_model` records, keyed by their `key_field` relation, with the given `values`.
+
+    `values` maps each key pk to the `{field: value}` of its result, `fields` being the names of the fields set.
+    `run_fields` is the `{field: value}` recording the run, as returned by `get_run_fields()`, set on every result.
+    Results are updated and created in bulk, and the results of objects missing from `values` are deleted.
+    Returns `(number of results created, number of results updated, number of results deleted)`.
+    """
+    key_attname = f"{key_field}_id"
+    existing = {getattr(result, key_attname): result for result in result_model.objects.all()}
+
+    obsolete = [result.pk for key, result in existing.items() if key not in values]
+    if obsolete:
+        result_model.objects.filter(pk__in=obsolete).delete()
+
+    to_update = [result for key, result in existing.items() if key in values]
+    to_create = [result_model(**{key_attname: key}) for key in values if key not in existing]
+    set_report_result_values(
+        result_model,
+        to_update + to_create,
+        key_attname,
+        {key: {**result_values, **run_fields} for key, result_values in values.items()},
+    )
+
+    result_model.objects.bulk_update(to_update, fields=[*fields, *run_fields], batch_size=REPORT_RESULT_BATCH_SIZE)
+    result_model.objects.bulk_create(to_create, batch_size=REPORT_RESULT_BATCH_SIZE)
+    # Bulk operations bypass the signals bumping the data version.
+    bump_data_version(result_model)
+    return len(to_create), len(to_update), len(obsolete)
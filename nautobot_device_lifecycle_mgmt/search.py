@@ -0,0 +1,81 @@
+"""Building blocks of the `q` search of the plugin filtersets, written so that the database can use indexes."""
+import calendar
+import datetime
+import re
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import Q
+
+
+# Search values looking like a date: YYYY, YYYY-MM, YYYY-MM-DD or MM-DD.
+DATE_SEARCH_RE = re.compile(
+    r"^(?:(?P<year>\d{4})(?:-(?P<month>\d{1,2})(?:-(?P<day>\d{1,2}))?)?"
+    r"|(?P<month_of_year>\d{1,2})-(?P<day_of_month>\d{1,2}))$"
+)
+
+
+def get_date_search_q(value, fields):
+    """Return the Q object matching the `fields` dates designated by a date-looking search `value`, or None.
+
+    `YYYY`, `YYYY-MM` and `YYYY-MM-DD` values match the dates of that year, month or day as date ranges, which
+    can use the date indexes. `MM-DD` values match that day of any year.
+    """
+    match = DATE_SEARCH_RE.match(value.strip())
+    if not match:
+        return None
+    try:
+        if match["month_of_year"]:
+            month, day = int(match["month_of_year"]), int(match["day_of_month"])
+            # Validated against a leap year, so that 02-29 is accepted.
+            datetime.date(2000, month, day)
+            return _or_q(Q(**{f"{field}__month": month, f"{field}__day": day}) for field in fields)
+        year = int(match["year"])
+        if match["day"]:
+            start = end = datetime.date(year, int(match["month"]), int(match["day"]))
+        elif match["month"]:
+            month = int(match["month"])
+            start = datetime.date(year, month, 1)
+            end = datetime.date(year, month, calendar.monthrange(year, month)[1])
+        else:
+            start, end = datetime.date(year, 1, 1), datetime.date(year, 12, 31)
+    except ValueError:
+        return None
+    return _or_q(Q(**{f"{field}__gte": start, f"{field}__lte": end}) for field in fields)
+
+
+def get_decimal_search_q(value, fields):
+    """Return the Q object matching the `fields` equal to a numeric search `value`, or None."""
+    try:
+        number = Decimal(value.strip())
+    except InvalidOperation:
+        return None
+    if not number.is_finite():
+        return None
+    return _or_q(Q(**{field: number}) for field in fields)
+
+
+def get_text_search_q(value, fields):
+    """Return the Q object matching the `fields` containing the search `value`, ignoring case."""
+    return _or_q(Q(**{f"{field}__icontains": value}) for field in fields)
+
+
+def get_related_search_q(value, relation, queryset, fields):
+    """Return the Q object matching the objects whose `relation` is one of the `queryset` objects matching `value`.
+
+    The search runs as a subquery on the related table, instead of joining it for each searched field.
+    """
+    return Q(**{f"{relation}__in": queryset.filter(get_text_search_q(value, fields)).values("pk")})
+
+
+def combine_search_q(*q_objects):
+    """Return the OR of the given search Q objects, skipping None, or a Q object matching nothing if all are None."""
+    q_objects = [q_object for q_object in q_objects if q_object is not None]
+    return _or_q(q_objects) if q_objects else Q(pk__in=[])
+
+
+def _or_q(q_objects):
+    """Return the OR of the given Q objects."""
+    qs_filter = Q()
+    for q_object in q_objects:
+        qs_filter |= q_object
+    return qs_filter
@@ -1,11 +1,13 @@
 """Custom signals for the Lifecycle Management plugin."""
 
 from django.apps import apps as global_apps
-from django.db.models.signals import pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 from nautobot.extras.choices import RelationshipTypeChoices
-from nautobot.extras.models import Relationship, RelationshipAssociation
+
+from nautobot_device_lifecycle_mgmt.data_version import bump_data_version, is_tracked
+from nautobot_device_lifecycle_mgmt.hardware_notices import sync_device_hardware_notices
 
 
 def post_migrate_create_relationships(sender, apps=global_apps, **kwargs):  # pylint: disable=unused-argument
@@ -70,36 +72,45 @@ def post_migrate_create_relationships(sender, apps=global_apps, **kwargs):  # py
         _Relationship.objects.get_or_create(name=relationship_dict["name"], defaults=relationship_dict)
 
 
-@receiver(pre_delete, sender="nautobot_device_lifecycle_mgmt.SoftwareLCM")
-def delete_softwarelcm_relationships(sender, instance, **kwargs):  # pylint: disable=unused-argument
-    """Delete all SoftwareLCM relationships to Device and InventoryItem objects."""
-    soft_relationships = Relationship.objects.filter(slug__in=("device_soft", "inventory_item_soft"))
-    RelationshipAssociation.objects.filter(relationship__in=soft_relationships, source_id=instance.pk).delete()
+# The relationship associations of deleted SoftwareLCM, CVELCM, Device and InventoryItem objects are removed through
+# the `source_for_associations` and `destination_for_associations` generic relations of Nautobot's RelationshipModel.
+# The deletion collects them with one query per batch of deleted objects, so no per-object pre_delete cleanup is needed.
+
+
+@receiver(post_save, sender="nautobot_device_lifecycle_mgmt.HardwareLCM")
+def sync_hardware_notice_devices(sender, instance, raw=False, **kwargs):  # pylint: disable=unused-argument
+    """Map a saved HardwareLCM to the Devices and InventoryItems it applies to."""
+    if not raw:
+        sync_device_hardware_notices(hardware_notice_pks=[instance.pk])
 
 
-@receiver(pre_delete, sender="dcim.Device")
-def delete_device_software_relationship(sender, instance, **kwargs):  # pylint: disable=unused-argument
-    """Delete Device relationship to SoftwareLCM object."""
-    soft_relationships = Relationship.objects.filter(slug__in=("device_soft", "inventory_item_soft"))
-    RelationshipAssociation.objects.filter(relationship__in=soft_relationships, destination_id=instance.pk).delete()
+@receiver(post_save, sender="dcim.Device")
+def sync_device_hardware_notice_mappings(sender, instance, raw=False, **kwargs):  # pylint: disable=unused-argument
+    """Map a saved Device, whose device type may have changed, to the HardwareLCM applying to it."""
+    if not raw:
+        sync_device_hardware_notices(device_pks=[instance.pk])
 
 
-@receiver(pre_delete, sender="dcim.InventoryItem")
-def delete_inventory_item_software_relationship(sender, instance, **kwargs):  # pylint: disable=unused-argument
-    """Delete InventoryItem relationship to SoftwareLCM object."""
-    soft_relationships = Relationship.objects.filter(slug__in=("device_soft", "inventory_item_soft"))
-    RelationshipAssociation.objects.filter(relationship__in=soft_relationships, destination_id=instance.pk).delete()
+@receiver(post_save, sender="dcim.InventoryItem")
+def sync_inventory_item_hardware_notices(sender, instance, raw=False, **kwargs):  # pylint: disable=unused-argument
+    """Map a saved InventoryItem, whose part ID or device may have changed, to the HardwareLCM applying to it."""
+    if not raw:
+        sync_device_hardware_notices(inventory_item_pks=[instance.pk])
 
 
-@receiver(pre_delete, sender="nautobot_device_lifecycle_mgmt.SoftwareLCM")
-def delete_software_to_cve_relationships(sender, instance, **kwargs):  # pylint: disable=unused-argument
-    """Delete all SoftwareLCM relationships to CVELCM objects."""
-    soft_relationships = Relationship.objects.filter(slug__in=("cve_soft"))
-    RelationshipAssociation.objects.filter(relationship__in=soft_relationships, source_id=instance.pk).delete()
+@receiver(post_save)
+@receiver(post_delete)
+def bump_model_data_version(sender, **kwargs):  # pylint: disable=unused-argument
+    """Bump the data version of tracked models on save and delete."""
+    if is_tracked(sender):
+        bump_data_version(sender)
 
 
-@receiver(pre_delete, sender="nautobot_device_lifecycle_mgmt.CVELCM")
-def delete_cve_to_software_relationships(sender, instance, **kwargs):  # pylint: disable=unused-argument
-    """Delete all CVELCM relationships to SoftwareLCM objects."""
-    soft_relationships = Relationship.objects.filter(slug__in=("cve_soft"))
-    RelationshipAssociation.objects.filter(relationship__in=soft_relationships, source_id=instance.pk).delete()
+@receiver(m2m_changed)
+def bump_m2m_data_version(sender, instance, action, model, **kwargs):  # pylint: disable=unused-argument
+    """Bump the data version of tracked models when their many-to-many relations, including tags, change."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    for changed_model in (type(instance), model):
+        if is_tracked(changed_model):
+            bump_data_version(changed_model)
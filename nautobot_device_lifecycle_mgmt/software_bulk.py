@@ -0,0 +1,306 @@
+"""Set-based computation of Software Lifecycle data for many Devices or InventoryItems at once."""
+
+from abc import ABC, abstractmethod
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from nautobot.dcim.models import Device, InventoryItem
+from nautobot.extras.models import RelationshipAssociation, TaggedItem
+
+from nautobot_device_lifecycle_mgmt.models import SoftwareImageLCM, SoftwareLCM, ValidatedSoftwareLCM
+
+
+# Weights of the non-preferred assignments, keyed by the weight of the matching preferred assignment.
+NON_PREFERRED_WEIGHTS = {10: 1000, 20: 1010, 30: 1030, 40: 1040, 990: 1990}
+
+
+def get_m2m_map(model, field_name, related_pks=None):
+    """Return {related object pk: set of `model` pks} read from the through table of the `field_name` relation."""
+    field = model._meta.get_field(field_name)  # pylint: disable=protected-access
+    related_pk_attname = f"{field.m2m_reverse_field_name()}_id"
+    rows = field.remote_field.through.objects.all()
+    if related_pks is not None:
+        rows = rows.filter(**{f"{related_pk_attname}__in": related_pks})
+    rows = rows.values_list(related_pk_attname, f"{field.m2m_field_name()}_id")
+    m2m_map = defaultdict(set)
+    for related_pk, obj_pk in rows:
+        m2m_map[related_pk].add(obj_pk)
+    return m2m_map
+
+
+def invert_m2m_map(m2m_map):
+    """Return {`model` pk: set of related object pks} from the {related object pk: set of `model` pks} `m2m_map`."""
+    inverse_map = defaultdict(set)
+    for related_pk, obj_pks in m2m_map.items():
+        for obj_pk in obj_pks:
+            inverse_map[obj_pk].add(related_pk)
+    return inverse_map
+
+
+def get_device_weight(device, vs_device_types, vs_device_roles, on_device, tagged):
+    """Return the weight of a preferred ValidatedSoftwareLCM for a Device, or None if it does not apply to it.
+
+    `device` is the values dict of the Device, `vs_device_types` and `vs_device_roles` the pks of the device types and
+    roles of the validated software, and `on_device` and `tagged` tell whether it is assigned to the Device directly
+    or by tag.
+    """
+    on_type = device["device_type_id"] in vs_device_types
+    on_role = device["device_role_id"] in vs_device_roles
+    type_match = on_type and (on_role or not vs_device_roles)
+    role_match = on_role and not vs_device_types
+    if not (on_device or type_match or role_match or tagged):
+        return None
+
+    if on_device:
+        return 10
+    if on_type and on_role:
+        return 20
+    if on_type and not vs_device_roles:
+        return 30
+    if on_role:
+        return 40
+    return 990
+
+
+class BulkItemSoftware(ABC):
+    """Base class computing SoftwareLCM and ValidatedSoftwareLCM related data for a set of objects.
+
+    Gives the same answers as `ItemSoftware` and the per-object validated software filters, but evaluates the whole
+    set with a fixed number of queries, whatever its size.
+    """
+
+    soft_relation_name = None
+    soft_obj_model = None
+    item_fields = ("id", "name")
+
+    def __init__(self, items_qs, validated_software_qs=None, software_qs=None, software_image_qs=None):
+        """Initialize BulkItemSoftware object.
+
+        The software, validated software and software images are read from `software_qs`, `validated_software_qs`
+        and `software_image_qs`, which default to all the objects, so that they can be restricted to those a user
+        can view.
+        """
+        self.items_qs = items_qs
+        if validated_software_qs is None:
+            validated_software_qs = ValidatedSoftwareLCM.objects.all()
+        self.validated_software_qs = validated_software_qs
+        if software_qs is None:
+            software_qs = SoftwareLCM.objects.all()
+        self.software_qs = software_qs
+        if software_image_qs is None:
+            software_image_qs = SoftwareImageLCM.objects.all()
+        self.software_image_qs = software_image_qs
+        self._items = None
+        self._item_tags = None
+
+    @property
+    def items(self):
+        """Return {pk: values dict} of the objects in the set."""
+        if self._items is None:
+            self._items = {item["id"]: item for item in self.items_qs.values(*self.item_fields)}
+        return self._items
+
+    def get_item_tags(self):
+        """Return {pk: set of Tag pks} of the objects in the set."""
+        if self._item_tags is None:
+            self._item_tags = defaultdict(set)
+            tagged_items = TaggedItem.objects.filter(
+                content_type=ContentType.objects.get_for_model(self.soft_obj_model),
+                object_id__in=list(self.items),
+            ).values_list("object_id", "tag_id")
+            for object_id, tag_id in tagged_items:
+                self._item_tags[object_id].add(tag_id)
+        return self._item_tags
+
+    def get_software_map(self):
+        """Return {pk: SoftwareLCM} for the objects in the set that have software assigned."""
+        software_assignments = dict(
+            RelationshipAssociation.objects.filter(
+                relationship__slug=self.soft_relation_name,
+                destination_type=ContentType.objects.get_for_model(self.soft_obj_model),
+                destination_id__in=list(self.items),
+            ).values_list("destination_id", "source_id")
+        )
+        softwares = self.software_qs.select_related("device_platform").in_bulk(set(software_assignments.values()))
+        return {
+            item_pk: softwares[software_pk]
+            for item_pk, software_pk in software_assignments.items()
+            if software_pk in softwares
+        }
+
+    @abstractmethod
+    def get_validated_software_weights(self, validated_softwares):
+        """Return {pk: {ValidatedSoftwareLCM pk: weight}} of the validated software applying to each object."""
+
+    @abstractmethod
+    def get_assigned_image_pks(self):
+        """Return {pk: set of SoftwareImageLCM pks} of the images assigned to each object, other than by tag."""
+
+    def get_software_image_candidates(self, software_map=None):
+        """Return {pk: [SoftwareImageLCM, ...]} of the images of the first matching precedence level of each object.
+
+        Uses the same precedence as the per-object software image filters: images assigned by tag, then by device
+        type or inventory item, then the software's default images.
+
+        `software_map` gives the target SoftwareLCM (or SoftwareLCM pk) of each object and defaults to the software
+        currently assigned to the objects. Objects without target software or matching image are left out.
+        """
+        if software_map is None:
+            software_map = self.get_software_map()
+        software_map = {item_pk: getattr(software, "pk", software) for item_pk, software in software_map.items()}
+
+        images_by_software = defaultdict(list)
+        for image in self.software_image_qs.filter(software__in=set(software_map.values())):
+            images_by_software[image.software_id].append(image)
+        images_by_tag = get_m2m_map(SoftwareImageLCM, "object_tags")
+        assigned_image_pks = self.get_assigned_image_pks()
+        item_tags = self.get_item_tags()
+
+        image_candidates = {}
+        for item_pk, software_pk in software_map.items():
+            images = images_by_software.get(software_pk)
+            if not images:
+                continue
+            tagged_image_pks = set().union(*(images_by_tag.get(tag_pk, ()) for tag_pk in item_tags.get(item_pk, ())))
+            for candidates in (
+                [image for image in images if image.pk in tagged_image_pks],
+                [image for image in images if image.pk in assigned_image_pks.get(item_pk, ())],
+                [image for image in images if image.default_image],
+            ):
+                if candidates:
+                    image_candidates[item_pk] = candidates
+                    break
+        return image_candidates
+
+    def get_software_image_map(self, software_map=None):
+        """Return {pk: SoftwareImageLCM} of the image to use on each object, as given by `get_software_image_candidates`."""
+        return {
+            item_pk: candidates[0] for item_pk, candidates in self.get_software_image_candidates(software_map).items()
+        }
+
+    def get_validated_software_map(self):
+        """Return {pk: [(ValidatedSoftwareLCM, weight), ...]} ordered by weight and start date."""
+        validated_softwares = self.validated_software_qs.select_related("software__device_platform").in_bulk()
+        validated_software_map = {}
+        for item_pk, weights in self.get_validated_software_weights(validated_softwares).items():
+            validated_software_map[item_pk] = sorted(
+                ((validated_softwares[vs_pk], weight) for vs_pk, weight in weights.items()),
+                key=lambda vs_weight: (vs_weight[1], vs_weight[0].start),
+            )
+        return validated_software_map
+
+    def get_validated_software_weight_map(self):
+        """Return {ValidatedSoftwareLCM pk: lowest weight} of the validated software applying to any object in the set."""
+        validated_softwares = self.validated_software_qs.only("id", "preferred").in_bulk()
+        weight_map = {}
+        for weights in self.get_validated_software_weights(validated_softwares).values():
+            for vs_pk, weight in weights.items():
+                weight_map[vs_pk] = min(weight, weight_map.get(vs_pk, weight))
+        return weight_map
+
+    def get_results(self):
+        """Return {pk: result} with the assigned software, applicable validated software and validation status.
+
+        Each result is a dict with the `software` (or None), the `validated_software` list of
+        `(ValidatedSoftwareLCM, weight)` tuples ordered by weight, and the `is_validated` and
+        `is_preferred_validated` flags.
+        """
+        software_map = self.get_software_map()
+        validated_software_map = self.get_validated_software_map()
+
+        results = {}
+        for item_pk in self.items:
+            software = software_map.get(item_pk)
+            validated_software = validated_software_map.get(item_pk, [])
+            matching = [
+                vs
+                for vs, _ in validated_software
+                if software is not None and vs.software_id == software.pk and vs.valid
+            ]
+            results[item_pk] = {
+                "software": software,
+                "validated_software": validated_software,
+                "is_validated": bool(matching),
+                "is_preferred_validated": any(vs.preferred for vs in matching),
+            }
+        return results
+
+
+class BulkDeviceSoftware(BulkItemSoftware):
+    """Computes software validation data for a set of Device objects."""
+
+    soft_obj_model = Device
+    soft_relation_name = "device_soft"
+    item_fields = ("id", "name", "device_type_id", "device_role_id")
+
+    def get_validated_software_weights(self, validated_softwares):
+        """Return {pk: {ValidatedSoftwareLCM pk: weight}}, weighted like `DeviceValidatedSoftwareFilter`."""
+        by_device = get_m2m_map(ValidatedSoftwareLCM, "devices", list(self.items))
+        by_device_type = get_m2m_map(ValidatedSoftwareLCM, "device_types")
+        by_device_role = get_m2m_map(ValidatedSoftwareLCM, "device_roles")
+        by_tag = get_m2m_map(ValidatedSoftwareLCM, "object_tags")
+
+        # Inverse mappings, needed to tell whether a validated software has any device types or roles at all.
+        vs_device_types, vs_device_roles = invert_m2m_map(by_device_type), invert_m2m_map(by_device_role)
+
+        weights = {}
+        for item_pk, item in self.items.items():
+            tagged = set().union(*(by_tag.get(tag_pk, ()) for tag_pk in self.get_item_tags().get(item_pk, ())))
+            candidates = by_device.get(item_pk, set()) | by_device_type.get(item["device_type_id"], set()) | tagged
+            candidates |= by_device_role.get(item["device_role_id"], set())
+            preferred_weights = (
+                (
+                    vs_pk,
+                    get_device_weight(
+                        item,
+                        vs_device_types[vs_pk],
+                        vs_device_roles[vs_pk],
+                        vs_pk in by_device.get(item_pk, ()),
+                        vs_pk in tagged,
+                    ),
+                )
+                for vs_pk in candidates.intersection(validated_softwares)
+            )
+            weights[item_pk] = {
+                vs_pk: weight if validated_softwares[vs_pk].preferred else NON_PREFERRED_WEIGHTS[weight]
+                for vs_pk, weight in preferred_weights
+                if weight is not None
+            }
+        return weights
+
+    def get_assigned_image_pks(self):
+        """Return {pk: set of SoftwareImageLCM pks} of the images assigned to each Device's device type."""
+        device_type_pks = {item["device_type_id"] for item in self.items.values()}
+        images_by_device_type = get_m2m_map(SoftwareImageLCM, "device_types", device_type_pks)
+        return {
+            item_pk: images_by_device_type.get(item["device_type_id"], set()) for item_pk, item in self.items.items()
+        }
+
+
+class BulkInventoryItemSoftware(BulkItemSoftware):
+    """Computes software validation data for a set of InventoryItem objects."""
+
+    soft_obj_model = InventoryItem
+    soft_relation_name = "inventory_item_soft"
+
+    def get_validated_software_weights(self, validated_softwares):
+        """Return {pk: {ValidatedSoftwareLCM pk: weight}}, weighted like `InventoryItemValidatedSoftwareFilter`."""
+        by_inventory_item = get_m2m_map(ValidatedSoftwareLCM, "inventory_items", list(self.items))
+        by_tag = get_m2m_map(ValidatedSoftwareLCM, "object_tags")
+        item_tags = self.get_item_tags()
+
+        weights = {}
+        for item_pk in self.items:
+            candidates = set(by_inventory_item.get(item_pk, ()))
+            for tag_pk in item_tags.get(item_pk, ()):
+                candidates |= by_tag.get(tag_pk, set())
+            weights[item_pk] = {
+                vs_pk: 20 if validated_softwares[vs_pk].preferred else NON_PREFERRED_WEIGHTS[20]
+                for vs_pk in candidates
+                if vs_pk in validated_softwares
+            }
+        return weights
+
+    def get_assigned_image_pks(self):
+        """Return {pk: set of SoftwareImageLCM pks} of the images assigned to each InventoryItem."""
+        return get_m2m_map(SoftwareImageLCM, "inventory_items", list(self.items))
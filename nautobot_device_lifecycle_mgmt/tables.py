@@ -12,6 +12,7 @@ from nautobot.utilities.tables import (
     TagColumn,
     ToggleColumn,
 )
+from nautobot.dcim.models import Device
 from nautobot.extras.tables import StatusTableMixin
 from nautobot_device_lifecycle_mgmt.models import (
     HardwareLCM,
@@ -24,6 +25,10 @@ from nautobot_device_lifecycle_mgmt.models import (
     VulnerabilityLCM,
     DeviceSoftwareValidationResult,
     InventoryItemSoftwareValidationResult,
+    DeviceHardwareEoXResult,
+    InventoryItemHardwareEoXResult,
+    DeviceContractCoverage,
+    InventoryItemContractCoverage,
     SoftwareImageLCM,
 )
 
@@ -84,6 +89,8 @@ class HardwareLCMTable(BaseTable):
                     {% endif %}""",
         verbose_name="Documentation",
     )
+    expired = BooleanColumn()
+    days_to_expiry = tables.Column(verbose_name="Days to Expiry")
     actions = ButtonsColumn(HardwareLCM, buttons=("changelog", "edit", "delete"))
 
     class Meta(BaseTable.Meta):  # pylint: disable=too-few-public-methods
@@ -99,9 +106,41 @@ class HardwareLCMTable(BaseTable):
             "end_of_support",
             "end_of_sw_releases",
             "end_of_security_patches",
+            "expired",
+            "days_to_expiry",
             "documentation_url",
             "actions",
         )
+        default_columns = (
+            "pk",
+            "name",
+            "reference_item",
+            "release_date",
+            "end_of_sale",
+            "end_of_support",
+            "end_of_sw_releases",
+            "end_of_security_patches",
+            "documentation_url",
+            "actions",
+        )
+
+
+class HardwareLCMDeviceTable(BaseTable):
+    """Table for the Devices affected by a hardware notice."""
+
+    name = tables.Column(linkify=True, verbose_name="Device")
+    site = tables.Column(linkify=True)
+    rack = tables.Column(linkify=True)
+    device_type = tables.Column(linkify=True, verbose_name="Type", order_by=("device_type__model",))
+    device_role = tables.Column(linkify=True, verbose_name="Role", order_by=("device_role__name",))
+    platform = tables.Column(linkify=True)
+
+    class Meta(BaseTable.Meta):  # pylint: disable=too-few-public-methods
+        """Meta attributes."""
+
+        model = Device
+        fields = ("name", "site", "rack", "device_type", "device_role", "platform", "serial", "asset_tag")
+        default_columns = ("name", "site", "rack", "device_type", "device_role", "platform")
 
 
 class SoftwareLCMTable(BaseTable):
@@ -114,6 +153,7 @@ class SoftwareLCMTable(BaseTable):
         args=[A("pk")],
         orderable=False,
     )
+    version = tables.Column(order_by=("version_sort_key",))
     device_platform = tables.TemplateColumn("{{ record.device_platform }}")
     long_term_support = BooleanColumn()
     pre_release = BooleanColumn()
@@ -392,6 +432,182 @@ class InventoryItemSoftwareValidationResultListTable(BaseTable):
         ]
 
 
+class DeviceHardwareEoXResultListTable(BaseTable):
+    """Table for a list of device hardware EoX report."""
+
+    device = tables.Column(accessor="device", verbose_name="Device", linkify=True)
+    device_type = tables.Column(accessor="device__device_type", verbose_name="Device Type", linkify=True)
+    site = tables.Column(accessor="device__site", verbose_name="Site", linkify=True)
+    end_of_sale = tables.Column(verbose_name="End of Sale")
+    end_of_support = tables.Column(verbose_name="End of Support")
+    end_of_sw_releases = tables.Column(verbose_name="End of Software Releases")
+    end_of_security_patches = tables.Column(verbose_name="End of Security Patches")
+    last_run = tables.Column(accessor="last_run", verbose_name="Last Run")
+    run_type = tables.Column(accessor="run_type", verbose_name="Run Type")
+
+    class Meta(BaseTable.Meta):  # pylint: disable=too-few-public-methods
+        """Metaclass attributes of DeviceHardwareEoXResultListTable."""
+
+        model = DeviceHardwareEoXResult
+        fields = [
+            "device",
+            "device_type",
+            "site",
+            "end_of_sale",
+            "end_of_support",
+            "end_of_sw_releases",
+            "end_of_security_patches",
+            "last_run",
+            "run_type",
+        ]
+        default_columns = [
+            "device",
+            "device_type",
+            "site",
+            "end_of_sale",
+            "end_of_support",
+            "end_of_security_patches",
+            "last_run",
+        ]
+
+
+class InventoryItemHardwareEoXResultListTable(BaseTable):
+    """Table for a list of inventory item hardware EoX report."""
+
+    inventory_item = tables.Column(accessor="inventory_item", verbose_name="Inventory Item", linkify=True)
+    part_id = tables.Column(accessor="inventory_item__part_id", verbose_name="Part ID")
+    device = tables.Column(accessor="inventory_item__device", verbose_name="Device", linkify=True)
+    end_of_sale = tables.Column(verbose_name="End of Sale")
+    end_of_support = tables.Column(verbose_name="End of Support")
+    end_of_sw_releases = tables.Column(verbose_name="End of Software Releases")
+    end_of_security_patches = tables.Column(verbose_name="End of Security Patches")
+    last_run = tables.Column(accessor="last_run", verbose_name="Last Run")
+    run_type = tables.Column(accessor="run_type", verbose_name="Run Type")
+
+    class Meta(BaseTable.Meta):  # pylint: disable=too-few-public-methods
+        """Metaclass attributes of InventoryItemHardwareEoXResultListTable."""
+
+        model = InventoryItemHardwareEoXResult
+        fields = [
+            "inventory_item",
+            "part_id",
+            "device",
+            "end_of_sale",
+            "end_of_support",
+            "end_of_sw_releases",
+            "end_of_security_patches",
+            "last_run",
+            "run_type",
+        ]
+        default_columns = [
+            "inventory_item",
+            "part_id",
+            "device",
+            "end_of_sale",
+            "end_of_support",
+            "end_of_security_patches",
+            "last_run",
+        ]
+
+
+class DeviceContractCoverageListTable(BaseTable):
+    """Table for a list of device contract coverage."""
+
+    device = tables.Column(accessor="device", verbose_name="Device", linkify=True)
+    device_type = tables.Column(accessor="device__device_type", verbose_name="Device Type", linkify=True)
+    site = tables.Column(accessor="device__site", verbose_name="Site", linkify=True)
+    is_covered = BooleanColumn(verbose_name="Covered")
+    contract = tables.Column(accessor="contract", verbose_name="Active Contract", linkify=True)
+    provider = tables.Column(accessor="provider", verbose_name="Vendor", linkify=True)
+    support_level = tables.Column(verbose_name="Support Level")
+    end = tables.Column(verbose_name="Contract End")
+    gap_start = tables.Column(verbose_name="Coverage Gap Start")
+    gap_end = tables.Column(verbose_name="Coverage Gap End")
+    contract_count = tables.Column(verbose_name="Contracts")
+    last_run = tables.Column(accessor="last_run", verbose_name="Last Run")
+    run_type = tables.Column(accessor="run_type", verbose_name="Run Type")
+
+    class Meta(BaseTable.Meta):  # pylint: disable=too-few-public-methods
+        """Metaclass attributes of DeviceContractCoverageListTable."""
+
+        model = DeviceContractCoverage
+        fields = [
+            "device",
+            "device_type",
+            "site",
+            "is_covered",
+            "contract",
+            "provider",
+            "support_level",
+            "end",
+            "gap_start",
+            "gap_end",
+            "contract_count",
+            "last_run",
+            "run_type",
+        ]
+        default_columns = [
+            "device",
+            "device_type",
+            "site",
+            "is_covered",
+            "contract",
+            "provider",
+            "support_level",
+            "gap_start",
+            "last_run",
+        ]
+
+
+class InventoryItemContractCoverageListTable(BaseTable):
+    """Table for a list of inventory item contract coverage."""
+
+    inventory_item = tables.Column(accessor="inventory_item", verbose_name="Inventory Item", linkify=True)
+    part_id = tables.Column(accessor="inventory_item__part_id", verbose_name="Part ID")
+    device = tables.Column(accessor="inventory_item__device", verbose_name="Device", linkify=True)
+    is_covered = BooleanColumn(verbose_name="Covered")
+    contract = tables.Column(accessor="contract", verbose_name="Active Contract", linkify=True)
+    provider = tables.Column(accessor="provider", verbose_name="Vendor", linkify=True)
+    support_level = tables.Column(verbose_name="Support Level")
+    end = tables.Column(verbose_name="Contract End")
+    gap_start = tables.Column(verbose_name="Coverage Gap Start")
+    gap_end = tables.Column(verbose_name="Coverage Gap End")
+    contract_count = tables.Column(verbose_name="Contracts")
+    last_run = tables.Column(accessor="last_run", verbose_name="Last Run")
+    run_type = tables.Column(accessor="run_type", verbose_name="Run Type")
+
+    class Meta(BaseTable.Meta):  # pylint: disable=too-few-public-methods
+        """Metaclass attributes of InventoryItemContractCoverageListTable."""
+
+        model = InventoryItemContractCoverage
+        fields = [
+            "inventory_item",
+            "part_id",
+            "device",
+            "is_covered",
+            "contract",
+            "provider",
+            "support_level",
+            "end",
+            "gap_start",
+            "gap_end",
+            "contract_count",
+            "last_run",
+            "run_type",
+        ]
+        default_columns = [
+            "inventory_item",
+            "part_id",
+            "device",
+            "is_covered",
+            "contract",
+            "provider",
+            "support_level",
+            "gap_start",
+            "last_run",
+        ]
+
+
 class ContractLCMTable(BaseTable):
     """Table for list view."""
 
@@ -407,6 +623,8 @@ class ContractLCMTable(BaseTable):
     cost = tables.TemplateColumn(
         template_code="""{{ record.cost }}{% if record.currency %} {{ record.currency }}{% endif %}"""
     )
+    expired = BooleanColumn()
+    days_to_expiry = tables.Column(verbose_name="Days to Expiry")
     actions = ButtonsColumn(ContractLCM, buttons=("changelog", "edit", "delete"))
 
     class Meta(BaseTable.Meta):  # pylint: disable=too-few-public-methods
@@ -414,6 +632,19 @@ class ContractLCMTable(BaseTable):
 
         model = ContractLCM
         fields = (
+            "pk",
+            "name",
+            "start",
+            "end",
+            "cost",
+            "support_level",
+            "contract_type",
+            "provider",
+            "expired",
+            "days_to_expiry",
+            "actions",
+        )
+        default_columns = (
             "pk",
             "name",
             "start",
@@ -1,10 +1,7 @@
 """Extended core templates for the Lifecycle Management plugin."""
 from abc import ABCMeta
 
-from django.db.models import Q
-
 from nautobot.extras.plugins import PluginTemplateExtension
-from nautobot.dcim.models import InventoryItem
 from .models import HardwareLCM
 from .software import (
     DeviceSoftware,
@@ -38,16 +35,7 @@ class DeviceHWLCM(PluginTemplateExtension, metaclass=ABCMeta):
 
         return self.render(
             "nautobot_device_lifecycle_mgmt/inc/device_notice.html",
-            extra_context={
-                "hw_notices": HardwareLCM.objects.filter(
-                    Q(device_type=dev_obj.device_type)
-                    | Q(
-                        inventory_item__in=[
-                            i.part_id for i in InventoryItem.objects.filter(device__pk=dev_obj.pk) if i.part_id
-                        ]
-                    )
-                )
-            },
+            extra_context={"hw_notices": HardwareLCM.objects.filter(device_mappings__device=dev_obj.pk).distinct()},
         )
 
 
@@ -1,21 +1,34 @@
 """Unit tests for nautobot_device_lifecycle_mgmt."""
 import datetime
+import json
+
+import time_machine
+
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 
-from nautobot.utilities.testing import APIViewTestCases
+from nautobot.utilities.testing import APITestCase, APIViewTestCases
+from nautobot.utilities.utils import get_route_for_model
 from nautobot.dcim.models import DeviceType, Manufacturer, Platform, Device, DeviceRole, InventoryItem, Site
-from nautobot.extras.models import Status, Tag
+from nautobot.extras.models import Relationship, RelationshipAssociation, Status, Tag
+from nautobot.users.models import ObjectPermission
 
 from nautobot_device_lifecycle_mgmt.models import (
     HardwareLCM,
     SoftwareLCM,
+    ContactLCM,
     ContractLCM,
     ProviderLCM,
     ValidatedSoftwareLCM,
     CVELCM,
     VulnerabilityLCM,
     SoftwareImageLCM,
+    DeviceSoftwareValidationResult,
+    InventoryItemSoftwareValidationResult,
 )
 from nautobot_device_lifecycle_mgmt.tests.conftest import create_devices, create_cves, create_softwares
 
@@ -227,6 +240,17 @@ class ContractLCMAPITest(APIViewTestCases.APIViewTestCase):
             provider=provider,
         )
 
+    def test_expiry_follows_current_date(self):
+        """Test the expiry of the contracts is computed on the day of each request."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_contractlcm")
+        contract = ContractLCM.objects.get(name="Meraki Hardware Support")
+        url = reverse(get_route_for_model(ContractLCM, "detail", api=True), kwargs={"pk": contract.pk})
+        for today, expired, days_to_expiry in (("2022-03-31 12:00", False, 1), ("2022-04-02 12:00", True, -1)):
+            with time_machine.travel(today):
+                response = self.client.get(url, **self.header)
+            self.assertHttpStatus(response, 200)
+            self.assertEqual((response.data["expired"], response.data["days_to_expiry"]), (expired, days_to_expiry))
+
     def test_bulk_create_objects(self):
         """Currently don't support bulk operations."""
 
@@ -527,6 +551,91 @@ class VulnerabilityLCMAPITest(
     def test_list_objects_brief(self):
         """Nautobot 1.4 adds 'created' and 'last_updated' causing testing mismatch with previous versions."""
 
+    def test_list_objects_keyset_pagination(self):
+        """Test paging through all objects with opt-in keyset pagination."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_vulnerabilitylcm")
+        url = f"{self._get_list_url()}?pagination=cursor&limit=2"
+        seen = []
+        while url:
+            response = self.client.get(url, **self.header)
+            self.assertHttpStatus(response, 200)
+            self.assertNotIn("count", response.data)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            seen.extend(result["id"] for result in response.data["results"])
+            url = response.data["next"]
+
+        expected = sorted(str(pk) for pk in VulnerabilityLCM.objects.values_list("pk", flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_list_objects_keyset_pagination_count(self):
+        """Test the total count is only returned with keyset pagination when requested."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_vulnerabilitylcm")
+        response = self.client.get(f"{self._get_list_url()}?pagination=cursor&count=true", **self.header)
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["count"], VulnerabilityLCM.objects.count())
+
+    def test_list_objects_sparse_fields(self):
+        """Test only the requested fields are rendered."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_vulnerabilitylcm")
+        response = self.client.get(f"{self._get_list_url()}?fields=id,software", **self.header)
+
+        self.assertHttpStatus(response, 200)
+        for result in response.data["results"]:
+            self.assertEqual(sorted(result), ["id", "software"])
+
+    def test_list_objects_exclude_fields(self):
+        """Test excluded fields are not rendered."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_vulnerabilitylcm")
+        response = self.client.get(f"{self._get_list_url()}?exclude=tags,custom_fields", **self.header)
+
+        self.assertHttpStatus(response, 200)
+        for result in response.data["results"]:
+            self.assertNotIn("tags", result)
+            self.assertNotIn("custom_fields", result)
+            self.assertIn("cve", result)
+
+    def test_get_object_collapsed_relations(self):
+        """Test related objects are rendered as primary keys unless expanded."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_vulnerabilitylcm")
+        vulnerability = VulnerabilityLCM.objects.first()
+        response = self.client.get(f"{self._get_detail_url(vulnerability)}?expand=software", **self.header)
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["cve"], str(vulnerability.cve.pk))
+        self.assertEqual(response.data["device"], str(vulnerability.device.pk))
+        self.assertEqual(response.data["software"]["id"], str(vulnerability.software.pk))
+
+    def test_stream_objects(self):
+        """Test streaming all objects as newline-delimited JSON."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_vulnerabilitylcm")
+        response = self.client.get(f"{self._get_list_url()}stream/", **self.header)
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), VulnerabilityLCM.objects.count())
+        self.assertEqual(
+            sorted(json.loads(line)["id"] for line in lines),
+            sorted(str(pk) for pk in VulnerabilityLCM.objects.values_list("pk", flat=True)),
+        )
+
+    def test_stream_objects_filtered(self):
+        """Test streaming honours the filterset."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_vulnerabilitylcm")
+        vulnerability = VulnerabilityLCM.objects.first()
+        response = self.client.get(f"{self._get_list_url()}stream/?q={vulnerability.cve.name}", **self.header)
+
+        self.assertHttpStatus(response, 200)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line)["id"] for line in lines], [str(vulnerability.pk)])
+
+    def test_stream_objects_without_permission(self):
+        """Test streaming requires view permission."""
+        response = self.client.get(f"{self._get_list_url()}stream/", **self.header)
+
+        self.assertHttpStatus(response, 403)
+
 
 class SoftwareImageLCMAPITest(APIViewTestCases.APIViewTestCase):
     """Test the SoftwareImageLCM API."""
@@ -773,3 +882,387 @@ class ProviderLCMAPITest(APIViewTestCases.APIViewTestCase):
 
     def test_list_objects_brief(self):
         """Nautobot 1.4 adds 'created' and 'last_updated' causing testing mismatch with previous versions."""
+
+
+class APIQueryCountTest(APITestCase):
+    """Test the number of queries issued by the API list endpoints does not grow with the page size."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.devices = create_devices()
+        cls.softwares = create_softwares()
+        cls.cves = create_cves()
+        cls.tag = Tag.objects.create(name="lcm", slug="lcm")
+        cls.provider = ProviderLCM.objects.create(name="Cisco")
+        for i, device in enumerate(cls.devices):
+            cls.create_device_objects(i, device)
+
+        # Every object needs related objects so that a page of one exercises the same prefetches as a full page.
+        for i, software in enumerate(cls.softwares):
+            image = SoftwareImageLCM(image_file_name=f"image{i}.bin", software=software)
+            image.device_types.set(DeviceType.objects.all())
+            image.inventory_items.set(InventoryItem.objects.all())
+            image.object_tags.set([cls.tag])
+            image.save()
+
+    @classmethod
+    def create_device_objects(cls, i, device):
+        """Create the objects of each model related to the `i`th device and software."""
+        manufacturer = Manufacturer.objects.get(slug="cisco")
+        device.tags.add(cls.tag)
+        inventory_item = InventoryItem.objects.create(device=device, name=f"Module {i}", manufacturer=manufacturer)
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model=f"DT {i}", slug=f"dt-{i}")
+        HardwareLCM.objects.create(device_type=device_type, end_of_sale=datetime.date(2021, 4, 1)).tags.add(cls.tag)
+
+        validated_software = ValidatedSoftwareLCM(software=cls.softwares[i], start=datetime.date(2020, 1, 1))
+        validated_software.devices.set(cls.devices)
+        validated_software.device_types.set([device.device_type])
+        validated_software.device_roles.set([device.device_role])
+        validated_software.inventory_items.set([inventory_item])
+        validated_software.object_tags.set([cls.tag])
+        validated_software.save()
+
+        VulnerabilityLCM.objects.create(cve=cls.cves[i], device=device, software=cls.softwares[i])
+        VulnerabilityLCM.objects.create(cve=cls.cves[i], inventory_item=inventory_item, software=cls.softwares[i])
+
+        device_result = DeviceSoftwareValidationResult.objects.create(
+            device=device, software=cls.softwares[i], is_validated=True, run_type="full-report-run"
+        )
+        device_result.valid_software.set([validated_software])
+        inventory_item_result = InventoryItemSoftwareValidationResult.objects.create(
+            inventory_item=inventory_item, software=cls.softwares[i], is_validated=True, run_type="full-report-run"
+        )
+        inventory_item_result.valid_software.set([validated_software])
+
+        contract = ContractLCM.objects.create(provider=cls.provider, name=f"Contract {i}")
+        ContactLCM.objects.create(name=f"Contact {i}", contract=contract)
+        ProviderLCM.objects.create(name=f"Provider {i}")
+
+    def setUp(self):
+        super().setUp()
+        self.user.is_superuser = True
+        self.user.save()
+
+    def _list_query_count(self, url):
+        # Warm up any per-request configuration lookups before counting.
+        self.client.get(url, **self.header)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 200)
+        return len(queries)
+
+    def test_list_query_count_independent_of_page_size(self):
+        """Test listing one or all objects of each model issues the same number of queries."""
+        for model in (
+            HardwareLCM,
+            ContractLCM,
+            ProviderLCM,
+            ContactLCM,
+            SoftwareLCM,
+            SoftwareImageLCM,
+            ValidatedSoftwareLCM,
+            CVELCM,
+            VulnerabilityLCM,
+            DeviceSoftwareValidationResult,
+            InventoryItemSoftwareValidationResult,
+        ):
+            with self.subTest(model=model._meta.model_name):
+                url = reverse(get_route_for_model(model, "list", api=True))
+                count = model.objects.count()
+                self.assertGreaterEqual(count, 3)
+                self.assertEqual(
+                    self._list_query_count(f"{url}?limit=1"),
+                    self._list_query_count(f"{url}?limit={count}"),
+                )
+
+    def test_sparse_fields_skip_related_queries(self):
+        """Test omitted and collapsed relations are not joined or prefetched."""
+        url = reverse(get_route_for_model(ValidatedSoftwareLCM, "list", api=True))
+        full_count = self._list_query_count(url)
+
+        self.assertLess(self._list_query_count(f"{url}?fields=id,software"), full_count)
+        self.assertLess(self._list_query_count(f"{url}?exclude=devices,device_types,device_roles"), full_count)
+
+        software_version_column = '"nautobot_device_lifecycle_mgmt_softwarelcm"."version"'
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(f"{url}?fields=id,software", **self.header)
+        self.assertTrue(
+            any(software_version_column in query["sql"].split(" FROM ")[0] for query in queries.captured_queries)
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(f"{url}?fields=id,software&expand=false", **self.header)
+        self.assertFalse(
+            any(software_version_column in query["sql"].split(" FROM ")[0] for query in queries.captured_queries)
+        )
+
+
+class SoftwareValidationAPITest(APITestCase):
+    """Test the bulk software validation API."""
+
+    url = reverse("plugins-api:nautobot_device_lifecycle_mgmt-api:software-validation")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.devices = create_devices()
+        cls.software = create_softwares()[0]
+        relationship = Relationship.objects.get(slug="device_soft")
+        for device in cls.devices[:2]:
+            RelationshipAssociation.objects.create(relationship=relationship, source=cls.software, destination=device)
+        cls.validated_software = ValidatedSoftwareLCM(
+            software=cls.software, start=datetime.date(2020, 1, 1), preferred=True
+        )
+        cls.validated_software.devices.set([cls.devices[0]])
+        cls.validated_software.save()
+
+    def test_validate_devices(self):
+        """Test validating devices by ID."""
+        self.add_permissions(
+            "nautobot_device_lifecycle_mgmt.view_validatedsoftwarelcm",
+            "nautobot_device_lifecycle_mgmt.view_softwarelcm",
+            "dcim.view_device",
+        )
+        response = self.client.post(
+            self.url, {"devices": [str(device.pk) for device in self.devices]}, format="json", **self.header
+        )
+
+        self.assertHttpStatus(response, 200)
+        results = {str(result["id"]): result for result in response.data["devices"]}
+        self.assertEqual(len(results), 3)
+        self.assertNotIn("inventory_items", response.data)
+        result = results[str(self.devices[0].pk)]
+        self.assertEqual(str(result["software"]["id"]), str(self.software.pk))
+        self.assertEqual(str(result["validated_software"][0]["id"]), str(self.validated_software.pk))
+        self.assertEqual(result["validated_software"][0]["weight"], 10)
+        self.assertTrue(result["is_validated"])
+        self.assertTrue(result["is_preferred_validated"])
+        self.assertFalse(results[str(self.devices[1].pk)]["is_validated"])
+        self.assertIsNone(results[str(self.devices[2].pk)]["software"])
+
+    def test_validate_devices_by_filter(self):
+        """Test validating the devices matching filter parameters, combined with IDs."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_validatedsoftwarelcm", "dcim.view_device")
+        response = self.client.post(self.url, {"device_filter": {"name": ["sw1", "sw2"]}}, format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual({result["name"] for result in response.data["devices"]}, {"sw1", "sw2"})
+
+        response = self.client.post(
+            self.url,
+            {"devices": [str(self.devices[1].pk)], "device_filter": {"name": ["sw1", "sw2"]}},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, 200)
+        self.assertEqual([result["name"] for result in response.data["devices"]], ["sw2"])
+
+    def test_validate_invalid_request(self):
+        """Test an empty request or an invalid filter is rejected."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_validatedsoftwarelcm", "dcim.view_device")
+        self.assertHttpStatus(self.client.post(self.url, {}, format="json", **self.header), 400)
+        response = self.client.post(
+            self.url, {"device_filter": {"status": ["nonexistent"]}}, format="json", **self.header
+        )
+        self.assertHttpStatus(response, 400)
+
+    def test_validate_restricted_devices(self):
+        """Test devices the user cannot view are not evaluated."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_validatedsoftwarelcm")
+        response = self.client.post(
+            self.url, {"devices": [str(device.pk) for device in self.devices]}, format="json", **self.header
+        )
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["devices"], [])
+
+    def test_validate_restricted_software(self):
+        """Test the software the user cannot view is not returned."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_validatedsoftwarelcm", "dcim.view_device")
+        response = self.client.post(self.url, {"devices": [str(self.devices[0].pk)]}, format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertIsNone(response.data["devices"][0]["software"])
+        self.assertFalse(response.data["devices"][0]["is_validated"])
+
+    def test_validate_without_permission(self):
+        """Test the endpoint requires permission to view validated software."""
+        self.add_permissions("dcim.view_device")
+        response = self.client.post(self.url, {"devices": [str(self.devices[0].pk)]}, format="json", **self.header)
+        self.assertHttpStatus(response, 403)
+
+
+class SoftwareImageResolutionAPITest(APITestCase):
+    """Test the bulk software image resolution API."""
+
+    url = reverse("plugins-api:nautobot_device_lifecycle_mgmt-api:software-image-resolution")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.devices = create_devices()
+        cls.software, cls.software_2 = create_softwares()[:2]
+        relationship = Relationship.objects.get(slug="device_soft")
+        RelationshipAssociation.objects.create(
+            relationship=relationship, source=cls.software, destination=cls.devices[0]
+        )
+        cls.image = SoftwareImageLCM.objects.create(
+            image_file_name="ios.bin", software=cls.software, default_image=True
+        )
+        cls.image_2 = SoftwareImageLCM.objects.create(
+            image_file_name="ios2.bin", software=cls.software_2, default_image=True
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.add_permissions(
+            "nautobot_device_lifecycle_mgmt.view_softwareimagelcm",
+            "nautobot_device_lifecycle_mgmt.view_softwarelcm",
+            "dcim.view_device",
+        )
+
+    def test_resolve_assigned_software_images(self):
+        """Test resolving the image of the software assigned to each device."""
+        response = self.client.post(self.url, {"device_filter": {"name": ["sw1", "sw2"]}}, format="json", **self.header)
+
+        self.assertHttpStatus(response, 200)
+        results = {result["name"]: result for result in response.data["devices"]}
+        self.assertEqual(str(results["sw1"]["software"]["id"]), str(self.software.pk))
+        self.assertEqual(str(results["sw1"]["software_image"]["id"]), str(self.image.pk))
+        self.assertIsNone(results["sw2"]["software"])
+        self.assertIsNone(results["sw2"]["software_image"])
+
+    def test_resolve_target_software_images(self):
+        """Test resolving the image of an explicit target software."""
+        response = self.client.post(
+            self.url,
+            {"devices": [str(device.pk) for device in self.devices], "software": str(self.software_2.pk)},
+            format="json",
+            **self.header,
+        )
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(len(response.data["devices"]), 3)
+        for result in response.data["devices"]:
+            self.assertEqual(str(result["software_image"]["id"]), str(self.image_2.pk))
+
+    def test_resolve_restricted_software_images(self):
+        """Test the images and target software the user cannot view are not used."""
+        ObjectPermission.objects.filter(name="nautobot_device_lifecycle_mgmt.view_softwareimagelcm").update(
+            constraints={"image_file_name": "ios2.bin"}
+        )
+        response = self.client.post(self.url, {"devices": [str(self.devices[0].pk)]}, format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertIsNone(response.data["devices"][0]["software_image"])
+
+        ObjectPermission.objects.filter(name="nautobot_device_lifecycle_mgmt.view_softwarelcm").update(
+            constraints={"version": self.software.version}
+        )
+        response = self.client.post(
+            self.url,
+            {"devices": [str(self.devices[0].pk)], "software": str(self.software_2.pk)},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, 400)
+
+
+class ConditionalRequestAPITest(APITestCase):
+    """Test the API list and detail endpoints answer conditional requests."""
+
+    @classmethod
+    def setUpTestData(cls):
+        softwares = create_softwares()
+        cls.validated_software = ValidatedSoftwareLCM.objects.create(
+            software=softwares[0], start=datetime.date(2020, 1, 1)
+        )
+        cls.device = create_devices()[0]
+
+    def setUp(self):
+        super().setUp()
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_validatedsoftwarelcm")
+        self.list_url = reverse(get_route_for_model(ValidatedSoftwareLCM, "list", api=True))
+        self.detail_url = reverse(
+            get_route_for_model(ValidatedSoftwareLCM, "detail", api=True), kwargs={"pk": self.validated_software.pk}
+        )
+
+    def _get_etag(self, url):
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertIn("Last-Modified", response)
+        return response["ETag"]
+
+    def test_not_modified(self):
+        """Test a request with the current ETag is answered with a 304 and no body."""
+        for url in (self.list_url, self.detail_url):
+            etag = self._get_etag(url)
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **self.header)
+            self.assertHttpStatus(response, 304)
+            self.assertEqual(response.content, b"")
+
+    def test_etag_varies_with_query(self):
+        """Test the ETag depends on the request path and query."""
+        self.assertNotEqual(self._get_etag(self.list_url), self._get_etag(f"{self.list_url}?limit=1"))
+
+    def test_modified_on_write(self):
+        """Test writes to the model, its many-to-many relations or its related models change the ETag."""
+        etag = self._get_etag(self.list_url)
+        self.validated_software.save()
+        self.assertHttpStatus(self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag, **self.header), 200)
+
+        etag = self._get_etag(self.list_url)
+        self.validated_software.devices.add(self.device)
+        self.assertHttpStatus(self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag, **self.header), 200)
+
+        etag = self._get_etag(self.list_url)
+        self.validated_software.software.save()
+        self.assertHttpStatus(self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag, **self.header), 200)
+
+    def test_modified_on_permission_change(self):
+        """Test a change of the user permissions changes the ETag."""
+        etag = self._get_etag(self.list_url)
+        self.add_permissions("dcim.view_device")
+        self.assertHttpStatus(self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag, **self.header), 200)
+
+    def test_modified_on_next_day(self):
+        """Test the ETag and Last-Modified change at midnight, as the validity depends on the current date."""
+        with time_machine.travel("2022-03-31 12:00"):
+            # Initialize the data versions on that day, for their write timestamps not to follow it.
+            cache.clear()
+            response = self.client.get(self.list_url, **self.header)
+        with time_machine.travel("2022-04-01 12:00"):
+            for headers in (
+                {"HTTP_IF_NONE_MATCH": response["ETag"]},
+                {"HTTP_IF_MODIFIED_SINCE": response["Last-Modified"]},
+            ):
+                self.assertHttpStatus(self.client.get(self.list_url, **headers, **self.header), 200)
+            self.assertHttpStatus(
+                self.client.get(self.list_url, HTTP_IF_NONE_MATCH=self._get_etag(self.list_url), **self.header), 304
+            )
+
+
+class ContractRenewalForecastAPITest(APITestCase):
+    """Test the contract renewal forecast API."""
+
+    url = reverse("plugins-api:nautobot_device_lifecycle_mgmt-api:contract-renewal-forecast")
+
+    @classmethod
+    def setUpTestData(cls):
+        provider = ProviderLCM.objects.create(name="Cisco")
+        end = datetime.date.today() + datetime.timedelta(days=400)
+        ContractLCM.objects.create(provider=provider, name="Contract 1", end=end, cost=100, currency="USD")
+        ContractLCM.objects.create(provider=provider, name="Contract 2", end=end, cost=50, currency="USD")
+
+    def test_forecast(self):
+        """Test the contracts are summed per period and vendor."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_contractlcm")
+        response = self.client.get(f"{self.url}?period=month&years=2", **self.header)
+
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["group_by"], "provider")
+        self.assertEqual(len(response.data["periods"]), 24)
+        self.assertEqual(len(response.data["results"]), 1)
+        result = response.data["results"][0]
+        self.assertEqual((result["provider"], result["currency"], result["contract_count"]), ("Cisco", "USD", 2))
+        self.assertEqual(result["total_cost"], 150)
+
+    def test_invalid_request(self):
+        """Test the request is rejected without permission or with invalid parameters."""
+        self.assertHttpStatus(self.client.get(self.url, **self.header), 403)
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_contractlcm")
+        self.assertHttpStatus(self.client.get(f"{self.url}?years=0", **self.header), 400)
+        self.assertHttpStatus(self.client.get(f"{self.url}?group_by=tenant", **self.header), 400)
@@ -0,0 +1,153 @@
+"""nautobot_device_lifecycle_mgmt test class for the computation of the contract coverage."""
+from datetime import date, datetime
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from nautobot.dcim.models import InventoryItem
+from nautobot.extras.models import Relationship, RelationshipAssociation
+
+from nautobot_device_lifecycle_mgmt.contract_coverage import (
+    get_contract_coverage,
+    update_device_contract_coverage,
+    update_inventory_item_contract_coverage,
+)
+from nautobot_device_lifecycle_mgmt.models import (
+    ContractLCM,
+    DeviceContractCoverage,
+    InventoryItemContractCoverage,
+    ProviderLCM,
+)
+from nautobot_device_lifecycle_mgmt.tests.conftest import create_devices
+
+
+TODAY = date(2024, 1, 1)
+
+
+def contract_dict(name, start, end, support_level=None):
+    """Return the dict of a contract, as given to `get_contract_coverage()`."""
+    return {"pk": name, "start": start, "end": end, "provider_id": None, "support_level": support_level}
+
+
+class GetContractCoverageTestCase(TestCase):
+    """Tests for the coverage computed from the contracts of an object."""
+
+    def test_no_contract(self):
+        """An object without contracts is uncovered from today on."""
+        coverage = get_contract_coverage([], TODAY)
+        self.assertFalse(coverage["is_covered"])
+        self.assertIsNone(coverage["contract"])
+        self.assertEqual(coverage["gap_start"], TODAY)
+        self.assertIsNone(coverage["gap_end"])
+        self.assertEqual(coverage["contract_count"], 0)
+
+    def test_active_contract(self):
+        """The active contract is the covering contract ending last, and its end day is not covered."""
+        contracts = [
+            contract_dict("expired", date(2022, 1, 1), TODAY),
+            contract_dict("short", date(2023, 1, 1), date(2024, 6, 1)),
+            contract_dict("long", None, date(2025, 1, 1), support_level="24x7"),
+            contract_dict("future", date(2024, 3, 1), date(2026, 1, 1)),
+        ]
+        coverage = get_contract_coverage(contracts, TODAY)
+        self.assertTrue(coverage["is_covered"])
+        self.assertEqual(coverage["contract"], "long")
+        self.assertEqual(coverage["support_level"], "24x7")
+        self.assertEqual(coverage["end"], date(2025, 1, 1))
+        # The future contract starts before the long one ends, and extends the coverage.
+        self.assertEqual(coverage["gap_start"], date(2026, 1, 1))
+        self.assertIsNone(coverage["gap_end"])
+        self.assertEqual(coverage["contract_count"], 4)
+
+    def test_gap(self):
+        """The gap runs from the end of the coverage to the day before the next contract starts."""
+        contracts = [
+            contract_dict("current", date(2023, 1, 1), date(2024, 6, 1)),
+            contract_dict("renewal", date(2024, 7, 1), date(2025, 7, 1)),
+        ]
+        coverage = get_contract_coverage(contracts, TODAY)
+        self.assertEqual(coverage["gap_start"], date(2024, 6, 1))
+        self.assertEqual(coverage["gap_end"], date(2024, 6, 30))
+
+        coverage = get_contract_coverage(contracts[1:], TODAY)
+        self.assertFalse(coverage["is_covered"])
+        self.assertEqual(coverage["gap_start"], TODAY)
+        self.assertEqual(coverage["gap_end"], date(2024, 6, 30))
+
+    def test_open_ended_contract(self):
+        """A contract without end date covers the object for good."""
+        contracts = [
+            contract_dict("dated", date(2023, 1, 1), date(2030, 1, 1)),
+            contract_dict("open", date(2023, 6, 1), None),
+        ]
+        coverage = get_contract_coverage(contracts, TODAY)
+        self.assertEqual(coverage["contract"], "open")
+        self.assertIsNone(coverage["end"])
+        self.assertIsNone(coverage["gap_start"])
+
+
+class UpdateContractCoverageTestCase(TestCase):
+    """Tests for the bulk refresh of the contract coverage results."""
+
+    def setUp(self):
+        self.device_1, self.device_2, self.device_3 = create_devices()
+        self.item = InventoryItem.objects.create(device=self.device_1, name="PSU1", part_id="PWR-C1-350WAC")
+        self.provider = ProviderLCM.objects.create(name="Cisco")
+        self.contract_1 = ContractLCM.objects.create(
+            provider=self.provider, name="Contract 1", start=date(2023, 1, 1), end=date(2024, 6, 1), support_level="8x5"
+        )
+        self.contract_2 = ContractLCM.objects.create(
+            provider=self.provider, name="Contract 2", start=date(2024, 7, 1), end=date(2025, 7, 1)
+        )
+        device_relationship = Relationship.objects.get(slug="contractlcm-to-device")
+        for contract, device in (
+            (self.contract_1, self.device_1),
+            (self.contract_2, self.device_1),
+            (self.contract_2, self.device_2),
+        ):
+            RelationshipAssociation.objects.create(
+                relationship=device_relationship, source=contract, destination=device
+            )
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug="contractlcm-to-inventoryitem"),
+            source=self.contract_1,
+            destination=self.item,
+        )
+
+    def test_device_contract_coverage(self):
+        """Every device gets a coverage result, computed with a fixed number of queries."""
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(update_device_contract_coverage(datetime(2024, 1, 1)), (3, 0, 0))
+        query_count = len(queries)
+
+        coverage = DeviceContractCoverage.objects.get(device=self.device_1)
+        self.assertTrue(coverage.is_covered)
+        self.assertEqual(coverage.contract, self.contract_1)
+        self.assertEqual(coverage.provider, self.provider)
+        self.assertEqual(coverage.support_level, "8x5")
+        self.assertEqual(coverage.end, date(2024, 6, 1))
+        self.assertEqual((coverage.gap_start, coverage.gap_end), (date(2024, 6, 1), date(2024, 6, 30)))
+        self.assertEqual(coverage.contract_count, 2)
+        self.assertEqual(
+            set(DeviceContractCoverage.objects.filter(is_covered=False).values_list("device", flat=True)),
+            {self.device_2.pk, self.device_3.pk},
+        )
+
+        self.device_3.delete()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(update_device_contract_coverage(datetime(2024, 8, 1)), (0, 2, 0))
+        self.assertLessEqual(len(queries), query_count)
+        coverage = DeviceContractCoverage.objects.get(device=self.device_2)
+        self.assertTrue(coverage.is_covered)
+        self.assertEqual(coverage.contract, self.contract_2)
+        self.assertEqual(coverage.gap_start, date(2025, 7, 1))
+
+    def test_inventory_item_contract_coverage(self):
+        """Inventory items get the coverage of the contract related to them."""
+        self.assertEqual(update_inventory_item_contract_coverage(datetime(2024, 1, 1)), (1, 0, 0))
+        coverage = InventoryItemContractCoverage.objects.get()
+        self.assertEqual(coverage.inventory_item, self.item)
+        self.assertEqual(coverage.contract, self.contract_1)
+        self.assertEqual(coverage.gap_start, date(2024, 6, 1))
+        self.assertIsNone(coverage.gap_end)
@@ -0,0 +1,152 @@
+"""nautobot_device_lifecycle_mgmt test class for the contract renewal forecast."""
+from datetime import date
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from nautobot.dcim.models import Device, Site
+from nautobot.extras.models import Relationship, RelationshipAssociation
+from nautobot.utilities.testing import TestCase
+
+from nautobot_device_lifecycle_mgmt.choices import ContractForecastGroupChoices, ContractForecastPeriodChoices
+from nautobot_device_lifecycle_mgmt.contract_forecast import ContractRenewalForecast, add_months
+from nautobot_device_lifecycle_mgmt.models import ContractLCM, ProviderLCM
+from nautobot_device_lifecycle_mgmt.tests.conftest import create_devices
+
+
+TODAY = date(2024, 2, 15)
+
+
+class ContractRenewalForecastTestCase(TestCase):  # pylint: disable=too-many-instance-attributes
+    """Tests for ContractRenewalForecast and ContractRenewalForecastView."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.device_1, self.device_2, self.device_3 = create_devices()
+        self.device_3.site = Site.objects.create(name="Test 2", slug="test-2")
+        self.device_3.save()
+        cisco = ProviderLCM.objects.create(name="Cisco")
+        arista = ProviderLCM.objects.create(name="Arista")
+        self.contract_1 = ContractLCM.objects.create(
+            provider=cisco, name="Contract 1", end=date(2024, 1, 10), cost=100, currency="USD", contract_type="Hardware"
+        )
+        self.contract_2 = ContractLCM.objects.create(
+            provider=cisco, name="Contract 2", end=date(2024, 3, 31), cost=200, currency="USD", contract_type="Hardware"
+        )
+        self.contract_3 = ContractLCM.objects.create(
+            provider=cisco, name="Contract 3", end=date(2024, 2, 1), cost=50, currency="EUR", contract_type="Software"
+        )
+        self.contract_4 = ContractLCM.objects.create(
+            provider=arista, name="Contract 4", end=date(2024, 5, 1), cost=None, currency="USD"
+        )
+        # Outside of the forecast, ending before the current quarter or after its last quarter.
+        ContractLCM.objects.create(provider=cisco, name="Contract 5", end=date(2023, 12, 31), cost=10, currency="USD")
+        ContractLCM.objects.create(provider=cisco, name="Contract 6", end=date(2025, 1, 1), cost=10, currency="USD")
+
+        device_relationship = Relationship.objects.get(slug="contractlcm-to-device")
+        for contract, device in (
+            (self.contract_1, self.device_1),
+            (self.contract_1, self.device_2),
+            (self.contract_1, self.device_3),
+            (self.contract_2, self.device_1),
+        ):
+            RelationshipAssociation.objects.create(
+                relationship=device_relationship, source=contract, destination=device
+            )
+
+    def test_add_months(self):
+        """Months are added across years, on the first day of the month."""
+        self.assertEqual(add_months(date(2024, 11, 20), 3), date(2025, 2, 1))
+        self.assertEqual(add_months(date(2024, 1, 31), -1), date(2023, 12, 1))
+
+    def test_quarter_provider_forecast(self):
+        """Contracts are counted and their costs summed per quarter, vendor and currency."""
+        forecast = ContractRenewalForecast(ContractLCM.objects.all(), today=TODAY)
+        self.assertEqual((forecast.start, forecast.end), (date(2024, 1, 1), date(2025, 1, 1)))
+        self.assertEqual(
+            forecast.get_periods(), [date(2024, 1, 1), date(2024, 4, 1), date(2024, 7, 1), date(2024, 10, 1)]
+        )
+        self.assertEqual(forecast.get_period_label(date(2024, 4, 1)), "2024-Q2")
+        self.assertEqual(
+            [tuple(row.values()) for row in forecast.get_rows()],
+            [
+                (date(2024, 1, 1), "Cisco", "EUR", 1, Decimal("50")),
+                (date(2024, 1, 1), "Cisco", "USD", 2, Decimal("300")),
+                (date(2024, 4, 1), "Arista", "USD", 1, None),
+            ],
+        )
+
+    def test_month_contract_type_forecast(self):
+        """Months are bucketed up to the same month of the next year, and the currency breakdown has no other group."""
+        forecast = ContractRenewalForecast(
+            ContractLCM.objects.all(),
+            period=ContractForecastPeriodChoices.MONTH,
+            group_by=ContractForecastGroupChoices.CONTRACT_TYPE,
+            today=TODAY,
+        )
+        self.assertEqual(forecast.start, date(2024, 2, 1))
+        self.assertEqual(forecast.get_period_label(forecast.start), "2024-02")
+        self.assertEqual(
+            [(row["period"], row["contract_type"], row["total_cost"]) for row in forecast.get_rows()],
+            [
+                (date(2024, 2, 1), "Software", Decimal("50")),
+                (date(2024, 3, 1), "Hardware", Decimal("200")),
+                (date(2024, 5, 1), None, None),
+                (date(2025, 1, 1), None, Decimal("10")),
+            ],
+        )
+
+        forecast.group_by = ContractForecastGroupChoices.CURRENCY
+        self.assertEqual(forecast.columns, ("period", "currency", "contract_count", "total_cost"))
+        self.assertEqual(len(forecast.get_rows()), 4)
+
+    def test_site_forecast(self):
+        """A contract is counted once in each site of the devices it covers."""
+        forecast = ContractRenewalForecast(
+            ContractLCM.objects.all(), group_by=ContractForecastGroupChoices.SITE, today=TODAY
+        )
+        self.assertEqual(
+            [(row["site"], row["currency"], row["contract_count"], row["total_cost"]) for row in forecast.get_rows()],
+            [("Test 1", "USD", 2, Decimal("300")), ("Test 2", "USD", 1, Decimal("100"))],
+        )
+
+        forecast = ContractRenewalForecast(
+            ContractLCM.objects.all(),
+            group_by=ContractForecastGroupChoices.SITE,
+            devices_qs=Device.objects.exclude(pk=self.device_3.pk),
+            today=TODAY,
+        )
+        self.assertEqual([row["site"] for row in forecast.get_rows()], ["Test 1"])
+
+    def test_cached_forecast(self):
+        """The rows are served from the cache until a contract changes."""
+        forecast = ContractRenewalForecast(ContractLCM.objects.all(), today=TODAY)
+        rows = forecast.get_rows()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(forecast.get_rows(), rows)
+        self.assertEqual(len(queries), 0)
+
+        self.contract_4.cost = 75
+        self.contract_4.save()
+        self.assertEqual(forecast.get_rows()[-1]["total_cost"], Decimal("75"))
+
+    def test_view(self):
+        """The view renders the forecast and exports it as CSV."""
+        url = reverse("plugins:nautobot_device_lifecycle_mgmt:contract_renewal_forecast")
+        self.assertHttpStatus(self.client.get(url), 403)
+
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_contractlcm")
+        response = self.client.get(url, {"period": "month", "years": 2, "group_by": "currency"})
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.context["forecast"].years, 2)
+        self.assertEqual(response.context["group_label"], "Currency")
+
+        response = self.client.get(url, {"export": "csv"})
+        self.assertEqual(response["Content-Type"], "text/csv")
+        lines = response.content.decode().splitlines()
+        self.assertEqual(lines[0], "period,provider,currency,contract_count,total_cost")
+        self.assertEqual(len(lines), len(ContractRenewalForecast(ContractLCM.objects.all()).get_rows()) + 1)
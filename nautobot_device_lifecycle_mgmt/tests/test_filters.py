@@ -1,12 +1,14 @@
 """Test filters for lifecycle management."""
 from datetime import date
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.contenttypes.models import ContentType
 import time_machine
 
 from nautobot.dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Site, Platform
-from nautobot.extras.models import Status
+from nautobot.extras.models import Relationship, RelationshipAssociation, Status
 
 from nautobot_device_lifecycle_mgmt.choices import CVESeverityChoices
 from nautobot_device_lifecycle_mgmt.models import (
@@ -15,6 +17,10 @@ from nautobot_device_lifecycle_mgmt.models import (
     ValidatedSoftwareLCM,
     DeviceSoftwareValidationResult,
     InventoryItemSoftwareValidationResult,
+    DeviceHardwareEoXResult,
+    DeviceContractCoverage,
+    ContractLCM,
+    ProviderLCM,
     CVELCM,
     VulnerabilityLCM,
     SoftwareImageLCM,
@@ -25,6 +31,8 @@ from nautobot_device_lifecycle_mgmt.filters import (
     ValidatedSoftwareLCMFilterSet,
     DeviceSoftwareValidationResultFilterSet,
     InventoryItemSoftwareValidationResultFilterSet,
+    DeviceHardwareEoXResultFilterSet,
+    DeviceContractCoverageFilterSet,
     CVELCMFilterSet,
     VulnerabilityLCMFilterSet,
     SoftwareImageLCMFilterSet,
@@ -94,6 +102,14 @@ class HardwareLCMTestCase(TestCase):
         params = {"q": "04-01"}
         self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
 
+    def test_q_date_forms(self):
+        """Test q filter with full dates and months, and with values that are not dates."""
+        self.assertEqual(self.filterset({"q": "2024-04-01"}, self.queryset).qs.count(), 1)
+        self.assertEqual(self.filterset({"q": "2023-4"}, self.queryset).qs.count(), 1)
+        self.assertEqual(self.filterset({"q": "2025-05"}, self.queryset).qs.count(), 1)
+        self.assertEqual(self.filterset({"q": "2023-02-30"}, self.queryset).qs.count(), 0)
+        self.assertEqual(self.filterset({"q": "c9300"}, self.queryset).qs.count(), 0)
+
     def test_eo_sale(self):
         """Test end_of_sale filter."""
         params = {"end_of_sale": "2022-04-01"}
@@ -200,6 +216,11 @@ class SoftwareLCMFilterSetTestCase(TestCase):
         params = {"q": "4.25M"}
         self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
 
+    def test_q_release_date_day(self):
+        """Test q filter to find single record based on a full release date."""
+        params = {"q": "2019-01-10"}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
+
     def test_documentation_url(self):
         """Test documentation_url filter."""
         params = {"documentation_url": "https://www.arista.com/softdocs"}
@@ -215,6 +236,15 @@ class SoftwareLCMFilterSetTestCase(TestCase):
         params = {"pre_release": True}
         self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
 
+    def test_version_range(self):
+        """Test version range filters compare versions in their natural order."""
+        params = {"version__gte": "4.26"}
+        self.assertEqual(list(self.filterset(params, self.queryset).qs), [self.softwares[0]])
+        params = {"version__lt": "10.1"}
+        self.assertEqual(list(self.filterset(params, self.queryset).qs), [self.softwares[1]])
+        params = {"version__gt": "4.25M", "version__lte": "17.3.3 MD"}
+        self.assertEqual(list(self.filterset(params, self.queryset).qs), [self.softwares[0]])
+
 
 class ValidatedSoftwareLCMFilterSetTestCase(TestCase):
     """Tests for ValidatedSoftwareLCMFilterSet."""
@@ -243,6 +273,16 @@ class ValidatedSoftwareLCMFilterSetTestCase(TestCase):
 
         manufacturer = Manufacturer.objects.create(name="Cisco", slug="cisco")
         device_type = DeviceType.objects.create(manufacturer=manufacturer, model="ASR-1000", slug="asr-1000")
+        other_device_type = DeviceType.objects.create(manufacturer=manufacturer, model="ASR-9000", slug="asr-9000")
+        device_role = DeviceRole.objects.create(name="Router", slug="router")
+        site = Site.objects.create(name="Site 1", slug="site-1")
+        self.devices = [
+            Device.objects.create(name=f"rtr{index}", device_type=device_type, device_role=device_role, site=site)
+            for index in range(5)
+        ]
+        self.other_device = Device.objects.create(
+            name="rtr-other", device_type=other_device_type, device_role=device_role, site=site
+        )
 
         validated_software = ValidatedSoftwareLCM(
             software=self.softwares[0],
@@ -282,6 +322,34 @@ class ValidatedSoftwareLCMFilterSetTestCase(TestCase):
         params = {"preferred": True}
         self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
 
+    def test_device_id(self):
+        """Test device_id filter with several devices, ordered by weight."""
+        params = {"device_id": [self.devices[0].pk, self.other_device.pk]}
+        self.assertEqual(
+            [vs.software for vs in self.filterset(params, self.queryset).qs],
+            [self.softwares[0], self.softwares[1]],
+        )
+        params = {"device_id": [self.other_device.pk]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 0)
+
+    def test_device_name(self):
+        """Test device_name filter, combined with the other filters."""
+        params = {"device_name": ["rtr1", "rtr2"], "preferred": False}
+        self.assertEqual(
+            list(self.filterset(params, self.queryset).qs.values_list("software", flat=True)), [self.softwares[1].pk]
+        )
+        params = {"device_name": ["rtr-missing"]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 0)
+
+    def test_device_id_queries(self):
+        """Test that the device_id filter costs the same number of queries whatever the number of devices."""
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(len(self.filterset({"device_id": [self.devices[0].pk]}, self.queryset).qs), 2)
+        with CaptureQueriesContext(connection) as more_queries:
+            devices = {"device_id": [device.pk for device in self.devices]}
+            self.assertEqual(len(self.filterset(devices, self.queryset).qs), 2)
+        self.assertEqual(len(more_queries), len(queries))
+
     def test_valid(self):
         """Test valid filter."""
         date_valid_and_invalid = date(2019, 6, 11)
@@ -487,6 +555,98 @@ class InventoryItemSoftwareValidationResultFilterSetTestCase(TestCase):
         self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
 
 
+class DeviceHardwareEoXResultFilterSetTestCase(TestCase):
+    """Tests for the DeviceHardwareEoXResult model."""
+
+    queryset = DeviceHardwareEoXResult.objects.all()
+    filterset = DeviceHardwareEoXResultFilterSet
+
+    def setUp(self):
+        """Set up test objects."""
+        self.device_1, self.device_2, self.device_3 = create_devices()
+        self.other_site = Site.objects.create(name="Test 2", slug="test-2")
+        self.device_3.site = self.other_site
+        self.device_3.save()
+
+        DeviceHardwareEoXResult.objects.create(device=self.device_1, end_of_support=date(2023, 3, 1))
+        DeviceHardwareEoXResult.objects.create(device=self.device_2, end_of_support=date(2024, 1, 1))
+        DeviceHardwareEoXResult.objects.create(device=self.device_3, end_of_support=date(2023, 2, 1))
+
+    def test_end_of_support_range(self):
+        """Test end_of_support__gte and end_of_support__lte filters."""
+        params = {"end_of_support__gte": "2023-01-01", "end_of_support__lte": "2023-12-31"}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
+
+    @time_machine.travel("2023-01-01")
+    def test_end_of_support_within(self):
+        """Test end_of_support_within filter."""
+        params = {"end_of_support_within": 180, "site": ["test-1"]}
+        self.assertEqual(list(self.filterset(params, self.queryset).qs), [self.queryset.get(device=self.device_1)])
+
+    def test_site(self):
+        """Test site filter."""
+        params = {"site_id": [self.other_site.pk]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.get().device, self.device_3)
+
+    def test_q_search(self):
+        """Test q filter to find single record based on device name."""
+        params = {"q": "sw2"}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
+
+
+class DeviceContractCoverageFilterSetTestCase(TestCase):
+    """Tests for the DeviceContractCoverage model."""
+
+    queryset = DeviceContractCoverage.objects.all()
+    filterset = DeviceContractCoverageFilterSet
+
+    def setUp(self):
+        """Set up test objects."""
+        self.device_1, self.device_2, self.device_3 = create_devices()
+        self.provider = ProviderLCM.objects.create(name="Cisco")
+        self.contract = ContractLCM.objects.create(provider=self.provider, name="Contract 1", support_level="24x7")
+
+        DeviceContractCoverage.objects.create(
+            device=self.device_1,
+            is_covered=True,
+            contract=self.contract,
+            provider=self.provider,
+            support_level="24x7",
+            end=date(2023, 3, 1),
+            gap_start=date(2023, 3, 1),
+        )
+        DeviceContractCoverage.objects.create(
+            device=self.device_2, is_covered=True, end=date(2024, 1, 1), gap_start=date(2024, 1, 1)
+        )
+        DeviceContractCoverage.objects.create(device=self.device_3, gap_start=date(2023, 1, 1))
+
+    def test_is_covered(self):
+        """Test is_covered filter."""
+        params = {"is_covered": False}
+        self.assertEqual(self.filterset(params, self.queryset).qs.get().device, self.device_3)
+
+    @time_machine.travel("2023-01-01")
+    def test_coverage_ends_within(self):
+        """Test coverage_ends_within filter, which skips the uncovered devices."""
+        params = {"coverage_ends_within": 180}
+        self.assertEqual(self.filterset(params, self.queryset).qs.get().device, self.device_1)
+
+    def test_end_range(self):
+        """Test end__gte and end__lte filters."""
+        params = {"end__gte": "2023-06-01", "end__lte": "2024-06-01"}
+        self.assertEqual(self.filterset(params, self.queryset).qs.get().device, self.device_2)
+
+    def test_contract_provider_support_level(self):
+        """Test contract, provider and support_level filters."""
+        for params in ({"contract": [self.contract.pk]}, {"provider": [self.provider.pk]}, {"support_level": ["24x7"]}):
+            self.assertEqual(self.filterset(params, self.queryset).qs.get().device, self.device_1)
+
+    def test_q_search(self):
+        """Test q filter to find records based on device or contract name."""
+        self.assertEqual(self.filterset({"q": "sw2"}, self.queryset).qs.get().device, self.device_2)
+        self.assertEqual(self.filterset({"q": "Contract 1"}, self.queryset).qs.get().device, self.device_1)
+
+
 class CVELCMTestCase(TestCase):
     """Tests for CVELCMFilter."""
 
@@ -754,6 +914,32 @@ class SoftwareImageLCMFilterSetTestCase(TestCase):
         soft_image.device_types.set([self.devicetype_2.pk])
         soft_image.save()
 
+        device_role = DeviceRole.objects.create(name="Router", slug="router")
+        site = Site.objects.create(name="Site 1", slug="site-1")
+        self.devices = (
+            Device.objects.create(name="rtr1", device_type=devicetype_1, device_role=device_role, site=site),
+            Device.objects.create(name="rtr2", device_type=self.devicetype_2, device_role=device_role, site=site),
+        )
+        device_soft = Relationship.objects.get(slug="device_soft")
+        for software, device in zip(self.softwares, self.devices):
+            RelationshipAssociation.objects.create(relationship=device_soft, source=software, destination=device)
+
+    def test_device_id(self):
+        """Test device_id filter with several devices."""
+        params = {"device_id": [device.pk for device in self.devices]}
+        self.assertEqual(
+            sorted(self.filterset(params, self.queryset).qs.values_list("image_file_name", flat=True)),
+            ["eos4.25.m.swi", "ios17.3.3md-ssl.img"],
+        )
+
+    def test_device_name(self):
+        """Test device_name filter, combined with the other filters."""
+        params = {"device_name": ["rtr1", "rtr2"], "software": [self.softwares[0].pk]}
+        self.assertEqual(
+            list(self.filterset(params, self.queryset).qs.values_list("image_file_name", flat=True)),
+            ["ios17.3.3md-ssl.img"],
+        )
+
     def test_q_image_name(self):
         """Test q filter to find single record based on the image name."""
         params = {"q": "ios17.3.3"}
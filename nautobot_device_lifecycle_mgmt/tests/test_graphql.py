@@ -0,0 +1,227 @@
+"""Unit tests for the nautobot_device_lifecycle_mgmt GraphQL types."""
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from nautobot.core.graphql import execute_query
+from nautobot.dcim.models import Device
+from nautobot.extras.models import Relationship, RelationshipAssociation, Status
+
+from nautobot_device_lifecycle_mgmt.choices import CVESeverityChoices, ReportRunTypeChoices
+from nautobot_device_lifecycle_mgmt.models import (
+    CVELCM,
+    ContractLCM,
+    DeviceSoftwareValidationResult,
+    HardwareLCM,
+    ProviderLCM,
+    ValidatedSoftwareLCM,
+    VulnerabilityLCM,
+)
+from nautobot_device_lifecycle_mgmt.tests.conftest import create_cves, create_devices, create_softwares
+
+User = get_user_model()
+
+SOFTWARE_QUERY = """
+{
+    softwares {
+        version
+        devices { name }
+        cves { name }
+    }
+    cves {
+        name
+        affected_softwares { version }
+    }
+    contracts {
+        name
+        expired
+        devices { name }
+    }
+    devices {
+        name
+        software { version }
+        validated_softwares { software { version } preferred }
+    }
+    inventory_items {
+        name
+        software { version }
+        validated_softwares { start }
+    }
+}
+"""
+
+
+class GraphQLBatchingTestCase(TestCase):
+    """Test the plugin GraphQL types resolve their relations in batch."""
+
+    def setUp(self):
+        self.user = User.objects.create(username="graphql", is_superuser=True)
+        self.devices = create_devices()
+        self.softwares = create_softwares()
+        self.cves = create_cves()
+        self.provider = ProviderLCM.objects.create(name="Cisco")
+
+    def _associate(self, device, software, cve):
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug="device_soft"), source=software, destination=device
+        )
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug="soft_cve"), source=software, destination=cve
+        )
+        validated_software = ValidatedSoftwareLCM.objects.create(
+            software=software, start=datetime.date(2020, 1, 1), preferred=True
+        )
+        validated_software.devices.set([device])
+        contract = ContractLCM.objects.create(
+            provider=self.provider, name=f"Contract {device.name}", end=datetime.date(2020, 1, 1)
+        )
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug="contractlcm-to-device"), source=contract, destination=device
+        )
+
+    def _execute(self):
+        with CaptureQueriesContext(connection) as queries:
+            result = execute_query(SOFTWARE_QUERY, user=self.user)
+        self.assertIsNone(result.errors)
+        return result.data, len(queries)
+
+    def test_relationship_fields(self):
+        self._associate(self.devices[0], self.softwares[0], self.cves[0])
+        data, _ = self._execute()
+
+        software = next(item for item in data["softwares"] if item["version"] == self.softwares[0].version)
+        self.assertEqual(software["devices"], [{"name": self.devices[0].name}])
+        self.assertEqual(software["cves"], [{"name": self.cves[0].name}])
+        cve = next(item for item in data["cves"] if item["name"] == self.cves[0].name)
+        self.assertEqual(cve["affected_softwares"], [{"version": self.softwares[0].version}])
+        self.assertEqual(data["contracts"], [{"name": "Contract sw1", "expired": True, "devices": [{"name": "sw1"}]}])
+
+        device = next(item for item in data["devices"] if item["name"] == self.devices[0].name)
+        self.assertEqual(device["software"], {"version": self.softwares[0].version})
+        self.assertEqual(
+            device["validated_softwares"], [{"software": {"version": self.softwares[0].version}, "preferred": True}]
+        )
+        device = next(item for item in data["devices"] if item["name"] == self.devices[1].name)
+        self.assertIsNone(device["software"])
+        self.assertEqual(device["validated_softwares"], [])
+
+    def test_query_count_independent_of_object_count(self):
+        self._associate(self.devices[0], self.softwares[0], self.cves[0])
+        self._execute()  # Build the schema and warm up the caches before counting.
+        _, single_count = self._execute()
+
+        for device, software, cve in zip(self.devices[1:], self.softwares[1:], self.cves[1:]):
+            self._associate(device, software, cve)
+        data, full_count = self._execute()
+
+        self.assertEqual(len(data["contracts"]), Device.objects.count())
+        self.assertEqual(single_count, full_count)
+
+
+LIFECYCLE_QUERY = """
+{
+    devices {
+        name
+        lifecycle {
+            software { version }
+            software_is_validated
+            end_of_sale
+            end_of_support
+            open_vulnerabilities { critical high low none total }
+            active_contract_end
+        }
+    }
+}
+"""
+
+
+class LifecycleSummaryTestCase(TestCase):
+    """Test the lifecycle summary of the core Device GraphQL type."""
+
+    def setUp(self):
+        self.user = User.objects.create(username="graphql", is_superuser=True)
+        self.devices = create_devices()
+        self.softwares = create_softwares()
+        self.cves = create_cves()
+        self.provider = ProviderLCM.objects.create(name="Cisco")
+        HardwareLCM.objects.create(
+            device_type=self.devices[0].device_type,
+            end_of_sale=datetime.date(2021, 1, 1),
+            end_of_support=datetime.date(2026, 1, 1),
+        )
+        self.status_fixed = Status.objects.create(name="Fixed", slug="fixed")
+        self.status_fixed.content_types.set([ContentType.objects.get_for_model(VulnerabilityLCM)])
+        CVELCM.objects.filter(pk=self.cves[0].pk).update(severity=CVESeverityChoices.CRITICAL)
+        CVELCM.objects.filter(pk=self.cves[1].pk).update(severity=CVESeverityChoices.HIGH)
+
+    def _populate(self, device):
+        today = datetime.date.today()
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug="device_soft"), source=self.softwares[0], destination=device
+        )
+        DeviceSoftwareValidationResult.objects.create(
+            device=device, software=self.softwares[0], is_validated=True, run_type=ReportRunTypeChoices.REPORT_FULL_RUN
+        )
+        for cve in self.cves:
+            VulnerabilityLCM.objects.create(cve=cve, software=self.softwares[0], device=device)
+        VulnerabilityLCM.objects.create(cve=self.cves[0], device=device, status=self.status_fixed)
+        for name, start, end in (
+            ("active", today - datetime.timedelta(days=10), today + datetime.timedelta(days=30)),
+            ("longest", None, today + datetime.timedelta(days=60)),
+            ("expired", today - datetime.timedelta(days=100), today - datetime.timedelta(days=1)),
+            ("future", today + datetime.timedelta(days=10), today + datetime.timedelta(days=365)),
+        ):
+            contract = ContractLCM.objects.create(
+                provider=self.provider, name=f"{name} {device.name}", start=start, end=end
+            )
+            RelationshipAssociation.objects.create(
+                relationship=Relationship.objects.get(slug="contractlcm-to-device"), source=contract, destination=device
+            )
+
+    def _execute(self):
+        with CaptureQueriesContext(connection) as queries:
+            result = execute_query(LIFECYCLE_QUERY, user=self.user)
+        self.assertIsNone(result.errors)
+        return {device["name"]: device["lifecycle"] for device in result.data["devices"]}, len(queries)
+
+    def test_lifecycle_summary(self):
+        self._populate(self.devices[0])
+        data, _ = self._execute()
+
+        self.assertEqual(
+            data[self.devices[0].name],
+            {
+                "software": {"version": self.softwares[0].version},
+                "software_is_validated": True,
+                "end_of_sale": "2021-01-01",
+                "end_of_support": "2026-01-01",
+                "open_vulnerabilities": {"critical": 1, "high": 1, "low": 0, "none": 1, "total": 3},
+                "active_contract_end": str(datetime.date.today() + datetime.timedelta(days=60)),
+            },
+        )
+        self.assertEqual(
+            data[self.devices[1].name],
+            {
+                "software": None,
+                "software_is_validated": None,
+                "end_of_sale": "2021-01-01",
+                "end_of_support": "2026-01-01",
+                "open_vulnerabilities": {"critical": 0, "high": 0, "low": 0, "none": 0, "total": 0},
+                "active_contract_end": None,
+            },
+        )
+
+    def test_query_count_independent_of_object_count(self):
+        self._populate(self.devices[0])
+        self._execute()  # Build the schema and warm up the caches before counting.
+        _, single_count = self._execute()
+
+        for device in self.devices[1:]:
+            self._populate(device)
+        _, full_count = self._execute()
+
+        self.assertEqual(single_count, full_count)
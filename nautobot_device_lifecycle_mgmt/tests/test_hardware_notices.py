@@ -0,0 +1,119 @@
+"""nautobot_device_lifecycle_mgmt test class for the mapping of hardware notices to devices."""
+from datetime import date, datetime
+
+from django.test import TestCase
+
+from nautobot.dcim.models import Device, DeviceRole, DeviceType, InventoryItem, Manufacturer, Site
+
+from nautobot_device_lifecycle_mgmt.hardware_notices import (
+    sync_device_hardware_notices,
+    update_device_hardware_eox_results,
+    update_inventory_item_hardware_eox_results,
+)
+from nautobot_device_lifecycle_mgmt.models import (
+    DeviceHardwareEoXResult,
+    DeviceHardwareNotice,
+    HardwareLCM,
+    InventoryItemHardwareEoXResult,
+)
+
+
+class DeviceHardwareNoticeTestCase(TestCase):
+    """Tests for the maintenance of DeviceHardwareNotice."""
+
+    def setUp(self):
+        manufacturer = Manufacturer.objects.create(name="Cisco", slug="cisco")
+        self.device_type_1 = DeviceType.objects.create(manufacturer=manufacturer, model="c9300-24", slug="c9300-24")
+        self.device_type_2 = DeviceType.objects.create(manufacturer=manufacturer, model="c9300-48", slug="c9300-48")
+        device_role = DeviceRole.objects.create(name="Access", slug="access")
+        site = Site.objects.create(name="Test 1", slug="test-1")
+        self.device_1 = Device.objects.create(
+            name="sw1", device_type=self.device_type_1, device_role=device_role, site=site
+        )
+        self.device_2 = Device.objects.create(
+            name="sw2", device_type=self.device_type_2, device_role=device_role, site=site
+        )
+        self.item = InventoryItem.objects.create(device=self.device_2, name="PSU1", part_id="PWR-C1-350WAC")
+
+        self.device_type_notice = HardwareLCM.objects.create(
+            device_type=self.device_type_1, end_of_sale=date(2023, 1, 1)
+        )
+        self.part_notice = HardwareLCM.objects.create(inventory_item="PWR-C1-350WAC", end_of_sale=date(2023, 1, 1))
+
+    def get_mappings(self):
+        """Return the (device, inventory item, hardware notice) pks of every DeviceHardwareNotice mapping."""
+        return set(DeviceHardwareNotice.objects.values_list("device_id", "inventory_item_id", "hardware_notice_id"))
+
+    def test_mapping_on_notice_save(self):
+        """Saved notices are mapped to the devices of their device type and to the items of their part."""
+        self.assertEqual(
+            self.get_mappings(),
+            {
+                (self.device_1.pk, None, self.device_type_notice.pk),
+                (self.device_2.pk, self.item.pk, self.part_notice.pk),
+            },
+        )
+        self.part_notice.delete()
+        self.assertEqual(self.get_mappings(), {(self.device_1.pk, None, self.device_type_notice.pk)})
+
+    def test_mapping_on_device_type_change(self):
+        """Changing the device type of a device moves it to the notices of its new device type."""
+        self.device_1.device_type = self.device_type_2
+        self.device_1.save()
+        self.device_2.device_type = self.device_type_1
+        self.device_2.save()
+        self.assertEqual(
+            self.get_mappings(),
+            {
+                (self.device_2.pk, None, self.device_type_notice.pk),
+                (self.device_2.pk, self.item.pk, self.part_notice.pk),
+            },
+        )
+
+    def test_mapping_on_part_id_change(self):
+        """Changing the part ID or device of an inventory item updates its notice."""
+        self.item.device = self.device_1
+        self.item.save()
+        self.assertIn((self.device_1.pk, self.item.pk, self.part_notice.pk), self.get_mappings())
+        self.item.part_id = "PWR-C1-715WAC"
+        self.item.save()
+        self.assertEqual(self.get_mappings(), {(self.device_1.pk, None, self.device_type_notice.pk)})
+
+    def test_sync(self):
+        """Changes made without signals are caught up by a sync."""
+        InventoryItem.objects.filter(pk=self.item.pk).update(part_id="")
+        Device.objects.filter(pk=self.device_2.pk).update(device_type=self.device_type_1)
+        self.assertEqual(sync_device_hardware_notices(), (1, 1))
+        self.assertEqual(
+            self.get_mappings(),
+            {
+                (self.device_1.pk, None, self.device_type_notice.pk),
+                (self.device_2.pk, None, self.device_type_notice.pk),
+            },
+        )
+        self.assertEqual(sync_device_hardware_notices(), (0, 0))
+
+    def test_hardware_eox_results(self):
+        """Results hold the earliest milestones of the notices of each device and item."""
+        HardwareLCM.objects.filter(pk=self.device_type_notice.pk).update(end_of_support=date(2026, 1, 1))
+        HardwareLCM.objects.filter(pk=self.part_notice.pk).update(end_of_support=date(2025, 6, 1))
+        item = InventoryItem.objects.create(device=self.device_1, name="PSU1", part_id="PWR-C1-350WAC")
+        stale = DeviceHardwareEoXResult.objects.create(device=self.device_2, end_of_sale=date(2020, 1, 1))
+        DeviceHardwareNotice.objects.filter(device=self.device_2).delete()
+
+        self.assertEqual(update_device_hardware_eox_results(datetime(2024, 1, 1)), (1, 0, 1))
+        result = DeviceHardwareEoXResult.objects.get()
+        self.assertEqual(result.device, self.device_1)
+        self.assertEqual(result.end_of_sale, date(2023, 1, 1))
+        self.assertEqual(result.end_of_support, date(2025, 6, 1))
+        self.assertIsNone(result.end_of_security_patches)
+        self.assertFalse(DeviceHardwareEoXResult.objects.filter(pk=stale.pk).exists())
+
+        self.assertEqual(update_inventory_item_hardware_eox_results(datetime(2024, 1, 1)), (1, 0, 0))
+        result = InventoryItemHardwareEoXResult.objects.get()
+        self.assertEqual(result.inventory_item, item)
+        self.assertEqual(result.end_of_support, date(2025, 6, 1))
+
+        HardwareLCM.objects.filter(pk=self.part_notice.pk).update(end_of_support=None)
+        self.assertEqual(update_device_hardware_eox_results(datetime(2024, 1, 2)), (0, 1, 0))
+        self.assertEqual(DeviceHardwareEoXResult.objects.get().end_of_support, date(2026, 1, 1))
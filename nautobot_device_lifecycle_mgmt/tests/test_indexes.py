@@ -0,0 +1,246 @@
+"""nautobot_device_lifecycle_mgmt test class checking that the key queries of the plugin are served by indexes."""
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from django.db import connection
+from django.test import TestCase
+
+from nautobot.dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Platform, Site
+
+from nautobot_device_lifecycle_mgmt import choices
+from nautobot_device_lifecycle_mgmt.filters import (
+    CVELCMFilterSet,
+    ContractLCMFilterSet,
+    HardwareLCMFilterSet,
+    SoftwareLCMFilterSet,
+    ValidatedSoftwareLCMFilterSet,
+    VulnerabilityLCMFilterSet,
+)
+from nautobot_device_lifecycle_mgmt.models import (
+    CVELCM,
+    ContractLCM,
+    DeviceContractCoverage,
+    DeviceSoftwareValidationResult,
+    HardwareLCM,
+    ProviderLCM,
+    SoftwareLCM,
+    ValidatedSoftwareLCM,
+    VulnerabilityLCM,
+)
+
+
+# Number of rows generated in each table.
+DATASET_SIZE = 200
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "EXPLAIN output is checked for PostgreSQL only")
+class QueryIndexesTestCase(TestCase):
+    """Run EXPLAIN on the key queries of the filtersets, reports and jobs, and check that no table is scanned."""
+
+    @classmethod
+    def setUpTestData(cls):
+        manufacturer = Manufacturer.objects.create(name="Cisco", slug="cisco")
+        platform = Platform.objects.create(name="Cisco IOS", slug="cisco_ios", manufacturer=manufacturer)
+        device_role = DeviceRole.objects.create(name="Access", slug="access")
+        site = Site.objects.create(name="Test 1", slug="test-1")
+        device_types = DeviceType.objects.bulk_create(
+            [
+                DeviceType(manufacturer=manufacturer, model=f"model-{index}", slug=f"model-{index}")
+                for index in range(DATASET_SIZE)
+            ]
+        )
+        HardwareLCM.objects.bulk_create(
+            [
+                HardwareLCM(
+                    device_type=device_type,
+                    end_of_sale=date(2020, 1, 1) + timedelta(days=index),
+                    end_of_support=date(2024, 1, 1) + timedelta(days=index) if index % 2 else None,
+                )
+                for index, device_type in enumerate(device_types)
+            ]
+        )
+        softwares = SoftwareLCM.objects.bulk_create(
+            [
+                SoftwareLCM(
+                    device_platform=platform,
+                    version=f"15.{index}",
+                    release_date=date(2019, 1, 1) + timedelta(days=index),
+                    end_of_support=date(2022, 1, 1) + timedelta(days=index),
+                )
+                for index in range(DATASET_SIZE)
+            ]
+        )
+        ValidatedSoftwareLCM.objects.bulk_create(
+            [
+                ValidatedSoftwareLCM(
+                    software=software,
+                    start=date(2020, 1, 1) + timedelta(days=index),
+                    end=date(2023, 1, 1) + timedelta(days=index) if index % 3 else None,
+                    preferred=not index % 10,
+                )
+                for index, software in enumerate(softwares)
+            ]
+        )
+        cves = CVELCM.objects.bulk_create(
+            [
+                CVELCM(
+                    name=f"CVE-2021-{index:05}",
+                    link=f"https://nvd.nist.gov/vuln/detail/CVE-2021-{index:05}",
+                    published_date=date(2021, 1, 1) + timedelta(days=index),
+                    severity=choices.CVESeverityChoices.values()[index % len(choices.CVESeverityChoices.CHOICES)],
+                )
+                for index in range(DATASET_SIZE)
+            ]
+        )
+        devices = [
+            Device.objects.create(
+                name=f"sw{index}", device_type=device_types[0], device_role=device_role, site=site, platform=platform
+            )
+            for index in range(DATASET_SIZE // 4)
+        ]
+        VulnerabilityLCM.objects.bulk_create(
+            [
+                VulnerabilityLCM(
+                    cve=cve, software=softwares[index % len(softwares)], device=devices[index % len(devices)]
+                )
+                for index, cve in enumerate(cves)
+            ]
+        )
+        DeviceSoftwareValidationResult.objects.bulk_create(
+            [
+                DeviceSoftwareValidationResult(
+                    device=device,
+                    software=softwares[index],
+                    is_validated=bool(index % 5),
+                    last_run=datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(hours=index),
+                    run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN,
+                )
+                for index, device in enumerate(devices)
+            ]
+        )
+        provider = ProviderLCM.objects.create(name="Cisco")
+        ContractLCM.objects.bulk_create(
+            [
+                ContractLCM(provider=provider, name=f"Contract {index}", end=date(2022, 1, 1) + timedelta(days=index))
+                for index in range(DATASET_SIZE)
+            ]
+        )
+        DeviceContractCoverage.objects.bulk_create(
+            [
+                DeviceContractCoverage(
+                    device=device,
+                    is_covered=bool(index % 5),
+                    end=date(2024, 1, 1) + timedelta(days=index) if index % 5 else None,
+                    gap_start=date(2024, 1, 1) + timedelta(days=index if index % 5 else 0),
+                    run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN,
+                )
+                for index, device in enumerate(devices)
+            ]
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def get_plan_nodes(self, queryset):
+        """Return the nodes of the plan of `queryset` scanning its table, and the types of all the plan nodes."""
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            # Sequential scans are only chosen when no index can serve the query.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0][0]["Plan"]
+
+        scans, node_types, nodes = [], set(), [plan]
+        while nodes:
+            node = nodes.pop()
+            node_types.add(node["Node Type"])
+            if node.get("Relation Name") == queryset.model._meta.db_table:
+                scans.append(node)
+            nodes.extend(node.get("Plans", []))
+        return scans, node_types
+
+    def assertIndexed(self, queryset, ordered=False):  # pylint: disable=invalid-name
+        """Assert that the table of `queryset` is only read through index lookups.
+
+        With `ordered`, an index may instead be read in full to return the rows without sorting them.
+        """
+        scans, node_types = self.get_plan_nodes(queryset)
+        self.assertTrue(scans)
+        for scan in scans:
+            self.assertNotEqual(scan["Node Type"], "Seq Scan", scan)
+            if scan["Node Type"] in ("Index Scan", "Index Only Scan") and not ordered:
+                self.assertIn("Index Cond", scan, scan)
+        if ordered:
+            self.assertNotIn("Sort", node_types)
+
+    def test_hardware_notice_queries(self):
+        """Expired notices and the notices ending within a period are found with the date indexes."""
+        today = date(2024, 1, 1)
+        self.assertIndexed(HardwareLCM.objects.filter_expired(today=today))
+        self.assertIndexed(HardwareLCM.objects.filter(end_of_support__gte=today, end_of_support__lte=date(2024, 6, 1)))
+        self.assertIndexed(HardwareLCM.objects.filter(inventory_item="WS-X6848-TX-2T"))
+
+    def test_software_queries(self):
+        """Software end of support and validity periods are looked up with indexes."""
+        today = date(2024, 1, 1)
+        self.assertIndexed(SoftwareLCM.objects.filter(end_of_support__lte=today))
+        valid_q = ValidatedSoftwareLCM.objects.filter(start__lte=today, end__isnull=True) | (
+            ValidatedSoftwareLCM.objects.filter(start__lte=today, end__gte=today)
+        )
+        self.assertIndexed(valid_q)
+        self.assertIndexed(ValidatedSoftwareLCM.objects.filter(preferred=True, start__lte=today, end__gte=today))
+        self.assertIndexed(ValidatedSoftwareLCM.objects.filter(software=SoftwareLCM.objects.first(), preferred=True))
+
+    def test_cve_queries(self):
+        """CVEs are found by publication date and listed by severity, and vulnerabilities are matched by CVE."""
+        self.assertIndexed(CVELCM.objects.filter(published_date__gte=date(2021, 6, 1)))
+        self.assertIndexed(CVELCM.objects.order_by("severity", "name")[:50], ordered=True)
+        vulnerability = VulnerabilityLCM.objects.first()
+        self.assertIndexed(
+            VulnerabilityLCM.objects.filter(
+                cve=vulnerability.cve, software=vulnerability.software, device=vulnerability.device
+            )
+        )
+
+    def test_validation_result_queries(self):
+        """The last full run and the invalid devices of the software validation report are found with indexes."""
+        self.assertIndexed(
+            DeviceSoftwareValidationResult.objects.filter(
+                run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN
+            ).order_by("-last_run")[:1],
+            ordered=True,
+        )
+        self.assertIndexed(DeviceSoftwareValidationResult.objects.filter(is_validated=False).order_by())
+
+    def test_contract_queries(self):
+        """Expired contracts are found with the end date index."""
+        self.assertIndexed(ContractLCM.objects.filter_expired(today=date(2022, 6, 1)))
+
+    def test_contract_coverage_queries(self):
+        """Uncovered devices and the devices whose coverage lapses within a period are found with indexes."""
+        self.assertIndexed(DeviceContractCoverage.objects.filter(is_covered=False).order_by())
+        self.assertIndexed(
+            DeviceContractCoverage.objects.filter(gap_start__gt=date(2024, 1, 1), gap_start__lte=date(2024, 1, 10))
+        )
+        self.assertIndexed(DeviceContractCoverage.objects.filter(end__lte=date(2024, 1, 10)).order_by())
+
+    def test_date_search_queries(self):
+        """The `q` searches use the date indexes for date-looking values."""
+        self.assertIndexed(HardwareLCMFilterSet({"q": "2020-03"}, HardwareLCM.objects.all()).qs)
+        self.assertIndexed(
+            ValidatedSoftwareLCMFilterSet({"q": "2020-03"}, ValidatedSoftwareLCM.objects.all()).qs.order_by()
+        )
+
+    def test_text_search_queries(self):
+        """The `q` searches use the trigram indexes for text, along with the date indexes for date-looking values."""
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            if cursor.fetchone() is None:
+                self.skipTest("The pg_trgm extension is not installed")
+
+        self.assertIndexed(SoftwareLCMFilterSet({"q": "15.12"}, SoftwareLCM.objects.all()).qs.order_by())
+        self.assertIndexed(SoftwareLCMFilterSet({"q": "2019-03-01"}, SoftwareLCM.objects.all()).qs.order_by())
+        self.assertIndexed(CVELCMFilterSet({"q": "CVE-2021-0012"}, CVELCM.objects.all()).qs)
+        self.assertIndexed(ContractLCMFilterSet({"q": "Contract 12"}, ContractLCM.objects.all()).qs)
+        self.assertIndexed(
+            CVELCM.objects.filter(pk__in=VulnerabilityLCMFilterSet({"q": "CVE-2021-0012"}).qs.values("cve"))
+        )
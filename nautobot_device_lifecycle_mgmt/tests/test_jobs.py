@@ -0,0 +1,275 @@
+"""Unit tests for the nautobot_device_lifecycle_mgmt jobs."""
+import datetime
+
+from django.contrib.contenttypes.models import ContentType
+
+from nautobot.dcim.models import Device, Platform
+from nautobot.extras.choices import JobResultStatusChoices
+from nautobot.extras.models import Job, JobLogEntry, Relationship, RelationshipAssociation, Status
+from nautobot.utilities.testing import TransactionTestCase, run_job_for_testing
+
+from nautobot_device_lifecycle_mgmt.models import (
+    CVELCM,
+    ContractLCM,
+    DeviceContractCoverage,
+    DeviceHardwareEoXResult,
+    HardwareLCM,
+    InventoryItemHardwareEoXResult,
+    SoftwareLCM,
+    ValidatedSoftwareLCM,
+    VulnerabilityLCM,
+)
+from nautobot_device_lifecycle_mgmt.tests.conftest import (
+    create_cves,
+    create_devices,
+    create_inventory_items,
+    create_softwares,
+)
+
+
+class GenerateVulnerabilitiesTestCase(TransactionTestCase):
+    """Test the GenerateVulnerabilities job."""
+
+    # Restore the Relationships and Jobs created at migration time, as TransactionTestCase truncates the tables.
+    serialized_rollback = True
+
+    def setUp(self):
+        super().setUp()
+        self.inventory_items = create_inventory_items()
+        self.devices = [item.device for item in self.inventory_items]
+        self.softwares = create_softwares()
+        self.cves = create_cves()
+        self.job = Job.objects.get(job_class_name="GenerateVulnerabilities")
+
+    def _associate(self, slug, source, destination):
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug=slug),
+            source_type=ContentType.objects.get_for_model(source),
+            source_id=source.pk,
+            destination_type=ContentType.objects.get_for_model(destination),
+            destination_id=destination.pk,
+        )
+
+    def _run(self, **data):
+        job_result = run_job_for_testing(self.job, data={"debug": False, **data})
+        job_result.refresh_from_db()
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_COMPLETED)
+        return job_result
+
+    def _vulnerabilities(self):
+        return set(
+            VulnerabilityLCM.objects.values_list(
+                "cve__name", "software__version", "device__name", "inventory_item__name"
+            )
+        )
+
+    def test_generate_vulnerabilities(self):
+        self._associate("soft_cve", self.softwares[0], self.cves[0])
+        self._associate("soft_cve", self.softwares[0], self.cves[1])
+        self._associate("soft_cve", self.softwares[1], self.cves[2])
+        self._associate("device_soft", self.softwares[0], self.devices[0])
+        self._associate("device_soft", self.softwares[1], self.devices[1])
+        self._associate("inventory_item_soft", self.softwares[0], self.inventory_items[2])
+        sw0, sw1 = self.softwares[0].version, self.softwares[1].version
+        VulnerabilityLCM.objects.create(cve=self.cves[0], software=self.softwares[0], device=self.devices[0])
+
+        self._run()
+
+        self.assertEqual(
+            self._vulnerabilities(),
+            {
+                (self.cves[0].name, sw0, "sw1", None),
+                (self.cves[1].name, sw0, "sw1", None),
+                (self.cves[0].name, sw0, None, self.inventory_items[2].name),
+                (self.cves[1].name, sw0, None, self.inventory_items[2].name),
+                (self.cves[2].name, sw1, "sw2", None),
+            },
+        )
+
+        # Running the job again does not create duplicates.
+        self._run()
+        self.assertEqual(VulnerabilityLCM.objects.count(), 5)
+
+    def test_generate_vulnerabilities_published_after(self):
+        self._associate("soft_cve", self.softwares[0], self.cves[0])
+        self._associate("soft_cve", self.softwares[0], self.cves[1])
+        self._associate("device_soft", self.softwares[0], self.devices[0])
+
+        self._run(published_after="2021-06-01")
+
+        self.assertEqual(self._vulnerabilities(), {(self.cves[1].name, self.softwares[0].version, "sw1", None)})
+
+    def _setup_stale_vulnerabilities(self):
+        self._associate("soft_cve", self.softwares[0], self.cves[0])
+        self._associate("device_soft", self.softwares[0], self.devices[0])
+        self._associate("inventory_item_soft", self.softwares[0], self.inventory_items[0])
+        # CVE no longer associated to the software.
+        VulnerabilityLCM.objects.create(cve=self.cves[1], software=self.softwares[0], device=self.devices[0])
+        # Device no longer running the software.
+        VulnerabilityLCM.objects.create(cve=self.cves[0], software=self.softwares[0], device=self.devices[1])
+        # Still valid.
+        VulnerabilityLCM.objects.create(cve=self.cves[0], software=self.softwares[0], device=self.devices[0])
+
+    def test_reconcile_vulnerabilities_delete(self):
+        self._setup_stale_vulnerabilities()
+
+        self._run(reconcile=True)
+
+        self.assertEqual(
+            self._vulnerabilities(),
+            {
+                (self.cves[0].name, self.softwares[0].version, "sw1", None),
+                (self.cves[0].name, self.softwares[0].version, None, self.inventory_items[0].name),
+            },
+        )
+
+    def test_reconcile_vulnerabilities_status(self):
+        self._setup_stale_vulnerabilities()
+        status = Status.objects.create(name="Obsolete", slug="obsolete")
+        status.content_types.set([ContentType.objects.get_for_model(VulnerabilityLCM)])
+
+        self._run(reconcile=True, obsolete_status=status.pk)
+
+        self.assertEqual(VulnerabilityLCM.objects.count(), 4)
+        self.assertEqual(
+            set(VulnerabilityLCM.objects.filter(status=status).values_list("cve__name", "device__name")),
+            {(self.cves[1].name, "sw1"), (self.cves[0].name, "sw2")},
+        )
+
+
+class LinkAffectedSoftwareTestCase(TransactionTestCase):
+    """Test the LinkAffectedSoftware job."""
+
+    # Restore the Relationships and Jobs created at migration time, as TransactionTestCase truncates the tables.
+    serialized_rollback = True
+
+    def test_link_affected_software(self):
+        platform = Platform.objects.create(name="Cisco IOS", slug="cisco_ios")
+        other_platform = Platform.objects.create(name="Cisco NX-OS", slug="cisco_nxos")
+        softwares = {
+            version: SoftwareLCM.objects.create(device_platform=platform, version=version)
+            for version in ("15.2(4)M", "15.2(4)M10", "15.2(7)E2", "15.2(7)E3", "15.10(1)")
+        }
+        other_software = SoftwareLCM.objects.create(device_platform=other_platform, version="15.2(5)")
+        cve = CVELCM.objects.create(
+            name="CVE-2021-1391",
+            published_date="2021-03-24",
+            link="https://www.cvedetails.com/cve/CVE-2021-1391/",
+            affected_versions=[
+                {"platform": "cisco_ios", "versions": ">=15.2(4)M, <15.2(7)E3"},
+                {"platform": "cisco_ios", "versions": "15.10(1)"},
+            ],
+        )
+        invalid_cve = CVELCM.objects.create(
+            name="CVE-2021-0002", published_date="2021-03-24", link="https://example.com"
+        )
+        CVELCM.objects.filter(pk=invalid_cve.pk).update(affected_versions=[{"platform": "cisco_ios"}])
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug="soft_cve"), source=softwares["15.2(4)M"], destination=cve
+        )
+
+        job_result = run_job_for_testing(Job.objects.get(job_class_name="LinkAffectedSoftware"), data={})
+        job_result.refresh_from_db()
+
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_COMPLETED)
+        linked = set(
+            RelationshipAssociation.objects.filter(relationship__slug="soft_cve", destination_id=cve.pk).values_list(
+                "source_id", flat=True
+            )
+        )
+        self.assertEqual(
+            linked, {softwares[version].pk for version in ("15.2(4)M", "15.2(4)M10", "15.2(7)E2", "15.10(1)")}
+        )
+        self.assertNotIn(other_software.pk, linked)
+
+
+class FleetUpgradePlanReportTestCase(TransactionTestCase):
+    """Test the FleetUpgradePlanReport job."""
+
+    # Restore the Relationships and Jobs created at migration time, as TransactionTestCase truncates the tables.
+    serialized_rollback = True
+
+    def test_fleet_upgrade_plan(self):
+        devices = create_devices()
+        platform = devices[0].platform
+        software = SoftwareLCM.objects.create(device_platform=platform, version="15.2(7)E3")
+        target = SoftwareLCM.objects.create(device_platform=platform, version="15.2(7)E4")
+        validated_software = ValidatedSoftwareLCM.objects.create(
+            software=target, start=datetime.date(2020, 1, 1), preferred=True
+        )
+        validated_software.device_types.set([devices[0].device_type])
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug="device_soft"), source=software, destination=devices[0]
+        )
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug="device_soft"), source=target, destination=devices[1]
+        )
+
+        job_result = run_job_for_testing(
+            Job.objects.get(job_class_name="FleetUpgradePlanReport"), data={"sites": [str(devices[0].site.pk)]}
+        )
+        job_result.refresh_from_db()
+
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_COMPLETED)
+        messages = list(JobLogEntry.objects.filter(job_result=job_result).values_list("message", flat=True))
+        self.assertIn("Wave 1: upgrade 2 Cisco IOS 6509-E devices to 15.2(7)E4 (2).", messages)
+        self.assertTrue(
+            any(message.startswith("Planned 3 devices: 1 on target software, 2 to upgrade") for message in messages)
+        )
+
+
+class HardwareEoXFullReportTestCase(TransactionTestCase):
+    """Test the HardwareEoXFullReport job."""
+
+    # Restore the Relationships and Jobs created at migration time, as TransactionTestCase truncates the tables.
+    serialized_rollback = True
+
+    def test_hardware_eox_report(self):
+        inventory_items = create_inventory_items()
+        device_type = inventory_items[0].device.device_type
+        HardwareLCM.objects.create(device_type=device_type, end_of_support=datetime.date(2025, 1, 1))
+        HardwareLCM.objects.create(inventory_item=inventory_items[0].part_id, end_of_sale=datetime.date(2022, 1, 1))
+
+        job_result = run_job_for_testing(Job.objects.get(job_class_name="HardwareEoXFullReport"), data={})
+        job_result.refresh_from_db()
+
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(
+            DeviceHardwareEoXResult.objects.filter(end_of_support=datetime.date(2025, 1, 1)).count(),
+            Device.objects.filter(device_type=device_type).count(),
+        )
+        device_result = DeviceHardwareEoXResult.objects.get(device=inventory_items[0].device)
+        self.assertEqual(device_result.end_of_sale, datetime.date(2022, 1, 1))
+        item_result = InventoryItemHardwareEoXResult.objects.get()
+        self.assertEqual(item_result.inventory_item, inventory_items[0])
+        self.assertEqual(item_result.end_of_sale, datetime.date(2022, 1, 1))
+        self.assertIsNone(item_result.end_of_support)
+
+
+class ContractCoverageFullReportTestCase(TransactionTestCase):
+    """Test the ContractCoverageFullReport job."""
+
+    # Restore the Relationships and Jobs created at migration time, as TransactionTestCase truncates the tables.
+    serialized_rollback = True
+
+    def test_contract_coverage_report(self):
+        device_1, device_2, device_3 = create_devices()
+        contract = ContractLCM.objects.create(
+            name="Contract 1", end=datetime.date.today() + datetime.timedelta(days=30)
+        )
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug="contractlcm-to-device"), source=contract, destination=device_1
+        )
+
+        job_result = run_job_for_testing(Job.objects.get(job_class_name="ContractCoverageFullReport"), data={})
+        job_result.refresh_from_db()
+
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_COMPLETED)
+        coverage = DeviceContractCoverage.objects.get(is_covered=True)
+        self.assertEqual(coverage.device, device_1)
+        self.assertEqual(coverage.contract, contract)
+        self.assertEqual(coverage.gap_start, contract.end)
+        self.assertEqual(
+            set(DeviceContractCoverage.objects.filter(is_covered=False).values_list("device", flat=True)),
+            {device_2.pk, device_3.pk},
+        )
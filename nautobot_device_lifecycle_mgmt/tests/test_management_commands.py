@@ -0,0 +1,102 @@
+"""Unit tests for the nautobot_device_lifecycle_mgmt management commands."""
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from nautobot.dcim.models import Device
+from nautobot.extras.models import Relationship, RelationshipAssociation, Status
+
+from nautobot_device_lifecycle_mgmt.models import CVELCM, DeviceHardwareNotice, HardwareLCM, VulnerabilityLCM
+from nautobot_device_lifecycle_mgmt.tests.conftest import create_cves, create_devices, create_softwares
+from nautobot_device_lifecycle_mgmt.tests.test_nvd_import import nvd_11_item
+
+
+class ReconcileVulnerabilitiesTestCase(TestCase):
+    """Test the reconcile_vulnerabilities management command."""
+
+    def setUp(self):
+        self.devices = create_devices()
+        self.softwares = create_softwares()
+        self.cves = create_cves()
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug="soft_cve"), source=self.softwares[0], destination=self.cves[0]
+        )
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug="device_soft"),
+            source=self.softwares[0],
+            destination=self.devices[0],
+        )
+        self.valid = VulnerabilityLCM.objects.create(
+            cve=self.cves[0], software=self.softwares[0], device=self.devices[0]
+        )
+        self.stale = [
+            VulnerabilityLCM.objects.create(cve=self.cves[0], software=self.softwares[0], device=device)
+            for device in self.devices[1:]
+        ]
+
+    def test_delete_obsolete_vulnerabilities(self):
+        out = StringIO()
+        call_command("reconcile_vulnerabilities", "--batch-size", "1", stdout=out)
+
+        self.assertEqual(list(VulnerabilityLCM.objects.all()), [self.valid])
+        self.assertIn("Retired 2 obsolete Vulnerabilities.", out.getvalue())
+
+    def test_set_status_on_obsolete_vulnerabilities(self):
+        status = Status.objects.create(name="Obsolete", slug="obsolete")
+        status.content_types.set([ContentType.objects.get_for_model(VulnerabilityLCM)])
+
+        call_command("reconcile_vulnerabilities", "--status", "obsolete", stdout=StringIO())
+
+        self.assertEqual(set(VulnerabilityLCM.objects.filter(status=status)), set(self.stale))
+        self.valid.refresh_from_db()
+        self.assertIsNone(self.valid.status)
+
+    def test_invalid_status(self):
+        with self.assertRaises(CommandError):
+            call_command("reconcile_vulnerabilities", "--status", "active", stdout=StringIO())
+
+
+class ImportNVDFeedsTestCase(TestCase):
+    """Test the import_nvd_feeds management command."""
+
+    def test_import_directory(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, "nvdcve-1.1-2021.json"), "w", encoding="utf-8") as feed_file:
+                json.dump({"CVE_Items": [nvd_11_item("CVE-2021-0001"), nvd_11_item("CVE-2021-0002")]}, feed_file)
+
+            out = StringIO()
+            call_command("import_nvd_feeds", tmp_dir, stdout=out)
+            call_command("import_nvd_feeds", tmp_dir, stdout=out)
+
+        self.assertEqual(CVELCM.objects.count(), 2)
+        self.assertIn("2 CVEs created", out.getvalue())
+        self.assertIn("unchanged since its last import", out.getvalue())
+
+    def test_missing_path(self):
+        with self.assertRaises(CommandError):
+            call_command("import_nvd_feeds", "/nonexistent/nvdcve.json.gz", stdout=StringIO())
+
+
+class SyncHardwareNoticesTestCase(TestCase):
+    """Test the sync_hardware_notices management command."""
+
+    def test_sync(self):
+        devices = create_devices()
+        notice = HardwareLCM.objects.create(device_type=devices[0].device_type, end_of_support="2023-01-01")
+        DeviceHardwareNotice.objects.all().delete()
+        Device.objects.filter(pk=devices[2].pk).delete()
+
+        out = StringIO()
+        call_command("sync_hardware_notices", stdout=out)
+
+        self.assertEqual(
+            set(DeviceHardwareNotice.objects.values_list("device_id", "hardware_notice_id")),
+            {(devices[0].pk, notice.pk), (devices[1].pk, notice.pk)},
+        )
+        self.assertIn("Created 2 and deleted 0", out.getvalue())
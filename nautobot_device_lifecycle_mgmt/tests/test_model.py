@@ -1,13 +1,17 @@
 """nautobot_device_lifecycle_mgmt test class for models."""
 from datetime import date
+from unittest import mock
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.core.exceptions import ValidationError
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 
 import time_machine
 
-from nautobot.dcim.models import DeviceType, Manufacturer, Platform
+from nautobot.dcim.models import Device, DeviceType, InventoryItem, Manufacturer, Platform
 from nautobot.extras.choices import RelationshipTypeChoices
 from nautobot.extras.models import Relationship, RelationshipAssociation, Status, Tag
 
@@ -23,6 +27,7 @@ from nautobot_device_lifecycle_mgmt.models import (
     ProviderLCM,
     ContractLCM,
 )
+from nautobot_device_lifecycle_mgmt.versions import get_version_key
 from .conftest import (
     create_devices,
     create_inventory_items,
@@ -138,6 +143,50 @@ class HardwareLCMTestCase(TestCase):
         hwlcm_obj = HardwareLCM.objects.create(device_type=self.device_type, end_of_support=date(2999, 4, 1))
         self.assertFalse(hwlcm_obj.expired)
 
+    @time_machine.travel("2023-01-01")
+    def test_with_expiry_matches_expired_property(self):
+        """The expiry annotated in the database matches the properties for every `expired_field` setting."""
+        manufacturer = self.manufacturer
+        dates = [
+            (date(2022, 1, 1), None, None),
+            (None, date(2023, 1, 1), None),
+            (date(2022, 1, 1), date(2024, 1, 1), None),
+            (date(2024, 1, 1), date(2022, 1, 1), date(2022, 6, 1)),
+            (date(2024, 1, 1), date(2025, 1, 1), date(2022, 6, 1)),
+        ]
+        for index, (end_of_sale, end_of_support, end_of_security_patches) in enumerate(dates):
+            HardwareLCM.objects.create(
+                device_type=DeviceType.objects.create(model=f"c{index}", slug=f"c{index}", manufacturer=manufacturer),
+                end_of_sale=end_of_sale,
+                end_of_support=end_of_support,
+                end_of_security_patches=end_of_security_patches,
+            )
+
+        for expired_field in ("end_of_support", "end_of_sale", "end_of_security_patches"):
+            with mock.patch.dict(
+                settings.PLUGINS_CONFIG["nautobot_device_lifecycle_mgmt"], {"expired_field": expired_field}
+            ):
+                for notice in HardwareLCM.objects.with_expiry():
+                    fresh_notice = HardwareLCM.objects.get(pk=notice.pk)
+                    self.assertEqual(notice.expiry_date, fresh_notice.expiry_date)
+                    self.assertEqual(notice.expired, fresh_notice.expired)
+                    self.assertEqual(notice.days_to_expiry, fresh_notice.days_to_expiry)
+                self.assertEqual(
+                    set(HardwareLCM.objects.filter_expired()),
+                    {notice for notice in HardwareLCM.objects.all() if notice.expired},
+                )
+                self.assertEqual(
+                    set(HardwareLCM.objects.filter_expired(False)),
+                    {notice for notice in HardwareLCM.objects.all() if not notice.expired},
+                )
+
+        with mock.patch.dict(
+            settings.PLUGINS_CONFIG["nautobot_device_lifecycle_mgmt"], {"expired_field": "end_of_support"}
+        ):
+            notice = HardwareLCM.objects.with_expiry().get(device_type__model="c2")
+        self.assertEqual(notice.days_to_expiry, 365)
+        self.assertFalse(notice.expired)
+
 
 class SoftwareLCMTestCase(TestCase):
     """Tests for the SoftwareLCM model."""
@@ -179,6 +228,26 @@ class SoftwareLCMTestCase(TestCase):
         self.assertEqual(softwarelcm_full.pre_release, True)
         self.assertEqual(str(softwarelcm_full), f"{self.device_platform.name} - {softwarelcm_full.version}")
 
+    def test_version_sort_key(self):
+        """Version sort keys are maintained on save and bulk create, and order versions naturally."""
+        softwarelcm = SoftwareLCM.objects.create(device_platform=self.device_platform, version="15.9(3)M")
+        self.assertEqual(softwarelcm.version_sort_key, get_version_key("15.9(3)M"))
+        softwarelcm.version = "15.10(1)M"
+        softwarelcm.save()
+        softwarelcm.refresh_from_db()
+        self.assertEqual(softwarelcm.version_sort_key, get_version_key("15.10(1)M"))
+
+        SoftwareLCM.objects.bulk_create(
+            [
+                SoftwareLCM(device_platform=self.device_platform, version="15.2(4)M3"),
+                SoftwareLCM(device_platform=self.device_platform, version="15.2(4)M10"),
+            ]
+        )
+        self.assertEqual(
+            list(SoftwareLCM.objects.values_list("version", flat=True)),
+            ["15.2(4)M3", "15.2(4)M10", "15.10(1)M"],
+        )
+
 
 class ValidatedSoftwareLCMTestCase(TestCase):
     """Tests for the ValidatedSoftwareLCM model."""
@@ -626,3 +695,67 @@ class ProviderLCMTestCase(TestCase):
         self.assertEqual(cisco_contract.currency, "USD")
         self.assertEqual(cisco_contract.contract_type, "Hardware")
         self.assertEqual(cisco_contract.comments, "Cisco gave us discount")
+
+    @time_machine.travel("2023-01-01")
+    def test_contract_with_expiry(self):
+        """The expiry of contracts annotated in the database matches the properties."""
+        provider = ProviderLCM.objects.create(name="Cisco")
+        for name, end in (("Ended", date(2022, 6, 1)), ("Ends today", date(2023, 1, 1)), ("Active", date(2023, 1, 31))):
+            ContractLCM.objects.create(provider=provider, name=name, start=date(2020, 1, 1), end=end)
+        ContractLCM.objects.create(provider=provider, name="Open ended", start=date(2020, 1, 1))
+
+        annotated = {
+            contract.name: (contract.expired, contract.days_to_expiry) for contract in ContractLCM.objects.with_expiry()
+        }
+        self.assertEqual(
+            annotated,
+            {contract.name: (contract.expired, contract.days_to_expiry) for contract in ContractLCM.objects.all()},
+        )
+        self.assertEqual(annotated["Active"], (False, 30))
+        self.assertEqual(annotated["Open ended"], (False, None))
+        self.assertEqual(
+            set(ContractLCM.objects.filter_expired().values_list("name", flat=True)), {"Ended", "Ends today"}
+        )
+        self.assertEqual(
+            set(ContractLCM.objects.filter_expired(False).values_list("name", flat=True)), {"Active", "Open ended"}
+        )
+
+
+class RelationshipAssociationCleanupTestCase(TestCase):
+    """Tests for the removal of the relationship associations of deleted objects."""
+
+    def setUp(self):
+        self.devices = create_devices()
+        self.software = create_softwares()[0]
+        self.cve = create_cves()[0]
+        device_soft = Relationship.objects.get(slug="device_soft")
+        inventory_item_soft = Relationship.objects.get(slug="inventory_item_soft")
+        for device in self.devices:
+            RelationshipAssociation.objects.create(relationship=device_soft, source=self.software, destination=device)
+            item = InventoryItem.objects.create(device=device, name="Supervisor")
+            RelationshipAssociation.objects.create(
+                relationship=inventory_item_soft, source=self.software, destination=item
+            )
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug="soft_cve"), source=self.software, destination=self.cve
+        )
+
+    def test_delete_devices(self):
+        """Bulk deleting devices removes their associations, and those of their items, in a fixed number of queries."""
+        with CaptureQueriesContext(connection) as queries:
+            Device.objects.filter(pk=self.devices[0].pk).delete()
+        query_count = len(queries)
+        self.assertEqual(RelationshipAssociation.objects.filter(source_id=self.software.pk).count(), 5)
+
+        with CaptureQueriesContext(connection) as queries:
+            Device.objects.all().delete()
+        self.assertEqual(len(queries), query_count)
+        self.assertEqual(RelationshipAssociation.objects.filter(source_id=self.software.pk).count(), 1)
+
+    def test_delete_cve_and_software(self):
+        """Deleting a CVE or a software removes its associations."""
+        self.cve.delete()
+        self.assertFalse(RelationshipAssociation.objects.filter(relationship__slug="soft_cve").exists())
+
+        self.software.delete()
+        self.assertFalse(RelationshipAssociation.objects.exists())
@@ -0,0 +1,120 @@
+"""Unit tests for the NVD feed importer."""
+import gzip
+import io
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.test import TestCase
+
+from nautobot_device_lifecycle_mgmt import nvd_import
+from nautobot_device_lifecycle_mgmt.models import CVELCM, NVDFeedImport
+from nautobot_device_lifecycle_mgmt.nvd_import import import_nvd_feed, iter_json_array, parse_nvd_item
+
+
+def nvd_11_item(name, score=9.8, severity="CRITICAL", description="Test vulnerability"):
+    """Return an item of an NVD 1.1 JSON feed."""
+    return {
+        "cve": {
+            "CVE_data_meta": {"ID": name},
+            "description": {"description_data": [{"lang": "en", "value": description}]},
+        },
+        "impact": {
+            "baseMetricV3": {"cvssV3": {"baseScore": score, "baseSeverity": severity}},
+            "baseMetricV2": {"cvssV2": {"baseScore": 7.5}, "severity": "HIGH"},
+        },
+        "publishedDate": "2021-12-10T10:15Z",
+    }
+
+
+def nvd_20_item(name):
+    """Return an item of an NVD 2.0 API response."""
+    return {
+        "cve": {
+            "id": name,
+            "published": "2022-03-01T12:00:00.000",
+            "descriptions": [{"lang": "es", "value": "Prueba"}, {"lang": "en", "value": "Test"}],
+            "metrics": {"cvssMetricV2": [{"cvssData": {"baseScore": 5.0}, "baseSeverity": "MEDIUM"}]},
+        }
+    }
+
+
+class NVDImportTestCase(TestCase):
+    """Test the import of NVD JSON feeds."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _write_feed(self, items, file_name="nvdcve-1.1-2021.json.gz"):
+        path = os.path.join(self.tmp_dir.name, file_name)
+        document = {"CVE_data_type": "CVE", "CVE_data_numberOfCVEs": str(len(items)), "CVE_Items": items}
+        with gzip.open(path, "wt", encoding="utf-8") as feed_file:
+            json.dump(document, feed_file, indent=1)
+        return path
+
+    def test_iter_json_array_small_chunks(self):
+        items = [nvd_11_item(f"CVE-2021-{index:04d}") for index in range(20)]
+        document = json.dumps({"CVE_data_type": "CVE", "CVE_Items": items, "CVE_data_format": "MITRE"})
+        with mock.patch.object(nvd_import, "READ_CHUNK_SIZE", 7):
+            self.assertEqual(list(iter_json_array(io.StringIO(document))), items)
+        self.assertEqual(list(iter_json_array(io.StringIO('{"CVE_Items": []}'))), [])
+
+    def test_parse_nvd_items(self):
+        self.assertEqual(
+            parse_nvd_item(nvd_11_item("CVE-2021-44228", score=10.0)),
+            {
+                "name": "CVE-2021-44228",
+                "published_date": "2021-12-10",
+                "link": "https://nvd.nist.gov/vuln/detail/CVE-2021-44228",
+                "description": "Test vulnerability",
+                "severity": "Critical",
+                "cvss": 10.0,
+                "cvss_v2": 7.5,
+                "cvss_v3": 10.0,
+            },
+        )
+        self.assertEqual(
+            parse_nvd_item(nvd_20_item("CVE-2022-0001")),
+            {
+                "name": "CVE-2022-0001",
+                "published_date": "2022-03-01",
+                "link": "https://nvd.nist.gov/vuln/detail/CVE-2022-0001",
+                "description": "Test",
+                "severity": "Medium",
+                "cvss": 5.0,
+                "cvss_v2": 5.0,
+                "cvss_v3": None,
+            },
+        )
+        self.assertIsNone(parse_nvd_item({"cve": {"CVE_data_meta": {"ID": "CVE-2021-0001"}}}))
+
+    def test_import_nvd_feed(self):
+        CVELCM.objects.create(
+            name="CVE-2021-0001", published_date="2021-01-01", link="https://example.com", description="Old"
+        )
+        path = self._write_feed(
+            [nvd_11_item("CVE-2021-0001"), nvd_11_item("CVE-2021-0002", severity="LOW", score=2.0), {"cve": {}}]
+        )
+
+        counts = import_nvd_feed(path, batch_size=1)
+
+        self.assertEqual(counts, {"created": 1, "updated": 1, "unchanged": 0, "skipped": 1})
+        updated = CVELCM.objects.get(name="CVE-2021-0001")
+        self.assertEqual(updated.description, "Test vulnerability")
+        self.assertEqual(str(updated.published_date), "2021-12-10")
+        self.assertEqual(CVELCM.objects.get(name="CVE-2021-0002").severity, "Low")
+        feed_import = NVDFeedImport.objects.get(file_name="nvdcve-1.1-2021.json.gz")
+        self.assertEqual(feed_import.cve_count, 2)
+
+    def test_import_nvd_feed_skips_unchanged_file(self):
+        path = self._write_feed([nvd_11_item("CVE-2021-0001")])
+        self.assertEqual(import_nvd_feed(path)["created"], 1)
+
+        self.assertIsNone(import_nvd_feed(path))
+        self.assertEqual(import_nvd_feed(path, force=True), {"created": 0, "updated": 0, "unchanged": 1, "skipped": 0})
+
+        path = self._write_feed([nvd_11_item("CVE-2021-0001", score=5.0, severity="MEDIUM")])
+        self.assertEqual(import_nvd_feed(path)["updated"], 1)
+        self.assertEqual(CVELCM.objects.get(name="CVE-2021-0001").severity, "Medium")
@@ -0,0 +1,243 @@
+"""nautobot_device_lifecycle_mgmt test class for set-based software validation."""
+import datetime
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from nautobot.dcim.models import Device, DeviceRole, DeviceType, InventoryItem, Manufacturer, Platform, Site
+from nautobot.extras.models import Relationship, RelationshipAssociation, Tag
+
+from nautobot_device_lifecycle_mgmt.models import SoftwareImageLCM, SoftwareLCM, ValidatedSoftwareLCM
+from nautobot_device_lifecycle_mgmt.software_bulk import BulkDeviceSoftware, BulkInventoryItemSoftware
+from nautobot_device_lifecycle_mgmt.software_filters import DeviceSoftwareImageFilter, DeviceValidatedSoftwareFilter
+
+
+class BulkSoftwareTestCase(TestCase):  # pylint: disable=too-many-instance-attributes
+    """Tests for BulkDeviceSoftware and BulkInventoryItemSoftware."""
+
+    def setUp(self):
+        manufacturer, _ = Manufacturer.objects.get_or_create(name="Arista", slug="arista")
+        platform, _ = Platform.objects.get_or_create(name="Arista EOS", slug="arista_eos", manufacturer=manufacturer)
+        self.software_1 = SoftwareLCM.objects.create(device_platform=platform, version="4.25M")
+        self.software_2 = SoftwareLCM.objects.create(device_platform=platform, version="4.26M")
+
+        devicetype_1 = DeviceType.objects.create(manufacturer=manufacturer, model="7124", slug="7124")
+        devicetype_2 = DeviceType.objects.create(manufacturer=manufacturer, model="7150S", slug="7150s")
+        devicerole_1 = DeviceRole.objects.create(name="Switch", slug="switch", color="ff0000")
+        devicerole_2 = DeviceRole.objects.create(name="Router", slug="router", color="00ff00")
+        site = Site.objects.create(name="Site1", slug="site1")
+        tag = Tag.objects.create(name="lcm", slug="lcm")
+
+        self.device_1 = Device.objects.create(
+            name="Device1", device_type=devicetype_1, device_role=devicerole_1, site=site
+        )
+        self.device_1.tags.add(tag)
+        self.device_2 = Device.objects.create(
+            name="Device2", device_type=devicetype_2, device_role=devicerole_1, site=site
+        )
+        self.device_3 = Device.objects.create(
+            name="Device3", device_type=devicetype_1, device_role=devicerole_2, site=site
+        )
+        self.inventory_item = InventoryItem.objects.create(device=self.device_3, name="Module1")
+        self.inventory_item.tags.add(tag)
+
+        device_soft = Relationship.objects.get(slug="device_soft")
+        for device in (self.device_1, self.device_2):
+            RelationshipAssociation.objects.create(relationship=device_soft, source=self.software_1, destination=device)
+        RelationshipAssociation.objects.create(
+            relationship=Relationship.objects.get(slug="inventory_item_soft"),
+            source=self.software_1,
+            destination=self.inventory_item,
+        )
+
+        self.vs_device = ValidatedSoftwareLCM.objects.create(software=self.software_1, start=datetime.date(2020, 1, 1))
+        self.vs_device.devices.set([self.device_1])
+        self.vs_type_role = ValidatedSoftwareLCM.objects.create(
+            software=self.software_1, start=datetime.date(2020, 1, 2), preferred=True
+        )
+        self.vs_type_role.device_types.set([devicetype_1])
+        self.vs_type_role.device_roles.set([devicerole_1])
+        self.vs_type = ValidatedSoftwareLCM.objects.create(
+            software=self.software_2, start=datetime.date(2020, 1, 3), preferred=True
+        )
+        self.vs_type.device_types.set([devicetype_2])
+        self.vs_role = ValidatedSoftwareLCM.objects.create(software=self.software_1, start=datetime.date(2020, 1, 4))
+        self.vs_role.device_roles.set([devicerole_2])
+        self.vs_tag = ValidatedSoftwareLCM.objects.create(
+            software=self.software_2, start=datetime.date(2020, 1, 5), preferred=True
+        )
+        self.vs_tag.object_tags.set([tag])
+        self.vs_expired = ValidatedSoftwareLCM.objects.create(
+            software=self.software_1, start=datetime.date(2020, 1, 6), end=datetime.date(2021, 1, 1)
+        )
+        self.vs_expired.device_types.set([devicetype_2])
+        self.vs_inventory_item = ValidatedSoftwareLCM.objects.create(
+            software=self.software_1, start=datetime.date(2021, 1, 1)
+        )
+        self.vs_inventory_item.inventory_items.set([self.inventory_item])
+
+    def test_device_validated_software_ordered_by_weight(self):
+        results = BulkDeviceSoftware(Device.objects.all()).get_results()
+
+        self.assertEqual(
+            results[self.device_1.pk]["validated_software"],
+            [(self.vs_type_role, 20), (self.vs_tag, 990), (self.vs_device, 1000)],
+        )
+        self.assertEqual(results[self.device_2.pk]["validated_software"], [(self.vs_type, 30), (self.vs_expired, 1030)])
+        self.assertEqual(results[self.device_3.pk]["validated_software"], [(self.vs_role, 1040)])
+
+    def test_device_validated_software_matches_per_device_filter(self):
+        results = BulkDeviceSoftware(Device.objects.all()).get_results()
+
+        for device in Device.objects.all():
+            expected = [
+                (vs, vs.weight)
+                for vs in DeviceValidatedSoftwareFilter(ValidatedSoftwareLCM.objects.all(), device).filter_qs()
+            ]
+            self.assertEqual(results[device.pk]["validated_software"], expected)
+
+    def test_device_validation_status(self):
+        results = BulkDeviceSoftware(Device.objects.all()).get_results()
+
+        self.assertEqual(results[self.device_1.pk]["software"], self.software_1)
+        self.assertTrue(results[self.device_1.pk]["is_validated"])
+        self.assertTrue(results[self.device_1.pk]["is_preferred_validated"])
+        # Software 1 is only validated for Device2 by an expired ValidatedSoftwareLCM.
+        self.assertFalse(results[self.device_2.pk]["is_validated"])
+        self.assertIsNone(results[self.device_3.pk]["software"])
+        self.assertFalse(results[self.device_3.pk]["is_validated"])
+
+    def test_device_validated_software_queryset_restricts_results(self):
+        results = BulkDeviceSoftware(
+            Device.objects.filter(pk=self.device_1.pk), ValidatedSoftwareLCM.objects.filter(preferred=False)
+        ).get_results()
+
+        self.assertEqual(list(results), [self.device_1.pk])
+        self.assertEqual(results[self.device_1.pk]["validated_software"], [(self.vs_device, 1000)])
+        self.assertTrue(results[self.device_1.pk]["is_validated"])
+        self.assertFalse(results[self.device_1.pk]["is_preferred_validated"])
+
+    def test_device_query_count_independent_of_set_size(self):
+        with CaptureQueriesContext(connection) as single:
+            BulkDeviceSoftware(Device.objects.filter(pk=self.device_1.pk)).get_results()
+        with CaptureQueriesContext(connection) as full:
+            BulkDeviceSoftware(Device.objects.all()).get_results()
+
+        self.assertEqual(len(single), len(full))
+
+    def test_inventory_item_validated_software(self):
+        results = BulkInventoryItemSoftware(InventoryItem.objects.all()).get_results()
+
+        self.assertEqual(
+            results[self.inventory_item.pk]["validated_software"],
+            [(self.vs_tag, 20), (self.vs_inventory_item, 1010)],
+        )
+        self.assertEqual(results[self.inventory_item.pk]["software"], self.software_1)
+        self.assertTrue(results[self.inventory_item.pk]["is_validated"])
+        self.assertFalse(results[self.inventory_item.pk]["is_preferred_validated"])
+
+
+class BulkSoftwareImageTestCase(TestCase):  # pylint: disable=too-many-instance-attributes
+    """Tests for the software image resolution of BulkDeviceSoftware and BulkInventoryItemSoftware."""
+
+    def setUp(self):
+        manufacturer, _ = Manufacturer.objects.get_or_create(name="Arista", slug="arista")
+        platform, _ = Platform.objects.get_or_create(name="Arista EOS", slug="arista_eos", manufacturer=manufacturer)
+        self.software = SoftwareLCM.objects.create(device_platform=platform, version="4.25M")
+        self.software_2 = SoftwareLCM.objects.create(device_platform=platform, version="4.26M")
+
+        devicetype_1 = DeviceType.objects.create(manufacturer=manufacturer, model="7124", slug="7124")
+        devicetype_2 = DeviceType.objects.create(manufacturer=manufacturer, model="7150S", slug="7150s")
+        devicerole = DeviceRole.objects.create(name="Switch", slug="switch", color="ff0000")
+        site = Site.objects.create(name="Site1", slug="site1")
+        tag = Tag.objects.create(name="lcm", slug="lcm")
+
+        self.device_tag = Device.objects.create(
+            name="Device1", device_type=devicetype_1, device_role=devicerole, site=site
+        )
+        self.device_tag.tags.add(tag)
+        self.device_type = Device.objects.create(
+            name="Device2", device_type=devicetype_2, device_role=devicerole, site=site
+        )
+        self.device_default = Device.objects.create(
+            name="Device3", device_type=devicetype_1, device_role=devicerole, site=site
+        )
+        self.device_tag_and_type = Device.objects.create(
+            name="Device4", device_type=devicetype_2, device_role=devicerole, site=site
+        )
+        self.device_tag_and_type.tags.add(tag)
+        self.device_no_software = Device.objects.create(
+            name="Device5", device_type=devicetype_1, device_role=devicerole, site=site
+        )
+        self.inventory_item = InventoryItem.objects.create(device=self.device_default, name="Module1")
+        self.inventory_item_default = InventoryItem.objects.create(device=self.device_default, name="Module2")
+
+        device_soft = Relationship.objects.get(slug="device_soft")
+        for device in (self.device_tag, self.device_type, self.device_default, self.device_tag_and_type):
+            RelationshipAssociation.objects.create(relationship=device_soft, source=self.software, destination=device)
+        inventory_item_soft = Relationship.objects.get(slug="inventory_item_soft")
+        for inventory_item in (self.inventory_item, self.inventory_item_default):
+            RelationshipAssociation.objects.create(
+                relationship=inventory_item_soft, source=self.software, destination=inventory_item
+            )
+
+        self.image_tag = SoftwareImageLCM.objects.create(image_file_name="eos-tag.swi", software=self.software)
+        self.image_tag.object_tags.set([tag])
+        self.image_type = SoftwareImageLCM.objects.create(image_file_name="eos-dt.swi", software=self.software)
+        self.image_type.device_types.set([devicetype_2])
+        self.image_inventory_item = SoftwareImageLCM.objects.create(
+            image_file_name="eos-inv.swi", software=self.software
+        )
+        self.image_inventory_item.inventory_items.set([self.inventory_item])
+        self.image_default = SoftwareImageLCM.objects.create(
+            image_file_name="eos-def.swi", software=self.software, default_image=True
+        )
+        self.image_2_default = SoftwareImageLCM.objects.create(
+            image_file_name="eos2-def.swi", software=self.software_2, default_image=True
+        )
+
+    def test_device_software_image_precedence(self):
+        image_map = BulkDeviceSoftware(Device.objects.all()).get_software_image_map()
+
+        self.assertEqual(
+            image_map,
+            {
+                self.device_tag.pk: self.image_tag,
+                self.device_type.pk: self.image_type,
+                self.device_default.pk: self.image_default,
+                self.device_tag_and_type.pk: self.image_tag,
+            },
+        )
+
+    def test_device_software_image_matches_per_device_filter(self):
+        image_map = BulkDeviceSoftware(Device.objects.all()).get_software_image_map()
+
+        for device in Device.objects.all():
+            expected = DeviceSoftwareImageFilter(SoftwareImageLCM.objects.all(), device).filter_qs().first()
+            self.assertEqual(image_map.get(device.pk), expected)
+
+    def test_device_software_image_for_target_software(self):
+        image_map = BulkDeviceSoftware(Device.objects.all()).get_software_image_map(
+            {self.device_tag.pk: self.software_2, self.device_no_software.pk: self.software.pk}
+        )
+
+        self.assertEqual(
+            image_map, {self.device_tag.pk: self.image_2_default, self.device_no_software.pk: self.image_default}
+        )
+
+    def test_device_software_image_query_count_independent_of_set_size(self):
+        with CaptureQueriesContext(connection) as single:
+            BulkDeviceSoftware(Device.objects.filter(pk=self.device_tag.pk)).get_software_image_map()
+        with CaptureQueriesContext(connection) as full:
+            BulkDeviceSoftware(Device.objects.all()).get_software_image_map()
+
+        self.assertEqual(len(single), len(full))
+
+    def test_inventory_item_software_image_precedence(self):
+        image_map = BulkInventoryItemSoftware(InventoryItem.objects.all()).get_software_image_map()
+
+        self.assertEqual(
+            image_map,
+            {self.inventory_item.pk: self.image_inventory_item, self.inventory_item_default.pk: self.image_default},
+        )
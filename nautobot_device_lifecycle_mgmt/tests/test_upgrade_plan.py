@@ -0,0 +1,129 @@
+"""nautobot_device_lifecycle_mgmt test class for the fleet upgrade plan."""
+import datetime
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from nautobot.dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Platform, Site
+from nautobot.extras.models import Relationship, RelationshipAssociation
+from nautobot.utilities.testing import TestCase
+
+from nautobot_device_lifecycle_mgmt.choices import UpgradePlanStatusChoices
+from nautobot_device_lifecycle_mgmt.models import SoftwareImageLCM, SoftwareLCM, ValidatedSoftwareLCM
+from nautobot_device_lifecycle_mgmt.upgrade_plan import (
+    UPGRADE_PLAN_FIELDS,
+    FleetUpgradePlan,
+    iter_upgrade_plan_csv,
+    iter_upgrade_plan_json,
+)
+
+
+class FleetUpgradePlanTestCase(TestCase):  # pylint: disable=too-many-instance-attributes
+    """Tests for FleetUpgradePlan and FleetUpgradePlanView."""
+
+    def setUp(self):
+        super().setUp()
+        manufacturer = Manufacturer.objects.create(name="Arista", slug="arista")
+        self.platform = Platform.objects.create(name="Arista EOS", slug="arista_eos", manufacturer=manufacturer)
+        self.software_1 = SoftwareLCM.objects.create(device_platform=self.platform, version="4.25M")
+        self.software_2 = SoftwareLCM.objects.create(device_platform=self.platform, version="4.26M")
+        SoftwareImageLCM.objects.create(software=self.software_2, image_file_name="eos-4.26M.swi", default_image=True)
+
+        self.devicetype_1 = DeviceType.objects.create(manufacturer=manufacturer, model="7124", slug="7124")
+        self.devicetype_2 = DeviceType.objects.create(manufacturer=manufacturer, model="7150S", slug="7150s")
+        self.devicerole_1 = DeviceRole.objects.create(name="Switch", slug="switch", color="ff0000")
+        devicerole_2 = DeviceRole.objects.create(name="Router", slug="router", color="00ff00")
+        self.site = Site.objects.create(name="Site1", slug="site1")
+
+        self.device_1 = self.create_device("Device1", self.devicetype_1, self.devicerole_1)
+        self.device_2 = self.create_device("Device2", self.devicetype_1, self.devicerole_1)
+        self.device_3 = self.create_device("Device3", self.devicetype_2, devicerole_2)
+        self.device_4 = self.create_device("Device4", self.devicetype_1, self.devicerole_1)
+        device_soft = Relationship.objects.get(slug="device_soft")
+        RelationshipAssociation.objects.create(
+            relationship=device_soft, source=self.software_1, destination=self.device_1
+        )
+        RelationshipAssociation.objects.create(
+            relationship=device_soft, source=self.software_2, destination=self.device_2
+        )
+
+        validated_software = ValidatedSoftwareLCM.objects.create(
+            software=self.software_2, start=datetime.date(2020, 1, 1), preferred=True
+        )
+        validated_software.device_types.set([self.devicetype_1])
+        expired_validated_software = ValidatedSoftwareLCM.objects.create(
+            software=self.software_1, start=datetime.date(2020, 1, 1), end=datetime.date(2021, 1, 1), preferred=True
+        )
+        expired_validated_software.device_types.set([self.devicetype_2])
+
+    def create_device(self, name, device_type, device_role):
+        """Create a Device of the Arista EOS platform."""
+        return Device.objects.create(
+            name=name, device_type=device_type, device_role=device_role, site=self.site, platform=self.platform
+        )
+
+    def test_plan_rows(self):
+        """Devices are compared to their preferred valid validated software."""
+        plan = FleetUpgradePlan(Device.objects.all())
+        rows = {row["device"]: row for row in plan}
+
+        self.assertEqual(rows["Device1"]["status"], UpgradePlanStatusChoices.UPGRADE)
+        self.assertEqual(rows["Device1"]["current_software"], "4.25M")
+        self.assertEqual(rows["Device1"]["target_software"], "4.26M")
+        self.assertEqual(rows["Device1"]["target_image"], "eos-4.26M.swi")
+        self.assertEqual(rows["Device2"]["status"], UpgradePlanStatusChoices.CURRENT)
+        self.assertIsNone(rows["Device2"]["wave"])
+        self.assertEqual(rows["Device3"]["status"], UpgradePlanStatusChoices.NO_TARGET)
+        self.assertIsNone(rows["Device3"]["target_software"])
+        self.assertEqual(rows["Device4"]["status"], UpgradePlanStatusChoices.UPGRADE)
+        self.assertIsNone(rows["Device4"]["current_software"])
+        self.assertEqual(rows["Device1"]["wave"], rows["Device4"]["wave"])
+
+        self.assertEqual(plan.status_counts[UpgradePlanStatusChoices.UPGRADE], 2)
+        self.assertEqual(len(plan.waves), 1)
+        wave = plan.waves[("Arista EOS", "7124")]
+        self.assertEqual(wave["device_count"], 2)
+        self.assertEqual(dict(wave["target_softwares"]), {"4.26M": 2})
+
+    def test_plan_batches(self):
+        """The plan is the same whatever the batch size, and each batch costs a fixed number of queries."""
+        rows = list(FleetUpgradePlan(Device.objects.all()))
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(list(FleetUpgradePlan(Device.objects.all(), batch_size=2)), rows)
+
+        for index in range(5, 9):
+            self.create_device(f"Device{index}", self.devicetype_1, self.devicerole_1)
+        with CaptureQueriesContext(connection) as more_queries:
+            self.assertEqual(len(list(FleetUpgradePlan(Device.objects.all(), batch_size=4))), 8)
+        self.assertEqual(len(more_queries), len(queries))
+
+    def test_plan_exports(self):
+        """The plan is exported as CSV lines and as a JSON array."""
+        csv_lines = list(iter_upgrade_plan_csv(FleetUpgradePlan(Device.objects.all())))
+        self.assertEqual(csv_lines[0].strip(), ",".join(UPGRADE_PLAN_FIELDS))
+        self.assertEqual(len(csv_lines), 5)
+
+        data = json.loads("".join(iter_upgrade_plan_json(FleetUpgradePlan(Device.objects.all()))))
+        self.assertEqual([row["device"] for row in data], ["Device1", "Device2", "Device4", "Device3"])
+        self.assertEqual(json.loads("".join(iter_upgrade_plan_json(FleetUpgradePlan(Device.objects.none())))), [])
+
+    def test_view(self):
+        """The view renders the waves and streams the exports of the filtered devices."""
+        url = reverse("plugins:nautobot_device_lifecycle_mgmt:upgrade_plan")
+        self.assertHttpStatus(self.client.get(url), 403)
+
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_validatedsoftwarelcm", "dcim.view_device")
+        response = self.client.get(url)
+        self.assertHttpStatus(response, 200)
+        self.assertContains(response, "7124")
+
+        response = self.client.get(url, {"export": "csv", "role": "router"})
+        self.assertEqual(response["Content-Type"], "text/csv")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith(f"{self.device_3.pk},Device3,"))
+
+        response = self.client.get(url, {"export": "json"})
+        self.assertEqual(len(json.loads(b"".join(response.streaming_content))), 4)
@@ -0,0 +1,65 @@
+"""Unit tests for the software version parsing helpers."""
+from django.test import SimpleTestCase
+
+from nautobot_device_lifecycle_mgmt.versions import (
+    VersionIndex,
+    get_version_key,
+    parse_version_range,
+    validate_affected_versions,
+)
+
+
+class VersionKeyTestCase(SimpleTestCase):
+    """Test the sortable version keys."""
+
+    def test_version_order(self):
+        versions = [
+            "4.28.3M",
+            "4.28.10M",
+            "15.2(4)M",
+            "15.2(4)M3",
+            "15.2(4)M10",
+            "15.2(7)E3",
+            "15.9",
+            "15.10",
+            "17.3.4",
+            "17.3.4a",
+            "20.4R3",
+            "20.4R3-S2",
+            "20.4R3-S10",
+        ]
+        self.assertEqual(sorted(reversed(versions), key=get_version_key), versions)
+
+    def test_equivalent_versions(self):
+        self.assertEqual(get_version_key("17.03.04a"), get_version_key("17.3.4A"))
+
+
+class VersionRangeTestCase(SimpleTestCase):
+    """Test the version range parsing and matching."""
+
+    def test_parse_version_range(self):
+        self.assertEqual(
+            parse_version_range(">=15.2(4)M, <15.2(7)E3"),
+            [(">=", get_version_key("15.2(4)M")), ("<", get_version_key("15.2(7)E3"))],
+        )
+        self.assertEqual(parse_version_range("17.3.4a"), [("==", get_version_key("17.3.4a"))])
+        for invalid in ("", ">=", "~15.2", ">=15.2, "):
+            with self.assertRaises(ValueError):
+                parse_version_range(invalid)
+
+    def test_version_index(self):
+        index = VersionIndex((version, version) for version in ("15.2(4)M", "15.2(4)M3", "15.2(7)E2", "15.2(7)E3"))
+        self.assertEqual(index.get_range(parse_version_range(">=15.2(4)M3, <15.2(7)E3")), ["15.2(4)M3", "15.2(7)E2"])
+        self.assertEqual(index.get_range(parse_version_range(">15.2(4)M, <=15.2(7)E2")), ["15.2(4)M3", "15.2(7)E2"])
+        self.assertEqual(index.get_range(parse_version_range("15.2(7)E3")), ["15.2(7)E3"])
+        self.assertEqual(index.get_range(parse_version_range(">15.2(7)E3")), [])
+
+    def test_version_index_from_version_keys(self):
+        index = VersionIndex.from_version_keys((get_version_key(version), version) for version in ("4.28.3M", "4.9.1F"))
+        self.assertEqual(index.get_range(parse_version_range(">=4.10")), ["4.28.3M"])
+
+    def test_validate_affected_versions(self):
+        validate_affected_versions([{"platform": "cisco_ios", "versions": ">=15.2(4)M"}])
+        for invalid in ({}, [{"platform": "cisco_ios"}], [{"platform": "cisco_ios", "versions": "~1"}]):
+            with self.assertRaises(ValueError):
+                validate_affected_versions(invalid)
@@ -1,12 +1,16 @@
 """Unit tests for views."""
 import datetime
+import time
+
+import time_machine
 
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.urls import reverse
+from django.utils.http import http_date
 
-from nautobot.utilities.testing import ViewTestCases
-from nautobot.dcim.models import DeviceType, Manufacturer
+from nautobot.utilities.testing import TestCase, ViewTestCases
+from nautobot.dcim.models import DeviceType, Manufacturer, Site
 from nautobot.users.models import ObjectPermission
 from nautobot.extras.models import Status
 
@@ -14,6 +18,8 @@ from nautobot_device_lifecycle_mgmt.models import (
     HardwareLCM,
     DeviceSoftwareValidationResult,
     InventoryItemSoftwareValidationResult,
+    DeviceHardwareEoXResult,
+    DeviceContractCoverage,
     CVELCM,
     VulnerabilityLCM,
     SoftwareImageLCM,
@@ -59,6 +65,16 @@ class HardwareLCMViewTest(ViewTestCases.PrimaryObjectViewTestCase):
             "c9200-48, 2023-10-06, 2024-10-06, 2025-10-06, 2026-10-06, https://cisco.com/eox",
         )
 
+    def test_list_expiry_follows_current_date(self):
+        """The expiry of the listed notices is computed on the day of each request."""
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_hardwarelcm")
+        url = reverse("plugins:nautobot_device_lifecycle_mgmt:hardwarelcm_list")
+        for today, expired in (("2021-03-31 12:00", False), ("2021-04-02 12:00", True)):
+            with time_machine.travel(today):
+                response = self.client.get(url)
+            self.assertHttpStatus(response, 200)
+            self.assertEqual({row.record.expired for row in response.context["table"].page.object_list}, {expired})
+
     def test_has_advanced_tab(self):
         pass
 
@@ -69,6 +85,43 @@ class HardwareLCMViewTest(ViewTestCases.PrimaryObjectViewTestCase):
         pass
 
 
+class HardwareLCMDevicesViewTest(TestCase):
+    """Test the affected Devices tab of the HardwareLCM view."""
+
+    def setUp(self):
+        super().setUp()
+        devices = create_devices()
+        devices[2].site = Site.objects.create(name="Test 2", slug="test-2")
+        devices[2].save()
+        self.hardware_notice = HardwareLCM.objects.create(
+            device_type=devices[0].device_type, end_of_sale=datetime.date(2021, 4, 1)
+        )
+        self.add_permissions("nautobot_device_lifecycle_mgmt.view_hardwarelcm", "dcim.view_device")
+
+    def test_detail_view_does_not_list_devices(self):
+        """The notice detail page only renders the number of affected devices."""
+        response = self.client.get(self.hardware_notice.get_absolute_url())
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.context["device_count"], 3)
+        self.assertNotContains(response, "sw1")
+
+    def test_devices_tab(self):
+        """The devices tab is paginated, sortable and counts the devices per site."""
+        url = reverse(
+            "plugins:nautobot_device_lifecycle_mgmt:hardwarelcm_devices", kwargs={"pk": self.hardware_notice.pk}
+        )
+        response = self.client.get(url, {"per_page": 2, "sort": "-name"})
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(
+            [row.record.name for row in response.context["devices_table"].page.object_list], ["sw3", "sw2"]
+        )
+        self.assertEqual(response.context["device_count"], 3)
+        self.assertEqual(
+            [(row["site__name"], row["device_count"]) for row in response.context["site_counts"]],
+            [("Test 1", 2), ("Test 2", 1)],
+        )
+
+
 class ValidatedSoftwareDeviceReportViewTest(ViewTestCases.ListObjectsViewTestCase):
     """Test ValidatedSoftwareDeviceReportView"""
 
@@ -119,6 +172,34 @@ class ValidatedSoftwareDeviceReportViewTest(ViewTestCases.ListObjectsViewTestCas
             200,
         )
 
+    def test_validation_report_view_conditional_get(self):
+        """Test the report is answered with a 304 until the validation results change."""
+        obj_perm = ObjectPermission(name="Test permission", actions=["view"])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(self.model))
+        url = reverse("plugins:nautobot_device_lifecycle_mgmt:validatedsoftware_device_report")
+
+        response = self.client.get(url)
+        self.assertHttpStatus(response, 200)
+        etag = response["ETag"]
+        self.assertIn("Last-Modified", response)
+        self.assertHttpStatus(self.client.get(url, HTTP_IF_NONE_MATCH=etag), 304)
+        self.assertHttpStatus(self.client.get(f"{url}?platform=cisco_ios", HTTP_IF_NONE_MATCH=etag), 200)
+
+        result = DeviceSoftwareValidationResult.objects.first()
+        result.is_validated = True
+        result.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertHttpStatus(response, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_validation_report_view_conditional_get_without_permission(self):
+        """Test a conditional request is denied to a user without the view permission."""
+        url = reverse("plugins:nautobot_device_lifecycle_mgmt:validatedsoftware_device_report")
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 24 * 60 * 60))
+        self.assertHttpStatus(response, 403)
+
     def test_get_object_notes(self):
         pass
 
@@ -522,3 +603,115 @@ class InventoryItemSoftwareValidationResultListViewTest(ViewTestCases.ListObject
 
     def test_list_objects_with_permission(self):
         pass
+
+
+class DeviceHardwareEoXResultListViewTest(ViewTestCases.ListObjectsViewTestCase):
+    """Test DeviceHardwareEoXResultListView"""
+
+    model = DeviceHardwareEoXResult
+
+    def _get_base_url(self):
+        return "plugins:nautobot_device_lifecycle_mgmt:devicehardwareeoxresult_list"
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test objects."""
+        device_1, device_2, device_3 = create_devices()
+        DeviceHardwareEoXResult.objects.create(device=device_1, end_of_support=datetime.date(2023, 3, 1))
+        DeviceHardwareEoXResult.objects.create(device=device_2, end_of_support=datetime.date(2024, 1, 1))
+        DeviceHardwareEoXResult.objects.create(device=device_3)
+
+    def test_device_hardware_eox_list_view_filtered(self):
+        """Test the list view filtered on an end of support range."""
+        obj_perm = ObjectPermission(name="Test permission", actions=["view"])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(self.model))
+        response = self.client.get(
+            reverse("plugins:nautobot_device_lifecycle_mgmt:devicehardwareeoxresult_list"),
+            {"end_of_support__lte": "2023-12-31"},
+        )
+        self.assertHttpStatus(response, 200)
+        self.assertContains(response, "sw1")
+        self.assertNotContains(response, "sw2")
+
+    def test_bulk_edit_objects_with_constrained_permission(self):
+        pass
+
+    def test_bulk_edit_objects_with_permission(self):
+        pass
+
+    def test_bulk_edit_objects_without_permission(self):
+        pass
+
+    def test_bulk_edit_form_contains_all_pks(self):
+        pass
+
+    def test_has_advanced_tab(self):
+        pass
+
+    def test_get_object_notes(self):
+        pass
+
+    def test_bulk_import_objects_with_permission_csv_file(self):
+        pass
+
+    def test_list_objects_with_permission(self):
+        pass
+
+
+class DeviceContractCoverageListViewTest(ViewTestCases.ListObjectsViewTestCase):
+    """Test DeviceContractCoverageListView"""
+
+    model = DeviceContractCoverage
+
+    def _get_base_url(self):
+        return "plugins:nautobot_device_lifecycle_mgmt:devicecontractcoverage_list"
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test objects."""
+        device_1, device_2, device_3 = create_devices()
+        DeviceContractCoverage.objects.create(
+            device=device_1, is_covered=True, end=datetime.date(2023, 3, 1), gap_start=datetime.date(2023, 3, 1)
+        )
+        DeviceContractCoverage.objects.create(device=device_2, gap_start=datetime.date(2023, 1, 1))
+        DeviceContractCoverage.objects.create(device=device_3, gap_start=datetime.date(2023, 1, 1))
+
+    def test_device_contract_coverage_list_view_filtered(self):
+        """Test the list view filtered on the covered devices."""
+        obj_perm = ObjectPermission(name="Test permission", actions=["view"])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(self.model))
+        response = self.client.get(
+            reverse("plugins:nautobot_device_lifecycle_mgmt:devicecontractcoverage_list"),
+            {"is_covered": "True"},
+        )
+        self.assertHttpStatus(response, 200)
+        self.assertContains(response, "sw1")
+        self.assertNotContains(response, "sw2")
+
+    def test_bulk_edit_objects_with_constrained_permission(self):
+        pass
+
+    def test_bulk_edit_objects_with_permission(self):
+        pass
+
+    def test_bulk_edit_objects_without_permission(self):
+        pass
+
+    def test_bulk_edit_form_contains_all_pks(self):
+        pass
+
+    def test_has_advanced_tab(self):
+        pass
+
+    def test_get_object_notes(self):
+        pass
+
+    def test_bulk_import_objects_with_permission_csv_file(self):
+        pass
+
+    def test_list_objects_with_permission(self):
+        pass
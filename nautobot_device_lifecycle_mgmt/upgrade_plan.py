@@ -0,0 +1,147 @@
+"""Set-based planning of the software upgrade of a fleet of Devices."""
+
+import csv
+import json
+from collections import Counter
+
+from rest_framework.utils.encoders import JSONEncoder
+
+from nautobot_device_lifecycle_mgmt.choices import UpgradePlanStatusChoices
+from nautobot_device_lifecycle_mgmt.software_bulk import BulkDeviceSoftware
+
+
+# Number of Devices whose upgrade is planned at a time.
+UPGRADE_PLAN_BATCH_SIZE = 1000
+
+# Devices are planned in this order, so that the Devices of an upgrade wave are contiguous.
+UPGRADE_PLAN_ORDERING = ("platform__name", "device_type__model", "name", "pk")
+
+UPGRADE_PLAN_FIELDS = (
+    "device_id",
+    "device",
+    "site",
+    "platform",
+    "device_type",
+    "device_role",
+    "current_software",
+    "target_software",
+    "target_image",
+    "status",
+    "wave",
+)
+
+
+class UpgradePlanDeviceSoftware(BulkDeviceSoftware):
+    """Computes software validation data for a set of Devices, with the names displayed in the upgrade plan."""
+
+    item_fields = BulkDeviceSoftware.item_fields + (
+        "site__name",
+        "platform__name",
+        "device_type__model",
+        "device_role__name",
+    )
+
+
+class FleetUpgradePlan:
+    """Upgrade plan of a set of Devices to their preferred validated software.
+
+    The target of each Device is its first currently valid ValidatedSoftwareLCM, in the order of
+    `DeviceValidatedSoftwareFilter`, and its image is resolved with the precedence of `DeviceSoftwareImageFilter`.
+    Devices are planned in batches, each costing a fixed number of queries.
+
+    Iterating the plan yields one row dict per Device, with the `UPGRADE_PLAN_FIELDS` keys. Devices requiring an
+    upgrade are grouped into upgrade waves by platform and device type; `waves` and `status_counts` are filled in
+    while iterating.
+    """
+
+    def __init__(self, devices_qs, validated_software_qs=None, batch_size=UPGRADE_PLAN_BATCH_SIZE):
+        """Initialize FleetUpgradePlan object."""
+        self.devices_qs = devices_qs
+        self.validated_software_qs = validated_software_qs
+        self.batch_size = batch_size
+        self.waves = {}
+        self.status_counts = Counter()
+
+    def __iter__(self):
+        """Yield the upgrade plan row of each Device."""
+        device_pks = list(self.devices_qs.order_by(*UPGRADE_PLAN_ORDERING).values_list("pk", flat=True))
+        for start in range(0, len(device_pks), self.batch_size):
+            end = start + self.batch_size
+            batch_qs = self.devices_qs.model.objects.filter(pk__in=device_pks[start:end])
+            yield from self.iter_batch(batch_qs.order_by(*UPGRADE_PLAN_ORDERING))
+
+    def iter_batch(self, devices_qs):
+        """Yield the upgrade plan row of each Device of a batch."""
+        bulk_software = UpgradePlanDeviceSoftware(devices_qs, self.validated_software_qs)
+        software_map = bulk_software.get_software_map()
+        targets = {}
+        for device_pk, validated_softwares in bulk_software.get_validated_software_map().items():
+            valid = [validated_software for validated_software, _ in validated_softwares if validated_software.valid]
+            if valid:
+                targets[device_pk] = valid[0].software
+        image_map = bulk_software.get_software_image_map(targets)
+
+        for device_pk, device in bulk_software.items.items():
+            software, target, image = software_map.get(device_pk), targets.get(device_pk), image_map.get(device_pk)
+            if target is None:
+                status = UpgradePlanStatusChoices.NO_TARGET
+            elif software is not None and software.pk == target.pk:
+                status = UpgradePlanStatusChoices.CURRENT
+            else:
+                status = UpgradePlanStatusChoices.UPGRADE
+            self.status_counts[status] += 1
+
+            yield {
+                "device_id": device_pk,
+                "device": device["name"],
+                "site": device["site__name"],
+                "platform": device["platform__name"],
+                "device_type": device["device_type__model"],
+                "device_role": device["device_role__name"],
+                "current_software": software.version if software is not None else None,
+                "target_software": target.version if target is not None else None,
+                "target_image": image.image_file_name if image is not None else None,
+                "status": status,
+                "wave": self.get_wave(device, target) if status == UpgradePlanStatusChoices.UPGRADE else None,
+            }
+
+    def get_wave(self, device, target):
+        """Return the number of the upgrade wave of `device`, counting it and its `target` software in the wave."""
+        wave_key = (device["platform__name"], device["device_type__model"])
+        if wave_key not in self.waves:
+            self.waves[wave_key] = {
+                "wave": len(self.waves) + 1,
+                "platform": device["platform__name"],
+                "device_type": device["device_type__model"],
+                "device_count": 0,
+                "target_softwares": {},
+            }
+        wave = self.waves[wave_key]
+        wave["device_count"] += 1
+        wave["target_softwares"][target.version] = wave["target_softwares"].get(target.version, 0) + 1
+        return wave["wave"]
+
+
+class Echo:  # pylint: disable=too-few-public-methods
+    """File-like object returning what is written to it, used to stream the output of `csv.writer`."""
+
+    def write(self, value):  # pylint: disable=no-self-use
+        """Return `value` instead of buffering it."""
+        return value
+
+
+def iter_upgrade_plan_csv(plan):
+    """Yield the CSV lines of the upgrade `plan`, starting with a header line."""
+    writer = csv.writer(Echo())
+    yield writer.writerow(UPGRADE_PLAN_FIELDS)
+    for row in plan:
+        yield writer.writerow([row[field] for field in UPGRADE_PLAN_FIELDS])
+
+
+def iter_upgrade_plan_json(plan):
+    """Yield the upgrade `plan` as chunks of a JSON array of row objects."""
+    separator = "["
+    for row in plan:
+        yield separator + json.dumps(row, cls=JSONEncoder)
+        separator = ","
+    yield "[]" if separator == "[" else "]"
@@ -37,6 +37,11 @@ urlpatterns = [
         kwargs={"model": HardwareLCM},
     ),
     path("hardware/import/", views.HardwareLCMBulkImportView.as_view(), name="hardwarelcm_import"),
+    path(
+        "hardware/<uuid:pk>/devices/",
+        views.HardwareLCMDevicesView.as_view(),
+        name="hardwarelcm_devices",
+    ),
     # Software Lifecycle Management URLs
     path("software/", views.SoftwareLCMListView.as_view(), name="softwarelcm_list"),
     path("software/<uuid:pk>/", views.SoftwareLCMView.as_view(), name="softwarelcm"),
@@ -123,6 +128,11 @@ urlpatterns = [
         views.ValidatedSoftwareDeviceReportView.as_view(),
         name="validatedsoftware_device_report",
     ),
+    path(
+        "validated-software/upgrade-plan/",
+        views.FleetUpgradePlanView.as_view(),
+        name="upgrade_plan",
+    ),
     path(
         "validated-software/inventoryitem-report/",
         views.ValidatedSoftwareInventoryItemReportView.as_view(),
@@ -140,8 +150,37 @@ urlpatterns = [
         views.InventoryItemSoftwareValidationResultListView.as_view(),
         name="inventoryitemsoftwarevalidationresult_list",
     ),
+    # DeviceHardwareEoXResult
+    path(
+        "device-hardware-eox-result/",
+        views.DeviceHardwareEoXResultListView.as_view(),
+        name="devicehardwareeoxresult_list",
+    ),
+    # InventoryItemHardwareEoXResult
+    path(
+        "inventory-item-hardware-eox-result/",
+        views.InventoryItemHardwareEoXResultListView.as_view(),
+        name="inventoryitemhardwareeoxresult_list",
+    ),
+    # DeviceContractCoverage
+    path(
+        "device-contract-coverage/",
+        views.DeviceContractCoverageListView.as_view(),
+        name="devicecontractcoverage_list",
+    ),
+    # InventoryItemContractCoverage
+    path(
+        "inventory-item-contract-coverage/",
+        views.InventoryItemContractCoverageListView.as_view(),
+        name="inventoryitemcontractcoverage_list",
+    ),
     # Contract Lifecycle Management URLs
     path("contract/", views.ContractLCMListView.as_view(), name="contractlcm_list"),
+    path(
+        "contract/renewal-forecast/",
+        views.ContractRenewalForecastView.as_view(),
+        name="contract_renewal_forecast",
+    ),
     path("contract/<uuid:pk>/", views.ContractLCMView.as_view(), name="contractlcm"),
     path("contract/add/", views.ContractLCMCreateView.as_view(), name="contractlcm_add"),
     path("contract/delete/", views.ContractLCMBulkDeleteView.as_view(), name="contractlcm_bulk_delete"),
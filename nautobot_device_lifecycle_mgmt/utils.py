@@ -1,5 +1,5 @@
 """Utility functions and classes used by the plugin."""
-from django.db.models import Count, Subquery, OuterRef
+from django.db.models import Count, Func, IntegerField, Subquery, OuterRef
 from django.db.models.functions import Coalesce
 
 
@@ -8,3 +8,22 @@ def count_related_m2m(model, field):
     subquery = Subquery(model.objects.filter(**{"pk": OuterRef("pk")}).order_by().annotate(c=Count(field)).values("c"))
 
     return Coalesce(subquery, 0)
+
+
+class DaysBetween(Func):  # pylint: disable=abstract-method
+    """Number of days from the `start` date expression to the `end` date expression, or NULL if either is NULL."""
+
+    arity = 2
+    output_field = IntegerField()
+
+    def __init__(self, start, end, **extra):
+        """Initialize the expression, keeping the `end - start` operand order of the SQL subtraction."""
+        super().__init__(end, start, **extra)
+
+    def as_sql(self, compiler, connection, function=None, template=None, arg_joiner=None, **extra_context):
+        """Subtract the dates, which gives a number of days on PostgreSQL."""
+        return super().as_sql(compiler, connection, template="(%(expressions)s)", arg_joiner=" - ", **extra_context)
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        """Use DATEDIFF, as subtracting dates does not give a number of days on MySQL."""
+        return super().as_sql(compiler, connection, function="DATEDIFF", **extra_context)
@@ -0,0 +1,85 @@
+"""Parsing and comparison of vendor software version strings and version ranges."""
+import re
+from bisect import bisect_left, bisect_right
+
+VERSION_TOKEN_RE = re.compile(r"\d+|[a-zA-Z]+")
+VERSION_CONSTRAINT_RE = re.compile(r"^(==|>=|<=|>|<)?\s*([a-zA-Z0-9]\S*)$")
+
+
+def get_version_key(version):
+    """Return a string whose lexical order is the natural order of the `version` strings.
+
+    The version is split into numeric and alphabetic tokens, ignoring separators, so that vendor schemes such as
+    "15.2(4)M3", "17.3.4a", "20.4R3-S2" or "4.28.3M" compare token by token: numbers numerically, letters
+    case-insensitively, letters before numbers, and a version before the longer versions it is a prefix of.
+    """
+    tokens = []
+    for token in VERSION_TOKEN_RE.findall(version or ""):
+        if token.isdigit():
+            number = token.lstrip("0") or "0"
+            # Prefixing the number with its length makes longer numbers sort after shorter ones.
+            tokens.append(f"1{len(number):02d}{number}")
+        else:
+            tokens.append(f"0{token.lower()}")
+    return ".".join(tokens)
+
+
+def parse_version_range(version_range):
+    """Return the `(operator, version key)` constraints of a comma-separated version range such as ">=15.2(4)M, <15.2(7)E3".
+
+    Supported operators are ==, >=, >, <= and <; a version without operator must match exactly. Raises ValueError if
+    the range cannot be parsed.
+    """
+    constraints = []
+    for constraint in version_range.split(","):
+        match = VERSION_CONSTRAINT_RE.match(constraint.strip())
+        if not match or not get_version_key(match.group(2)):
+            raise ValueError(f"Invalid version constraint {constraint.strip()!r} in {version_range!r}.")
+        constraints.append((match.group(1) or "==", get_version_key(match.group(2))))
+    return constraints
+
+
+def validate_affected_versions(affected_versions):
+    """Raise ValueError if `affected_versions` is not a list of {"platform": slug, "versions": range} entries."""
+    if not isinstance(affected_versions, list):
+        raise ValueError("Affected versions must be a list.")
+    for entry in affected_versions:
+        if not isinstance(entry, dict) or set(entry) != {"platform", "versions"}:
+            raise ValueError('Each affected versions entry must have a "platform" and a "versions" key.')
+        if not isinstance(entry["platform"], str) or not isinstance(entry["versions"], str):
+            raise ValueError('The "platform" and "versions" of an affected versions entry must be strings.')
+        parse_version_range(entry["versions"])
+
+
+class VersionIndex:
+    """Sorted index of values by version, answering version range queries with binary searches."""
+
+    def __init__(self, items):
+        """Initialize VersionIndex from `(version, value)` items."""
+        self._set_pairs((get_version_key(version), value) for version, value in items)
+
+    @classmethod
+    def from_version_keys(cls, items):
+        """Return a VersionIndex of `(version key, value)` items, such as stored version sort keys."""
+        index = cls.__new__(cls)
+        index._set_pairs(items)  # pylint: disable=protected-access
+        return index
+
+    def _set_pairs(self, pairs):
+        pairs = sorted(pairs, key=lambda pair: pair[0])
+        self.keys = [key for key, _ in pairs]
+        self.values = [value for _, value in pairs]
+
+    def get_range(self, constraints):
+        """Return the values whose version satisfies all the `(operator, version key)` constraints."""
+        lower, upper = 0, len(self.keys)
+        for operator, key in constraints:
+            if operator in ("==", ">="):
+                lower = max(lower, bisect_left(self.keys, key))
+            elif operator == ">":
+                lower = max(lower, bisect_right(self.keys, key))
+            if operator in ("==", "<="):
+                upper = min(upper, bisect_right(self.keys, key))
+            elif operator == "<":
+                upper = min(upper, bisect_left(self.keys, key))
+        return self.values[lower:upper]
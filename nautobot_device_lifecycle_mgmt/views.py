@@ -1,5 +1,6 @@
 """Views implementation for the Lifecycle Management plugin."""
 import base64
+import csv
 import inspect
 import io
 import logging
@@ -9,22 +10,34 @@ import matplotlib.pyplot as plt
 from matplotlib.ticker import MaxNLocator
 import numpy as np
 
+from django.contrib.auth import get_user_model
 from django.db.models import Q, F, Count, ExpressionWrapper, FloatField
+from django.http import HttpResponse, StreamingHttpResponse
+from django.shortcuts import render
+from django.utils.cache import get_conditional_response
+from django.views.generic import View
 from django_tables2 import RequestConfig
 
 from nautobot.core.forms import SearchForm
 from nautobot.core.views import generic
-from nautobot.dcim.models import Device
+from nautobot.dcim.filters import DeviceFilterSet
+from nautobot.dcim.models import Device, DeviceType, InventoryItem, Platform, Site
+from nautobot.users.models import ObjectPermission
 from nautobot.utilities.paginator import EnhancedPaginator, get_paginate_count
 from nautobot.utilities.views import ContentTypePermissionRequiredMixin
 from nautobot_device_lifecycle_mgmt import choices
 from nautobot_device_lifecycle_mgmt.models import (
+    DeviceHardwareNotice,
     HardwareLCM,
     SoftwareLCM,
     ContactLCM,
     ValidatedSoftwareLCM,
     DeviceSoftwareValidationResult,
     InventoryItemSoftwareValidationResult,
+    DeviceHardwareEoXResult,
+    InventoryItemHardwareEoXResult,
+    DeviceContractCoverage,
+    InventoryItemContractCoverage,
     ContractLCM,
     ProviderLCM,
     CVELCM,
@@ -39,6 +52,11 @@ from nautobot_device_lifecycle_mgmt.tables import (
     DeviceSoftwareValidationResultListTable,
     InventoryItemSoftwareValidationResultTable,
     InventoryItemSoftwareValidationResultListTable,
+    DeviceHardwareEoXResultListTable,
+    InventoryItemHardwareEoXResultListTable,
+    DeviceContractCoverageListTable,
+    InventoryItemContractCoverageListTable,
+    HardwareLCMDeviceTable,
     ContractLCMTable,
     ProviderLCMTable,
     ContactLCMTable,
@@ -59,6 +77,10 @@ from nautobot_device_lifecycle_mgmt.forms import (
     ValidatedSoftwareLCMCSVForm,
     DeviceSoftwareValidationResultFilterForm,
     InventoryItemSoftwareValidationResultFilterForm,
+    DeviceHardwareEoXResultFilterForm,
+    InventoryItemHardwareEoXResultFilterForm,
+    DeviceContractCoverageFilterForm,
+    InventoryItemContractCoverageFilterForm,
     ContractLCMForm,
     ContractLCMBulkEditForm,
     ContractLCMFilterForm,
@@ -81,6 +103,8 @@ from nautobot_device_lifecycle_mgmt.forms import (
     SoftwareImageLCMForm,
     SoftwareImageLCMFilterForm,
     SoftwareImageLCMCSVForm,
+    FleetUpgradePlanFilterForm,
+    ContractRenewalForecastFilterForm,
 )
 from nautobot_device_lifecycle_mgmt.filters import (
     HardwareLCMFilterSet,
@@ -91,16 +115,61 @@ from nautobot_device_lifecycle_mgmt.filters import (
     ValidatedSoftwareLCMFilterSet,
     DeviceSoftwareValidationResultFilterSet,
     InventoryItemSoftwareValidationResultFilterSet,
+    DeviceHardwareEoXResultFilterSet,
+    InventoryItemHardwareEoXResultFilterSet,
+    DeviceContractCoverageFilterSet,
+    InventoryItemContractCoverageFilterSet,
     CVELCMFilterSet,
     VulnerabilityLCMFilterSet,
     SoftwareImageLCMFilterSet,
 )
 
 from nautobot_device_lifecycle_mgmt.const import URL, PLUGIN_CFG
+from nautobot_device_lifecycle_mgmt.data_version import get_conditional_headers, set_conditional_headers
+from nautobot_device_lifecycle_mgmt.contract_forecast import ContractRenewalForecast
+from nautobot_device_lifecycle_mgmt.upgrade_plan import FleetUpgradePlan, iter_upgrade_plan_csv, iter_upgrade_plan_json
 from nautobot_device_lifecycle_mgmt.utils import count_related_m2m
 
 logger = logging.getLogger("nautobot_device_lifecycle_mgmt")
 
+
+class ConditionalGetMixin:
+    """Answer conditional GET requests with a 304 response when none of the `data_version_models` changed."""
+
+    data_version_models = ()
+
+    def setup(self, request, *args, **kwargs):
+        """Check the request preconditions before the view computes anything."""
+        self.conditional_headers = (None, None)  # pylint: disable=attribute-defined-outside-init
+        self.not_modified_response = None  # pylint: disable=attribute-defined-outside-init
+        if request.method in ("GET", "HEAD") and request.user.is_authenticated:
+            models = (*self.data_version_models, ObjectPermission, get_user_model())
+            self.conditional_headers = get_conditional_headers(models, request)
+            etag, last_modified = self.conditional_headers
+            if etag is not None:
+                self.not_modified_response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+        if self.not_modified_response is not None:
+            # The client already has the current page, skip the report aggregations done by the view setup.
+            View.setup(self, request, *args, **kwargs)
+        else:
+            super().setup(request, *args, **kwargs)
+
+    def dispatch(self, request, *args, **kwargs):
+        """Return the 304 response, or the rendered page with its ETag and Last-Modified headers."""
+        if self.not_modified_response is not None:
+            # The preconditions do not depend on the user permissions, which are checked before answering with a 304.
+            if not self.has_permission():
+                return self.handle_no_permission()
+            return self.not_modified_response
+
+        response = super().dispatch(request, *args, **kwargs)
+        etag, last_modified = self.conditional_headers
+        if etag is not None and response.status_code == 200:
+            set_conditional_headers(response, etag, last_modified)
+        return response
+
+
 # ---------------------------------------------------------------------------------
 #  Hardware Lifecycle Management Views
 # ---------------------------------------------------------------------------------
@@ -115,6 +184,11 @@ class HardwareLCMListView(generic.ObjectListView):
     filterset_form = HardwareLCMFilterForm
     table = HardwareLCMTable
 
+    def setup(self, request, *args, **kwargs):
+        """Annotate the expiry of the notices as of the day of the request."""
+        super().setup(request, *args, **kwargs)
+        self.queryset = self.queryset.with_expiry()
+
 
 class HardwareLCMView(generic.ObjectView):
     """Detail view."""
@@ -127,15 +201,44 @@ class HardwareLCMView(generic.ObjectView):
         request: The current request
         instance: The object being viewed
         """
-        if instance.device_type:
-            return {"devices": Device.objects.restrict(request.user, "view").filter(device_type=instance.device_type)}
-        if instance.inventory_item:
-            return {
-                "devices": Device.objects.restrict(request.user, "view").filter(
-                    inventoryitems__part_id=instance.inventory_item
-                )
-            }
-        return {"devices": []}
+        return {"device_count": get_hardware_notice_devices(request, instance).count()}
+
+
+def get_hardware_notice_devices(request, instance):
+    """Return the Devices affected by the HardwareLCM `instance` that the user of `request` can view."""
+    return Device.objects.restrict(request.user, "view").filter(
+        pk__in=DeviceHardwareNotice.objects.filter(hardware_notice=instance).values("device")
+    )
+
+
+class HardwareLCMDevicesView(generic.ObjectView):
+    """Affected Devices tab for HardwareLCM view."""
+
+    queryset = HardwareLCM.objects.prefetch_related("device_type")
+    template_name = "nautobot_device_lifecycle_mgmt/hardwarelcm_devices.html"
+
+    def get_extra_context(self, request, instance):
+        """Adds the paginated table of affected Devices and their counts per site."""
+        devices = get_hardware_notice_devices(request, instance)
+        devices_table = HardwareLCMDeviceTable(
+            data=devices.select_related("site", "rack", "device_type", "device_role", "platform"),
+            user=request.user,
+            order_by=("name",),
+        )
+
+        paginate = {
+            "paginator_class": EnhancedPaginator,
+            "per_page": get_paginate_count(request),
+        }
+        RequestConfig(request, paginate).configure(devices_table)
+
+        site_counts = devices.order_by().values("site__slug", "site__name").annotate(device_count=Count("pk"))
+        return {
+            "devices_table": devices_table,
+            "site_counts": site_counts.order_by("-device_count", "site__name"),
+            "device_count": devices_table.paginator.count,
+            "active_tab": "devices",
+        }
 
 
 class HardwareLCMCreateView(generic.ObjectEditView):
@@ -568,9 +671,11 @@ class ReportOverviewHelper(ContentTypePermissionRequiredMixin, generic.View):
         return aggr
 
 
-class ValidatedSoftwareDeviceReportView(generic.ObjectListView):
+class ValidatedSoftwareDeviceReportView(ConditionalGetMixin, generic.ObjectListView):
     """View for executive report on software Validation."""
 
+    data_version_models = (DeviceSoftwareValidationResult, SoftwareLCM, Device, DeviceType, Platform)
+
     filterset = DeviceSoftwareValidationResultFilterSet
     filterset_form = DeviceSoftwareValidationResultFilterForm
     table = DeviceSoftwareValidationResultTable
@@ -597,7 +702,7 @@ class ValidatedSoftwareDeviceReportView(generic.ObjectListView):
         try:
             report_last_run = (
                 DeviceSoftwareValidationResult.objects.filter(run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN)
-                .latest("last_updated")
+                .latest("last_run")
                 .last_run
             )
         except DeviceSoftwareValidationResult.DoesNotExist:
@@ -700,9 +805,97 @@ class ValidatedSoftwareDeviceReportView(generic.ObjectListView):
         return "\n".join(csv_data)
 
 
-class DeviceSoftwareValidationResultListView(generic.ObjectListView):
+class FleetUpgradePlanView(ContentTypePermissionRequiredMixin, View):
+    """Upgrade plan of the devices to their preferred validated software, exported as streaming CSV or JSON."""
+
+    template_name = "nautobot_device_lifecycle_mgmt/fleet_upgrade_plan.html"
+    exports = {
+        "csv": (iter_upgrade_plan_csv, "text/csv"),
+        "json": (iter_upgrade_plan_json, "application/json"),
+    }
+
+    def get_required_permission(self):
+        """Manually set permission when not tied to a model for global report."""
+        return "nautobot_device_lifecycle_mgmt.view_validatedsoftwarelcm"
+
+    def get(self, request):
+        """Render the upgrade waves, or stream the plan of every device when an export format is requested."""
+        devices = DeviceFilterSet(request.GET, Device.objects.restrict(request.user, "view")).qs
+        plan = FleetUpgradePlan(devices, ValidatedSoftwareLCM.objects.restrict(request.user, "view"))
+
+        export_format = request.GET.get("export")
+        if export_format in self.exports:
+            iter_export, content_type = self.exports[export_format]
+            response = StreamingHttpResponse(iter_export(plan), content_type=content_type)
+            response["Content-Disposition"] = f'attachment; filename="upgrade_plan.{export_format}"'
+            return response
+
+        for _ in plan:
+            pass
+        query = request.GET.copy()
+        query.pop("export", None)
+        return render(
+            request,
+            self.template_name,
+            {
+                "filter_form": FleetUpgradePlanFilterForm(request.GET, label_suffix=""),
+                "waves": plan.waves.values(),
+                "status_counts": {
+                    label: plan.status_counts[status] for status, label in choices.UpgradePlanStatusChoices.CHOICES
+                },
+                "query": query.urlencode(),
+            },
+        )
+
+
+class ContractRenewalForecastView(ContentTypePermissionRequiredMixin, View):
+    """Number and summed cost of the contracts ending in each upcoming month or quarter, exported as CSV."""
+
+    template_name = "nautobot_device_lifecycle_mgmt/contract_renewal_forecast.html"
+
+    def get_required_permission(self):
+        """Manually set permission when not tied to a model for global report."""
+        return "nautobot_device_lifecycle_mgmt.view_contractlcm"
+
+    def get(self, request):
+        """Render the forecast, or return it as CSV when requested."""
+        filter_form = ContractRenewalForecastFilterForm(request.GET, label_suffix="")
+        params = filter_form.cleaned_data if filter_form.is_valid() else {}
+        forecast = ContractRenewalForecast(
+            ContractLCM.objects.restrict(request.user, "view"),
+            devices_qs=Device.objects.restrict(request.user, "view"),
+            **{name: value for name, value in params.items() if value},
+        )
+        rows = [{**row, "period": forecast.get_period_label(row["period"])} for row in forecast.get_rows()]
+
+        if request.GET.get("export") == "csv":
+            response = HttpResponse(content_type="text/csv")
+            response["Content-Disposition"] = 'attachment; filename="contract_renewal_forecast.csv"'
+            writer = csv.writer(response)
+            writer.writerow(forecast.columns)
+            writer.writerows([row[column] for column in forecast.columns] for row in rows)
+            return response
+
+        query = request.GET.copy()
+        query.pop("export", None)
+        return render(
+            request,
+            self.template_name,
+            {
+                "filter_form": filter_form,
+                "forecast": forecast,
+                "group_label": choices.ContractForecastGroupChoices.as_dict()[forecast.group_by],
+                "rows": rows,
+                "query": query.urlencode(),
+            },
+        )
+
+
+class DeviceSoftwareValidationResultListView(ConditionalGetMixin, generic.ObjectListView):
     """DeviceSoftawareValidationResult List view."""
 
+    data_version_models = (DeviceSoftwareValidationResult, SoftwareLCM, ValidatedSoftwareLCM, Device, Platform)
+
     queryset = DeviceSoftwareValidationResult.objects.all()
     filterset = DeviceSoftwareValidationResultFilterSet
     filterset_form = DeviceSoftwareValidationResultFilterForm
@@ -711,9 +904,11 @@ class DeviceSoftwareValidationResultListView(generic.ObjectListView):
     template_name = "nautobot_device_lifecycle_mgmt/devicesoftwarevalidationresult_list.html"
 
 
-class ValidatedSoftwareInventoryItemReportView(generic.ObjectListView):
+class ValidatedSoftwareInventoryItemReportView(ConditionalGetMixin, generic.ObjectListView):
     """View for executive report on inventory item software validation."""
 
+    data_version_models = (InventoryItemSoftwareValidationResult, SoftwareLCM, InventoryItem, Device, Platform)
+
     filterset = InventoryItemSoftwareValidationResultFilterSet
     filterset_form = InventoryItemSoftwareValidationResultFilterForm
     table = InventoryItemSoftwareValidationResultTable
@@ -742,7 +937,7 @@ class ValidatedSoftwareInventoryItemReportView(generic.ObjectListView):
                 InventoryItemSoftwareValidationResult.objects.filter(
                     run_type=choices.ReportRunTypeChoices.REPORT_FULL_RUN
                 )
-                .latest("last_updated")
+                .latest("last_run")
                 .last_run
             )
         except InventoryItemSoftwareValidationResult.DoesNotExist:
@@ -846,9 +1041,18 @@ class ValidatedSoftwareInventoryItemReportView(generic.ObjectListView):
         return "\n".join(csv_data)
 
 
-class InventoryItemSoftwareValidationResultListView(generic.ObjectListView):
+class InventoryItemSoftwareValidationResultListView(ConditionalGetMixin, generic.ObjectListView):
     """DeviceSoftawareValidationResult List view."""
 
+    data_version_models = (
+        InventoryItemSoftwareValidationResult,
+        SoftwareLCM,
+        ValidatedSoftwareLCM,
+        InventoryItem,
+        Device,
+        Platform,
+    )
+
     queryset = InventoryItemSoftwareValidationResult.objects.all()
     filterset = InventoryItemSoftwareValidationResultFilterSet
     filterset_form = InventoryItemSoftwareValidationResultFilterForm
@@ -857,6 +1061,62 @@ class InventoryItemSoftwareValidationResultListView(generic.ObjectListView):
     template_name = "nautobot_device_lifecycle_mgmt/inventoryitemsoftwarevalidationresult_list.html"
 
 
+class DeviceHardwareEoXResultListView(ConditionalGetMixin, generic.ObjectListView):
+    """DeviceHardwareEoXResult List view."""
+
+    data_version_models = (DeviceHardwareEoXResult, Device, DeviceType, Site)
+
+    queryset = DeviceHardwareEoXResult.objects.select_related("device", "device__device_type", "device__site")
+    filterset = DeviceHardwareEoXResultFilterSet
+    filterset_form = DeviceHardwareEoXResultFilterForm
+    table = DeviceHardwareEoXResultListTable
+    action_buttons = ("export",)
+    template_name = "nautobot_device_lifecycle_mgmt/devicehardwareeoxresult_list.html"
+
+
+class InventoryItemHardwareEoXResultListView(ConditionalGetMixin, generic.ObjectListView):
+    """InventoryItemHardwareEoXResult List view."""
+
+    data_version_models = (InventoryItemHardwareEoXResult, InventoryItem, Device)
+
+    queryset = InventoryItemHardwareEoXResult.objects.select_related("inventory_item", "inventory_item__device")
+    filterset = InventoryItemHardwareEoXResultFilterSet
+    filterset_form = InventoryItemHardwareEoXResultFilterForm
+    table = InventoryItemHardwareEoXResultListTable
+    action_buttons = ("export",)
+    template_name = "nautobot_device_lifecycle_mgmt/inventoryitemhardwareeoxresult_list.html"
+
+
+class DeviceContractCoverageListView(ConditionalGetMixin, generic.ObjectListView):
+    """DeviceContractCoverage List view."""
+
+    data_version_models = (DeviceContractCoverage, Device, DeviceType, Site, ContractLCM, ProviderLCM)
+
+    queryset = DeviceContractCoverage.objects.select_related(
+        "device", "device__device_type", "device__site", "contract", "provider"
+    )
+    filterset = DeviceContractCoverageFilterSet
+    filterset_form = DeviceContractCoverageFilterForm
+    table = DeviceContractCoverageListTable
+    action_buttons = ("export",)
+    template_name = "nautobot_device_lifecycle_mgmt/devicecontractcoverage_list.html"
+
+
+class InventoryItemContractCoverageListView(ConditionalGetMixin, generic.ObjectListView):
+    """InventoryItemContractCoverage List view."""
+
+    data_version_models = (InventoryItemContractCoverage, InventoryItem, Device, ContractLCM, ProviderLCM)
+
+    queryset = InventoryItemContractCoverage.objects.select_related(
+        "inventory_item", "inventory_item__device", "contract", "provider"
+    )
+    filterset = InventoryItemContractCoverageFilterSet
+    filterset_form = InventoryItemContractCoverageFilterForm
+    table = InventoryItemContractCoverageListTable
+    action_buttons = ("export",)
+    template_name = "nautobot_device_lifecycle_mgmt/inventoryitemcontractcoverage_list.html"
+
+
 # ---------------------------------------------------------------------------------
 #  Contract Lifecycle Management Views
 # ---------------------------------------------------------------------------------
@@ -870,6 +1130,11 @@ class ContractLCMListView(generic.ObjectListView):
     filterset_form = ContractLCMFilterForm
     table = ContractLCMTable
 
+    def setup(self, request, *args, **kwargs):
+        """Annotate the expiry of the contracts as of the day of the request."""
+        super().setup(request, *args, **kwargs)
+        self.queryset = self.queryset.with_expiry()
+
 
 class ContractLCMView(generic.ObjectView):
     """Detail view."""
@@ -0,0 +1,203 @@
+"""Set-based generation and reconciliation of VulnerabilityLCM objects and of the CVE to software associations."""
+
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from nautobot.dcim.models import Device, InventoryItem
+from nautobot.extras.models import Relationship, RelationshipAssociation
+
+from nautobot_device_lifecycle_mgmt.data_version import bump_data_version
+from nautobot_device_lifecycle_mgmt.models import CVELCM, SoftwareLCM, VulnerabilityLCM
+from nautobot_device_lifecycle_mgmt.versions import VersionIndex, parse_version_range
+
+
+# Number of software versions whose vulnerabilities are computed and written at a time.
+SOFTWARE_BATCH_SIZE = 500
+# Number of Vulnerabilities inserted, or checked and retired, per query.
+VULNERABILITY_BATCH_SIZE = 1000
+
+
+def get_relationship_map(relationship_slug, source_pks, destination_qs):
+    """Return {source pk: set of destination pks} of the `relationship_slug` associations of the `source_pks` objects.
+
+    Associations to objects that are not in `destination_qs` are ignored.
+    """
+    associations = RelationshipAssociation.objects.filter(
+        relationship__slug=relationship_slug,
+        source_id__in=source_pks,
+        destination_id__in=destination_qs.values("pk"),
+    ).values_list("source_id", "destination_id")
+    relationship_map = defaultdict(set)
+    for source_pk, destination_pk in associations:
+        relationship_map[source_pk].add(destination_pk)
+    return relationship_map
+
+
+def iter_vulnerability_keys(cves, batch_size=SOFTWARE_BATCH_SIZE):
+    """Yield `(software pks, keys)` of the vulnerabilities that should exist for `cves`, by batches of software.
+
+    Each key is a `(cve pk, software pk, device pk, inventory item pk)` tuple, with either the device or the inventory
+    item pk set to None.
+    """
+    cve_associations = RelationshipAssociation.objects.filter(
+        relationship__slug="soft_cve", destination_id__in=cves.values("pk")
+    ).values_list("source_id", "destination_id")
+    cves_by_software = defaultdict(set)
+    for software_pk, cve_pk in cve_associations:
+        cves_by_software[software_pk].add(cve_pk)
+
+    software_pks = sorted(cves_by_software)
+    for start in range(0, len(software_pks), batch_size):
+        end = start + batch_size
+        batch = software_pks[start:end]
+        devices_by_software = get_relationship_map("device_soft", batch, Device.objects.all())
+        items_by_software = get_relationship_map("inventory_item_soft", batch, InventoryItem.objects.all())
+        keys = set()
+        for software_pk in batch:
+            for cve_pk in cves_by_software[software_pk]:
+                keys.update((cve_pk, software_pk, device_pk, None) for device_pk in devices_by_software[software_pk])
+                keys.update((cve_pk, software_pk, None, item_pk) for item_pk in items_by_software[software_pk])
+        yield batch, keys
+
+
+def get_existing_vulnerability_keys(cves, software_pks):
+    """Return the keys, as built by `iter_vulnerability_keys`, of the existing vulnerabilities of `cves`."""
+    keys = set()
+    vulnerabilities = VulnerabilityLCM.objects.filter(cve__in=cves, software_id__in=software_pks).values_list(
+        "cve_id", "software_id", "device_id", "inventory_item_id"
+    )
+    for cve_pk, software_pk, device_pk, item_pk in vulnerabilities:
+        if device_pk:
+            keys.add((cve_pk, software_pk, device_pk, None))
+        if item_pk:
+            keys.add((cve_pk, software_pk, None, item_pk))
+    return keys
+
+
+def create_missing_vulnerabilities(cves, software_pks, keys):
+    """Bulk create the vulnerabilities of `keys` that do not exist yet and return how many were created."""
+    missing = keys - get_existing_vulnerability_keys(cves, software_pks)
+    VulnerabilityLCM.objects.bulk_create(
+        [
+            VulnerabilityLCM(cve_id=cve_pk, software_id=software_pk, device_id=device_pk, inventory_item_id=item_pk)
+            for cve_pk, software_pk, device_pk, item_pk in missing
+        ],
+        batch_size=VULNERABILITY_BATCH_SIZE,
+    )
+    if missing:
+        # bulk_create() does not send the signals bumping the data version.
+        bump_data_version(VulnerabilityLCM)
+    return len(missing)
+
+
+def iter_obsolete_vulnerabilities(cves, status=None, batch_size=VULNERABILITY_BATCH_SIZE):
+    """Yield lists of the pks of the vulnerabilities of `cves` that are no longer backed by associations.
+
+    A vulnerability is obsolete when its software is no longer associated to its CVE, or to its device or inventory
+    item. Vulnerabilities are checked `batch_size` at a time, in pk order, and those already having `status` are
+    skipped.
+    """
+    vulnerabilities = VulnerabilityLCM.objects.filter(cve__in=cves, software__isnull=False).order_by("pk")
+    if status is not None:
+        vulnerabilities = vulnerabilities.exclude(status=status)
+    last_pk = None
+    while True:
+        batch = vulnerabilities if last_pk is None else vulnerabilities.filter(pk__gt=last_pk)
+        batch = list(batch.values_list("pk", "cve_id", "software_id", "device_id", "inventory_item_id")[:batch_size])
+        if not batch:
+            return
+        last_pk = batch[-1][0]
+
+        software_pks = {software_pk for _, _, software_pk, _, _ in batch}
+        cve_pairs = get_relationship_map("soft_cve", software_pks, cves)
+        device_pairs = get_relationship_map(
+            "device_soft", software_pks, Device.objects.filter(pk__in={row[3] for row in batch if row[3]})
+        )
+        item_pairs = get_relationship_map(
+            "inventory_item_soft",
+            software_pks,
+            InventoryItem.objects.filter(pk__in={row[4] for row in batch if row[4]}),
+        )
+        obsolete = [
+            pk
+            for pk, cve_pk, software_pk, device_pk, item_pk in batch
+            if cve_pk not in cve_pairs[software_pk]
+            or (device_pk not in device_pairs[software_pk] and item_pk not in item_pairs[software_pk])
+        ]
+        if obsolete:
+            yield obsolete
+
+
+def retire_vulnerabilities(pks, status=None):
+    """Set `status` on the vulnerabilities of `pks`, or delete them if no status is given."""
+    vulnerabilities = VulnerabilityLCM.objects.filter(pk__in=pks)
+    if status is None:
+        vulnerabilities.delete()
+    else:
+        vulnerabilities.update(status=status)
+    # update() does not send the signals bumping the data version.
+    bump_data_version(VulnerabilityLCM)
+
+
+def get_affected_software_pairs(cves):
+    """Return `(set of (software pk, CVE pk) pairs, list of CVE names)` matching the affected versions of `cves`.
+
+    Software versions are indexed once per platform from their stored sort keys, so each affected version range costs
+    two binary searches. The returned CVE names are those with ranges that could not be parsed.
+    """
+    keys_by_platform = defaultdict(list)
+    for software_pk, platform_slug, version_sort_key in SoftwareLCM.objects.values_list(
+        "pk", "device_platform__slug", "version_sort_key"
+    ):
+        keys_by_platform[platform_slug].append((version_sort_key, software_pk))
+    indexes = {
+        platform_slug: VersionIndex.from_version_keys(version_keys)
+        for platform_slug, version_keys in keys_by_platform.items()
+    }
+
+    pairs, invalid = set(), []
+    for cve_pk, cve_name, affected_versions in cves.values_list("pk", "name", "affected_versions"):
+        try:
+            for entry in affected_versions or []:
+                index = indexes.get(entry["platform"])
+                if index is not None:
+                    pairs.update(
+                        (software_pk, cve_pk) for software_pk in index.get_range(parse_version_range(entry["versions"]))
+                    )
+        except (KeyError, TypeError, ValueError):
+            invalid.append(cve_name)
+    return pairs, invalid
+
+
+def link_affected_softwares(cves):
+    """Create the missing `soft_cve` associations between `cves` and the software matching their affected versions.
+
+    Returns `(number of associations created, list of the names of the CVEs with invalid affected versions)`.
+    """
+    pairs, invalid = get_affected_software_pairs(cves)
+    relationship = Relationship.objects.get(slug="soft_cve")
+    existing = set(
+        RelationshipAssociation.objects.filter(
+            relationship=relationship, destination_id__in=cves.values("pk")
+        ).values_list("source_id", "destination_id")
+    )
+    software_type = ContentType.objects.get_for_model(SoftwareLCM)
+    cve_type = ContentType.objects.get_for_model(CVELCM)
+    missing = pairs - existing
+    RelationshipAssociation.objects.bulk_create(
+        [
+            RelationshipAssociation(
+                relationship=relationship,
+                source_type=software_type,
+                source_id=software_pk,
+                destination_type=cve_type,
+                destination_id=cve_pk,
+            )
+            for software_pk, cve_pk in missing
+        ],
+        batch_size=VULNERABILITY_BATCH_SIZE,
+    )
+    if missing:
+        # bulk_create() does not send the signals bumping the data version.
+        bump_data_version(RelationshipAssociation)
+    return len(missing), invalid